@@ -69,10 +69,25 @@ function utils.saveFile(path, data, append)
 	io.close(file)
 end
 
+---Saves a file to the given path with the given binary contents. Errors out if the file cannot be created.
+---@param path string The path to the file.
+---@param data string The contents of the file.
+function utils.saveFileBinary(path, data)
+	local file, err = io.open(path, "wb")
+	assert(file, string.format("Failed to save file: %s (%s)", path, err))
+	io.output(file)
+	io.write(data)
+	io.close(file)
+end
+
 ---Loads a file from a given path and interprets it as JSON data. Returns `nil` if the file doesn't exist. Errors out if the file does not contain valid JSON data.
 ---@param path string The path to the file.
 ---@return table?
 function utils.loadJson(path)
+	local chunkData = utils.loadJsonChunk(path)
+	if chunkData then
+		return chunkData
+	end
 	local contents = utils.loadFile(path)
 	if not contents then
 		return nil
@@ -83,6 +98,45 @@ function utils.loadJson(path)
 	return data
 end
 
+---Loads the Lua chunk generated from a JSON file by `generate.py -jc` (`<path>.lua`) and returns the data it contains.
+---Returns `nil` if there is no chunk, or if the JSON file has changed since the chunk was generated, as told by the hash sidecar (`<path>.hash`).
+---@param path string The path to the JSON file.
+---@return table?
+function utils.loadJsonChunk(path)
+	local hash = utils.loadFile(path .. ".hash")
+	if not hash then
+		return nil
+	end
+	local contents = utils.loadFileBinary(path)
+	if not contents or love.data.encode("string", "hex", love.data.hash("sha1", contents)) ~= hash:match("%x+") then
+		return nil
+	end
+	local chunk = utils.loadFile(path .. ".lua")
+	if not chunk then
+		return nil
+	end
+	local fn, err = loadstring(chunk, "@" .. path .. ".lua")
+	assert(fn, string.format("Lua chunk error: %s: %s", path, tostring(err)))
+	-- The chunk is only a table constructor, so it doesn't need access to anything.
+	setfenv(fn, {})
+	return fn()
+end
+
+---Returns the SHA-1 hash of the contents of the given files, in order, as a hexadecimal string, or `nil` if any of them doesn't exist.
+---Generated files store this hash to tell whether the files they have been generated from have changed since.
+---@param paths string[] The paths to the files.
+---@return string?
+function utils.hashFiles(paths)
+	local contents = {}
+	for i, path in ipairs(paths) do
+		contents[i] = utils.loadFileBinary(path)
+		if not contents[i] then
+			return nil
+		end
+	end
+	return love.data.encode("string", "hex", love.data.hash("sha1", table.concat(contents)))
+end
+
 ---Loads a file from a given path and interprets it as JSON data. Throws an error if the file has not been found.
 ---@param path string The path to the file.
 ---@return table
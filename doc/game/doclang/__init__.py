@@ -0,0 +1,49 @@
+# DocLang Generator library.
+# Converts DocLang (.docl) files into JSON schemas and Lua Config Classes, and save state descriptions into the save state packing module. `generate.py` is a thin command line wrapper around it.
+#
+# Only the entry points used by `generate.py` and outside tooling are exported here. Helpers are imported from their submodules,
+# e.g. `from doclang.lua import docld_to_lua_context`.
+#
+# The `beautifier` (ANSI colors and pretty printing) and `html` (legacy documentation) modules are only needed by some callers,
+# so they are not imported until they are accessed, e.g. `doclang.beautifier.C_RED`.
+
+import importlib
+
+from .utils import load_file, save_file, load_json, save_json, indent_text
+from .docld import docl_to_docld
+from .schema import docld_to_schema, schema_get_hash, docl_to_schema
+from .lua import docld_to_lua, docl_to_lua
+from .pipeline import (
+	docl_load_file, docl_load_all,
+	docld_all_to_schemas, docld_all_to_configs, docld_all_to_python, docl_all_to_schemas, docl_all_to_configs, docl_all_to_python,
+	save_schemas, docl_is_config_class_protected, save_configs,
+	docl_test_all_configs
+)
+from .batch import batch_load_shared, batch_validate_game, batch_stamp_game, batch_process
+from .generators import generators_optimize_game
+from .fuzz import fuzz_run, fuzz_measure_scaling
+from .maps import MAP_CATALOG_PATH, maps_build_catalog, maps_compare_catalog
+from .grids import PATH_GRID_NAME, path_grids_build_game
+from .particles import particle_analyze_game
+from .sounds import sound_analyze_game
+from .fonts import font_get_metrics_path, fonts_bake_game
+from .locales import LOCALE_TABLE_PATH, locales_compile_game
+from .trains import TRAIN_PRESETS_PATH, trains_compile_game
+from .speeds import SPEED_TABLES_PATH, speeds_bake_game
+from .providers import PROVIDER_TIERS_PATH, providers_classify_game
+from .selectors import SELECTOR_MASKS_PATH, selectors_compile_game
+from .layers import layers_validate_game
+from .chunks import JSON_CHUNK_SUFFIX, chunks_convert_game
+from .diff import DIFF_KINDS, docld_load_revision, docld_save_manifest, docld_diff_get_affected_data, docld_diff_impact
+from .dedup import dedup_game, dedup_save_build
+from .memory import MEMORY_CATEGORIES, memory_estimate_game
+from .usage import usage_report, usage_report_file
+from .corpus import CORPUS_DEFAULT_SCALE, corpus_generate_game, corpus_check_game
+from .savestates import savestate_load_all, savestate_all_to_schemas, savestate_all_to_lua
+
+_LAZY_MODULES = ["beautifier", "html"]
+
+def __getattr__(name):
+	if name in _LAZY_MODULES:
+		return importlib.import_module("." + name, __name__)
+	raise AttributeError("module " + repr(__name__) + " has no attribute " + repr(name))
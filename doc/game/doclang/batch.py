@@ -0,0 +1,123 @@
+# Batch mode: validates many game (and mod) folders at once.
+# Everything which does not depend on a particular game (DocLD trees, schemas, `_structures` and compiled validators) is prepared once
+# with `batch_load_shared()` and then shared between all games, which are processed in parallel by worker processes.
+# Validation is pure Python, so threads wouldn't run it in parallel. Compiled validators are closures, which can't be sent to other processes,
+# so the plain schemas are sent instead, and each worker process compiles its own validators once.
+
+import os, time
+from concurrent.futures import ProcessPoolExecutor
+
+from .pipeline import docl_load_all, docld_all_to_schemas
+from .validator import schema_store_new, schema_store_add_all, schema_store_load_structures, schema_store_compile_all, schema_store_validate
+from .utils import load_file, save_file
+from .schema import schema_get_hash
+from .game import game_load_resources, game_resolve_extends, game_set_stamp
+
+
+
+# Parses all DocLang files from `data_path` and structure schemas from `schemas_path` once, and compiles all validators.
+# Returns a dictionary with `docld`, `schemas` and `store` (the compiled schema store) fields.
+def batch_load_shared(data_path, schemas_path):
+	docld = docl_load_all(data_path)
+	schemas = docld_all_to_schemas(docld)
+	store = schema_store_new()
+	schema_store_add_all(store, schemas)
+	schema_store_load_structures(store, schemas_path)
+	schema_store_compile_all(store)
+	return {
+		"docld": docld,
+		"schemas": schemas,
+		"store": store
+	}
+
+# Validates a single resource with its `_extends` chain resolved. Meta fields (`_alias`, `_validated`) are not a part of the schemas and are skipped.
+# Returns a list of error messages.
+def batch_validate_resource(shared, resources, rel_path):
+	resource = resources[rel_path]
+	if resource["data"] == None:
+		return ["<root>: not a valid JSON file"]
+	if not resource["schema"] in shared["store"]["schemas"]:
+		return ["<root>: unknown schema " + resource["schema"]]
+	try:
+		data = game_resolve_extends(resources, rel_path)
+	except Exception as e:
+		return ["_extends: " + str(e)]
+	data = {key: data[key] for key in data if key != "_alias" and key != "_validated"}
+	return schema_store_validate(shared["store"], resource["schema"], data)
+
+# Validates all resources of the game located at `path` against the shared schemas.
+# Returns a dictionary with the following fields:
+#  - `path`: the game path,
+#  - `validated`: the number of validated resources,
+#  - `skipped`: a list of JSON files which are not resources (they have no `$schema` field),
+#  - `errors`: a dictionary of resource paths to lists of error messages, only for resources which failed validation,
+#  - `time`: the time spent on this game, in seconds.
+def batch_validate_game(shared, path):
+	start = time.time()
+	resources = game_load_resources(path)
+	result = {"path": path, "validated": 0, "skipped": [], "errors": {}}
+	for rel_path in resources:
+		if resources[rel_path]["data"] != None and resources[rel_path]["schema"] == None:
+			result["skipped"].append(rel_path)
+			continue
+		errors = batch_validate_resource(shared, resources, rel_path)
+		if len(errors) > 0:
+			result["errors"][rel_path] = errors
+		result["validated"] += 1
+	result["time"] = time.time() - start
+	return result
+
+# Validates all resources of the game located at `path` and stamps the valid ones with the hash of their schema (the `_validated` field),
+# so that the engine constructs them with the trusted Config Class constructors, which perform no checks.
+# Stale stamps are removed from invalid resources. Resources which extend other resources are never stamped.
+# Returns the `batch_validate_game()` result with an additional `stamped` field: a list of stamped resource paths.
+def batch_stamp_game(shared, path):
+	result = batch_validate_game(shared, path)
+	result["stamped"] = []
+	resources = game_load_resources(path)
+	for rel_path in resources:
+		data = resources[rel_path]["data"]
+		if data == None or resources[rel_path]["schema"] == None:
+			continue
+		stamp = None
+		if not rel_path in result["errors"] and not "_extends" in data and resources[rel_path]["schema"] in shared["schemas"]:
+			stamp = schema_get_hash(shared["schemas"][resources[rel_path]["schema"]])
+			result["stamped"].append(rel_path)
+		if data.get("_validated") != stamp:
+			file_path = os.path.join(path, rel_path)
+			save_file(file_path, game_set_stamp(load_file(file_path), stamp))
+	return result
+
+# The shared data of the current worker process of `batch_process()`, set up by `batch_init_worker()`.
+batch_worker_shared = None
+
+# Sets up a worker process of `batch_process()`, given the shared data without compiled validators, and compiles the validators.
+def batch_init_worker(shared):
+	global batch_worker_shared
+	store = schema_store_new()
+	schema_store_add_all(store, shared["store"]["schemas"])
+	schema_store_compile_all(store)
+	batch_worker_shared = {"docld": shared["docld"], "schemas": shared["schemas"], "store": store}
+
+# Validates a single game in a worker process of `batch_process()`.
+def batch_validate_game_worker(path):
+	return batch_validate_game(batch_worker_shared, path)
+
+# Validates all the given games in parallel, using a single shared parse and validator cache.
+# `shared` can be passed in to reuse the result of an earlier `batch_load_shared()` call.
+# `workers` is the number of worker processes, by default one per game, up to the number of CPUs. With a single worker, games are validated in this process.
+# Returns a summary with `games` (a list of `batch_validate_game()` results, in the order of `paths`),
+# `shared_time` (time spent on the shared part, in seconds) and `time` (total time, in seconds).
+def batch_process(paths, data_path, schemas_path, workers = None, shared = None):
+	start = time.time()
+	if shared == None:
+		shared = batch_load_shared(data_path, schemas_path)
+	shared_time = time.time() - start
+	workers = workers or min(len(paths), os.cpu_count() or 1) or 1
+	if workers == 1:
+		games = [batch_validate_game(shared, path) for path in paths]
+	else:
+		plain = {"docld": shared["docld"], "schemas": shared["schemas"], "store": {"schemas": shared["store"]["schemas"], "validators": {}}}
+		with ProcessPoolExecutor(max_workers = workers, initializer = batch_init_worker, initargs = (plain,)) as executor:
+			games = list(executor.map(batch_validate_game_worker, paths))
+	return {"games": games, "shared_time": shared_time, "time": time.time() - start}
@@ -0,0 +1,114 @@
+# ANSI colors and the pretty printer used by the command line interface.
+# This module is loaded lazily (see `doclang.__getattr__`), so importing the library does not pull it in.
+
+
+
+#
+#    COLORS
+#
+
+C_RESET = "\33[0m"
+C_BOLD = "\33[1m"
+C_RED = "\33[91m"
+C_GREEN = "\33[92m"
+C_YELLOW = "\33[93m"
+C_CYAN = "\33[96m"
+C_WHITE = "\33[97m"
+
+
+
+#
+#    BEAUTIFIER
+#
+
+
+def get_pretty_value(value, indent):
+	if type(value) is dict:
+		return get_pretty_dict(value, indent + 1)
+	elif type(value) is list:
+		return get_pretty_list(value, indent + 1)
+	elif type(value) is int or type(value) is float:
+		return C_BOLD + C_YELLOW + str(value) + C_RESET
+	elif type(value) is str:
+		if "\33" in value:
+			return C_BOLD + C_YELLOW + "<\"" + C_RESET + value + C_RESET + C_BOLD + C_YELLOW + "\">" + C_RESET
+		else:
+			return C_BOLD + "\"" + value + "\"" + C_RESET
+	elif type(value) is bool:
+		if value:
+			return C_BOLD + C_GREEN + "True" + C_RESET
+		else:
+			return C_BOLD + C_RED + "False" + C_RESET
+	else:
+		return str(value)
+
+
+
+def get_pretty_dict(data, indent = 0):
+	keys = list(data.keys())
+	keys.sort()
+	# Type key will be always first.
+	if "type" in keys:
+		keys.remove("type")
+		keys = ["type"] + keys
+	###
+	has_compound_values = False
+	for key in keys:
+		if type(data[key]) is dict or type(data[key]) is list:
+			has_compound_values = True
+			break
+	s = "{"
+	if has_compound_values:
+		s += "\n"
+	for key in keys:
+		value = data[key]
+		value_str = get_pretty_value(value, indent)
+		if has_compound_values:
+			s += " " * ((indent + 1) * 4)
+		if key == "type":
+			s += C_YELLOW + key + C_RESET + ": " + value_str
+		else:
+			s += key + ": " + value_str
+		if key != keys[-1]:
+			s += ","
+			if not has_compound_values:
+				s += " "
+		if has_compound_values:
+			s += "\n"
+	if has_compound_values:
+		s += " " * (indent * 4)
+	s += "}"
+	return s
+
+
+
+def get_pretty_list(data, indent = 0):
+	has_compound_values = False
+	for value in data:
+		if type(value) is dict or type(value) is list:
+			has_compound_values = True
+			break
+	s = "["
+	if has_compound_values:
+		s += "\n"
+	for i in range(len(data)):
+		value = data[i]
+		value_str = get_pretty_value(value, indent)
+		if has_compound_values:
+			s += " " * ((indent + 1) * 4)
+		s += value_str
+		if i != len(data) - 1:
+			s += ","
+			if not has_compound_values:
+				s += " "
+		if has_compound_values:
+			s += "\n"
+	if has_compound_values:
+		s += " " * (indent * 4)
+	s += "]"
+	return s
+
+
+
+def print_pretty_dict(data):
+	print(get_pretty_dict(data))
@@ -0,0 +1,125 @@
+# JSON chunk converter.
+# Converts every JSON file of a game into an equivalent Lua chunk (`<file>.json.lua`, a single `return {...}` statement), so that the engine
+# can load it with the Lua parser instead of decoding it with `com/json.lua`, which is much slower.
+# Next to each chunk, a `<file>.json.hash` sidecar holds the SHA-1 hash of the JSON file the chunk was made from.
+# `_Utils.loadJson()` only uses a chunk if that hash matches the current JSON file, and decodes the JSON file otherwise.
+
+import os, re, math, json, hashlib
+
+from .game import game_find_files
+
+
+# Suffixes which are appended to the path of a JSON file to get the paths of its chunk and its hash sidecar.
+JSON_CHUNK_SUFFIX = ".lua"
+JSON_HASH_SUFFIX = ".hash"
+
+# Lua chunks can't have more than this many distinct string or number constants.
+CHUNK_MAX_CONSTANTS = 65535
+
+LUA_KEYWORDS = [
+	"and", "break", "do", "else", "elseif", "end", "false", "for", "function", "goto", "if", "in",
+	"local", "nil", "not", "or", "repeat", "return", "then", "true", "until", "while"
+]
+LUA_IDENTIFIER_PATTERN = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+LUA_STRING_ESCAPES = {"\\": "\\\\", "\"": "\\\"", "\n": "\\n", "\r": "\\r", "\t": "\\t"}
+
+
+
+# Returns the SHA-1 hash of the raw (binary) contents of a JSON file, as stored in its hash sidecar.
+def chunk_get_hash(contents):
+	return hashlib.sha1(contents).hexdigest()
+
+# Converts a string to a Lua string literal. Non-ASCII characters are kept as they are, since Lua strings are just bytes.
+def chunk_string_to_lua(string):
+	out = "\""
+	for character in string:
+		if character in LUA_STRING_ESCAPES:
+			out += LUA_STRING_ESCAPES[character]
+		elif ord(character) < 32 or ord(character) == 127:
+			out += "\\%03d" % ord(character)
+		else:
+			out += character
+	return out + "\""
+
+# Converts decoded JSON data to a Lua expression which evaluates to the same table `com/json.lua` would decode it to.
+# `null`s are omitted from objects and leave holes in arrays, and both empty objects and empty arrays become `{}`.
+# `constants` is a set which collects all string and number constants, so that the caller can check the chunk isn't too big.
+def chunk_value_to_lua(value, constants):
+	if value == None:
+		return "nil"
+	elif value is True:
+		return "true"
+	elif value is False:
+		return "false"
+	elif type(value) is int or type(value) is float:
+		if type(value) is float and not math.isfinite(value):
+			raise ValueError("JSON numbers must be finite, got " + str(value))
+		constants.add(("number", value))
+		return repr(value)
+	elif type(value) is str:
+		constants.add(("string", value))
+		return chunk_string_to_lua(value)
+	elif type(value) is list:
+		return "{" + ", ".join(chunk_value_to_lua(item, constants) for item in value) + "}"
+	elif type(value) is dict:
+		fields = []
+		for key in value:
+			if value[key] == None:
+				continue
+			constants.add(("string", key))
+			if LUA_IDENTIFIER_PATTERN.match(key) and not key in LUA_KEYWORDS:
+				fields.append(key + " = " + chunk_value_to_lua(value[key], constants))
+			else:
+				fields.append("[" + chunk_string_to_lua(key) + "] = " + chunk_value_to_lua(value[key], constants))
+		return "{" + ", ".join(fields) + "}"
+	raise ValueError("Unknown JSON value type: " + str(type(value)))
+
+# Converts the raw (binary) contents of a JSON file to a Lua chunk. `rel_path` is only used in the header comment.
+# Throws a `ValueError` if the file is not valid JSON or if the chunk would have too many constants for the Lua parser.
+def chunk_json_to_lua(contents, rel_path):
+	constants = set()
+	expression = chunk_value_to_lua(json.loads(contents), constants)
+	if len(constants) > CHUNK_MAX_CONSTANTS:
+		raise ValueError("too many distinct values (" + str(len(constants)) + ") to fit in a Lua chunk")
+	return "-- Generated from " + rel_path + " by generate.py -jc. Do not edit; regenerate it instead.\nreturn " + expression + "\n"
+
+# Converts all JSON files of the given game folder into Lua chunks. Files whose hash sidecar is up to date are skipped.
+# Chunks and hash sidecars of JSON files which no longer exist are removed.
+# Returns `{"converted": [path], "up_to_date": [path], "removed": [path], "errors": {path: message}}`.
+def chunks_convert_game(path):
+	out = {"converted": [], "up_to_date": [], "removed": [], "errors": {}}
+	for rel_path in game_find_files(path, ".json"):
+		full_path = os.path.join(path, rel_path)
+		with open(full_path, "rb") as file:
+			contents = file.read()
+		hash = chunk_get_hash(contents)
+		try:
+			with open(full_path + JSON_HASH_SUFFIX, "r") as file:
+				if file.read().strip() == hash and os.path.exists(full_path + JSON_CHUNK_SUFFIX):
+					out["up_to_date"].append(rel_path)
+					continue
+		except IOError:
+			pass
+		try:
+			# Encoding can fail as well, e.g. on lone surrogates, so it's done before anything is written.
+			chunk = chunk_json_to_lua(contents, rel_path).encode("utf-8")
+			with open(full_path + JSON_CHUNK_SUFFIX, "wb") as file:
+				file.write(chunk)
+			with open(full_path + JSON_HASH_SUFFIX, "w") as file:
+				file.write(hash)
+		except Exception as e:
+			out["errors"][rel_path] = str(e)
+			# Without the hash sidecar, the engine loads the JSON file instead of an outdated or partially written chunk.
+			if os.path.exists(full_path + JSON_HASH_SUFFIX):
+				os.remove(full_path + JSON_HASH_SUFFIX)
+			continue
+		out["converted"].append(rel_path)
+
+	for rel_path in game_find_files(path, ".json" + JSON_HASH_SUFFIX):
+		json_path = os.path.join(path, rel_path[:-len(JSON_HASH_SUFFIX)])
+		if not os.path.exists(json_path):
+			for suffix in [JSON_CHUNK_SUFFIX, JSON_HASH_SUFFIX]:
+				if os.path.exists(json_path + suffix):
+					os.remove(json_path + suffix)
+			out["removed"].append(rel_path[:-len(JSON_HASH_SUFFIX)])
+	return out
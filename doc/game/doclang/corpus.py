@@ -0,0 +1,310 @@
+# Synthetic game corpus generator.
+# Generates a large, schema-valid game folder for load and scale testing: thousands of Sprites and Sound Events, hundreds of maps
+# with long paths, deep `_extends` chains and long lists of Expressions. Resource contents are generated from the DocLD trees,
+# so the corpus keeps up with the DocLang files. The same seed and scale always produce the same corpus, byte for byte,
+# so that every optimization of the loading code can be measured against it.
+# The corpus exercises the loading paths (resource scanning, map scanning, Config Class construction), it is not a playable game.
+
+import os, re, math, json, zlib, wave, random, struct
+
+from .walker import docld_get_type_map
+from .game import game_load_resources
+from .pipeline import docld_all_to_python
+
+
+# The default scale of a corpus. Any of these can be overridden.
+# - `images`, `sounds`: the number of image and sound files, which Sprites and Sound Events refer to,
+# - `sprites`, `sound_events`: the number of Sprites and Sound Events,
+# - `maps`, `paths`, `path_nodes`: the number of maps, paths per map and nodes per path,
+# - `extends_depth`: the length of `_extends` chains; every resource extends the previous one, except for the first one of each chain,
+# - `expressions`: the number of conditions of each Sound Event entry, all of which are Expressions.
+CORPUS_DEFAULT_SCALE = {
+	"images": 16,
+	"sounds": 16,
+	"sprites": 2000,
+	"sound_events": 2000,
+	"maps": 200,
+	"paths": 1,
+	"path_nodes": 10000,
+	"extends_depth": 16,
+	"expressions": 64
+}
+
+# The engine version corpus games are made for.
+CORPUS_ENGINE_VERSION = "v0.52.1"
+
+CORPUS_WORDS = ["apple", "sphere", "path", "shooter", "level", "color", "speed", "delay", "chain", "bonus", "score", "frame", "layer", "sound", "effect", "magic"]
+# Structures which are objects with numeric fields, along with the bounds of these fields.
+# Vectors are kept positive, as most of them are sizes or positions on screen.
+CORPUS_STRUCTURES = {"Vector2": (["x", "y"], 1, 512), "Vector3": (["x", "y", "z"], 1, 512), "Color": (["r", "g", "b"], 0, 1)}
+# The chance of an optional field being generated.
+CORPUS_OPTIONAL_RATE = 0.5
+# The default chance of an Expression-capable value being generated as an Expression.
+CORPUS_EXPRESSION_RATE = 0.25
+# The distance between two neighboring path nodes, in pixels.
+CORPUS_NODE_DISTANCE = 8
+
+
+
+#
+#    VALUES
+#
+
+# Returns a random Expression of the given type, ex. `"${3 * 4 + 1}"` or `"${3 < 4 && 2 == 2}"`.
+def corpus_random_expression(rng, value_type):
+	def term():
+		return " ".join(str(rng.randint(1, 9)) + " " + rng.choice(["+", "-", "*"]) for i in range(rng.randint(0, 2))) + " " + str(rng.randint(1, 9))
+	if value_type == "boolean":
+		return "${" + " && ".join(term().strip() + " " + rng.choice(["<", ">", "==", "<="]) + " " + term().strip() for i in range(rng.randint(1, 3))) + "}"
+	return "${" + term().strip() + "}"
+
+# Returns a random number within the bounds given by DocLD constraints, ex. `[">=0", "<1"]`.
+def corpus_random_number(rng, constraints, integer):
+	low, high = None, None
+	for constraint in constraints:
+		bound = float(constraint.lstrip("<>="))
+		if constraint.startswith(">="):
+			low = bound
+		elif constraint.startswith(">"):
+			low = bound + (1 if integer else 0.01)
+		elif constraint.startswith("<="):
+			high = bound
+		elif constraint.startswith("<"):
+			high = bound - (1 if integer else 0.01)
+	if low == None:
+		low = min(0, high if high != None else 0) - 100 if high != None and high < 0 else (0 if high != None else -100)
+	if high == None:
+		high = low + 100 if low > 0 else 100
+	if integer:
+		return rng.randint(math.ceil(low), math.floor(high))
+	return round(rng.uniform(low, high), 2)
+
+# Returns a random key matching the given Regex Object regex, different for each index.
+# Throws a `ValueError` if no key can be found.
+def corpus_random_key(rng, regex, index):
+	for key in [rng.choice(CORPUS_WORDS) + str(index), str(index), "-" + str(index + 1)]:
+		if re.match(regex, key):
+			return key
+	raise ValueError("no key matches " + regex)
+
+# Returns a random value valid against the given DocLD entry.
+# `state` is a dictionary of the following fields:
+# - `rng`: the `random.Random` instance to be used,
+# - `docld`, `type_map`: all DocLD trees and the result of `docld_get_type_map()` for them,
+# - `references`: a dictionary of DocLang type names to the lists of paths of generated resources (or files) of these types,
+# - `inline`: a list of DocLang type names which are generated inline instead of referred to,
+# - `lengths`: a dictionary of field names to the lengths of arrays and Regex Objects stored in these fields,
+# - `required`, `excluded`: lists of names of optional fields which are always and never generated, respectively; required fields are unaffected,
+# - `expression_rate`: the chance of an Expression-capable value being generated as an Expression.
+# Throws a `ValueError` if no valid value can be generated, ex. a reference to a type of which there are no resources.
+def corpus_random_value(state, entry, name = None):
+	rng = state["rng"]
+	if "const" in entry:
+		return entry["const"]
+	if "types" in entry:
+		choices = list(entry["types"])
+		rng.shuffle(choices)
+		for choice in choices:
+			try:
+				return corpus_random_value(state, choice, name)
+			except ValueError:
+				pass
+		raise ValueError("no choice of " + str(name) + " can be generated")
+
+	value_type = entry.get("type")
+	if value_type == None:
+		return rng.randint(0, 9)
+	elif value_type == "object":
+		return corpus_random_object(state, entry, name)
+	elif value_type == "array":
+		return [corpus_random_value(state, entry["children"][0]) for i in range(state["lengths"].get(name, rng.randint(1, 3)))]
+	elif entry.get("expression") and value_type in ["number", "integer", "boolean"] and rng.random() < state["expression_rate"]:
+		return corpus_random_expression(rng, value_type)
+	elif value_type in ["number", "integer"]:
+		return corpus_random_number(rng, entry.get("constraints", []), value_type == "integer")
+	elif value_type == "boolean":
+		return rng.random() < 0.5
+	elif value_type == "string":
+		if "children" in entry:
+			return rng.choice(entry["children"])["const"]
+		return " ".join(rng.choice(CORPUS_WORDS) for i in range(rng.randint(1, 3)))
+	elif value_type in CORPUS_STRUCTURES:
+		fields, low, high = CORPUS_STRUCTURES[value_type]
+		return {field: round(rng.uniform(low, high), 2) for field in fields}
+	elif len(state["references"].get(value_type, [])) > 0:
+		return rng.choice(state["references"][value_type])
+	elif value_type in state["inline"] and value_type in state["type_map"]:
+		return corpus_random_value(state, state["docld"][state["type_map"][value_type]], name)
+	raise ValueError("can't generate a value of type " + value_type)
+
+# Returns a random object valid against the given DocLD object entry. See `corpus_random_value()`.
+def corpus_random_object(state, entry, name):
+	rng = state["rng"]
+	children = entry.get("children", [])
+	out = {}
+	if "regex" in entry or (len(children) > 0 and not "keyconst" in entry and not "name" in children[0]):
+		for i in range(state["lengths"].get(name, rng.randint(1, 3))):
+			out[corpus_random_key(rng, entry.get("regex", "^.*$"), i)] = corpus_random_value(state, children[0])
+		return out
+
+	fields = []
+	if "keyconst" in entry:
+		choice = rng.choice([child for child in children if "const" in child])
+		out[entry["keyconst"]] = choice["const"]
+		fields += choice.get("children", [])
+	fields += [child for child in children if "name" in child]
+	for child in fields:
+		if child["optional"] and (child["name"] in state["excluded"] or (not child["name"] in state["required"] and rng.random() >= CORPUS_OPTIONAL_RATE)):
+			continue
+		try:
+			out[child["name"]] = corpus_random_value(state, child, child["name"])
+		except ValueError:
+			if not child["optional"]:
+				raise
+	return out
+
+
+
+#
+#    FILES
+#
+
+# Returns a minimal PNG image of the given size, filled with a single color.
+def corpus_make_png(width, height, color):
+	def chunk(name, data):
+		return struct.pack(">I", len(data)) + name + data + struct.pack(">I", zlib.crc32(name + data) & 0xffffffff)
+	rows = b"".join(b"\x00" + bytes(color) * width for i in range(height))
+	return b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)) + chunk(b"IDAT", zlib.compress(rows)) + chunk(b"IEND", b"")
+
+# Writes a short, silent WAV file.
+def corpus_write_wav(path, frames):
+	with wave.open(path, "wb") as file:
+		file.setnchannels(1)
+		file.setsampwidth(2)
+		file.setframerate(22050)
+		file.writeframes(b"\x00\x00" * frames)
+
+# Returns the `$schema` field of a resource located at the given path relative to a game folder,
+# assuming the game folder is inside the `games` folder of the engine, like all games are.
+def corpus_get_schema_field(rel_path, schema_path):
+	return "../" * (rel_path.count("/") + 2) + "schemas/" + schema_path
+
+# Saves a resource. Resources are saved without indentation and with sorted keys, so that the same data always gives the same file.
+def corpus_save_resource(path, rel_path, schema_path, data):
+	full_path = os.path.join(path, rel_path)
+	os.makedirs(os.path.dirname(full_path), exist_ok = True)
+	contents = json.dumps(dict({"$schema": corpus_get_schema_field(rel_path, schema_path)}, **data), sort_keys = True)
+	with open(full_path, "w", encoding = "utf-8", newline = "\n") as file:
+		file.write(contents)
+	return len(contents)
+
+# Returns the names of the fields of the given DocLD entry which are required arrays or Regex Objects.
+# Config Class constructors only take these from the resource data itself, never from its base resource.
+def corpus_get_own_fields(entry):
+	out = []
+	for child in entry.get("children", []):
+		if "name" in child and not child["optional"] and (child.get("type") == "array" or (child.get("type") == "object" and "regex" in child)):
+			out.append(child["name"])
+	return out
+
+# Generates `count` resources of the given type, as `<folder>/<name>_<index>.json`, in `_extends` chains of the given depth.
+# Resources which extend another one only override a few of its fields, and keep the fields returned by `corpus_get_own_fields()`.
+# Returns the list of resource paths and the number of bytes written.
+def corpus_generate_resources(state, path, docl_path, folder, name, count, depth):
+	schema_path = docl_path[:-5] + ".json"
+	own_fields = corpus_get_own_fields(state["docld"][docl_path])
+	out = []
+	size = 0
+	for i in range(count):
+		rel_path = folder + "/" + name + "_" + str(i) + ".json"
+		data = corpus_random_value(state, state["docld"][docl_path])
+		if i % depth != 0:
+			keys = sorted(key for key in data if not key in own_fields)
+			keys = [key for key in own_fields if key in data] + state["rng"].sample(keys, min(len(keys), state["rng"].randint(1, 2)))
+			data = {key: data[key] for key in keys}
+			data["_extends"] = out[-1]
+		size += corpus_save_resource(path, rel_path, schema_path, data)
+		out.append(rel_path)
+	return out, size
+
+# Returns a path of the given number of nodes, as a random walk: each node is `CORPUS_NODE_DISTANCE` pixels from the previous one,
+# and the direction slowly turns, so that paths wind around like real ones do.
+def corpus_random_path(rng, count):
+	x, y = rng.uniform(0, 800), rng.uniform(0, 600)
+	angle = rng.uniform(0, math.pi * 2)
+	nodes = []
+	for i in range(count):
+		nodes.append({"x": round(x, 2), "y": round(y, 2)})
+		angle += rng.uniform(-0.2, 0.2)
+		x += math.cos(angle) * CORPUS_NODE_DISTANCE
+		y += math.sin(angle) * CORPUS_NODE_DISTANCE
+	return {"nodes": nodes}
+
+# Generates a synthetic game corpus in the given folder, which should be empty or nonexistent.
+# `scale` overrides any of the `CORPUS_DEFAULT_SCALE` fields. Returns `{"files": {kind: count}, "bytes": number of bytes written}`.
+def corpus_generate_game(docld, path, seed = 0, scale = None):
+	scale = dict(CORPUS_DEFAULT_SCALE, **(scale or {}))
+	rng = random.Random(seed)
+	state = {"rng": rng, "docld": docld, "type_map": docld_get_type_map(docld), "references": {}, "inline": [], "lengths": {}, "required": [], "excluded": [], "expression_rate": CORPUS_EXPRESSION_RATE}
+	out = {"files": {}, "bytes": 0}
+
+	state["references"]["Image"] = []
+	for i in range(scale["images"]):
+		rel_path = "images/image_" + str(i) + ".png"
+		os.makedirs(os.path.join(path, "images"), exist_ok = True)
+		contents = corpus_make_png(16, 16, [rng.randint(0, 255) for j in range(3)])
+		with open(os.path.join(path, rel_path), "wb") as file:
+			file.write(contents)
+		state["references"]["Image"].append(rel_path)
+		out["bytes"] += len(contents)
+	state["references"]["Sound"] = []
+	for i in range(scale["sounds"]):
+		rel_path = "sounds/sound_" + str(i) + ".wav"
+		os.makedirs(os.path.join(path, "sounds"), exist_ok = True)
+		frames = rng.randint(100, 2000)
+		corpus_write_wav(os.path.join(path, rel_path), frames)
+		state["references"]["Sound"].append(rel_path)
+		out["bytes"] += frames * 2
+	out["files"]["images"] = scale["images"]
+	out["files"]["sounds"] = scale["sounds"]
+
+	state["references"]["Sprite"], size = corpus_generate_resources(state, path, "sprite.docl", "sprites", "sprite", scale["sprites"], scale["extends_depth"])
+	out["files"]["sprites"] = scale["sprites"]
+	out["bytes"] += size
+	# Sound Events are generated as lists of entries, each with a full list of conditions. `sound` can't coexist with `sounds`.
+	state.update({"lengths": {"conditions": scale["expressions"]}, "required": ["sounds", "conditions"], "excluded": ["sound"], "expression_rate": 1})
+	state["references"]["SoundEvent"], size = corpus_generate_resources(state, path, "sound_event.docl", "sound_events", "sound_event", scale["sound_events"], scale["extends_depth"])
+	state.update({"lengths": {}, "required": [], "excluded": [], "expression_rate": CORPUS_EXPRESSION_RATE})
+	out["files"]["sound_events"] = scale["sound_events"]
+	out["bytes"] += size
+
+	for i in range(scale["maps"]):
+		data = {"name": "Map " + str(i), "paths": [corpus_random_path(rng, scale["path_nodes"]) for j in range(scale["paths"])], "objects": []}
+		out["bytes"] += corpus_save_resource(path, "maps/map_" + str(i) + "/config.json", "map.json", data)
+	out["files"]["maps"] = scale["maps"]
+
+	data = corpus_random_value(state, docld["game.docl"])
+	data.update({"name": "Synthetic Corpus " + str(seed), "engineVersion": CORPUS_ENGINE_VERSION, "tickRate": 60})
+	out["bytes"] += corpus_save_resource(path, "config.json", "game.json", data)
+	return out
+
+# Loads every resource of the given game folder the way the engine's Config Classes do, using the loaders generated by `docld_all_to_python()`,
+# which mirror the Lua constructors, down to missing required arrays being errors. Schema validation alone can't tell whether a resource
+# which extends another one can be constructed, so this makes sure that the corpus actually gets through Config Class construction.
+# Returns `{"loaded": number of resources loaded, "errors": {path: message}}`.
+def corpus_check_game(docld, path):
+	module = {}
+	exec(docld_all_to_python(docld), module)
+	resources = {}
+	for rel_path, resource in game_load_resources(path).items():
+		if resource["schema"] in module["CONFIG_LOADERS"]:
+			resources[rel_path] = resource["data"]
+	out = {"loaded": 0, "errors": {}}
+	cache = {}
+	for rel_path in sorted(resources):
+		try:
+			module["load_resource"](resources, rel_path, cache)
+			out["loaded"] += 1
+		except Exception as e:
+			out["errors"][rel_path] = str(e)
+	return out
@@ -0,0 +1,230 @@
+# Asset deduplicator.
+# `ResourceManager` keys resources by their path, so byte-identical images, sounds and resources stored under different paths
+# are loaded and kept in memory once for each path. This tool hashes every asset, groups identical ones, picks a canonical path
+# for each group and rewrites every reference to the others, so that the duplicates can be left out of the build.
+# References are found through the DocLD trees (fields of types such as `Sprite`, `Image`, `Sound` or `SoundEvent`, and `_extends`).
+# Resources are compared without their `$schema` field, which depends on their folder. Rewriting references can make more resources
+# identical (e.g. two Sprites using two copies of the same image), so the process repeats until no new duplicates are found.
+# Assets which can be referred to in a way that can't be rewritten are pinned and never removed: files at fixed paths (the game config,
+# the `config` folder, map configs and Spheres, whose color is in their path), files whose name appears in any other file, like a UI script,
+# and resources of the types whose paths are stored in save data (profiles and saved levels), which would otherwise point at removed files.
+# Files generated by the other tools (JSON chunks, Font metrics, the map catalog, ...) are not searched for file names, as they repeat
+# the paths of the files they were made from. The chunks of removed and rewritten resources are left out of the build.
+
+import os, re, json, shutil, hashlib
+
+from .utils import save_json
+from .game import game_find_files, game_get_schema_path, game_get_docl_path, game_load_json
+from .walker import docld_get_type_map, docld_walk, data_set
+from .fonts import FONT_METRICS_SUFFIX, font_get_png_size
+from .chunks import JSON_CHUNK_SUFFIX, JSON_HASH_SUFFIX
+from .maps import MAP_CATALOG_PATH
+from .grids import PATH_GRID_NAME
+from .locales import LOCALE_TABLE_PATH
+from .trains import TRAIN_PRESETS_PATH
+from .speeds import SPEED_TABLES_PATH
+from .providers import PROVIDER_TIERS_PATH
+from .selectors import SELECTOR_MASKS_PATH
+
+
+# Extensions of asset files, as in `ResourceManager.EXTENSION_TO_RESOURCE_MAP`, along with their resource types.
+DEDUP_EXTENSIONS = {"png": "Image", "ogg": "Sound", "mp3": "Sound", "wav": "Sound", "ttf": "FontFile", "glsl": "Shader"}
+
+# DocLang types whose values are never references.
+DEDUP_VALUE_TYPES = ["number", "integer", "boolean", "string", "object", "array", "Vector2", "Vector3", "Color"]
+
+# Paths of files which the engine loads from a fixed location. These files are never removed.
+DEDUP_PINNED_PATTERNS = [re.compile(r"^[^/]+$"), re.compile(r"^config/"), re.compile(r"^maps/[^/]+/config\.json$"), re.compile(r"^spheres/sphere_-?\d+\.json$")]
+
+# Resource types whose paths are stored in save data with `ResourceManager:getResourceReference()`: Level Sets in profiles,
+# Levels and Difficulties in profile sessions, and Collectibles, Collectible Generators, Projectiles and Path Entities in saved levels.
+# Resources of these types are never removed, so that existing save data keeps pointing at them.
+DEDUP_PERSISTED_TYPES = ["LevelSet", "Level", "Difficulty", "Collectible", "CollectibleGenerator", "Projectile", "PathEntity"]
+
+# Suffixes of the files generated next to game files, as skipped by `ResourceManager:scanResources()`, and paths of the other generated files.
+DEDUP_GENERATED_SUFFIXES = [".json" + JSON_CHUNK_SUFFIX, ".json" + JSON_HASH_SUFFIX, FONT_METRICS_SUFFIX]
+DEDUP_GENERATED_PATHS = [MAP_CATALOG_PATH, LOCALE_TABLE_PATH, TRAIN_PRESETS_PATH, SPEED_TABLES_PATH, PROVIDER_TIERS_PATH, SELECTOR_MASKS_PATH]
+DEDUP_GENERATED_PATTERNS = [re.compile(r"^maps/[^/]+/" + re.escape(PATH_GRID_NAME) + "$")]
+
+# Matches file names in text files, used to pin assets referred to outside of resources.
+DEDUP_FILE_NAME_PATTERN = re.compile(r"[\w\-.]+\.(?:" + "|".join(list(DEDUP_EXTENSIONS) + ["json"]) + r")\b")
+
+# The number of bytes an image takes in video memory per pixel, once loaded as an RGBA8 texture.
+DEDUP_BYTES_PER_PIXEL = 4
+
+
+
+# Returns the content hash of a resource: its data without the `$schema` field, along with the schema it uses.
+def dedup_hash_resource(data):
+	contents = [game_get_schema_path(data), {key: data[key] for key in data if key != "$schema"}]
+	return hashlib.sha1(json.dumps(contents, sort_keys = True).encode("utf-8")).hexdigest()
+
+# Returns the content hash of an asset file.
+def dedup_hash_file(path):
+	with open(path, "rb") as file:
+		return hashlib.sha1(file.read()).hexdigest()
+
+# Returns the set of file names which appear in the given files, which are not assets.
+def dedup_find_file_names(path, rel_paths):
+	out = set()
+	for rel_path in rel_paths:
+		try:
+			with open(os.path.join(path, rel_path), "r", encoding = "utf-8") as file:
+				out.update(DEDUP_FILE_NAME_PATTERN.findall(file.read()))
+		except (IOError, UnicodeDecodeError):
+			pass
+	return out
+
+# Returns whether the file at the given path has been generated by one of the other tools.
+def dedup_is_generated(rel_path):
+	if rel_path in DEDUP_GENERATED_PATHS:
+		return True
+	for suffix in DEDUP_GENERATED_SUFFIXES:
+		if rel_path.endswith(suffix):
+			return True
+	for pattern in DEDUP_GENERATED_PATTERNS:
+		if pattern.match(rel_path):
+			return True
+	return False
+
+# Returns whether an asset at the given path is pinned, i.e. it must stay in the build. See the module comment.
+def dedup_is_pinned(rel_path, file_names):
+	for pattern in DEDUP_PINNED_PATTERNS:
+		if pattern.match(rel_path):
+			return True
+	return os.path.basename(rel_path) in file_names
+
+# Picks the canonical path out of a group of identical assets: a pinned one, then one outside of map folders (which are loaded
+# in the `map` batch), then the shortest path. All other pinned assets in the group stay in the build under their own paths.
+def dedup_pick_canonical(rel_paths, pinned):
+	return sorted(rel_paths, key = lambda rel_path: (not rel_path in pinned, rel_path.startswith("maps/"), len(rel_path), rel_path))[0]
+
+# Returns the list of references in the given resource data, as `(fields, path)` tuples, including `_extends`.
+def dedup_find_references(docld, schema, data):
+	out = []
+	if type(data.get("_extends")) is str:
+		out.append((["_extends"], data["_extends"]))
+	def callback(entry, value, fields):
+		if type(value) is str and entry.get("type") != None and not entry["type"] in DEDUP_VALUE_TYPES:
+			out.append((fields, value))
+	docld_walk(docld[game_get_docl_path(schema)], data, callback, docld)
+	return out
+
+# Rewrites all references of the given resources according to the given dictionary of old paths to new paths.
+# Returns the number of references rewritten.
+def dedup_rewrite_references(docld, resources, replaced):
+	count = 0
+	for rel_path in resources:
+		data = resources[rel_path]
+		for fields, value in dedup_find_references(docld, game_get_schema_path(data), data):
+			if value in replaced:
+				data_set(data, fields, replaced[value])
+				count += 1
+	return count
+
+# Returns the number of bytes a duplicate would take in video memory, which is only the case for images.
+def dedup_get_vram(path, rel_path):
+	if not rel_path.endswith(".png"):
+		return 0
+	width, height = font_get_png_size(os.path.join(path, rel_path))
+	return width * height * DEDUP_BYTES_PER_PIXEL
+
+# Deduplicates the assets of the given game folder, using the DocLD trees of all resource types to find references.
+# Returns `{"resources": {path: rewritten data}, "removed": {duplicate path: canonical path}, "groups": [{"canonical", "duplicates", "bytes", "vram"}],
+# ranked by the memory saved, "bytes": file bytes saved, "vram": video memory bytes saved, "rewritten": number of references rewritten,
+# "persisted_types": `DEDUP_PERSISTED_TYPES`, "errors": {path: message}}`.
+# Only the resources whose references have changed are listed in `resources`.
+def dedup_game(docld, path):
+	out = {"resources": {}, "removed": {}, "groups": [], "bytes": 0, "vram": 0, "rewritten": 0, "persisted_types": DEDUP_PERSISTED_TYPES, "errors": {}}
+	type_map = docld_get_type_map(docld)
+	persisted = [type_map[type_name] for type_name in DEDUP_PERSISTED_TYPES if type_name in type_map]
+	resources = {}
+	files = []
+	others = []
+	for rel_path in game_find_files(path):
+		extension = rel_path.split(".")[-1]
+		if extension in DEDUP_EXTENSIONS:
+			files.append(rel_path)
+			continue
+		if dedup_is_generated(rel_path):
+			continue
+		data = game_load_json(os.path.join(path, rel_path)) if extension == "json" else None
+		schema = game_get_schema_path(data)
+		if schema != None and game_get_docl_path(schema) in docld:
+			resources[rel_path] = data
+		else:
+			others.append(rel_path)
+	file_names = dedup_find_file_names(path, others)
+	pinned = set(rel_path for rel_path in files + list(resources) if dedup_is_pinned(rel_path, file_names))
+	pinned.update(rel_path for rel_path in resources if game_get_docl_path(game_get_schema_path(resources[rel_path])) in persisted)
+	original = json.loads(json.dumps(resources))
+
+	hashes = {}
+	for rel_path in files:
+		hashes[rel_path] = dedup_hash_file(os.path.join(path, rel_path))
+	while True:
+		for rel_path in resources:
+			hashes[rel_path] = dedup_hash_resource(resources[rel_path])
+		groups = {}
+		for rel_path in hashes:
+			groups.setdefault(hashes[rel_path], []).append(rel_path)
+		replaced = {}
+		for key in groups:
+			if len(groups[key]) < 2:
+				continue
+			canonical = dedup_pick_canonical(groups[key], pinned)
+			duplicates = [rel_path for rel_path in groups[key] if rel_path != canonical and not rel_path in pinned]
+			if len(duplicates) == 0:
+				continue
+			group = {"canonical": canonical, "duplicates": duplicates, "bytes": 0, "vram": 0}
+			for rel_path in duplicates:
+				replaced[rel_path] = canonical
+				group["bytes"] += os.path.getsize(os.path.join(path, rel_path))
+				try:
+					group["vram"] += dedup_get_vram(path, rel_path)
+				except Exception as e:
+					out["errors"][rel_path] = str(e)
+			out["groups"].append(group)
+			out["bytes"] += group["bytes"]
+			out["vram"] += group["vram"]
+		if len(replaced) == 0:
+			break
+		for rel_path in replaced:
+			del hashes[rel_path]
+			resources.pop(rel_path, None)
+		out["removed"].update(replaced)
+		# Paths replaced earlier could have been pointing at an asset which is now a duplicate itself.
+		for rel_path in out["removed"]:
+			out["removed"][rel_path] = replaced.get(out["removed"][rel_path], out["removed"][rel_path])
+		out["rewritten"] += dedup_rewrite_references(docld, resources, replaced)
+
+	# Groups whose canonical path has become a duplicate later on are merged into the group of their final canonical path.
+	groups = {}
+	for group in out["groups"]:
+		canonical = out["removed"].get(group["canonical"], group["canonical"])
+		merged = groups.setdefault(canonical, {"canonical": canonical, "duplicates": [], "bytes": 0, "vram": 0})
+		merged["duplicates"] += group["duplicates"]
+		merged["bytes"] += group["bytes"]
+		merged["vram"] += group["vram"]
+	out["groups"] = sorted(groups.values(), key = lambda group: (-group["bytes"] - group["vram"], group["canonical"]))
+	for rel_path in resources:
+		if resources[rel_path] != original[rel_path]:
+			out["resources"][rel_path] = resources[rel_path]
+	return out
+
+# Saves a deduplicated build of the given game folder to the given output folder, given the result of `dedup_game()`:
+# all files are copied, except the removed duplicates, and the rewritten resources are saved in place of the originals.
+# JSON chunks of the removed and rewritten resources are left out, as they no longer match their JSON files.
+def dedup_save_build(path, out_path, result):
+	stale = set()
+	for rel_path in list(result["removed"]) + list(result["resources"]):
+		stale.update([rel_path + JSON_CHUNK_SUFFIX, rel_path + JSON_HASH_SUFFIX])
+	for rel_path in game_find_files(path):
+		if rel_path in result["removed"] or rel_path in stale:
+			continue
+		full_path = os.path.join(out_path, rel_path)
+		if rel_path in result["resources"]:
+			save_json(full_path, result["resources"][rel_path])
+		else:
+			os.makedirs(os.path.dirname(full_path), exist_ok = True)
+			shutil.copyfile(os.path.join(path, rel_path), full_path)
@@ -0,0 +1,171 @@
+# Structural DocLD diff.
+# Compares two revisions of the DocLD trees (e.g. the current `data` folder and a manifest saved before a change, or another git revision
+# checked out into a separate folder), classifies every changed field, and tells which generated files and game data files are affected,
+# so that only those need to be regenerated and revalidated.
+#
+# Fields are identified by paths built from their names, with `[]` for array items, `*` for the values of nameless-keyed objects
+# and `"const"` for the choices of Enum Objects. ex: `key[].keys[]`, `"waves".behavior`.
+
+import os, json
+
+from .utils import load_file
+from .pipeline import docl_load_all, docl_get_schema_path, docl_get_class_file_name, docld_file_to_schema, docld_file_to_lua
+from .game import game_load_resources, game_resolve_extends, game_get_docl_path
+from .walker import docld_walk
+
+
+# Change kinds, and how they affect game data files which are valid against the old revision:
+# - `"none"` - such files stay valid,
+# - `"present"` - only files which contain the changed field can become invalid,
+# - `"all"` - all files which contain the object holding the changed field can become invalid.
+DIFF_KINDS = {
+	"added": "none",
+	"added_required": "all",
+	"removed": "present",
+	"made_optional": "none",
+	"made_required": "all",
+	"default_changed": "none",
+	"type_changed": "present",
+	"constraints_changed": "present",
+	"description_changed": "none"
+}
+
+# DocLD fields which make up the type of an entry, the constraints of an entry, and its description.
+DIFF_TYPE_FIELDS = ["type", "types", "expression", "keyconst", "const"]
+DIFF_CONSTRAINT_FIELDS = ["constraints", "regex"]
+DIFF_DESCRIPTION_FIELDS = ["description", "keyconst_description"]
+
+
+
+# Loads an old DocLD revision: either a folder of `.docl` files, or a manifest saved by `docld_save_manifest()`.
+def docld_load_revision(path):
+	if os.path.isdir(path):
+		return docl_load_all(path)
+	return json.loads(load_file(path))
+
+# Saves all DocLD trees as a manifest, to be compared against later.
+def docld_save_manifest(docld, path):
+	with open(path, "w") as file:
+		json.dump(docld, file, sort_keys = True)
+
+# Returns the keys under which the children of the given DocLD entry are matched between revisions, in order.
+def docld_diff_get_child_keys(entry):
+	out = []
+	for child in entry.get("children", []):
+		if "name" in child:
+			key = child["name"]
+		elif "const" in child:
+			key = json.dumps(child["const"])
+		elif entry.get("type") == "array":
+			key = "[]"
+		else:
+			key = "*"
+		# Nameless children which can't be told apart are matched by their order.
+		while key in out:
+			key += "'"
+		out.append(key)
+	return out
+
+# Joins a field path with the key of one of its children.
+def docld_diff_join(path, key):
+	if path == "" or key.startswith("["):
+		return path + key
+	return path + "." + key
+
+# Compares two DocLD entries and appends all changes to `changes`, as `{"field", "kind", "old", "new"}` dictionaries.
+# `trigger` is the old entry whose presence in game data makes a file worth revalidating; it's not meant to be saved.
+def docld_diff_entry(old, new, changes, path = "", old_parent = None):
+	def add(kind, old_value, new_value, trigger):
+		changes.append({"field": path or "(root)", "kind": kind, "old": old_value, "new": new_value, "trigger": trigger})
+
+	if old == None:
+		add("added" if new.get("optional", False) else "added_required", None, new.get("type"), old_parent)
+		return
+	if new == None:
+		add("removed", old.get("type"), None, old)
+		return
+	if old.get("optional", False) != new.get("optional", False):
+		add("made_optional" if new.get("optional", False) else "made_required", old.get("optional", False), new.get("optional", False), old_parent)
+	if old.get("default") != new.get("default"):
+		add("default_changed", old.get("default"), new.get("default"), old)
+	if any(old.get(field) != new.get(field) for field in DIFF_TYPE_FIELDS):
+		add("type_changed", old.get("types", old.get("type")), new.get("types", new.get("type")), old)
+	if any(old.get(field) != new.get(field) for field in DIFF_CONSTRAINT_FIELDS):
+		add("constraints_changed", old.get("constraints", old.get("regex")), new.get("constraints", new.get("regex")), old)
+	if any(old.get(field) != new.get(field) for field in DIFF_DESCRIPTION_FIELDS):
+		add("description_changed", None, None, old)
+
+	old_children = dict(zip(docld_diff_get_child_keys(old), old.get("children", [])))
+	new_children = dict(zip(docld_diff_get_child_keys(new), new.get("children", [])))
+	for key in old_children:
+		docld_diff_entry(old_children[key], new_children.get(key), changes, docld_diff_join(path, key), old)
+	for key in new_children:
+		if not key in old_children:
+			docld_diff_entry(None, new_children[key], changes, docld_diff_join(path, key), old)
+
+# Compares two revisions of all DocLD trees, as loaded by `docl_load_all()`.
+# Returns a dictionary of `.docl` paths to their lists of changes; files without changes are omitted.
+# Whole files which have been added or removed have a single `"added"` or `"removed"` change of the `(root)` field.
+def docld_diff_all(old_docld, new_docld):
+	out = {}
+	for rel_path in sorted(set(old_docld) | set(new_docld)):
+		changes = []
+		docld_diff_entry(old_docld.get(rel_path), new_docld.get(rel_path), changes)
+		if len(changes) > 0:
+			out[rel_path] = changes
+	return out
+
+# Returns the game data files of the given game folder which need revalidating after the given diff.
+# Only the files which contain a changed field are returned, or, for changes which make fields required, a parent of one.
+# Returns `{"files": {path: [reasons]}, "errors": {path: message}}`.
+def docld_diff_get_affected_data(old_docld, new_docld, diff, path):
+	triggers = {}
+	for rel_path in diff:
+		for change in diff[rel_path]:
+			if DIFF_KINDS[change["kind"]] != "none" and change["trigger"] != None:
+				triggers.setdefault(id(change["trigger"]), []).append(rel_path + ": " + change["field"] + " " + change["kind"].replace("_", " "))
+
+	out = {"files": {}, "errors": {}}
+	resources = game_load_resources(path)
+	for rel_path in resources:
+		schema = resources[rel_path]["schema"]
+		if schema == None:
+			continue
+		docl_path = game_get_docl_path(schema)
+		if not docl_path in old_docld:
+			# There was nothing to validate this file against before.
+			if docl_path in new_docld:
+				out["files"][rel_path] = [docl_path + ": new resource type"]
+			continue
+		try:
+			data = game_resolve_extends(resources, rel_path)
+		except Exception as e:
+			out["errors"][rel_path] = str(e)
+			continue
+		reasons = []
+		def callback(entry, value, fields):
+			for reason in triggers.get(id(entry), []):
+				if not reason in reasons:
+					reasons.append(reason)
+		docld_walk(old_docld[docl_path], data, callback, old_docld)
+		if len(reasons) > 0:
+			out["files"][rel_path] = reasons
+	return out
+
+# Compares two revisions of all DocLD trees and tells what needs to be done about the changes.
+# Returns `{"changes": {docl path: [changes]}, "schemas": [schema path], "configs": [Config Class file name]}`,
+# with the generated files whose contents actually differ between the revisions, so they need rewriting.
+# Use `docld_diff_get_affected_data()` to find the game data files which need revalidating.
+def docld_diff_impact(old_docld, new_docld):
+	diff = docld_diff_all(old_docld, new_docld)
+	out = {"changes": diff, "schemas": [], "configs": []}
+	for rel_path in diff:
+		if not rel_path in new_docld:
+			continue
+		old = old_docld.get(rel_path)
+		new = new_docld[rel_path]
+		if old == None or docld_file_to_schema(old, rel_path) != docld_file_to_schema(new, rel_path):
+			out["schemas"].append(docl_get_schema_path(rel_path))
+		if old == None or docld_file_to_lua(old, rel_path) != docld_file_to_lua(new, rel_path):
+			out["configs"].append(docl_get_class_file_name(rel_path))
+	return out
@@ -0,0 +1,132 @@
+# The DocLang (docl) parser, producing the intermediate DocLangData (docld) format used by all backends.
+
+
+
+# Converts DocLang to an internal intermediate DocLangData format.
+def docl_to_docld(data):
+	out = {}
+	current_children = []
+
+	lines = data.split("\n")
+	for line in lines:
+		line_out = {"optional": False}
+
+		# 4 spaces = one indent.
+		line = line.replace("    ", "\t")
+		# Count indents and remove indentation.
+		indent = 0
+		line = line.split("\t")
+		while indent < len(line) - 1 and line[indent] == "":
+			indent += 1
+		line = line[indent]
+		# Extract the description.
+		line = line.split(" - ")
+		if len(line) > 1:
+			line_out["description"] = " - ".join(line[1:]).replace("\\n", "\n")
+		# Extract tokens.
+		line = line[0].split(" ")
+		# Skip all lines not starting with -.
+		if line[0] != "-":
+			continue
+
+		# Go through the tokens, recognize them and fill in the data.
+		default = False
+		default_string = False
+		curly = False
+		for i in range(1, len(line)):
+			token = line[i]
+
+			# If told to do so, this token will be a default value.
+			if default:
+				if token == "true" or token == "false": # boolean
+					line_out["default"] = token == "true"
+				elif token[0] == "\"": # string
+					if token[-1] == "\"": # single-word string
+						line_out["default"] = token[1:-1]
+					else: # start of string
+						line_out["default"] = token[1:]
+						default_string = True
+				elif default_string:
+					if token[-1] == "\"": # end of string
+						line_out["default"] += " " + token[:-1]
+						default_string = False
+					else: # middle of string
+						line_out["default"] += " " + token
+				elif token == "{}": # object (only the empty state is available as defaults for the object)
+					line_out["default"] = {}
+				elif token[0] == "(": # Vector2 component 1
+					line_out["default"] = {}
+					line_out["default"]["x"] = float(token[1:-1]) if "." in token[1:-1] else int(token[1:-1])
+				elif token[-1] == ")": # Vector2 component 2
+					line_out["default"]["y"] = float(token[:-1]) if "." in token[:-1] else int(token[:-1])
+				elif "." in token: # float
+					line_out["default"] = float(token)
+				else: # integer
+					line_out["default"] = int(token)
+				if token[0] != "(" and not default_string:
+					default = False
+				continue
+
+			# If we're parsing the curly brace part.
+			if curly:
+				if token[-1] == "}":
+					line_out["keyconst_description"] += token[:-1]
+					curly = False
+				else:
+					line_out["keyconst_description"] += token + " "
+				continue
+
+			# Otherwise, just parse the token as normal.
+			if token[0] == "(" and token[-1] == ")": # (type) or (Structure)
+				# Different types can be separated with | and mixed around, e.g. (type|type|Structure).
+				line_out["types"] = []
+				subtokens = token[1:-1].split("|")
+				for subtoken in subtokens:
+					if subtoken[0] == "$": # $expression
+						line_out["types"].append({"type": subtoken[1:], "expression": True})
+					else: # type
+						line_out["types"].append({"type": subtoken})
+				# `types` don't exist if there's one type. Instead, have a direct `type` field.
+				if len(line_out["types"]) == 1:
+					for i in range(len(line_out["types"][0].keys())):
+						line_out[list(line_out["types"][0].keys())[i]] = list(line_out["types"][0].values())[i]
+				if len(line_out["types"]) < 2:
+					del line_out["types"]
+			elif token[0] == "[" and token[-1] == "]": # [constraints]
+				line_out["constraints"] = token[1:-1].split(",")
+			elif token[0] == "\"" and token[-1] == "\"": # "const"
+				line_out["const"] = token[1:-1]
+			elif token[:2] == "<<" and token[-2:] == ">>": # <<regex>>
+				line_out["regex"] = token[2:-2]
+			elif token[0] == "{" and token[-1] == ":": # {keyconst: keyconst_description}
+				# This is a special token. Because descriptions have spaces, we collect all tokens until the closing brace is found.
+				line_out["keyconst"] = token[1:-1]
+				line_out["keyconst_description"] = ""
+				curly = True
+			elif token == "=": # = default_value
+				default = True
+			else: # name (or name* if optional)
+				line_out["name"] = token
+				if line_out["name"][-1] == "*":
+					line_out["name"] = line_out["name"][:-1]
+					line_out["optional"] = True
+		
+		# Insert the processed line as a child.
+		if indent == 0:
+			out = line_out
+		else:
+			parent = current_children[indent - 1]
+			if "children" in parent:
+				parent["children"].append(line_out)
+			else:
+				parent["children"] = [line_out]
+		
+		# Update children.
+		if len(current_children) > indent:
+			current_children[indent] = line_out
+		elif len(current_children) == indent:
+			current_children.append(line_out)
+		else:
+			pass # Throw an error - double indent.
+	
+	return out
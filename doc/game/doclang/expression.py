@@ -0,0 +1,419 @@
+# Offline analysis of Expressions, as found in `$number`, `$integer`, `$boolean`, `$string` and `$Vector2` fields.
+# The tokenizer and compiler are a port of `src/Expression.lua`, so that the compiled steps (in RPN) are identical to what the engine runs.
+#
+# An Expression value is either a raw value (a number, a boolean, or a string which is not of format `${...}`), which always evaluates to itself,
+# or a string of format `${...}`, which is compiled.
+
+import math, re
+
+
+
+# Token patterns used in `expression_tokenize()`. Order matters: the first matching pattern decides the token type.
+PATTERNS = [
+	(re.compile(r"[0-9]"), "number"),
+	(re.compile(r"[\"']"), "string"),
+	(re.compile(r"[A-Za-z_]"), "literal"),
+	(re.compile(r"[+\-/*%^|&=!<>?,:.]"), "operator"),
+	(re.compile(r"[()\[\]]"), "bracket")
+]
+
+# Operators and their precedence.
+OPERATORS = {
+	"^": {"precedence": 10, "right_assoc": True},
+	"!": {"precedence": 9, "right_assoc": True},
+	"-u": {"precedence": 9, "right_assoc": True},
+	"*": {"precedence": 8, "right_assoc": False},
+	"/": {"precedence": 8, "right_assoc": False},
+	"%": {"precedence": 8, "right_assoc": False},
+	"+": {"precedence": 7, "right_assoc": False},
+	"-": {"precedence": 7, "right_assoc": False},
+	"..": {"precedence": 6, "right_assoc": True},
+	">": {"precedence": 5, "right_assoc": False},
+	">=": {"precedence": 5, "right_assoc": False},
+	"<": {"precedence": 5, "right_assoc": False},
+	"<=": {"precedence": 5, "right_assoc": False},
+	"==": {"precedence": 4, "right_assoc": False},
+	"!=": {"precedence": 4, "right_assoc": False},
+	"&&": {"precedence": 3, "right_assoc": False},
+	"||": {"precedence": 2, "right_assoc": False},
+	"?": {"precedence": 1, "right_assoc": True},
+	":": {"precedence": 1, "right_assoc": True},
+	",": {"precedence": 0, "right_assoc": False}
+}
+
+# Functions (and operators) whose result depends on something other than their arguments.
+FUNCTIONS_RANDOM = ["random", "randomf", "randomi"]
+FUNCTIONS_VARIABLE = ["get", "getd"]
+FUNCTIONS_GAME = ["tr", "tr1", "tr2"]
+
+
+
+#
+#    PARSING
+#
+
+# Returns `True` if the given value is an Expression which has to be compiled, i.e. a string of format `${...}`.
+def expression_is_compiled(value):
+	return type(value) is str and value.startswith("${") and value.endswith("}")
+
+# Performs a tokenization step: in the given string, the first token is returned as `{"value": ..., "type": ...}` and the remainder is returned as a string.
+# Throws an exception if the tokenization step fails.
+def expression_get_token(s):
+	s = s.strip()
+	c = s[:1]
+	token_type = None
+	for pattern, pattern_type in PATTERNS:
+		if pattern.match(c):
+			token_type = pattern_type
+			break
+
+	if token_type == "number":
+		match = re.match(r"[0-9]+\.[0-9]+", s) or re.match(r"[0-9]+", s)
+		value = float(match.group(0)) if "." in match.group(0) else int(match.group(0))
+		s = s[match.end():]
+	elif token_type == "string":
+		end = None
+		for i in range(1, len(s)):
+			if s[i] == c and s[i - 1] != "\\":
+				end = i
+				break
+		if end == None:
+			raise Exception("No matching quotation mark found")
+		value = s[1:end].replace("\\" + c, c).replace("\\n", "\n")
+		s = s[end + 1:]
+	elif token_type == "literal":
+		match = re.match(r"[A-Za-z0-9_]+", s)
+		value = match.group(0)
+		if value == "true" or value == "false":
+			token_type = "boolean"
+			value = value == "true"
+		s = s[match.end():]
+	elif token_type == "operator":
+		length = 2 if s[:2] in ["//", "||", "&&", "==", "!=", "<=", ">=", ".."] else 1
+		value = s[:length]
+		s = s[length:]
+	elif token_type == "bracket":
+		value = s[0]
+		s = s[1:]
+	else:
+		raise Exception("Unknown token type (" + c + ")")
+	return {"value": value, "type": token_type}, s
+
+# Breaks a given expression string (without the `${` and `}`) down to single tokens.
+def expression_tokenize(s):
+	tokens = []
+	while s.strip() != "":
+		token, s = expression_get_token(s)
+		# Detect unary minuses.
+		if token["type"] == "operator" and token["value"] == "-" and (len(tokens) == 0 or tokens[-1]["type"] == "operator" or (tokens[-1]["type"] == "bracket" and tokens[-1]["value"] == "(")):
+			token["value"] = "-u"
+		# Detect functions.
+		if token["type"] == "bracket" and token["value"] == "(" and len(tokens) > 0 and tokens[-1]["type"] == "literal":
+			tokens[-1]["type"] = "function"
+		tokens.append(token)
+	return tokens
+
+# Compiles the given token list into a list of steps in RPN notation, exactly like `Expression:compile()` does.
+def expression_compile(tokens):
+	steps = []
+	op_stack = []
+
+	for token in tokens:
+		if token["type"] in ["number", "boolean", "string", "literal"]:
+			if len(op_stack) > 0 and op_stack[-1]["type"] == "operator" and op_stack[-1]["value"] == ".":
+				# If there is a dot, take it out and merge the previous literal with this one.
+				op_stack.pop()
+				steps[-1]["value"] = str(steps[-1]["value"]) + "." + str(token["value"])
+			else:
+				steps.append({"type": "value", "value": token["value"]})
+		elif token["type"] == "bracket":
+			op = token["value"]
+			if op == "(" or op == "[":
+				if op == "[":
+					op_stack.append({"type": "function", "value": "get"})
+				op_stack.append({"type": "operator", "value": op})
+			else:
+				opening = "(" if op == ")" else "["
+				while len(op_stack) > 0 and op_stack[-1]["value"] != opening:
+					steps.append({"type": "operator", "value": op_stack.pop()["value"]})
+				if len(op_stack) == 0:
+					raise Exception("Missing " + opening)
+				op_stack.pop()
+				if len(op_stack) > 0 and op_stack[-1]["type"] == "function":
+					steps.append({"type": "operator", "value": op_stack.pop()["value"]})
+		elif token["type"] == "operator":
+			op = token["value"]
+			last_function = None
+			for entry in reversed(op_stack):
+				if entry["type"] == "function":
+					last_function = entry
+					break
+			if op == "|":
+				# This is a symbol which changes get to getd.
+				if last_function == None or last_function["value"] != "get":
+					raise Exception("| in incorrect place")
+				last_function["value"] = "getd"
+			elif op == ".":
+				if last_function == None or last_function["value"] != "get":
+					raise Exception(". in incorrect place")
+				op_stack.append({"type": "operator", "value": op})
+			elif op in OPERATORS:
+				while len(op_stack) > 0 and op_stack[-1]["value"] != "(" and op_stack[-1]["value"] in OPERATORS:
+					last = OPERATORS[op_stack[-1]["value"]]
+					if OPERATORS[op]["precedence"] < last["precedence"] or (OPERATORS[op]["precedence"] == last["precedence"] and not OPERATORS[op]["right_assoc"]):
+						steps.append({"type": "operator", "value": op_stack.pop()["value"]})
+					else:
+						break
+				op_stack.append({"type": "operator", "value": op})
+		elif token["type"] == "function":
+			op_stack.append({"type": "function", "value": token["value"]})
+
+	for entry in reversed(op_stack):
+		if entry["value"] == "(" or entry["value"] == "[":
+			raise Exception("Missing " + (")" if entry["value"] == "(" else "]"))
+		steps.append({"type": "operator", "value": entry["value"]})
+
+	return steps
+
+# Parses an Expression value.
+# Returns `{"raw": value}` for raw values and `{"steps": [...]}` for compiled expressions.
+# Throws an exception if the expression is malformed.
+def expression_parse(value):
+	if not expression_is_compiled(value):
+		return {"raw": value}
+	return {"steps": expression_compile(expression_tokenize(value[2:-1]))}
+
+
+
+#
+#    ANALYSIS
+#
+
+# Returns a sorted list of all variables read by the given Expression value.
+# Variables whose names are computed at runtime are listed as `"?"`.
+# ex: "${[session.lives] + [level.score|0]}" -> ["level.score", "session.lives"]
+def expression_get_variables(value):
+	parsed = expression_parse(value)
+	if not "steps" in parsed:
+		return []
+	out = set()
+	steps = parsed["steps"]
+	arguments = expression_get_arguments(steps)
+	for i in range(len(steps)):
+		if steps[i]["type"] == "operator" and steps[i]["value"] in FUNCTIONS_VARIABLE and len(arguments[i]) > 0:
+			start, end = arguments[i][0]
+			out.add(str(steps[start]["value"]) if start == end and steps[start]["type"] == "value" else "?")
+	return sorted(out)
+
+# Returns the names of all functions used by the given Expression value.
+def expression_get_functions(value):
+	parsed = expression_parse(value)
+	if not "steps" in parsed:
+		return []
+	return sorted(set(step["value"] for step in parsed["steps"] if step["type"] == "operator" and not step["value"] in OPERATORS))
+
+# Returns `True` if the given Expression value always evaluates to the same value: it reads no variables, rolls no random numbers and doesn't touch the game.
+def expression_is_static(value):
+	for function in expression_get_functions(value):
+		if function in FUNCTIONS_RANDOM or function in FUNCTIONS_VARIABLE or function in FUNCTIONS_GAME:
+			return False
+	return True
+
+# Returns the number of stack values consumed by the given step. Values consume nothing and produce one value.
+# Separators (`,` and `:`) and unknown functions are skipped by the engine, so they consume and produce nothing.
+def expression_get_step_arity(step):
+	if step["type"] == "value":
+		return 0, 1
+	arity = {
+		"-u": 1, "!": 1, "?": 3,
+		"floor": 1, "ceil": 1, "round": 1, "random": 0, "randomf": 2, "randomi": 2, "vec2": 2,
+		"sin": 1, "cos": 1, "tan": 1, "max": 2, "min": 2, "clamp": 3,
+		"strnum": 1, "tr": 1, "tr1": 2, "tr2": 3, "get": 1, "getd": 2
+	}
+	if step["value"] in arity:
+		return arity[step["value"]], 1
+	if step["value"] in OPERATORS and step["value"] != "," and step["value"] != ":":
+		return 2, 1
+	return 0, 0
+
+# For each step of a compiled Expression, returns a list of its arguments as `(start, end)` step index ranges (both inclusive).
+def expression_get_arguments(steps):
+	out = []
+	stack = []
+	for i in range(len(steps)):
+		consumed, produced = expression_get_step_arity(steps[i])
+		arguments = stack[len(stack) - consumed:] if consumed > 0 else []
+		if consumed > 0:
+			del stack[len(stack) - consumed:]
+		out.append(arguments)
+		start = arguments[0][0] if len(arguments) > 0 else i
+		for j in range(produced):
+			stack.append((start, i))
+	return out
+
+
+
+#
+#    EVALUATION
+#
+
+# Raised when an Expression cannot be evaluated offline.
+class NotStaticError(Exception):
+	pass
+
+# Converts a value to a string the way Lua's `tostring()` does.
+def lua_tostring(value):
+	if type(value) is bool:
+		return "true" if value else "false"
+	if type(value) is float:
+		if value.is_integer() and abs(value) < 1e15:
+			return str(int(value))
+		return "%.14g" % value
+	if value == None:
+		return "nil"
+	return str(value)
+
+# Returns `True` if the given value is truthy in Lua: everything except `nil` and `false`.
+def lua_truthy(value):
+	return value != None and value is not False
+
+# Lua equality: values of different types are never equal.
+def lua_equals(a, b):
+	if type(a) is bool or type(b) is bool:
+		return type(a) is type(b) and a == b
+	return a == b
+
+OPERATOR_FUNCTIONS = {
+	"+": lambda a, b: a + b,
+	"-": lambda a, b: a - b,
+	"-u": lambda a: -a,
+	"*": lambda a, b: a * b,
+	"/": lambda a, b: a / b if b != 0 else (math.copysign(math.inf, a) if a != 0 else math.nan),
+	"^": lambda a, b: float(a) ** b,
+	"%": lambda a, b: a - math.floor(a / b) * b,
+	"..": lambda a, b: lua_tostring(a) + lua_tostring(b),
+	"==": lambda a, b: lua_equals(a, b),
+	"!=": lambda a, b: not lua_equals(a, b),
+	">": lambda a, b: a > b,
+	"<": lambda a, b: a < b,
+	">=": lambda a, b: a >= b,
+	"<=": lambda a, b: a <= b,
+	"||": lambda a, b: a if lua_truthy(a) else b,
+	"&&": lambda a, b: b if lua_truthy(a) else a,
+	"!": lambda a: not lua_truthy(a),
+	"?": lambda a, b, c: b if lua_truthy(a) and lua_truthy(b) else c,
+	"floor": lambda a: math.floor(a),
+	"ceil": lambda a: math.ceil(a),
+	"round": lambda a: math.floor(a + 0.5),
+	"vec2": lambda a, b: (a, b),
+	"sin": lambda a: math.sin(a),
+	"cos": lambda a: math.cos(a),
+	"tan": lambda a: math.tan(a),
+	"max": lambda a, b: max(a, b),
+	"min": lambda a, b: min(a, b),
+	"clamp": lambda a, b, c: min(max(a, b), c)
+}
+
+# Evaluates the given Expression value offline.
+# If `variables` is given, the Expression can read the variables from that dictionary; reading any other variable is not static.
+# Throws `NotStaticError` if the expression is not static (see `expression_is_static()`) or uses something which can't be evaluated offline.
+def expression_evaluate_static(value, variables = None):
+	parsed = expression_parse(value)
+	if "raw" in parsed:
+		return parsed["raw"]
+	for function in expression_get_functions(value):
+		if function in FUNCTIONS_RANDOM or function in FUNCTIONS_GAME or (function in FUNCTIONS_VARIABLE and variables == None):
+			raise NotStaticError("Expression depends on runtime state: " + value)
+	stack = []
+	for step in parsed["steps"]:
+		if step["type"] == "value":
+			stack.append(step["value"])
+			continue
+		if step["value"] == "," or step["value"] == ":":
+			continue
+		if step["value"] in FUNCTIONS_VARIABLE:
+			# `get` reads a variable, `getd` reads a variable with a default value: `[name|default]`.
+			default = stack.pop() if step["value"] == "getd" and len(stack) > 1 else None
+			name = stack.pop() if len(stack) > 0 else None
+			if variables.get(name) == None and step["value"] == "get":
+				raise NotStaticError("Variable " + str(name) + " is not known offline: " + value)
+			stack.append(variables.get(name) if variables.get(name) != None else default)
+			continue
+		if not step["value"] in OPERATOR_FUNCTIONS:
+			raise NotStaticError("Cannot evaluate " + step["value"] + " offline: " + value)
+		consumed = expression_get_step_arity(step)[0]
+		if len(stack) < consumed:
+			raise NotStaticError("Malformed expression: " + value)
+		arguments = stack[len(stack) - consumed:]
+		del stack[len(stack) - consumed:]
+		try:
+			stack.append(OPERATOR_FUNCTIONS[step["value"]](*arguments))
+		except (TypeError, ValueError, ZeroDivisionError, OverflowError):
+			raise NotStaticError("Cannot evaluate expression offline: " + value)
+	return stack[0] if len(stack) > 0 else None
+
+# Evaluates the given Expression value offline. Returns `default` instead of throwing if it can't be done.
+def expression_try_evaluate_static(value, default = None):
+	try:
+		return expression_evaluate_static(value)
+	except (NotStaticError, Exception):
+		return default
+
+
+
+#
+#    BOUNDS
+#
+
+# Interval versions of the operators, used to find the range of values an Expression can evaluate to.
+# Each interval is a `(min, max)` tuple. Random functions produce the range of numbers they can roll.
+INTERVAL_FUNCTIONS = {
+	"+": lambda a, b: (a[0] + b[0], a[1] + b[1]),
+	"-": lambda a, b: (a[0] - b[1], a[1] - b[0]),
+	"-u": lambda a: (-a[1], -a[0]),
+	"*": lambda a, b: interval_from_values([a[0] * b[0], a[0] * b[1], a[1] * b[0], a[1] * b[1]]),
+	"/": lambda a, b: interval_from_values([a[0] / b[0], a[0] / b[1], a[1] / b[0], a[1] / b[1]]) if b[0] > 0 or b[1] < 0 else None,
+	"floor": lambda a: (math.floor(a[0]), math.floor(a[1])),
+	"ceil": lambda a: (math.ceil(a[0]), math.ceil(a[1])),
+	"round": lambda a: (math.floor(a[0] + 0.5), math.floor(a[1] + 0.5)),
+	"max": lambda a, b: (max(a[0], b[0]), max(a[1], b[1])),
+	"min": lambda a, b: (min(a[0], b[0]), min(a[1], b[1])),
+	"clamp": lambda a, b, c: (min(max(a[0], b[0]), c[0]), min(max(a[1], b[0]), c[1])),
+	"random": lambda: (0, 1),
+	"randomf": lambda a, b: (min(a[0], b[0]), max(a[1], b[1])),
+	"randomi": lambda a, b: (math.ceil(min(a[0], b[0])), math.floor(max(a[1], b[1]))),
+	"?": lambda a, b, c: (min(b[0], c[0]), max(b[1], c[1]))
+}
+
+# Returns the smallest interval containing all of the given numbers.
+def interval_from_values(values):
+	return (min(values), max(values))
+
+# Returns the `(min, max)` range of numbers the given Expression value can evaluate to, or `None` if it can't be determined offline
+# (for example, because it reads a variable or doesn't evaluate to a number).
+# ex: "${randomf(0.5, 1.5) * 2}" -> (1.0, 3.0)
+def expression_get_bounds(value):
+	parsed = expression_parse(value)
+	if "raw" in parsed:
+		raw = parsed["raw"]
+		return (raw, raw) if (type(raw) is int or type(raw) is float) else None
+	stack = []
+	for step in parsed["steps"]:
+		if step["type"] == "value":
+			stack.append((step["value"], step["value"]) if (type(step["value"]) is int or type(step["value"]) is float) else None)
+			continue
+		if step["value"] == "," or step["value"] == ":":
+			continue
+		consumed = expression_get_step_arity(step)[0]
+		if len(stack) < consumed:
+			return None
+		arguments = stack[len(stack) - consumed:]
+		del stack[len(stack) - consumed:]
+		if not step["value"] in INTERVAL_FUNCTIONS or None in arguments[1 if step["value"] == "?" else 0:]:
+			stack.append(None)
+			continue
+		try:
+			stack.append(INTERVAL_FUNCTIONS[step["value"]](*arguments))
+		except (TypeError, ValueError, ZeroDivisionError, OverflowError):
+			stack.append(None)
+	return stack[0] if len(stack) == 1 else None
@@ -0,0 +1,131 @@
+# Font metrics baker.
+# Bakes the glyph metrics of `"image"` and `"bmfont"` Fonts into a `<font>.metrics.json` file next to each Font resource, so that the engine
+# can measure and draw text by indexing flat arrays instead of looking characters up one by one, and doesn't need to parse `.fnt` files at startup.
+#
+# All arrays are indexed by codepoint (a Lua array index of `codepoint + 1`), with `null` for characters the Font doesn't have:
+# - `advances` - how far the pen moves after the character, in pixels,
+# - `quads` - `[x, y, width, height, xOffset, yOffset, page]` of the character box in its page image,
+# and `kerning` is a list of `[first, second, amount]` codepoint pairs. `pages` are paths to the page images, relative to the game folder.
+# `sources` lists the files the metrics have been baked from (the Font resource, the resources it extends, and its image or BMFont file),
+# and `hash` is the SHA-1 hash of their contents. The engine ignores metrics whose sources have changed since they've been baked.
+
+import os, re, struct, posixpath
+
+from .utils import load_file
+from .game import game_load_resources, game_get_resources_of_type, game_resolve_extends, game_get_extends_chain, game_hash_files
+
+
+# Suffix which replaces `.json` in the path of a Font to get the path of its baked metrics.
+FONT_METRICS_SUFFIX = ".metrics.json"
+
+# Matches a single `key=value` pair of a BMFont text file. Values can be quoted.
+BMFONT_PAIR_PATTERN = re.compile(r"(\w+)=(\"[^\"]*\"|\S+)")
+
+
+
+# Returns the path of the baked metrics of the given Font resource.
+# ex: "fonts/score.json" -> "fonts/score.metrics.json"
+def font_get_metrics_path(rel_path):
+	return rel_path[:-5] + FONT_METRICS_SUFFIX
+
+# Returns the `(width, height)` of a PNG image from its header.
+def font_get_png_size(path):
+	with open(path, "rb") as file:
+		header = file.read(24)
+	if len(header) < 24 or header[:8] != b"\x89PNG\r\n\x1a\n":
+		raise ValueError(path + " is not a PNG image")
+	return struct.unpack(">II", header[16:24])
+
+# Parses a BMFont text file (`.fnt`).
+# Returns `{"info": {...}, "common": {...}, "pages": {id: file}, "chars": [{...}], "kernings": [{...}]}`, with numeric values converted to integers.
+# Throws a `ValueError` for binary or XML BMFont files, which are not supported.
+def font_parse_bmfont(contents):
+	out = {"info": {}, "common": {}, "pages": {}, "chars": [], "kernings": []}
+	if not contents.startswith("info"):
+		raise ValueError("only text BMFont files are supported")
+	for line in contents.split("\n"):
+		tag = line.split(" ")[0].strip()
+		values = {}
+		for key, value in BMFONT_PAIR_PATTERN.findall(line):
+			if value.startswith("\""):
+				values[key] = value[1:-1]
+			else:
+				try:
+					values[key] = int(value)
+				except ValueError:
+					values[key] = value
+		if tag == "info" or tag == "common":
+			out[tag] = values
+		elif tag == "page":
+			out["pages"][values["id"]] = values["file"]
+		elif tag == "char":
+			out["chars"].append(values)
+		elif tag == "kerning":
+			out["kernings"].append(values)
+	return out
+
+# Returns an empty set of metrics, with room for all codepoints up to and including `max_codepoint`.
+def font_new_metrics(line_height, base, pages, max_codepoint):
+	return {"lineHeight": line_height, "base": base, "pages": pages, "advances": [None] * (max_codepoint + 1), "quads": [None] * (max_codepoint + 1), "kerning": []}
+
+# Bakes the metrics of an `"image"` Font, given its data with `_extends` resolved, and the game folder.
+# Lowercase letters missing from the Font fall back to uppercase ones, just like `Font:getCharacterData()` does.
+def font_bake_image(data, path):
+	height = data.get("height")
+	if height == None:
+		height = font_get_png_size(os.path.join(path, data["image"]))[1]
+	codepoints = {}
+	for character in data["characters"]:
+		codepoints[ord(character)] = data["characters"][character]
+	for codepoint in range(ord("a"), ord("z") + 1):
+		if not codepoint in codepoints and codepoint - 32 in codepoints:
+			codepoints[codepoint] = codepoints[codepoint - 32]
+	out = font_new_metrics(height, height, [data["image"]], max(codepoints) if len(codepoints) > 0 else 0)
+	for codepoint in codepoints:
+		character = codepoints[codepoint]
+		out["advances"][codepoint] = character["width"]
+		out["quads"][codepoint] = [character["x"], character.get("y", 0), character["width"], height, 0, 0, 0]
+	return out
+
+# Bakes the metrics of a `"bmfont"` Font, given its data with `_extends` resolved, and the game folder.
+def font_bake_bmfont(data, path):
+	fnt = font_parse_bmfont(load_file(os.path.join(path, data["file"])))
+	directory = posixpath.dirname(data["file"])
+	pages = [posixpath.join(directory, fnt["pages"][i]) for i in sorted(fnt["pages"])]
+	chars = [char for char in fnt["chars"] if char["id"] >= 0]
+	out = font_new_metrics(fnt["common"]["lineHeight"], fnt["common"]["base"], pages, max(char["id"] for char in chars) if len(chars) > 0 else 0)
+	for char in chars:
+		out["advances"][char["id"]] = char["xadvance"]
+		out["quads"][char["id"]] = [char["x"], char["y"], char["width"], char["height"], char["xoffset"], char["yoffset"], char.get("page", 0)]
+	for kerning in fnt["kernings"]:
+		if kerning["amount"] != 0:
+			out["kerning"].append([kerning["first"], kerning["second"], kerning["amount"]])
+	return out
+
+# Returns the list of files the metrics of the given Font resource are baked from, given its data with `_extends` resolved:
+# the resource itself, the resources it extends, and its image (for `"image"` Fonts) or BMFont file (for `"bmfont"` Fonts).
+def font_get_sources(resources, rel_path, data):
+	return game_get_extends_chain(resources, rel_path) + [data["image"] if data["type"] == "image" else data["file"]]
+
+# Bakes the metrics of all Fonts of the given game folder.
+# Returns `{"fonts": {path: metrics}, "skipped": [path], "errors": {path: message}}`.
+# `"truetype"` and `"imageLove"` Fonts are rasterized by LOVE itself, so they are skipped.
+def fonts_bake_game(path):
+	resources = game_load_resources(path)
+	out = {"fonts": {}, "skipped": [], "errors": {}}
+	for rel_path in game_get_resources_of_type(resources, "font.json"):
+		try:
+			data = game_resolve_extends(resources, rel_path)
+			if data["type"] == "image":
+				metrics = font_bake_image(data, path)
+			elif data["type"] == "bmfont":
+				metrics = font_bake_bmfont(data, path)
+			else:
+				out["skipped"].append(rel_path)
+				continue
+			metrics["sources"] = font_get_sources(resources, rel_path, data)
+			metrics["hash"] = game_hash_files(path, metrics["sources"])
+			out["fonts"][rel_path] = metrics
+		except Exception as e:
+			out["errors"][rel_path] = str(e)
+	return out
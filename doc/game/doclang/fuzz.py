@@ -0,0 +1,415 @@
+# Property-based fuzzer and performance regression guard for the DocLang pipeline.
+# Generates random, valid DocLD trees, writes them out as DocL and checks that every stage of the pipeline
+# (`docl_to_docld()`, `docld_to_schema()` and the Lua Config Class emitter) agrees with the generated tree.
+# It also times each stage on growing inputs and reports stages whose running time grows faster than linearly.
+
+import json, math, random, time
+
+from .utils import markdown_strip, is_regex_numeric
+from .docld import docl_to_docld
+from .schema import docld_to_schema
+from .lua import docld_to_lua
+
+
+FUZZ_WORDS = ["apple", "sphere", "path", "shooter", "level", "color", "speed", "delay", "chain", "bonus", "score", "frame", "layer", "sound", "effect", "magic"]
+FUZZ_LEAF_TYPES = ["number", "integer", "string", "boolean", "Vector2", "Color", "Sprite", "SoundEvent", "CollectibleGenerator"]
+FUZZ_EXPRESSION_TYPES = ["number", "integer", "string", "boolean", "Vector2"]
+FUZZ_REGEXES = ["^[-]?[0-9]*$", "^[0-9]*$", "^-[0-9]*$", "^.*$", "^.$"]
+# The maximum number of nested arrays supported by `docld_to_lua_raw()`.
+FUZZ_MAX_ARRAYS = 5
+# The maximum nesting depth of generated trees. Trees grow in width instead once this is reached.
+FUZZ_MAX_DEPTH = 8
+# Stages whose running time grows faster than `size ^ FUZZ_MAX_GROWTH` are reported as regressions.
+FUZZ_MAX_GROWTH = 1.5
+FUZZ_SIZES = [250, 500, 1000, 2000, 4000]
+
+
+
+#
+#    GENERATION
+#
+
+# Returns a random description. Long descriptions span many words and contain Markdown and line breaks.
+def fuzz_random_description(rng, long = False):
+	words = []
+	for i in range(rng.randint(12, 60) if long else rng.randint(1, 8)):
+		word = rng.choice(FUZZ_WORDS)
+		roll = rng.random()
+		if roll < 0.05:
+			word = "**" + word + "**"
+		elif roll < 0.1:
+			word = "`" + word + "`"
+		elif roll < 0.12 and long:
+			word += "\n"
+		words.append(word)
+	return " ".join(words).replace("\n ", "\n").strip("\n") + "."
+
+# Returns a random default value for a simple entry of the given type, or `None` if that type can't have defaults.
+def fuzz_random_default(rng, entry_type):
+	if entry_type == "integer":
+		return rng.randint(-100, 100)
+	elif entry_type == "number":
+		return round(rng.uniform(-100, 100), 2)
+	elif entry_type == "boolean":
+		return rng.random() < 0.5
+	elif entry_type == "string":
+		return " ".join(rng.choice(FUZZ_WORDS) for i in range(rng.randint(1, 3)))
+	elif entry_type == "Vector2":
+		return {"x": rng.randint(-500, 500), "y": round(rng.uniform(-500, 500), 1)}
+	return None
+
+# Generates a random simple entry (anything that is not an object or an array).
+def fuzz_random_leaf(state, entry):
+	rng = state["rng"]
+	if rng.random() < 0.15:
+		entry["type"] = rng.choice(FUZZ_EXPRESSION_TYPES)
+		entry["expression"] = True
+	else:
+		entry["type"] = rng.choice(FUZZ_LEAF_TYPES)
+	if entry["type"] in ["number", "integer"] and rng.random() < 0.3:
+		entry["constraints"] = rng.choice([[">=0"], [">0"], [">=1", "<=10"], ["<100"]])
+	if entry["optional"] and rng.random() < 0.5 and (not "expression" in entry or entry["type"] in ["number", "Vector2"]):
+		default = fuzz_random_default(rng, entry["type"])
+		if default != None:
+			entry["default"] = default
+	if entry["type"] == "string" and not "expression" in entry and not "default" in entry and rng.random() < 0.2:
+		# Enum string.
+		entry["children"] = []
+		for i in range(rng.randint(1, 4)):
+			entry["children"].append({"optional": False, "const": rng.choice(FUZZ_WORDS) + str(i), "description": fuzz_random_description(rng)})
+			state["budget"] -= 1
+	return entry
+
+# Generates a list of named children of an object.
+def fuzz_random_children(state, depth, arrays):
+	rng = state["rng"]
+	out = []
+	for i in range(rng.randint(1, 6)):
+		if state["budget"] <= 0:
+			break
+		out.append(fuzz_random_entry(state, rng.choice(FUZZ_WORDS) + str(i), depth, arrays))
+	return out
+
+# Generates a random DocLD entry. Unnamed entries are the children of arrays and Regex Objects.
+# `depth` and `arrays` are the numbers of objects and arrays this entry is nested in.
+def fuzz_random_entry(state, name, depth, arrays):
+	rng = state["rng"]
+	state["budget"] -= 1
+	entry = {"optional": name != None and rng.random() < 0.3, "description": fuzz_random_description(rng, rng.random() < 0.1)}
+	if name != None:
+		entry["name"] = name
+
+	kinds = ["leaf"]
+	if depth < FUZZ_MAX_DEPTH and state["budget"] > 0:
+		kinds += ["object", "object", "enum_object", "regex_object"]
+		if arrays < FUZZ_MAX_ARRAYS:
+			kinds += ["array", "array"]
+	kind = rng.choice(kinds) if rng.random() < 0.5 else "leaf"
+	if name == None and kind == "leaf" and rng.random() < 0.5:
+		# Nameless entries are often objects in the real data.
+		kind = rng.choice(kinds)
+
+	if kind == "leaf":
+		return fuzz_random_leaf(state, entry)
+	elif kind == "array":
+		entry["type"] = "array"
+		entry["children"] = [fuzz_random_entry(state, None, depth, arrays + 1)]
+	elif kind == "regex_object":
+		entry["type"] = "object"
+		entry["regex"] = rng.choice(FUZZ_REGEXES)
+		entry["children"] = [fuzz_random_entry(state, None, depth + 1, arrays)]
+	elif kind == "enum_object":
+		entry["type"] = "object"
+		entry["keyconst"] = "type"
+		entry["keyconst_description"] = fuzz_random_description(rng)
+		entry["children"] = []
+		for i in range(rng.randint(1, 4)):
+			state["budget"] -= 1
+			choice = {"optional": False, "const": rng.choice(FUZZ_WORDS) + str(i), "description": fuzz_random_description(rng)}
+			children = fuzz_random_children(state, depth + 1, arrays) if rng.random() < 0.7 else []
+			if len(children) > 0:
+				choice["children"] = children
+			entry["children"].append(choice)
+		# Always-there fields can't share names with the fields of the choices.
+		always = fuzz_random_children(state, depth + 1, arrays) if rng.random() < 0.5 else []
+		for i in range(len(always)):
+			always[i]["name"] = rng.choice(FUZZ_WORDS) + "Always" + str(i)
+		entry["children"] += always
+	else:
+		entry["type"] = "object"
+		children = fuzz_random_children(state, depth + 1, arrays) if rng.random() < 0.95 else []
+		if len(children) > 0:
+			entry["children"] = children
+	return entry
+
+# Generates a random DocLD root object with approximately `size` entries (lines of DocL).
+def fuzz_random_docld(rng, size):
+	state = {"rng": rng, "budget": size - 1}
+	out = {"optional": False, "type": "object", "description": "The root object.", "children": []}
+	while state["budget"] > 0:
+		out["children"] += fuzz_random_children(state, 1, 0)
+	# Names must be unique.
+	for i in range(len(out["children"])):
+		out["children"][i]["name"] = rng.choice(FUZZ_WORDS) + "Root" + str(i)
+	return out
+
+# Generates a DocLD tree with `count` arrays nested in each other.
+def fuzz_nested_arrays_docld(count):
+	entry = {"optional": False, "type": "integer", "description": "An integer."}
+	for i in range(count):
+		entry = {"optional": False, "type": "array", "description": "A list.", "children": [entry]}
+	entry["name"] = "list"
+	return {"optional": False, "type": "object", "description": "The root object.", "children": [entry]}
+
+
+
+#
+#    SERIALIZATION
+#
+
+# Converts a default value to its DocL notation.
+def fuzz_value_to_docl(value):
+	if type(value) is bool:
+		return "true" if value else "false"
+	elif type(value) is str:
+		return "\"" + value + "\""
+	elif type(value) is dict:
+		return "(" + str(value["x"]) + ", " + str(value["y"]) + ")"
+	return str(value)
+
+# Converts a DocLD tree back to DocL. This is the inverse of `docl_to_docld()` for the trees generated by this module.
+def fuzz_docld_to_docl(entry, indent = 0):
+	tokens = ["-"]
+	if "const" in entry:
+		tokens.append("\"" + entry["const"] + "\"")
+	if "name" in entry:
+		tokens.append(entry["name"] + ("*" if entry["optional"] else ""))
+	if "default" in entry:
+		tokens += ["=", fuzz_value_to_docl(entry["default"])]
+	if "type" in entry:
+		tokens.append("(" + ("$" if "expression" in entry else "") + entry["type"] + ")")
+	if "constraints" in entry:
+		tokens.append("[" + ",".join(entry["constraints"]) + "]")
+	if "regex" in entry:
+		tokens.append("<<" + entry["regex"] + ">>")
+	if "keyconst" in entry:
+		tokens.append("{" + entry["keyconst"] + ": " + entry["keyconst_description"] + "}")
+	line = "    " * indent + " ".join(tokens)
+	if "description" in entry:
+		line += " - " + entry["description"].replace("\n", "\\n")
+	lines = [line]
+	for child in entry.get("children", []):
+		lines.append(fuzz_docld_to_docl(child, indent + 1))
+	return "\n".join(lines)
+
+
+
+#
+#    INVARIANTS
+#
+
+# Checks that the schema generated for the given entry describes it. Appends error messages to `errors`.
+def fuzz_check_schema(entry, schema, where, errors):
+	if "description" in entry and schema.get("description") != markdown_strip(entry["description"]):
+		errors.append(where + ": schema description mismatch")
+	children = entry.get("children", [])
+	if entry.get("type") == "object":
+		if "regex" in entry:
+			if not entry["regex"] in schema.get("patternProperties", {}):
+				errors.append(where + ": regex " + entry["regex"] + " missing from the schema")
+				return
+			fuzz_check_schema(children[0], schema["patternProperties"][entry["regex"]], where + "<<>>", errors)
+		elif "keyconst" in entry:
+			consts = [child for child in children if "const" in child]
+			if schema["properties"][entry["keyconst"]]["enum"] != [child["const"] for child in consts]:
+				errors.append(where + ": enum object choices mismatch")
+			if len(schema["allOf"]) != len(consts) + 1:
+				errors.append(where + ": enum object should have " + str(len(consts) + 1) + " allOf blocks")
+				return
+			for i in range(len(consts)):
+				for child in consts[i].get("children", []):
+					fuzz_check_schema(child, schema["allOf"][i + 1]["then"]["properties"][child["name"]], where + "." + consts[i]["const"] + "." + child["name"], errors)
+			for child in children:
+				if "name" in child:
+					if not child["name"] in schema["properties"]:
+						errors.append(where + ": always-there field " + child["name"] + " missing from the schema")
+						continue
+					fuzz_check_schema(child, schema["properties"][child["name"]], where + "." + child["name"], errors)
+		else:
+			properties = schema.get("properties", {})
+			if sorted(name for name in properties if name != "$schema") != sorted(child["name"] for child in children):
+				errors.append(where + ": object properties mismatch")
+				return
+			if schema.get("required", []) != [child["name"] for child in children if not child["optional"]]:
+				errors.append(where + ": required fields mismatch")
+			if schema.get("additionalProperties") != False:
+				errors.append(where + ": additional properties are allowed")
+			for child in children:
+				fuzz_check_schema(child, properties[child["name"]], where + "." + child["name"], errors)
+	elif entry.get("type") == "array":
+		if not "items" in schema:
+			errors.append(where + ": array has no items")
+			return
+		fuzz_check_schema(children[0], schema["items"], where + "[]", errors)
+	else:
+		if "expression" in entry:
+			expected = {"$ref": "_structures/Expr" + (entry["type"].capitalize() if entry["type"] in ["number", "integer", "string", "boolean"] else entry["type"]) + ".json"}
+		elif entry["type"] in ["number", "integer", "string", "boolean"]:
+			expected = {"type": entry["type"]}
+		else:
+			expected = {"$ref": "_structures/" + entry["type"] + ".json"}
+		for key in expected:
+			if schema.get(key) != expected[key]:
+				errors.append(where + ": expected " + key + " " + expected[key] + ", got " + str(schema.get(key)))
+		for constraint in entry.get("constraints", []):
+			if not any(key in schema for key in ["minimum", "exclusiveMinimum", "maximum", "exclusiveMaximum"]):
+				errors.append(where + ": constraint " + constraint + " missing from the schema")
+		if len(children) > 0 and [choice.get("const") for choice in schema.get("oneOf", [])] != [child["const"] for child in children]:
+			errors.append(where + ": enum string choices mismatch")
+
+# Collects the Lua expectations for the given entry: assignment prefixes which must appear in the generated code,
+# and the number of loops it should contain. `context` is the Lua index of the entry (e.g. `.a[i].b`).
+def fuzz_get_lua_expectations(entry, context, arrays, out):
+	if "name" in entry:
+		context += "." + entry["name"]
+	children = entry.get("children", [])
+	if entry.get("type") == "object":
+		if "regex" in entry:
+			out["loops"] += 1
+			fuzz_get_lua_expectations(children[0], context + ("[tonumber(n)]" if is_regex_numeric(entry["regex"]) else "[n]"), arrays, out)
+			return
+		if "keyconst" in entry:
+			out["lines"].append("self" + context + "." + entry["keyconst"] + " = u.parseString(")
+			for child in children:
+				if "const" in child:
+					out["lines"].append("== \"" + child["const"] + "\" then")
+					for subchild in child.get("children", []):
+						fuzz_get_lua_expectations(subchild, context, arrays, out)
+		for child in children:
+			if not "const" in child:
+				fuzz_get_lua_expectations(child, context, arrays, out)
+	elif entry.get("type") == "array":
+		out["loops"] += 1
+		fuzz_get_lua_expectations(children[0], context + "[" + "ijklm"[arrays] + "]", arrays + 1, out)
+	else:
+		out["lines"].append("self" + context + " = u.parse")
+
+# Checks the Lua Config Class generated for the given tree. Appends error messages to `errors`.
+def fuzz_check_lua(entry, lua, errors):
+	expectations = {"lines": [], "loops": 0}
+	fuzz_get_lua_expectations(entry, "", 0, expectations)
+	lines = [line.strip() for line in lua.split("\n")]
+	for expected in expectations["lines"]:
+		if not expected in lua:
+			errors.append("lua: missing " + expected)
+	loops = len([line for line in lines if line.startswith("for ")])
+	if loops != expectations["loops"]:
+		errors.append("lua: expected " + str(expectations["loops"]) + " loops, got " + str(loops))
+	blocks = len([line for line in lines if line.startswith("for ") or line.startswith("if ") or line.startswith("function ")])
+	ends = len([line for line in lines if line == "end"])
+	if blocks != ends:
+		errors.append("lua: " + str(blocks) + " blocks opened, but " + str(ends) + " closed")
+
+# Runs all invariant checks on a single DocLD tree. Returns a list of error messages (empty if everything holds).
+def fuzz_check_docld(entry):
+	errors = []
+	docl = fuzz_docld_to_docl(entry)
+	try:
+		parsed = docl_to_docld(docl)
+	except Exception as e:
+		return ["docld: parser failed: " + str(e)]
+	if parsed != entry:
+		errors.append("docld: round trip mismatch")
+		return errors
+	try:
+		schema = docld_to_schema(parsed)
+		json.dumps(schema)
+		fuzz_check_schema(parsed, schema, "root", errors)
+	except Exception as e:
+		errors.append("schema: " + type(e).__name__ + ": " + str(e))
+	try:
+		fuzz_check_lua(parsed, docld_to_lua(parsed, "FuzzConfig", "fuzz.json"), errors)
+	except Exception as e:
+		errors.append("lua: " + type(e).__name__ + ": " + str(e))
+	return errors
+
+# Checks that the Lua emitter accepts exactly `FUZZ_MAX_ARRAYS` nested arrays and refuses any more.
+def fuzz_check_array_limit():
+	errors = []
+	try:
+		fuzz_check_lua(fuzz_nested_arrays_docld(FUZZ_MAX_ARRAYS), docld_to_lua(fuzz_nested_arrays_docld(FUZZ_MAX_ARRAYS), "FuzzConfig", "fuzz.json"), errors)
+	except Exception as e:
+		errors.append("lua: " + str(FUZZ_MAX_ARRAYS) + " nested arrays were refused: " + str(e))
+	try:
+		docld_to_lua(fuzz_nested_arrays_docld(FUZZ_MAX_ARRAYS + 1), "FuzzConfig", "fuzz.json")
+		errors.append("lua: " + str(FUZZ_MAX_ARRAYS + 1) + " nested arrays were accepted")
+	except Exception:
+		pass
+	return errors
+
+# Generates `count` random trees from the given seed and checks all invariants on them.
+# Returns a list of `{"seed", "size", "docl", "errors"}` entries for the failing trees.
+def fuzz_run(count, seed = 0):
+	out = []
+	errors = fuzz_check_array_limit()
+	if len(errors) > 0:
+		out.append({"seed": None, "size": None, "docl": None, "errors": errors})
+	for i in range(count):
+		rng = random.Random(seed + i)
+		entry = fuzz_random_docld(rng, rng.randint(2, 60))
+		errors = fuzz_check_docld(entry)
+		if len(errors) > 0:
+			out.append({"seed": seed + i, "size": fuzz_get_entry_count(entry), "docl": fuzz_docld_to_docl(entry), "errors": errors})
+	return out
+
+# Returns the number of entries (lines of DocL) in the given tree.
+def fuzz_get_entry_count(entry):
+	return 1 + sum(fuzz_get_entry_count(child) for child in entry.get("children", []))
+
+
+
+#
+#    TIMING
+#
+
+# Times each pipeline stage on the given DocL code. Returns the best of `repeats` runs for each stage, in seconds.
+def fuzz_time_stages(docl, repeats = 5):
+	stages = {"docld": [], "schema": [], "lua": []}
+	for i in range(repeats):
+		t = time.perf_counter()
+		entry = docl_to_docld(docl)
+		stages["docld"].append(time.perf_counter() - t)
+		t = time.perf_counter()
+		docld_to_schema(entry)
+		stages["schema"].append(time.perf_counter() - t)
+		t = time.perf_counter()
+		docld_to_lua(entry, "FuzzConfig", "fuzz.json")
+		stages["lua"].append(time.perf_counter() - t)
+	return {stage: min(stages[stage]) for stage in stages}
+
+# Returns the growth exponent of the given `(size, time)` points: the slope of the least-squares line in log-log space.
+# Linear stages are close to 1, quadratic ones close to 2.
+def fuzz_get_growth_exponent(points):
+	xs = [math.log(size) for size, t in points]
+	ys = [math.log(max(t, 1e-9)) for size, t in points]
+	mean_x = sum(xs) / len(xs)
+	mean_y = sum(ys) / len(ys)
+	variance = sum((x - mean_x) ** 2 for x in xs)
+	return sum((xs[i] - mean_x) * (ys[i] - mean_y) for i in range(len(xs))) / variance
+
+# Times every pipeline stage on random trees of growing sizes.
+# Returns `{"sizes": [...], "stages": {stage: {"times": [...], "exponent", "ok"}}}`, where `ok` is `False` for super-linear stages.
+def fuzz_measure_scaling(sizes = None, seed = 0, max_growth = FUZZ_MAX_GROWTH):
+	sizes = sizes or FUZZ_SIZES
+	out = {"sizes": [], "stages": {"docld": {"times": []}, "schema": {"times": []}, "lua": {"times": []}}}
+	for size in sizes:
+		entry = fuzz_random_docld(random.Random(seed), size)
+		out["sizes"].append(fuzz_get_entry_count(entry))
+		times = fuzz_time_stages(fuzz_docld_to_docl(entry))
+		for stage in times:
+			out["stages"][stage]["times"].append(times[stage])
+	for stage in out["stages"]:
+		result = out["stages"][stage]
+		result["exponent"] = fuzz_get_growth_exponent(list(zip(out["sizes"], result["times"])))
+		result["ok"] = result["exponent"] <= max_growth
+	return out
@@ -0,0 +1,123 @@
+# Access to game data. A game is a folder (e.g. `games/Luxor`) containing JSON resources, images, sounds and so on.
+# Resources are recognized the same way the engine's Resource Manager does it: by the `$schema` field of each JSON file.
+
+import os, re, json, hashlib, posixpath
+
+from .utils import load_file
+
+
+
+# Returns paths of all files inside the given game folder, relative to that folder, in a stable order.
+# If `extension` is specified, only files with that extension are returned.
+# ex: ["config.json", "config/gameplay.json", "maps/Map1/config.json", ...]
+def game_find_files(path, extension = None):
+	out = []
+	for r, d, f in os.walk(path):
+		d.sort()
+		r = os.path.relpath(r, path).replace("\\", "/")
+		for file in sorted(f):
+			if extension != None and not file.endswith(extension):
+				continue
+			out.append(file if r == "." else r + "/" + file)
+	return out
+
+# Returns the schema path relative to the schema folder, based on the `$schema` field of a resource.
+# This mirrors `ResourceManager:getResourceTypeFromSchema()`.
+# ex: "../../../schemas/config/gameplay.json" -> "config/gameplay.json"
+def game_get_schema_path(data):
+	if type(data) is not dict or type(data.get("$schema")) is not str:
+		return None
+	schema = data["$schema"].split("/schemas/")
+	return schema[1] if len(schema) > 1 else schema[0]
+
+# Returns the `.docl` file describing resources with the given schema path.
+# ex: "config/gameplay.json" -> "config/gameplay.docl"
+def game_get_docl_path(schema_path):
+	return schema_path[:-5] + ".docl"
+
+# Loads a single JSON file from the game folder. Returns `None` if the file is not a valid JSON file.
+def game_load_json(path):
+	try:
+		return json.loads(load_file(path))
+	except (IOError, ValueError):
+		return None
+
+# Loads all JSON resources of the given game.
+# Returns a dictionary of paths relative to the game folder to `{"schema": <schema path or None>, "data": <raw data or None>}` entries.
+# Invalid JSON files are included with `data` set to `None`, so that they can be reported.
+def game_load_resources(path):
+	out = {}
+	for rel_path in game_find_files(path, ".json"):
+		data = game_load_json(os.path.join(path, rel_path))
+		out[rel_path] = {"schema": game_get_schema_path(data), "data": data}
+	return out
+
+# Returns the resources of the given schema path, as a dictionary of paths to their raw data.
+# ex: game_get_resources_of_type(resources, "sound_event.json")
+def game_get_resources_of_type(resources, schema_path):
+	out = {}
+	for rel_path in resources:
+		if resources[rel_path]["schema"] == schema_path:
+			out[rel_path] = resources[rel_path]["data"]
+	return out
+
+
+
+# Merges resource data with the data of its base resource, the same way Config Classes do: any field missing in `data` is taken from `base`.
+# Objects are merged recursively; any other value (including arrays) present in `data` replaces the base value.
+def game_merge_extends(data, base):
+	if type(data) is not dict or type(base) is not dict:
+		return data
+	out = dict(base)
+	for key in data:
+		out[key] = game_merge_extends(data[key], base[key]) if key in base else data[key]
+	return out
+
+# Returns the path of the given resource followed by the paths of all resources it extends, in order.
+def game_get_extends_chain(resources, rel_path):
+	out = [rel_path]
+	while type(resources[out[-1]]["data"].get("_extends")) is str:
+		out.append(posixpath.normpath(resources[out[-1]]["data"]["_extends"]))
+	return out
+
+# Returns the SHA-1 hash of the contents of the given files of the game folder, in order. Mirrors `_Utils.hashFiles()`.
+# Used by generated files to tell whether the files they have been generated from have changed since.
+def game_hash_files(path, rel_paths):
+	sha = hashlib.sha1()
+	for rel_path in rel_paths:
+		with open(os.path.join(path, rel_path), "rb") as file:
+			sha.update(file.read())
+	return sha.hexdigest()
+
+# Returns the raw data of the given resource with its `_extends` chain resolved, and with the `_extends` field removed.
+# `_extends` paths are relative to the game folder, just like all resource references.
+# Throws an exception if the chain is circular or refers to a missing resource.
+def game_resolve_extends(resources, rel_path, visited = None):
+	visited = visited or []
+	if rel_path in visited:
+		raise Exception("Circular _extends chain: " + " -> ".join(visited + [rel_path]))
+	if not rel_path in resources or resources[rel_path]["data"] == None:
+		raise Exception("Resource not found: " + rel_path)
+	data = resources[rel_path]["data"]
+	if type(data) is not dict or not "_extends" in data:
+		return data
+	base = game_resolve_extends(resources, posixpath.normpath(data["_extends"]), visited + [rel_path])
+	data = dict(data)
+	del data["_extends"]
+	return game_merge_extends(data, base)
+
+
+
+# Matches the `_validated` stamp field, along with the comma separating it from the previous field.
+STAMP_PATTERN = re.compile(r',\s*"_validated"\s*:\s*"[^"]*"')
+# Matches the `$schema` field.
+SCHEMA_PATTERN = re.compile(r'"\$schema"\s*:\s*"[^"]*"')
+
+# Sets the `_validated` stamp in the raw contents of a JSON resource, placing it right after the `$schema` field.
+# If `stamp` is `None`, the stamp is removed instead. The rest of the file is left untouched, so that its formatting is preserved.
+def game_set_stamp(contents, stamp):
+	contents = STAMP_PATTERN.sub("", contents, 1)
+	match = SCHEMA_PATTERN.search(contents)
+	if stamp == None or match == None:
+		return contents
+	return contents[:match.end()] + ", \"_validated\": \"" + stamp + "\"" + contents[match.end():]
@@ -0,0 +1,453 @@
+# Offline simplifier for Collectible Generators and Color Generators.
+# Both are trees of entries evaluated by the engine every time a powerup or a shooter color is rolled
+# (see `Level:evaluateCollectibleGeneratorEntry()` and `Shooter:generateColor()`).
+# This pass rewrites them into equivalent, cheaper trees:
+#  - references to other Collectible Generators are inlined, and nested `combine`, `repeat` and `randomPick` entries are flattened,
+#  - conditions and counts which don't depend on runtime state are evaluated,
+#  - fully static Collectible Generators are replaced with a precomputed probability table (a single `randomPick`) when that is cheaper,
+#  - unreachable Color Generator fallbacks are removed.
+# The probability of every outcome is preserved exactly. The sequence of random numbers drawn by the engine is not.
+
+import json, math
+from fractions import Fraction
+
+from .game import game_load_resources, game_resolve_extends
+from .walker import docld_walk, data_get, data_set
+from .expression import expression_try_evaluate_static, expression_get_variables
+
+
+# A Collectible Generator entry which always evaluates to an empty list.
+CG_EMPTY = {"type": "combine", "entries": []}
+# The maximum number of distinct outcomes of a probability table.
+CG_TABLE_MAX_OUTCOMES = 32
+# The maximum number of collectibles in a single outcome of a probability table.
+CG_TABLE_MAX_LENGTH = 32
+# The maximum number of joint outcomes enumerated when tabulating a `randomPick` whose entries can evaluate to nothing.
+CG_TABLE_MAX_JOINT = 4096
+# The maximum weight in a probability table. Weights are passed to `math.random()`, so they must be reasonably small integers.
+CG_TABLE_MAX_WEIGHT = 1000000
+
+
+
+#
+#    COLLECTIBLE GENERATORS
+#
+
+# Returns `True` if the given Collectible Generator entry always evaluates to an empty list.
+def cg_is_empty(node):
+	return type(node) is dict and node["type"] == "combine" and len(node["entries"]) == 0
+
+# Returns a copy of the given entry with the given conditions checked before its own ones.
+# References (strings) are wrapped into a `collectibleGenerator` entry if they need conditions.
+def cg_add_conditions(node, conditions):
+	if len(conditions) == 0 or cg_is_empty(node):
+		return node
+	if type(node) is str:
+		return {"type": "collectibleGenerator", "generator": node, "conditions": conditions}
+	node = dict(node)
+	node["conditions"] = conditions + node.get("conditions", [])
+	return node
+
+# Returns the statically known number of times a `repeat` entry evaluates its child, or `None` if it is only known at runtime.
+# The engine uses a numeric `for` loop, so fractional counts are floored.
+def cg_get_static_count(node):
+	count = expression_try_evaluate_static(node["count"])
+	if (type(count) is not int and type(count) is not float) or math.isnan(count) or math.isinf(count):
+		return None
+	return int(math.floor(count))
+
+# Returns `True` if the given weight behaves as expected in `_Utils.weightedRandom()`, which draws integers.
+def cg_is_integer_weight(weight):
+	return (type(weight) is int or (type(weight) is float and weight.is_integer())) and weight > 0
+
+# Returns `True` if the given entry is known to never evaluate to an empty list.
+def cg_is_never_empty(node):
+	if type(node) is not dict or len(node.get("conditions", [])) > 0:
+		return False
+	if node["type"] == "collectible":
+		return True
+	elif node["type"] == "combine":
+		return any(cg_is_never_empty(entry) for entry in node["entries"])
+	elif node["type"] == "repeat":
+		count = cg_get_static_count(node)
+		return count != None and count >= 1 and cg_is_never_empty(node["entry"])
+	elif node["type"] == "randomPick":
+		return any(cg_is_never_empty(entry["entry"]) for entry in node["pool"])
+	return False
+
+# Returns the number of `evaluateCollectibleGeneratorEntry()` calls needed to evaluate the given entry once.
+# Entries with runtime counts are assumed to repeat once; references count as a single call.
+def cg_get_cost(node):
+	if type(node) is not dict:
+		return 1
+	if node["type"] == "collectibleGenerator":
+		return 1 + cg_get_cost(node["generator"])
+	elif node["type"] == "combine":
+		return 1 + sum(cg_get_cost(entry) for entry in node["entries"])
+	elif node["type"] == "repeat":
+		return 1 + max(cg_get_static_count(node) or 1, 0) * cg_get_cost(node["entry"])
+	elif node["type"] == "randomPick":
+		return 1 + sum(cg_get_cost(entry["entry"]) for entry in node["pool"])
+	return 1
+
+# Evaluates conditions which are known offline.
+# Returns the list of conditions which remain to be checked at runtime, or `None` if any of them is always false.
+def cg_simplify_conditions(conditions, result):
+	out = []
+	for condition in conditions:
+		value = expression_try_evaluate_static(condition, condition)
+		if value is condition and type(condition) is str and condition.startswith("${"):
+			# Depends on runtime state.
+			result["unsimplified"].append("runtime condition " + condition + " (reads " + ", ".join(expression_get_variables(condition) or ["random numbers"]) + ")")
+			out.append(condition)
+		elif value == None or value is False:
+			result["actions"].append("removed an entry whose condition " + json.dumps(condition) + " is always false")
+			return None
+		else:
+			result["actions"].append("removed condition " + json.dumps(condition) + " which is always true")
+	return out
+
+# Resolves a reference to another Collectible Generator and returns its simplified tree, or the reference itself if it can't be resolved.
+def cg_simplify_reference(reference, context, result, stack):
+	if reference in stack:
+		result["unsimplified"].append("circular reference to " + reference)
+		return reference
+	if not reference in context["simplified"]:
+		try:
+			target = game_resolve_extends(context["resources"], reference)
+		except Exception as e:
+			result["unsimplified"].append("unresolved reference " + reference + ": " + str(e))
+			return reference
+		context["simplified"][reference] = cg_simplify(target, context, result, stack + [reference])
+	result["actions"].append("inlined " + reference)
+	return context["simplified"][reference]
+
+# Flattens the given `randomPick` pool: entries which are themselves unconditional `randomPick`s of never-empty entries are merged into it.
+# All weights must be integers. Returns the new pool with integer weights.
+def cg_flatten_pool(pool, result):
+	weights = []
+	for entry in pool:
+		sub = entry["entry"]
+		weight = Fraction(int(entry.get("weight", 1)))
+		if (type(sub) is dict and sub["type"] == "randomPick" and len(sub.get("conditions", [])) == 0
+			and all(cg_is_never_empty(e["entry"]) and cg_is_integer_weight(e.get("weight", 1)) for e in sub["pool"])):
+			total = sum(int(e.get("weight", 1)) for e in sub["pool"])
+			for e in sub["pool"]:
+				weights.append((e["entry"], weight * int(e.get("weight", 1)) / total))
+			result["actions"].append("flattened a nested randomPick")
+		else:
+			weights.append((sub, weight))
+	integers = cg_fractions_to_integers([weight for sub, weight in weights])
+	out = []
+	for i in range(len(weights)):
+		out.append({"entry": weights[i][0]} if integers[i] == 1 else {"entry": weights[i][0], "weight": integers[i]})
+	return out
+
+# Scales a list of positive fractions to the smallest list of integers with the same proportions.
+def cg_fractions_to_integers(fractions):
+	multiplier = 1
+	for fraction in fractions:
+		multiplier = multiplier * fraction.denominator // math.gcd(multiplier, fraction.denominator)
+	integers = [int(fraction * multiplier) for fraction in fractions]
+	divisor = 0
+	for integer in integers:
+		divisor = math.gcd(divisor, integer)
+	return [integer // max(divisor, 1) for integer in integers]
+
+# Returns a simplified copy of the given Collectible Generator entry (inline data or a reference).
+# `result` collects the performed actions and the reasons why parts could not be simplified.
+def cg_simplify(node, context, result, stack = None):
+	stack = stack or []
+	if type(node) is str:
+		return cg_simplify_reference(node, context, result, stack)
+
+	conditions = cg_simplify_conditions(node.get("conditions", []), result)
+	if conditions == None:
+		return CG_EMPTY
+
+	if node["type"] == "collectible":
+		out = {"type": "collectible", "collectible": node["collectible"]}
+	elif node["type"] == "collectibleGenerator":
+		inner = cg_simplify(node["generator"], context, result, stack)
+		if type(inner) is str:
+			out = {"type": "collectibleGenerator", "generator": inner}
+		else:
+			return cg_add_conditions(inner, conditions)
+	elif node["type"] == "combine":
+		entries = []
+		for entry in node["entries"]:
+			entry = cg_simplify(entry, context, result, stack)
+			if cg_is_empty(entry):
+				continue
+			if type(entry) is dict and entry["type"] == "combine" and len(entry.get("conditions", [])) == 0:
+				result["actions"].append("flattened a nested combine")
+				entries += entry["entries"]
+			else:
+				entries.append(entry)
+		if len(entries) == 0:
+			return CG_EMPTY
+		if len(entries) == 1:
+			result["actions"].append("replaced a single-entry combine with its entry")
+			return cg_add_conditions(entries[0], conditions)
+		out = {"type": "combine", "entries": entries}
+	elif node["type"] == "repeat":
+		entry = cg_simplify(node["entry"], context, result, stack)
+		count = cg_get_static_count(node)
+		if count == None:
+			result["unsimplified"].append("runtime repeat count " + json.dumps(node["count"]))
+			out = {"type": "repeat", "entry": entry, "count": node["count"]}
+		elif count <= 0 or cg_is_empty(entry):
+			return CG_EMPTY
+		elif count == 1:
+			return cg_add_conditions(entry, conditions)
+		else:
+			if type(entry) is dict and entry["type"] == "repeat" and len(entry.get("conditions", [])) == 0 and cg_get_static_count(entry) != None:
+				result["actions"].append("merged nested repeats")
+				count *= cg_get_static_count(entry)
+				entry = entry["entry"]
+			out = {"type": "repeat", "entry": entry, "count": count}
+	elif node["type"] == "randomPick":
+		pool = []
+		for entry in node["pool"]:
+			sub = cg_simplify(entry["entry"], context, result, stack)
+			if cg_is_empty(sub):
+				continue
+			pool.append(dict(entry, entry = sub))
+		if len(pool) == 0:
+			return CG_EMPTY
+		if len(pool) == 1:
+			result["actions"].append("replaced a single-entry randomPick with its entry")
+			return cg_add_conditions(pool[0]["entry"], conditions)
+		if all(cg_is_integer_weight(entry.get("weight", 1)) for entry in pool):
+			pool = cg_flatten_pool(pool, result)
+		else:
+			result["unsimplified"].append("randomPick with fractional weights")
+		out = {"type": "randomPick", "pool": pool}
+	else:
+		return node
+
+	if len(conditions) > 0:
+		out["conditions"] = conditions
+	return out
+
+
+
+# Computes the exact probability distribution of outcomes of the given entry.
+# Returns a dictionary of outcomes (tuples of collectibles as JSON strings, in order) to their probabilities,
+# or `None` if the entry depends on runtime state or is too big to be tabulated.
+def cg_tabulate(node):
+	if type(node) is not dict or len(node.get("conditions", [])) > 0:
+		return None
+	if node["type"] == "collectible":
+		return {(json.dumps(node["collectible"], sort_keys = True),): Fraction(1)}
+	elif node["type"] == "combine":
+		out = {(): Fraction(1)}
+		for entry in node["entries"]:
+			out = cg_table_concat(out, cg_tabulate(entry))
+			if out == None:
+				return None
+		return out
+	elif node["type"] == "repeat":
+		count = cg_get_static_count(node)
+		table = cg_tabulate(node["entry"])
+		if count == None or table == None:
+			return None
+		out = {(): Fraction(1)}
+		for i in range(count):
+			out = cg_table_concat(out, table)
+			if out == None:
+				return None
+		return out
+	elif node["type"] == "randomPick":
+		if not all(cg_is_integer_weight(entry.get("weight", 1)) for entry in node["pool"]):
+			return None
+		tables = [cg_tabulate(entry["entry"]) for entry in node["pool"]]
+		if None in tables:
+			return None
+		weights = [int(entry.get("weight", 1)) for entry in node["pool"]]
+		return cg_table_pick(tables, weights)
+	return None
+
+# Returns the distribution of two independent outcomes concatenated, or `None` if either is `None` or the result is too big.
+def cg_table_concat(a, b):
+	if a == None or b == None:
+		return None
+	out = {}
+	for outcome_a in a:
+		for outcome_b in b:
+			outcome = outcome_a + outcome_b
+			if len(outcome) > CG_TABLE_MAX_LENGTH:
+				return None
+			out[outcome] = out.get(outcome, 0) + a[outcome_a] * b[outcome_b]
+			if len(out) > CG_TABLE_MAX_OUTCOMES:
+				return None
+	return out
+
+# Returns the distribution of a `randomPick`: all entries are evaluated, empty results are discarded, and one of the rest is picked by weight.
+def cg_table_pick(tables, weights):
+	joint_count = 1
+	for table in tables:
+		joint_count *= len(table)
+	if joint_count > CG_TABLE_MAX_JOINT:
+		return None
+	out = {}
+	# Enumerate every combination of outcomes of all entries.
+	joint = [((), Fraction(1))]
+	for table in tables:
+		joint = [(outcomes + (outcome,), probability * table[outcome]) for outcomes, probability in joint for outcome in table]
+	for outcomes, probability in joint:
+		total = sum(weights[i] for i in range(len(outcomes)) if len(outcomes[i]) > 0)
+		if total == 0:
+			out[()] = out.get((), 0) + probability
+			continue
+		for i in range(len(outcomes)):
+			if len(outcomes[i]) > 0:
+				out[outcomes[i]] = out.get(outcomes[i], 0) + probability * Fraction(weights[i], total)
+	if len(out) > CG_TABLE_MAX_OUTCOMES:
+		return None
+	return out
+
+# Converts a probability table from `cg_tabulate()` back into a Collectible Generator entry.
+# Returns `None` if the table can't be represented (a `randomPick` can't pick an empty result) or its weights would be too big.
+def cg_from_table(table):
+	outcomes = sorted(outcome for outcome in table if table[outcome] > 0)
+	if () in outcomes:
+		return CG_EMPTY if len(outcomes) == 1 else None
+	entries = []
+	for outcome in outcomes:
+		collectibles = [{"type": "collectible", "collectible": json.loads(c)} for c in outcome]
+		entries.append(collectibles[0] if len(collectibles) == 1 else {"type": "combine", "entries": collectibles})
+	if len(entries) == 1:
+		return entries[0]
+	weights = cg_fractions_to_integers([table[outcome] for outcome in outcomes])
+	if max(weights) > CG_TABLE_MAX_WEIGHT:
+		return None
+	pool = []
+	for i in range(len(entries)):
+		pool.append({"entry": entries[i]} if weights[i] == 1 else {"entry": entries[i], "weight": weights[i]})
+	return {"type": "randomPick", "pool": pool}
+
+# Fully optimizes a single Collectible Generator: simplifies the tree, and then swaps it for a probability table if that's cheaper.
+# Returns the optimized entry; `result` is filled with details for the report.
+def cg_optimize(node, context, result):
+	result["cost_before"] = cg_get_cost(node)
+	out = cg_simplify(node, context, result)
+	if type(out) is str:
+		out = {"type": "collectibleGenerator", "generator": out}
+	table = cg_tabulate(out)
+	if table != None:
+		table_node = cg_from_table(table)
+		if table_node == None:
+			result["unsimplified"].append("the probability table can't be represented (it can evaluate to nothing)")
+		elif cg_get_cost(table_node) < cg_get_cost(out):
+			result["actions"].append("replaced with a probability table of " + str(len(table)) + " outcomes")
+			result["table"] = True
+			out = table_node
+	result["cost_after"] = cg_get_cost(out)
+	return out
+
+
+
+#
+#    COLOR GENERATORS
+#
+
+# Returns `True` if the given Color Generator can fail, i.e. fall through to its fallback.
+def color_generator_can_fail(node):
+	if node["type"] == "random":
+		return node.get("hasToExist", False) or len(node["colors"]) == 0
+	elif node["type"] == "giveUp":
+		# This type always returns a color.
+		return False
+	return True
+
+# Returns a simplified copy of the given Color Generator (inline data). References are left as they are.
+def color_generator_simplify(node, context, result):
+	node = dict(node)
+	if node["type"] == "random" and node.get("hasToExist", False):
+		result["unsimplified"].append("random generator depends on the colors present on the board (hasToExist)")
+	elif node["type"] == "nearEnd":
+		result["unsimplified"].append("nearEnd generator depends on the board state")
+	elif node["type"] == "giveUp" and node.get("spawnableColorsOnly", False):
+		result["unsimplified"].append("giveUp generator depends on the level's spawnable colors")
+	if "fallback" in node:
+		if not color_generator_can_fail(node):
+			result["actions"].append("removed an unreachable fallback")
+			del node["fallback"]
+		elif type(node["fallback"]) is dict:
+			node["fallback"] = color_generator_simplify(node["fallback"], context, result)
+	return node
+
+# Optimizes a single Color Generator. Returns the optimized data; `result` is filled with details for the report.
+def color_generator_optimize(node, context, result):
+	result["cost_before"] = color_generator_get_depth(node)
+	out = color_generator_simplify(node, context, result)
+	result["cost_after"] = color_generator_get_depth(out)
+	return out
+
+# Returns the length of the inline fallback chain of the given Color Generator, including itself.
+def color_generator_get_depth(node):
+	if type(node) is not dict:
+		return 1
+	return 1 + (color_generator_get_depth(node["fallback"]) if "fallback" in node else 0)
+
+
+
+#
+#    GAMES
+#
+
+# Optimizers for each handled DocLang type.
+GENERATOR_OPTIMIZERS = {
+	"CollectibleGenerator": cg_optimize,
+	"ColorGenerator": color_generator_optimize
+}
+
+# Finds every Collectible Generator and Color Generator in the given game (both standalone files and inline data inside other resources)
+# and optimizes them.
+# Returns `{"resources": {path: optimized data}, "report": [...]}`, where `resources` only contains resources which have changed,
+# with their `_extends` chains resolved. Each report entry contains the resource `path`, `fields` leading to the generator,
+# its `type`, `cost_before`, `cost_after`, `table`, and lists of `actions` and `unsimplified` reasons.
+def generators_optimize_game(docld, path):
+	resources = game_load_resources(path)
+	context = {"resources": resources, "simplified": {}}
+	schema_types = {"collectible_generator.json": "CollectibleGenerator", "color_generator.json": "ColorGenerator"}
+	out = {"resources": {}, "report": []}
+
+	for rel_path in resources:
+		schema = resources[rel_path]["schema"]
+		docl_path = schema[:-5] + ".docl" if schema != None else None
+		if not docl_path in docld:
+			continue
+		try:
+			data = game_resolve_extends(resources, rel_path)
+		except Exception:
+			continue
+
+		# Gather the generators first, so that the data is not modified while being walked.
+		found = []
+		if schema in schema_types:
+			found.append((schema_types[schema], []))
+		else:
+			def callback(entry, value, fields):
+				if entry.get("type") in GENERATOR_OPTIMIZERS and type(value) is dict:
+					found.append((entry["type"], fields))
+					return False
+			docld_walk(docld[docl_path], data, callback, docld)
+
+		new_data = json.loads(json.dumps(data))
+		for generator_type, fields in found:
+			result = {"path": rel_path, "fields": fields, "type": generator_type, "table": False, "actions": [], "unsimplified": []}
+			node = data_get(data, fields)
+			optimized = GENERATOR_OPTIMIZERS[generator_type](node, context, result)
+			if len(fields) == 0:
+				# Preserve the file-level fields.
+				new_data = {key: node[key] for key in ["$schema", "_alias"] if key in node}
+				new_data.update(optimized)
+			else:
+				data_set(new_data, fields, optimized)
+			out["report"].append(result)
+		if new_data != data:
+			out["resources"][rel_path] = new_data
+
+	return out
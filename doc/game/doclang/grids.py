@@ -0,0 +1,93 @@
+# Path grid generator.
+# Shot Spheres look for path crossings and nearby spheres on every step of their flight, which would otherwise mean going through
+# every segment of every path of the map. This generator lays a uniform grid over each map and lists, for every cell, the path segments
+# which pass through it along with the path offset range of the part inside the cell, so that the engine only needs to check those.
+# Each map gets its own `maps/<map>/path_grid.json`:
+# `{"cellSize", "originX", "originY", "columns", "rows", "paths": [{"nodeCount", "length"}], "cells": {index: [[path, segment, from, to]]}}`,
+# where cell `index` is `(cellY - originY) * columns + (cellX - originX)`, and paths and segments (the ID of their first node) are 1-based.
+
+import os, math
+
+from .game import game_load_resources, game_resolve_extends
+
+
+# Name of the path grid file, relative to the map folder.
+PATH_GRID_NAME = "path_grid.json"
+
+# The size of a single grid cell, in pixels.
+PATH_GRID_CELL_SIZE = 64
+
+
+
+# Returns the segments of a path, given its data, as `(segment, x1, y1, x2, y2, offset, length)` tuples.
+# Segments and their lengths are the same as in `Path:prepareNodes()`: warp segments are there, but have a length of 0.
+def path_grid_get_segments(path_data):
+	nodes = path_data["nodes"]
+	out = []
+	offset = 0
+	for i in range(len(nodes) - 1):
+		x1, y1, x2, y2 = nodes[i]["x"], nodes[i]["y"], nodes[i + 1]["x"], nodes[i + 1]["y"]
+		length = 0 if nodes[i].get("warp", False) else math.sqrt((x2 - x1) ** 2 + (y2 - y1) ** 2)
+		out.append((i + 1, x1, y1, x2, y2, offset, length))
+		offset += length
+	return out
+
+# Clips a segment to a rectangle, including its edges, using the Liang-Barsky algorithm.
+# Returns the `(t1, t2)` range of the segment inside the rectangle, with 0 being the start of the segment and 1 its end, or `None` if it's outside.
+def path_grid_clip_segment(x1, y1, x2, y2, min_x, min_y, max_x, max_y):
+	t1, t2 = 0, 1
+	dx, dy = x2 - x1, y2 - y1
+	for p, q in [(-dx, x1 - min_x), (dx, max_x - x1), (-dy, y1 - min_y), (dy, max_y - y1)]:
+		if p == 0:
+			if q < 0:
+				return None
+		elif p < 0:
+			t1 = max(t1, q / p)
+		else:
+			t2 = min(t2, q / p)
+	if t1 > t2:
+		return None
+	return t1, t2
+
+# Builds the path grid of a single map, given the list of its path data.
+def path_grid_build(paths, cell_size = PATH_GRID_CELL_SIZE):
+	segments = [path_grid_get_segments(path_data) for path_data in paths]
+	xs = [x for path in segments for segment in path for x in (segment[1], segment[3])] or [0]
+	ys = [y for path in segments for segment in path for y in (segment[2], segment[4])] or [0]
+	origin_x, origin_y = math.floor(min(xs) / cell_size), math.floor(min(ys) / cell_size)
+	columns = math.floor(max(xs) / cell_size) - origin_x + 1
+	rows = math.floor(max(ys) / cell_size) - origin_y + 1
+	out = {"cellSize": cell_size, "originX": origin_x, "originY": origin_y, "columns": columns, "rows": rows, "paths": [], "cells": {}}
+	for i, path in enumerate(segments):
+		out["paths"].append({"nodeCount": len(paths[i]["nodes"]), "length": sum(segment[6] for segment in path)})
+		for segment, x1, y1, x2, y2, offset, length in path:
+			# Only the cells overlapping the segment's bounding box can contain it.
+			for cell_y in range(math.floor(min(y1, y2) / cell_size), math.floor(max(y1, y2) / cell_size) + 1):
+				for cell_x in range(math.floor(min(x1, x2) / cell_size), math.floor(max(x1, x2) / cell_size) + 1):
+					clip = path_grid_clip_segment(x1, y1, x2, y2, cell_x * cell_size, cell_y * cell_size, (cell_x + 1) * cell_size, (cell_y + 1) * cell_size)
+					if clip == None:
+						continue
+					index = (cell_y - origin_y) * columns + (cell_x - origin_x)
+					out["cells"].setdefault(str(index), []).append([i + 1, segment, offset + clip[0] * length, offset + clip[1] * length])
+	return out
+
+# Builds the path grids of all maps of the given game folder.
+# Maps are found the same way `maps_build_catalog()` does it: every folder inside `maps` which contains a `config.json` file.
+# Returns `{"grids": {map folder name: grid}, "errors": {map folder name: message}}`.
+def path_grids_build_game(path):
+	out = {"grids": {}, "errors": {}}
+	maps_path = os.path.join(path, "maps")
+	if not os.path.isdir(maps_path):
+		return out
+	resources = game_load_resources(path)
+	for name in sorted(os.listdir(maps_path)):
+		if not os.path.isfile(os.path.join(maps_path, name, "config.json")):
+			continue
+		try:
+			paths = game_resolve_extends(resources, "maps/" + name + "/config.json")["paths"]
+			# Paths can be references to Path resources.
+			paths = [game_resolve_extends(resources, path_data) if type(path_data) is str else path_data for path_data in paths]
+			out["grids"][name] = path_grid_build(paths)
+		except Exception as e:
+			out["errors"][name] = str(e)
+	return out
@@ -0,0 +1,109 @@
+# Layer reference validator.
+# Layers are referred to by name all over the game data (`particleLayer`, `spriteHiddenLayer`, `layer`, ...), but only the layer list file
+# (`config/layers.json`, as selected by the `layers` field of `config.json`) defines them, and a misspelled name is silently drawn below
+# all other layers. This validator finds every layer reference, including the defaults of omitted fields, and reports unknown names.
+# It also emits the layer name to integer ID table, which is the same one `Renderer:setLayers()` builds: IDs are 1-based positions
+# in the layer list, and unknown layers get the ID `0`.
+
+import re
+
+from .game import game_load_resources, game_resolve_extends, game_get_docl_path
+from .walker import docld_walk
+
+
+# Path to the game config, which selects the layer list file, relative to the game folder.
+LAYERS_CONFIG_PATH = "config.json"
+# The layer list used by the engine when the game config doesn't select any.
+LAYERS_DEFAULT = ["MAIN"]
+
+# Matches names of the fields which hold layer names, ex: `layer`, `particleLayer`, `shadowSpriteHiddenLayer`.
+LAYER_FIELD_PATTERN = re.compile(r"^(layer|\w+Layer)$")
+
+
+
+# Returns whether the given DocLD entry describes a field which holds a layer name.
+def layer_is_field(entry):
+	return entry.get("type") == "string" and LAYER_FIELD_PATTERN.match(entry.get("name", "")) != None
+
+# Returns the layer list of the given game resources, either from the file selected by the game config, an inline layer list or the default one.
+# Throws an exception if the layer list file is missing.
+def layers_load(resources):
+	if not LAYERS_CONFIG_PATH in resources or type(resources[LAYERS_CONFIG_PATH]["data"]) is not dict:
+		return LAYERS_DEFAULT
+	layers = resources[LAYERS_CONFIG_PATH]["data"].get("layers")
+	if layers == None:
+		return LAYERS_DEFAULT
+	if type(layers) is str:
+		layers = game_resolve_extends(resources, layers)
+	return layers["layers"]
+
+# Returns a dictionary of layer names to their IDs. Throws a `ValueError` if a layer is listed more than once.
+def layers_get_ids(layers):
+	out = {}
+	for i, layer in enumerate(layers):
+		if layer in out:
+			raise ValueError("layers[" + str(i) + "]: layer " + repr(layer) + " is already listed as layers[" + str(out[layer] - 1) + "]")
+		out[layer] = i + 1
+	return out
+
+# Returns a dictionary of layer names to the list of places which refer to them, as `"path[field][field]..."` strings.
+# Fields which are omitted, but have a default layer, are returned as well, with ` (default)` appended to their place.
+# JSON files which aren't resources (e.g. UI layouts) are searched for fields named like layer fields.
+def layer_find_references(docld, resources, errors):
+	out = {}
+	def add(layer, where):
+		out.setdefault(layer, []).append(where)
+
+	for rel_path in resources:
+		schema = resources[rel_path]["schema"]
+		if schema == None or not game_get_docl_path(schema) in docld:
+			continue
+		try:
+			data = game_resolve_extends(resources, rel_path)
+		except Exception as e:
+			errors[rel_path] = str(e)
+			continue
+		def callback(entry, value, fields):
+			where = rel_path + "".join("[" + str(field) + "]" for field in fields)
+			if layer_is_field(entry) and type(value) is str:
+				add(value, where)
+			elif entry.get("type") == "object" and type(value) is dict:
+				for child in entry.get("children", []):
+					if layer_is_field(child) and "default" in child and not child["name"] in value:
+						add(child["default"], where + "[" + child["name"] + "] (default)")
+		docld_walk(docld[game_get_docl_path(schema)], data, callback, docld)
+
+	def search(value, where):
+		if type(value) is dict:
+			for key in value:
+				if LAYER_FIELD_PATTERN.match(key) and type(value[key]) is str:
+					add(value[key], where + "[" + key + "]")
+				else:
+					search(value[key], where + "[" + key + "]")
+		elif type(value) is list:
+			for i in range(len(value)):
+				search(value[i], where + "[" + str(i) + "]")
+	for rel_path in resources:
+		if resources[rel_path]["schema"] == None and resources[rel_path]["data"] != None:
+			search(resources[rel_path]["data"], rel_path)
+	return out
+
+# Validates all layer references of the given game folder, using the DocLD trees of all resource types to find them.
+# Returns `{"ids": {layer: ID}, "references": {layer: [places]}, "unused": [layer], "errors": {place: message}}`.
+# Layers set from Lua code (e.g. UI scripts) can't be found, so unused layers are only worth a look, not an error.
+def layers_validate_game(docld, path):
+	resources = game_load_resources(path)
+	out = {"ids": {}, "references": {}, "unused": [], "errors": {}}
+	try:
+		layers = layers_load(resources)
+		out["ids"] = layers_get_ids(layers)
+	except Exception as e:
+		out["errors"][LAYERS_CONFIG_PATH] = str(e)
+		return out
+	out["references"] = layer_find_references(docld, resources, out["errors"])
+	for layer in sorted(out["references"]):
+		if not layer in out["ids"]:
+			for where in out["references"][layer]:
+				out["errors"][where] = "unknown layer " + repr(layer)
+	out["unused"] = [layer for layer in layers if not layer in out["references"]]
+	return out
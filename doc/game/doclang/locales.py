@@ -0,0 +1,82 @@
+# Locale compiler.
+# Compiles all Locale files of a game into a single string table (`locales.json`), with stable key IDs for tooling, and reports missing translations.
+# The engine doesn't read the string table: it looks translations up by key in the Locale itself, which is a single table lookup already.
+# The string table contains:
+# - `keys` - all locale keys; the ID of a key is its position in this list, starting at 1. IDs never change once assigned:
+#   new keys are appended at the end, and keys which are no longer used by any locale are replaced with `null`,
+# - `strings` - all translations, each unique string stored only once,
+# - `locales` - for each Locale path, a list of positions in `strings` (starting at 1) for each key ID, or 0 if the key is not translated.
+
+import os, json
+
+from .utils import load_file
+from .game import game_load_resources, game_get_resources_of_type, game_resolve_extends
+
+
+# Path to the compiled string table, relative to the game folder.
+LOCALE_TABLE_PATH = "locales.json"
+
+
+
+# Loads the string table previously compiled for the given game folder. Returns `None` if there is none.
+def locales_load_table(path):
+	try:
+		return json.loads(load_file(os.path.join(path, LOCALE_TABLE_PATH)))
+	except (IOError, ValueError):
+		return None
+
+# Compiles the given locales, a dictionary of Locale paths to their `keys` dictionaries, into a string table.
+# If `old_table` is given, all of its key IDs are preserved.
+# Returns `{"table": string table, "coverage": {path: {"translated", "total", "missing"}}, "duplicates": number of deduplicated strings}`.
+def locales_compile(locales, old_table = None):
+	all_keys = set()
+	for rel_path in locales:
+		all_keys.update(locales[rel_path])
+
+	# Assign key IDs, keeping the old ones.
+	keys = list(old_table["keys"]) if old_table != None else []
+	ids = {}
+	for i in range(len(keys)):
+		if keys[i] in all_keys:
+			ids[keys[i]] = i
+		else:
+			keys[i] = None
+	for key in sorted(all_keys):
+		if not key in ids:
+			ids[key] = len(keys)
+			keys.append(key)
+
+	out = {"table": {"keys": keys, "strings": [], "locales": {}}, "coverage": {}, "duplicates": 0}
+	string_ids = {}
+	for rel_path in sorted(locales):
+		indices = [0] * len(keys)
+		for key in sorted(locales[rel_path]):
+			string = locales[rel_path][key]
+			if string in string_ids:
+				out["duplicates"] += 1
+			else:
+				out["table"]["strings"].append(string)
+				string_ids[string] = len(out["table"]["strings"])
+			indices[ids[key]] = string_ids[string]
+		out["table"]["locales"][rel_path] = indices
+		out["coverage"][rel_path] = {
+			"translated": len(locales[rel_path]),
+			"total": len(all_keys),
+			"missing": sorted(key for key in all_keys if not key in locales[rel_path])
+		}
+	return out
+
+# Compiles all Locales of the given game folder, keeping key IDs from its current string table.
+# Returns the result of `locales_compile()`, with an additional `"errors": {path: message}` field.
+def locales_compile_game(path):
+	resources = game_load_resources(path)
+	locales = {}
+	errors = {}
+	for rel_path in game_get_resources_of_type(resources, "locale.json"):
+		try:
+			locales[rel_path] = game_resolve_extends(resources, rel_path)["keys"]
+		except Exception as e:
+			errors[rel_path] = str(e)
+	out = locales_compile(locales, locales_load_table(path))
+	out["errors"] = errors
+	return out
@@ -0,0 +1,502 @@
+# The Lua Config Class backend.
+
+from .utils import is_regex_numeric
+from .docld import docl_to_docld
+
+
+
+# Returns whether the entry has at least a single Vector2 structure inside itself which has a default value.
+def docld_contains_default_vector(entry):
+	if "type" in entry and entry["type"] == "Vector2" and "default" in entry:
+		return True
+	if "children" in entry:
+		for child in entry["children"]:
+			if docld_contains_default_vector(child):
+				return True
+	return False
+
+# Returns the field paths of all regular objects (not Regex Objects) inside the entry, in the same format as the field read counts
+# of instrumented Config Classes: fields are separated with dots, and elements of arrays and Regex Objects are marked with `[]`.
+# ex: ["richPresence", "sounds[]", "sounds[].effect"]
+def docld_to_lua_object_paths(entry, label = ""):
+	out = []
+	if entry.get("type") == "object" and not "regex" in entry:
+		if label != "":
+			out.append(label)
+		children = []
+		for child in entry.get("children", []):
+			if "const" in child:
+				children += child.get("children", [])
+			elif "name" in child:
+				children.append(child)
+		for child in children:
+			out += docld_to_lua_object_paths(child, (label + "." if label != "" else "") + child["name"])
+	elif entry.get("type") in ["object", "array"]:
+		out += docld_to_lua_object_paths(entry["children"][0], label + "[]")
+	return out
+
+
+
+
+# Converts a list of fields to traverse through, such as `{{"type": "string", "value": "integers"}, {"type": "integer", "value": "n"}}`
+# into e.g. `"{\"integers\", n}"`.
+def docld_to_lua_index(fields):
+	out = "{"
+	for i in range(len(fields)):
+		field = fields[i]
+		if i > 0:
+			out += ", "
+		if field["type"] == "string":
+			out += "\"" + field["value"] + "\""
+		elif field["type"] == "integer":
+			out += str(field["value"])
+		elif field["type"] == "ref_string":
+			out += field["value"]
+		elif field["type"] == "ref_integer":
+			out += str(field["value"])
+	return out + "}"
+
+# Converts a list of fields to traverse through, such as `{{"type": "string", "value": "integers"}, {"type": "integer", "value": "n"}}`
+# into e.g. `".integers[n]"`.
+# ref_string is indexed by `[n]` instead of `.n`
+# ref_integer is indexed by `[tonumber(n)]` instead of `[n]`
+def docld_to_lua_context(fields):
+	out = ""
+	for i in range(len(fields)):
+		field = fields[i]
+		if field["type"] == "string":
+			out += "." + field["value"]
+		elif field["type"] == "integer":
+			out += "[" + str(field["value"]) + "]"
+		elif field["type"] == "ref_string":
+			out += "[" + field["value"] + "]"
+		elif field["type"] == "ref_integer":
+			out += "[tonumber(" + str(field["value"]) + ")]"
+	return out
+
+# Same as `docld_to_lua_context()`, but for indexing the raw `data` table instead of `self`.
+# Keys of decoded JSON objects are always strings, so ref_integer is indexed by `[n]` here, just like ref_string.
+def docld_to_lua_data_context(fields):
+	return docld_to_lua_context([{"type": "ref_string", "value": field["value"]} if field["type"] == "ref_integer" else field for field in fields])
+
+# Determines LDoc (luadoc) type from the DocLD entry, without the `---@type ` prefix.
+def docld_to_lua_ldoc(entry):
+	# TODO: Do something with this.
+	structure_config_lookup = ["number","integer","boolean","string","Vector2","Color","Sprite","Image","ColorPalette","Font","FontFile","SoundEvent","Sound","MusicTrack","MusicPlaylist"]
+
+	optional = entry["optional"]
+	out = ""
+	if "expression" in entry:
+		if entry["expression"]:
+			out = "Expression"
+	elif "type" in entry:
+		if entry["type"] == "object":
+			if "keyconst" in entry:
+				# Enum object.
+				# TODO: Do something with this.
+				out = "table"
+			elif "regex" in entry:
+				# Regex object.
+				if not "children" in entry or len(entry["children"]) != 1:
+					raise Exception("Regex Objects must have exactly one child!")
+				key_type = "number" if is_regex_numeric(entry["regex"]) else "string"
+				out = "table<" + key_type + ", " + docld_to_lua_ldoc(entry["children"][0]) + ">"
+			else:
+				# Regular object.
+				out = "{"
+				if "children" in entry:
+					for child in entry["children"]:
+						if out != "{":
+							out += ", "
+						if not "name" in child:
+							raise Exception("Regular objects' children must have a name!")
+						out += child["name"] + ": " + docld_to_lua_ldoc(child)
+				out += "}"
+			# Optional objects and arrays are actually always prepended, even if they are optional and no data is there.
+			optional = False
+		elif entry["type"] == "array":
+			if not "children" in entry or len(entry["children"]) != 1:
+				raise Exception("Arrays must have exactly one child!")
+			out = docld_to_lua_ldoc(entry["children"][0]) + "[]"
+			# Optional objects and arrays are actually always prepended, even if they are optional and no data is there.
+			optional = False
+		elif entry["type"] == "string":
+			if "children" in entry:
+				# Enum string.
+				for child in entry["children"]:
+					if out != "":
+						out += "|"
+					out += "\"" + child["const"] + "\""
+			else:
+				# A regular string.
+				out = "string"
+		else:
+			out = entry["type"]
+			if not entry["type"] in structure_config_lookup:
+				out += "Config"
+	if optional and not "default" in entry:
+		out += "?"
+	return out
+
+
+
+# Converts the default value of a simple entry to Lua code.
+def docld_to_lua_default(entry):
+	if entry["type"] == "boolean":
+		return "true" if entry["default"] else "false"
+	elif entry["type"] == "string":
+		return "\"" + entry["default"] + "\""
+	elif entry["type"] == "Vector2":
+		if entry["default"]["x"] == 0 and entry["default"]["y"] == 0:
+			return "Vec2()"
+		return "Vec2(" + str(entry["default"]["x"]) + ", " + str(entry["default"]["y"]) + ")"
+	return str(entry["default"])
+
+# Converts a single entry's simple value (not an array, not an object) to the part after the `=` sign in Lua config class code.
+# `name` will be overwritten if it exists in the entry.
+def docld_to_lua_value(entry, class_name, fields, optional):
+	lua_type_assoc = {
+		"number": "parseNumber",
+		"integer": "parseInteger",
+		"string": "parseString",
+		"boolean": "parseBoolean",
+		"Vector2": "parseVec2",
+		"Color": "parseColor",
+		"Sprite": "parseSprite",
+		"Image": "parseImage",
+		"ColorPalette": "parseColorPalette",
+		"Font": "parseFont",
+		"FontFile": "parseFontFile",
+		"SoundEvent": "parseSoundEvent",
+		"Sound": "parseSound",
+		"MusicTrack": "parseMusicTrack",
+		"MusicPlaylist": "parseMusicPlaylist"
+	}
+	lua_expr_type_assoc = {
+		"number": "parseExprNumber",
+		"integer": "parseExprInteger",
+		"string": "parseExprString",
+		"boolean": "parseExprBoolean",
+		"Vector2": "parseExprVec2"
+	}
+	
+	# Deal with simple fields.
+	if "type" in entry:
+		if entry["type"] == "object" or entry["type"] == "array":
+			raise Exception("ERROR: Cannot get a generic object or array parser")
+		lookup = lua_expr_type_assoc if "expression" in entry else lua_type_assoc
+		if entry["type"] in lookup:
+			function = "u." + lookup[entry["type"]]
+		else:
+			# If the provided type is not present in the lookup, assume a registered resource parser such as `parseCollectibleGeneratorConfig`
+			function = "u.parse" + entry["type"] + "Config"
+		if optional and not "default" in entry:
+			function += "Opt"
+		default = ", " + docld_to_lua_default(entry) if "default" in entry else ""
+		return function + "(data, base, path, " + docld_to_lua_index(fields) + default + ")"
+	elif "const" in entry:
+		raise Exception("TODO: Consts not supported")
+	elif "types" in entry:
+		raise Exception("TODO: Multitypes aren't supported")
+	raise Exception("TODO: something not supported at all!!!")
+
+# Converts a single entry's simple value to the part after the `=` sign in the trusted constructor of a Lua config class.
+# The trusted constructor is only used for data which has been validated against the schema, so the value is read directly from `data`
+# and no checks are performed. Resources which extend other resources are never constructed this way, so `base` is not used.
+def docld_to_lua_trusted_value(entry, fields):
+	lua_resource_types = ["Sprite", "Image", "ColorPalette", "Font", "FontFile", "SoundEvent", "Sound", "MusicTrack", "MusicPlaylist"]
+
+	value = "data" + docld_to_lua_data_context(fields)
+	default = docld_to_lua_default(entry) if "default" in entry else None
+	if "expression" in entry:
+		return "u.trustExpr(" + value + (", " + default if default != None else "") + ")"
+	elif entry["type"] == "boolean":
+		return value if default == None else "u.trustBoolean(" + value + ", " + default + ")"
+	elif entry["type"] in ["number", "integer", "string"]:
+		return value if default == None else value + " or " + default
+	elif entry["type"] == "Vector2":
+		return "u.trustVec2(" + value + (", " + default if default != None else "") + ")"
+	elif entry["type"] == "Color":
+		# DocLang has no syntax for Color defaults, so `u.trustColor()` doesn't take one.
+		if default != None:
+			raise Exception("Color fields can't have default values")
+		return "u.trustColor(" + value + ")"
+	elif entry["type"] in lua_resource_types:
+		return "u.trustResource(" + value + ", \"get" + entry["type"] + "\")"
+	return "u.trustConfig(" + value + ", path, \"" + entry["type"] + "\")"
+
+# Converts DocLangData to raw Lua config class information.
+# You might want to convert it to a fully fledged Lua config class by further processing the result using `docld_to_lua_pack()` and `docld_to_lua_finalize()`.
+# If `trusted` is set, the code is generated for the trusted constructor (see `docld_to_lua_trusted_value()`).
+def docld_to_lua_raw(entry, class_name, schema_path, is_root = True, fields = [], iterators_used = 0, trusted = False):
+	out = []
+
+	optional = entry["optional"]
+	if "name" in entry:
+		name = entry["name"]
+	
+	# Generate contexts.
+	fields_with_name = fields + [{"type": "string", "value": name}] if "name" in entry else fields
+	context = docld_to_lua_context(fields)
+	context_with_name = docld_to_lua_context(fields_with_name)
+	data_context_with_name = docld_to_lua_data_context(fields_with_name)
+
+	# Deal with fields.
+	if "type" in entry:
+		if entry["type"] == "object":
+			if not is_root:
+				# The root object is the class itself, hence the `not is_root` check.
+				table_id = "self" + context_with_name
+				if not optional or "default" in entry:
+					out.append(table_id + " = {}")
+				if optional:
+					out.append("if data" + data_context_with_name + " then")
+					out.append(1)
+					if not "default" in entry:
+						out.append(table_id + " = {}")
+			if "regex" in entry:
+				# So-called "Regex Object".
+				child = entry["children"][0]
+				out.append("for n, _ in pairs(data" + data_context_with_name + ") do")
+				out.append(1)
+				if is_regex_numeric(entry["regex"]):
+					new_fields = fields_with_name + [{"type": "ref_integer", "value": "n"}]
+				else:
+					new_fields = fields_with_name + [{"type": "ref_string", "value": "n"}]
+				out += docld_to_lua_raw(child, class_name, schema_path, False, new_fields, iterators_used, trusted)
+				out.append(-1)
+				out.append("end")
+			elif "keyconst" in entry:
+				# So-called "Enum Object".
+				full_keyconst = context_with_name + "." + entry["keyconst"]
+				if trusted:
+					out.append("self" + full_keyconst + " = data" + data_context_with_name + "." + entry["keyconst"])
+				else:
+					out.append("self" + full_keyconst + " = u.parseString(data, base, path, " + docld_to_lua_index(fields_with_name + [{"type": "string", "value": entry["keyconst"]}]) + ")")
+				error_msg = ""
+				children_processed = 0
+				for child in entry["children"]:
+					if "const" in child: # One of the choices in the Enum Object for the typed variable.
+						out.append(("if" if children_processed == 0 else "elseif") + " self" + full_keyconst + " == \"" + child["const"] + "\" then")
+						out.append(1)
+						if "children" in child:
+							for subchild in child["children"]:
+								out += docld_to_lua_raw(subchild, class_name, schema_path, False, fields_with_name, iterators_used, trusted)
+						else:
+							out.append("-- No fields")
+						out.append(-1)
+						if children_processed > 0:
+							# TODO: This check should not count extra items. For now, the "or" sugar is disabled.
+							if False and child == entry["children"][-1]:
+								error_msg += " or "
+							else:
+								error_msg += ", "
+						error_msg += "\\\"" + child["const"] + "\\\""
+						children_processed += 1
+				out.append("else")
+				out.append("    error(string.format(\"Unknown " + (name if "name" in entry else class_name) + " type: %s (expected " + error_msg + ")\", self" + full_keyconst + "))")
+				out.append("end")
+			# Regular object, AND extra children in the enum/regex objects.
+			if "children" in entry:
+				for child in entry["children"]:
+					# Either not a choice in the Enum Object or not the first child (since we've assigned it) in the Regex Object.
+					# Uhm... is there any point to extra entries in Regex Objects? I don't see any support or ideas for them anywhere...
+					if not "const" in child and (not "regex" in entry or child != entry["children"][0]):
+						distinguish_block = (not "type" in child or child["type"] != "string") and "children" in child
+						if distinguish_block and (len(out) > 0 and out[-1] != ""):
+							out.append("")
+						if "children" in child:
+							out.append("---@type " + docld_to_lua_ldoc(child))
+						out += docld_to_lua_raw(child, class_name, schema_path, False, fields_with_name, iterators_used, trusted)
+						if distinguish_block:
+							out.append("")
+			if not is_root:
+				if optional:
+					out.append(-1)
+					out.append("end")
+				if "name" in entry and out[-1] != "":
+					out.append("")
+		elif entry["type"] == "array":
+			if len(out) > 0 and out[-1] != "":
+				out.append("")
+			child = entry["children"][0]
+			table_id = context_with_name
+			# If it's more than 5 layers deep, that's your fault !! lol
+			# I know this is some really terrible Python code
+			# Can YOU make it 40,000,000,000% faster?
+			if iterators_used >= 5:
+				raise Exception("Maximum amount of 5 iterators exhausted. Check depth of your data!")
+			iterator = "ijklm"[iterators_used]
+			new_fields = fields_with_name + [{"type": "integer", "value": iterator}]
+			out.append("self" + table_id + " = {}")
+			if optional:
+				out.append("if data" + data_context_with_name + " then")
+				out.append(1)
+			out.append("for " + iterator + " = 1, #data" + data_context_with_name + " do")
+			out.append(1)
+			out += docld_to_lua_raw(child, class_name, schema_path, False, new_fields, iterators_used + 1, trusted)
+			out.append(-1)
+			out.append("end")
+			if optional:
+				out.append(-1)
+				out.append("end")
+			out.append("")
+		else:
+			if trusted:
+				out.append("self" + context_with_name + " = " + docld_to_lua_trusted_value(entry, fields_with_name))
+			else:
+				out.append("self" + context_with_name + " = " + docld_to_lua_value(entry, class_name, fields_with_name, optional))
+	elif "const" in entry:
+		print("TODO: Consts not supported")
+	elif "types" in entry:
+		print("TODO: Multitypes aren't supported")
+	
+	# Remove all trailing empty lines.
+	while len(out) > 0 and (out[-1] == ""):
+		out.pop()
+	
+	return out
+
+# Packs the raw list of lines and indentation instructions with everything that makes it a valid Config Class file.
+# This includes class header, necessary `require`s, a Resource Manager injector
+# The result is still a raw list and must be processed into valid Lua code with `docld_to_lua_finalize()`.
+# If `raw_trusted` is given, a trusted constructor (`:newTrusted()`) is generated from it as well, and `schema_hash` is stored in the metadata
+# so that the engine can tell whether a resource has been validated against the current schema.
+# If `instrumented` is set, the constructors make their instances count reads of their fields (see `_ConfigUtils.instrumentConfig()`),
+# which is used for field usage profiling. Such Config Classes are much slower to access and must not be shipped.
+def docld_to_lua_pack(raw, entry, class_name, schema_path, raw_trusted = None, schema_hash = None, instrumented = False):
+	out = []
+
+	# Lines to go before the raw contents.
+	out.append("--!!--")
+	out.append("-- Auto-generated by DocLang Generator")
+	out.append("-- REMOVE THIS COMMENT IF YOU MODIFY THIS FILE")
+	out.append("-- in order to protect it from being overwritten!")
+	out.append("--!!--")
+	out.append("")
+	out.append("local class = require \"com.class\"")
+	# Predict the Vector2 require for default vector parameters.
+	if docld_contains_default_vector(entry):
+		out.append("local Vec2 = require(\"src.Essentials.Vector2\")")
+	out.append("")
+	out.append("---@class " + class_name)
+	out.append("---@overload fun(data, path, isAnonymous):" + class_name)
+	out.append("local " + class_name + " = class:derive(\"" + class_name + "\")")
+	out.append("")
+	out.append(class_name + ".metadata = {")
+	out.append(1)
+	out.append("schemaPath = \"" + schema_path + "\"" + ("," if schema_hash != None or instrumented else ""))
+	if schema_hash != None:
+		out.append("schemaHash = \"" + schema_hash + "\"" + ("," if instrumented else ""))
+	if instrumented:
+		out.append("objects = {" + ", ".join("\"" + path + "\"" for path in docld_to_lua_object_paths(entry)) + "}")
+	out.append(-1)
+	out.append("}")
+	out.append("")
+	out.append("---Constructs an instance of " + class_name + ".")
+	out.append("---@param data table Raw data from a file.")
+	out.append("---@param path string? Path to the file. Used for error messages and saving data.")
+	out.append("---@param isAnonymous boolean? If `true`, this resource is anonymous and its path is invalid for saving data.")
+	out.append("---@param base " + class_name + "? If specified, this resource extends the provided resource. Any missing fields are prepended from the base resource.")
+	out.append("function " + class_name + ":new(data, path, isAnonymous, base)")
+	out.append(1)
+	out.append("local u = _ConfigUtils")
+	out.append("self._path = path")
+	out.append("self._alias = data._alias")
+	out.append("self._isAnonymous = isAnonymous")
+	out.append("")
+	out.append("base = base or {}")
+	out.append("")
+
+	# Add raw contents. Instrumented constructors don't count reads of the base resource, even if they fail.
+	if instrumented:
+		out.append("u.withFieldReadsPaused(function()")
+		out.append(1)
+		out += raw
+		out.append(-1)
+		out.append("end)")
+		out.append("u.instrumentConfig(self, " + class_name + ")")
+	else:
+		out += raw
+
+	# Lines to go after the raw contents.
+	out.append(-1)
+	out.append("end")
+	out.append("")
+
+	if raw_trusted != None:
+		out.append("---Constructs an instance of " + class_name + " from data which has been validated against its schema at build time.")
+		out.append("---No checks are performed. Used by the Resource Manager for resources with a matching `_validated` stamp.")
+		out.append("---@param data table Raw data from a file.")
+		out.append("---@param path string? Path to the file. Used for error messages and saving data.")
+		out.append("---@param isAnonymous boolean? If `true`, this resource is anonymous and its path is invalid for saving data.")
+		out.append("function " + class_name + ":newTrusted(data, path, isAnonymous)")
+		out.append(1)
+		out.append("local u = _ConfigUtils")
+		out.append("self._path = path")
+		out.append("self._alias = data._alias")
+		out.append("self._isAnonymous = isAnonymous")
+		out.append("")
+		out += raw_trusted
+		if instrumented:
+			out.append("")
+			out.append("u.instrumentConfig(self, " + class_name + ")")
+		out.append(-1)
+		out.append("end")
+		out.append("")
+	out.append("---Injects functions to Resource Manager regarding this resource type.")
+	out.append("---@param ResourceManager ResourceManager Resource Manager class to inject the functions to.")
+	out.append("function " + class_name + ".inject(ResourceManager)")
+	out.append(1)
+	out.append("---@class ResourceManager")
+	out.append("ResourceManager = ResourceManager")
+	out.append("")
+	out.append("---Retrieves a " + class_name + " by given path.")
+	out.append("---@param reference string The path to the resource.")
+	out.append("---@return " + class_name)
+	out.append("function ResourceManager:get" + class_name + "(reference)")
+	out.append(1)
+	out.append("return self:getResourceConfig(reference, \"" + class_name[:-6] + "\")")
+	out.append(-1)
+	out.append("end")
+	out.append(-1)
+	out.append("end")
+	out.append("")
+	out.append("return " + class_name)
+
+	return out
+
+# Finalizes the generated Lua config class code by turning a raw list of lines and indentation instructions
+# into a single string which is (hopefully) a valid Lua code.
+def docld_to_lua_finalize(raw):
+	output = ""
+	indent = 0
+	for i in range(len(raw)):
+		if type(raw[i]) is int:
+			# Integers are indentation instructions.
+			indent += raw[i]
+		else:
+			if raw[i] == "":
+				# Don't indent empty lines.
+				output += "\n"
+				continue
+			output += "    " * indent + raw[i] + "\n"
+	# Remove the last newline.
+	return output[:-1]
+
+# Converts DocLangData to a Lua config class.
+# If `schema_hash` is given, the class gets a trusted constructor as well. If `instrumented` is set, the class counts reads of its fields.
+# See `docld_to_lua_pack()` for both.
+def docld_to_lua(entry, class_name, schema_path, pack = True, schema_hash = None, instrumented = False):
+	raw = docld_to_lua_raw(entry, class_name, schema_path)
+	if pack:
+		raw_trusted = docld_to_lua_raw(entry, class_name, schema_path, trusted = True) if schema_hash != None else None
+		raw = docld_to_lua_pack(raw, entry, class_name, schema_path, raw_trusted, schema_hash, instrumented)
+	return docld_to_lua_finalize(raw)
+
+
+
+# Converts DocLang to a Lua config class.
+def docl_to_lua(data, class_name, schema_path, pack = True):
+	data = docl_to_docld(data)
+	return docld_to_lua(data, class_name, schema_path, pack)
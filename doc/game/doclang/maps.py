@@ -0,0 +1,68 @@
+# Map catalog generator.
+# A game's `maps/catalog.json` file summarizes every map, so that the engine doesn't need to load each map's `config.json` at startup.
+# Maps are found the same way `Game:new()` does it: every folder inside `maps` which contains a `config.json` file.
+
+import os, json, hashlib
+
+from .utils import load_file
+from .walker import docld_walk, docld_get_enum_choice
+
+
+# Path to the map catalog, relative to the game folder.
+MAP_CATALOG_PATH = "maps/catalog.json"
+
+
+
+# Returns the catalog entry of a single map: its name, the number of paths, the number of objects of each type and a SHA-1 hash of the file.
+# `contents` is the raw (binary) contents of the map's `config.json` file, and `map_docld` is the DocLD tree of `map.docl`.
+def map_get_catalog_entry(map_docld, contents):
+	data = json.loads(contents)
+	out = {"name": data.get("name"), "pathCount": 0, "objectCounts": {}, "hash": hashlib.sha1(contents).hexdigest()}
+	def callback(entry, value, fields):
+		if fields == ["paths"]:
+			out["pathCount"] = len(value) if type(value) is list else 0
+			return False
+		elif len(fields) == 2 and fields[0] == "objects" and "keyconst" in entry:
+			# Objects are Enum Objects; count them by their type.
+			choice = docld_get_enum_choice(entry, value)
+			object_type = choice["const"] if choice != None else str(value.get(entry["keyconst"]))
+			out["objectCounts"][object_type] = out["objectCounts"].get(object_type, 0) + 1
+			return False
+	docld_walk(map_docld, data, callback)
+	return out
+
+# Builds the map catalog of the given game folder, using the DocLD tree of `map.docl`.
+# Returns `{"maps": {map folder name: catalog entry}, "errors": {map folder name: message}}`.
+def maps_build_catalog(map_docld, path):
+	out = {"maps": {}, "errors": {}}
+	maps_path = os.path.join(path, "maps")
+	if not os.path.isdir(maps_path):
+		return out
+	for name in sorted(os.listdir(maps_path)):
+		config_path = os.path.join(maps_path, name, "config.json")
+		if not os.path.isfile(config_path):
+			continue
+		try:
+			with open(config_path, "rb") as file:
+				out["maps"][name] = map_get_catalog_entry(map_docld, file.read())
+		except ValueError as e:
+			out["errors"][name] = str(e)
+	return out
+
+# Compares a freshly built catalog against the one saved in the game folder.
+# Returns a dictionary of map folder names to `"added"`, `"removed"` or `"changed"` for all maps whose entries differ.
+def maps_compare_catalog(catalog, path):
+	try:
+		old = json.loads(load_file(os.path.join(path, MAP_CATALOG_PATH)))["maps"]
+	except (IOError, ValueError, KeyError):
+		old = {}
+	out = {}
+	for name in catalog["maps"]:
+		if not name in old:
+			out[name] = "added"
+		elif old[name].get("hash") != catalog["maps"][name]["hash"]:
+			out[name] = "changed"
+	for name in old:
+		if not name in catalog["maps"]:
+			out[name] = "removed"
+	return out
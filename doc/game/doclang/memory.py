@@ -0,0 +1,205 @@
+# Config memory footprint estimator.
+# Estimates how much Lua heap the Config Class instances built by `ResourceManager:loadResource()` take, by walking the game data
+# alongside its DocLD tree the same way the generated constructors do: objects and arrays become tables, `Vector2` and `Color` fields
+# become `Vec2` and `Color` instances, Expression fields become `Expression` instances with their compiled steps, inline resources become
+# anonymous Config Class instances, and references to other resources only take a table slot.
+# Sizes follow the 64-bit LuaJIT object layout (table headers, hash nodes and array slots rounded up to powers of two, string headers),
+# which is what LOVE runs on. They are estimates, not measurements: allocator overhead and the memory of the assets themselves are left out.
+# Strings are interned by Lua, so they are counted once per resource, and once per group when resources are grouped by type or batch.
+
+import math
+
+from .game import game_load_resources, game_resolve_extends, game_get_docl_path
+from .walker import docld_get_type_map, docld_get_enum_choice
+from .expression import expression_parse
+
+
+# Sizes of Lua objects, in bytes.
+MEMORY_TABLE_SIZE = 64
+MEMORY_SLOT_SIZE = 8
+MEMORY_NODE_SIZE = 24
+MEMORY_STRING_SIZE = 24
+
+# Resource batches set with `ResourceManager:setBatches()`, by the path prefix of the resources loaded in them.
+# `Map:new()` loads map configs, and everything in their folders, in the `map` batch. All other resources are loaded permanently.
+MEMORY_BATCHES = {"maps/": "map"}
+MEMORY_PERMANENT_BATCH = "(permanent)"
+
+# Categories of the estimated memory.
+# - `tables`: plain tables (objects, arrays) and Config Class instances,
+# - `vectors`: `Vec2` and `Color` instances,
+# - `expressions`: `Expression` instances and their compiled steps,
+# - `strings`: all strings which come from the data, such as paths, names and Expression sources.
+MEMORY_CATEGORIES = ["tables", "vectors", "expressions", "strings"]
+
+
+
+# Returns the number of slots Lua allocates for the given number of elements: the next power of two, or 0 for no elements.
+def memory_get_slots(count):
+	return 0 if count == 0 else 2 ** math.ceil(math.log2(count))
+
+# Returns the size of a table with the given number of array elements and hash keys.
+def memory_get_table_size(array, keys):
+	return MEMORY_TABLE_SIZE + memory_get_slots(array) * MEMORY_SLOT_SIZE + memory_get_slots(keys) * MEMORY_NODE_SIZE
+
+# Returns the size of a Lua string.
+def memory_get_string_size(value):
+	return MEMORY_STRING_SIZE + len(value.encode("utf-8")) + 1
+
+# Returns a new, empty estimate: `{"tables", "vectors", "expressions", "strings"}` in bytes, along with the set of strings counted so far.
+def memory_new_estimate():
+	out = {category: 0 for category in MEMORY_CATEGORIES}
+	out["_strings"] = set()
+	return out
+
+# Counts a string in the given estimate, unless it's been counted already.
+def memory_add_string(estimate, value):
+	if not value in estimate["_strings"]:
+		estimate["_strings"].add(value)
+		estimate["strings"] += memory_get_string_size(value)
+
+# Adds the size of an `Expression` instance built from the given value. Mirrors `Expression:new()`.
+# Every instance holds its source value and either the compiled steps (a list of `{type, value}` tables) or the raw value.
+def memory_add_expression(estimate, value):
+	estimate["expressions"] += memory_get_table_size(0, 2)
+	if type(value) is str:
+		memory_add_string(estimate, value)
+	parsed = expression_parse(value)
+	if "steps" in parsed:
+		estimate["expressions"] += memory_get_table_size(len(parsed["steps"]), 0) + memory_get_table_size(0, 2) * len(parsed["steps"])
+		for step in parsed["steps"]:
+			if step["type"] == "value" and type(step["value"]) is str:
+				memory_add_string(estimate, step["value"])
+
+# Adds the size of a value stored in a Config Class instance, given its DocLD entry, and returns whether that value is not `nil`.
+# `value` is `None` if the field is missing from the data, in which case its default is used, just like in the generated constructors.
+# `state` is `{"docld", "type_map"}`.
+def memory_add_value(state, estimate, entry, value):
+	if value == None and "default" in entry:
+		value = entry["default"]
+	value_type = entry.get("type")
+	# Consts and multi-type fields are not supported by Config Classes, so they are never stored.
+	if value_type == None:
+		return False
+	elif value_type == "object":
+		if value == None and entry["optional"]:
+			return False
+		memory_add_object(state, estimate, entry, value or {})
+		return True
+	elif value_type == "array":
+		# Arrays are always constructed, even when missing.
+		value = value or []
+		estimate["tables"] += memory_get_table_size(len(value), 0)
+		for item in value:
+			memory_add_value(state, estimate, entry["children"][0], item)
+		return True
+	elif value == None:
+		return False
+	elif "expression" in entry:
+		memory_add_expression(estimate, value)
+	elif value_type == "string":
+		memory_add_string(estimate, value)
+	elif value_type == "Vector2":
+		estimate["vectors"] += memory_get_table_size(0, 2)
+	elif value_type == "Color":
+		estimate["vectors"] += memory_get_table_size(0, 3)
+	elif value_type in state["type_map"] and type(value) is dict:
+		# An anonymous resource, constructed in place.
+		memory_add_config(state, estimate, state["docld"][state["type_map"][value_type]], value)
+	# Anything else is a number, a boolean or a reference to another resource, which don't take anything but the slot.
+	return True
+
+# Adds the size of an object, given its DocLD entry. The table itself is left out for the root object, which is the Config Class instance.
+# Returns the number of fields stored in the object.
+def memory_add_fields(state, estimate, entry, value):
+	count = 0
+	children = entry.get("children", [])
+	if "regex" in entry:
+		for key in value:
+			if memory_add_value(state, estimate, children[0], value[key]):
+				memory_add_string(estimate, key)
+				count += 1
+		children = children[1:]
+	elif "keyconst" in entry:
+		count += 1
+		choice = docld_get_enum_choice(entry, value)
+		children = (choice.get("children", []) if choice != None else []) + children
+	for child in children:
+		if "name" in child and memory_add_value(state, estimate, child, value.get(child["name"])):
+			count += 1
+	return count
+
+# Adds the size of a plain table holding an object.
+def memory_add_object(state, estimate, entry, value):
+	estimate["tables"] += memory_get_table_size(0, memory_add_fields(state, estimate, entry, value))
+
+# Adds the size of a Config Class instance, which holds its fields along with `_path`, `_isAnonymous` and, if present, `_alias`.
+def memory_add_config(state, estimate, entry, value):
+	count = memory_add_fields(state, estimate, entry, value) + 2
+	if "_alias" in value:
+		memory_add_string(estimate, value["_alias"])
+		count += 1
+	estimate["tables"] += memory_get_table_size(0, count)
+
+# Returns the estimate of a single Config Class instance, given its DocLD tree and data with `_extends` resolved.
+def memory_estimate(state, entry, rel_path, data):
+	out = memory_new_estimate()
+	memory_add_string(out, rel_path)
+	memory_add_config(state, out, entry, data)
+	return out
+
+# Returns the batch a resource at the given path is loaded in.
+def memory_get_batch(rel_path):
+	for prefix in MEMORY_BATCHES:
+		if rel_path.startswith(prefix):
+			return MEMORY_BATCHES[prefix]
+	return MEMORY_PERMANENT_BATCH
+
+# Adds an estimate to a group estimate, counting strings already in the group only once.
+def memory_merge(group, estimate):
+	for category in MEMORY_CATEGORIES:
+		if category != "strings":
+			group[category] += estimate[category]
+	for value in estimate["_strings"]:
+		memory_add_string(group, value)
+
+# Converts an estimate to its report form, with the total and without the string set.
+def memory_finalize(estimate):
+	out = {category: estimate[category] for category in MEMORY_CATEGORIES}
+	out["total"] = sum(out.values())
+	return out
+
+# Returns the given dictionary of estimates, ranked from the largest total to the smallest.
+def memory_rank(estimates):
+	return {key: estimates[key] for key in sorted(estimates, key = lambda key: (-estimates[key]["total"], key))}
+
+# Estimates the memory taken by the Config Class instances of all resources of the given game folder.
+# Returns `{"resources": {path: estimate}, "types": {type: estimate}, "batches": {batch: estimate}, "errors": {path: message}}`,
+# where each estimate is `{"tables", "vectors", "expressions", "strings", "total"}` in bytes, and is ranked by total.
+# Type and batch estimates also have a `count` of resources.
+def memory_estimate_game(docld, path):
+	resources = game_load_resources(path)
+	state = {"docld": docld, "type_map": docld_get_type_map(docld)}
+	out = {"resources": {}, "types": {}, "batches": {}, "errors": {}}
+	groups = {"types": {}, "batches": {}}
+	for rel_path in sorted(resources):
+		schema = resources[rel_path]["schema"]
+		if schema == None or not game_get_docl_path(schema) in docld:
+			continue
+		try:
+			docl_path = game_get_docl_path(schema)
+			estimate = memory_estimate(state, docld[docl_path], rel_path, game_resolve_extends(resources, rel_path))
+		except Exception as e:
+			out["errors"][rel_path] = str(e)
+			continue
+		out["resources"][rel_path] = memory_finalize(estimate)
+		for kind, key in [("types", docl_path[:-5]), ("batches", memory_get_batch(rel_path))]:
+			if not key in groups[kind]:
+				groups[kind][key] = memory_new_estimate()
+				groups[kind][key]["count"] = 0
+			memory_merge(groups[kind][key], estimate)
+			groups[kind][key]["count"] += 1
+	out["resources"] = memory_rank(out["resources"])
+	for kind in groups:
+		out[kind] = memory_rank({key: dict(memory_finalize(groups[kind][key]), count = groups[kind][key]["count"]) for key in groups[kind]})
+	return out
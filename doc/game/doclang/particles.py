@@ -0,0 +1,114 @@
+# Particle budget analyzer.
+# Computes how many Particle Pieces each Particle Effect (and each Map, through its particle objects) can keep alive at once,
+# so that particle pools can be sized up front and budgets can be kept under control.
+# The model mirrors `ParticleSpawner:update()`: each Emitter spawns `spawnCount` pieces at once, then one piece every `spawnDelay` seconds
+# until its `lifespan` runs out, and never has more than `spawnMax` pieces alive.
+
+import math
+
+from .game import game_load_resources, game_get_resources_of_type, game_resolve_extends
+from .expression import expression_get_bounds
+
+
+
+# Returns the `(min, max)` lifespan of a single Particle Piece, in seconds. `max` is `math.inf` if the pieces live indefinitely.
+# Returns `None` if the lifespan is an Expression whose bounds can't be determined offline.
+def particle_get_lifespan_bounds(particle):
+	if not "lifespan" in particle:
+		return (math.inf, math.inf)
+	return expression_get_bounds(particle["lifespan"])
+
+# Returns the smallest power of two which can hold the given number of particles. Zero stays zero.
+def particle_get_pool_size(count):
+	if count <= 0:
+		return 0
+	return 1 << (int(count) - 1).bit_length()
+
+# Resolves a resource which can be either inline data or a path to another resource.
+def particle_resolve(resources, value):
+	if type(value) is str:
+		return game_resolve_extends(resources, value)
+	return value
+
+# Computes the particle budget of a single Particle Emitter.
+# Returns `{"peak", "steady", "spawn_max", "lifespan", "reasons"}`, where `peak` is the worst-case number of pieces alive at once,
+# `steady` is the number of pieces alive once the Emitter settles down (0 if the Emitter despawns) and `reasons` explains any guesswork.
+def particle_emitter_get_budget(emitter, particle):
+	spawn_max = emitter["spawnMax"]
+	burst = min(emitter["spawnCount"], spawn_max)
+	delay = emitter.get("spawnDelay")
+	emitter_lifespan = emitter.get("lifespan", math.inf)
+	reasons = []
+
+	lifespan = particle_get_lifespan_bounds(particle)
+	if lifespan == None:
+		reasons.append("particle lifespan " + str(particle["lifespan"]) + " has no static bounds; assuming spawnMax")
+		return {"peak": spawn_max, "steady": spawn_max if emitter_lifespan == math.inf else 0, "spawn_max": spawn_max, "lifespan": None, "reasons": reasons}
+
+	# The longest a piece can live, and how many more pieces can be spawned while the initial burst is still alive.
+	longest = lifespan[1]
+	if delay == None or delay == 0:
+		spawned = 0 if delay == None else math.inf
+		if delay == 0:
+			reasons.append("spawnDelay is 0; the Emitter refills up to spawnMax every frame")
+	else:
+		spawned = math.floor(min(longest, emitter_lifespan) / delay)
+	peak = min(spawn_max, burst + spawned)
+
+	if emitter_lifespan != math.inf:
+		# The Emitter deactivates after its lifespan and is destroyed with all its pieces once they die out.
+		steady = 0
+	elif delay == None:
+		steady = burst if longest == math.inf else 0
+	elif delay == 0:
+		steady = spawn_max
+	else:
+		steady = min(spawn_max, math.ceil(longest / delay)) if longest != math.inf else spawn_max
+	return {"peak": peak, "steady": steady, "spawn_max": spawn_max, "lifespan": list(lifespan), "reasons": reasons}
+
+# Computes the particle budget of a Particle Effect, given as a path to the resource.
+# Returns `{"path", "emitters", "peak", "steady", "pool_size", "persistent"}`. The totals assume that all Emitters peak at the same time.
+def particle_effect_get_budget(resources, rel_path):
+	effect = game_resolve_extends(resources, rel_path)
+	out = {"path": rel_path, "emitters": [], "peak": 0, "steady": 0, "persistent": False}
+	for i in range(len(effect["emitters"])):
+		emitter = particle_resolve(resources, effect["emitters"][i])
+		budget = particle_emitter_get_budget(emitter, particle_resolve(resources, emitter["particleData"]))
+		budget["index"] = i
+		out["emitters"].append(budget)
+		out["peak"] += budget["peak"]
+		out["steady"] += budget["steady"]
+		if not "lifespan" in emitter:
+			out["persistent"] = True
+	out["pool_size"] = particle_get_pool_size(out["peak"])
+	return out
+
+# Analyzes all Particle Effects and Maps of the given game folder.
+# Returns `{"effects": {path: budget}, "maps": {path: {"name", "objects", "peak", "steady", "pool_size"}}, "errors": {path: message}}`.
+# Map totals include every particle object on the map; these effects are persistent, so they all stay alive while the map is shown.
+def particle_analyze_game(path):
+	resources = game_load_resources(path)
+	out = {"effects": {}, "maps": {}, "errors": {}}
+	for rel_path in game_get_resources_of_type(resources, "particle_effect.json"):
+		try:
+			out["effects"][rel_path] = particle_effect_get_budget(resources, rel_path)
+		except Exception as e:
+			out["errors"][rel_path] = str(e)
+
+	for rel_path in game_get_resources_of_type(resources, "map.json"):
+		map_data = resources[rel_path]["data"]
+		result = {"name": map_data.get("name"), "objects": [], "peak": 0, "steady": 0}
+		for i in range(len(map_data.get("objects", []))):
+			obj = map_data["objects"][i]
+			if obj.get("type") != "particle":
+				continue
+			effect = out["effects"].get(obj["particle"])
+			if effect == None:
+				out["errors"][rel_path] = "objects[" + str(i) + "]: unknown particle effect " + str(obj["particle"])
+				continue
+			result["objects"].append({"index": i, "particle": obj["particle"], "layer": obj.get("layer"), "peak": effect["peak"], "steady": effect["steady"]})
+			result["peak"] += effect["peak"]
+			result["steady"] += effect["steady"]
+		result["pool_size"] = particle_get_pool_size(result["peak"])
+		out["maps"][rel_path] = result
+	return out
@@ -0,0 +1,195 @@
+# File-level DocLang pipeline. All functions take explicit paths and return their results in memory.
+# Nothing here depends on the current working directory; writing results to disk is always a separate step.
+
+import os
+
+from .utils import load_file, save_file, save_json, case_snake_to_pascal
+from .docld import docl_to_docld
+from .schema import docld_to_schema, schema_get_hash
+from .lua import docld_to_lua
+from .python import docld_all_to_python_module
+
+
+# Test folders whose files are converted to full Config Classes instead of just their constructor contents: `trusted` ones get
+# a trusted constructor, and `instrumented` ones count reads of their fields as well. See `docl_test_file_lua()`.
+DOCL_TEST_MODES = ["trusted", "instrumented"]
+# The schema hash stored in Config Classes converted in test modes, so that the tests don't depend on the schema backend.
+DOCL_TEST_SCHEMA_HASH = "0123456789abcdef"
+
+
+#
+#    PATHS AND NAMES
+#
+
+# Returns paths of all `.docl` files inside the given folder, relative to that folder, in a stable order.
+# ex: ["collectible.docl", "config/gameplay.docl", ...]
+def docl_find_files(path):
+	out = []
+	for r, d, f in os.walk(path):
+		d.sort()
+		r = os.path.relpath(r, path).replace("\\", "/") # i.e. "data" -> ".", "data\config" -> "config"
+		for file in sorted(f):
+			if not file.endswith(".docl"):
+				continue
+			out.append(file if r == "." else r + "/" + file)
+	return out
+
+# Returns the path to the `_structures` folder as seen from a schema generated from the given `.docl` file.
+# ex: "collectible.docl" -> "_structures/", "config/gameplay.docl" -> "../_structures/"
+def docl_get_structures_path(rel_path):
+	return "../" * rel_path.count("/") + "_structures/"
+
+# Returns the path to the schema generated from the given `.docl` file, relative to the schema folder.
+# ex: "config/gameplay.docl" -> "config/gameplay.json"
+def docl_get_schema_path(rel_path):
+	return rel_path[:-5] + ".json"
+
+# Returns the Config Class name for the given `.docl` file.
+# ex: "config/gameplay.docl" -> "GameplayConfig"
+def docl_get_class_name(rel_path):
+	return docl_get_class_file_name(rel_path)[:-4] + "Config"
+
+# Returns the name of the Config Class file for the given `.docl` file. All Config Classes live in a single folder.
+# ex: "config/gameplay.docl" -> "Gameplay.lua", "ui2/node.docl" -> "UI2Node.lua"
+def docl_get_class_file_name(rel_path):
+	directory, file = os.path.split(rel_path)
+	return ("UI2" if directory == "ui2" else "") + case_snake_to_pascal(file[:-5]) + ".lua"
+
+
+
+#
+#    SINGLE FILES
+#
+
+# Loads a DocLang (.docl) file and returns its DocLD data.
+def docl_load_file(path):
+	return docl_to_docld(load_file(path))
+
+# Loads all DocLang files from the given folder.
+# Returns a dictionary of paths relative to that folder to their DocLD data.
+def docl_load_all(path):
+	out = {}
+	for rel_path in docl_find_files(path):
+		out[rel_path] = docl_load_file(os.path.join(path, rel_path))
+	return out
+
+# Converts DocLD data loaded from the given `.docl` file to a JSON schema.
+def docld_file_to_schema(entry, rel_path):
+	return docld_to_schema(entry, True, docl_get_structures_path(rel_path))
+
+# Converts DocLD data loaded from the given `.docl` file to a Lua Config Class, including its trusted constructor.
+# If `instrumented` is set, the Config Class counts reads of its fields, see `docld_to_lua_pack()`.
+def docld_file_to_lua(entry, rel_path, instrumented = False):
+	return docld_to_lua(entry, docl_get_class_name(rel_path), docl_get_schema_path(rel_path), True, schema_get_hash(docld_file_to_schema(entry, rel_path)), instrumented)
+
+
+
+#
+#    WHOLE FOLDERS
+#
+
+# Converts all DocLD data from `docl_load_all()` to JSON schemas.
+# Returns a dictionary of schema paths relative to the schema folder to the schemas themselves.
+def docld_all_to_schemas(docld):
+	out = {}
+	for rel_path in docld:
+		out[docl_get_schema_path(rel_path)] = docld_file_to_schema(docld[rel_path], rel_path)
+	return out
+
+# Converts all DocLD data from `docl_load_all()` to Lua Config Classes.
+# Returns a dictionary of Config Class file names to their contents.
+def docld_all_to_configs(docld, instrumented = False):
+	out = {}
+	for rel_path in docld:
+		out[docl_get_class_file_name(rel_path)] = docld_file_to_lua(docld[rel_path], rel_path, instrumented)
+	return out
+
+# Converts all DocLD data from `docl_load_all()` to a single Python module with a class and a loader function for each resource type.
+def docld_all_to_python(docld):
+	entries = []
+	for rel_path in docld:
+		entries.append((docld[rel_path], docl_get_class_name(rel_path), docl_get_schema_path(rel_path), schema_get_hash(docld_file_to_schema(docld[rel_path], rel_path))))
+	return docld_all_to_python_module(entries)
+
+# Converts all .docl files in the given folder to the corresponding schemas.
+def docl_all_to_schemas(path):
+	return docld_all_to_schemas(docl_load_all(path))
+
+# Converts all .docl files in the given folder to the corresponding Config Class files.
+def docl_all_to_configs(path, instrumented = False):
+	return docld_all_to_configs(docl_load_all(path), instrumented)
+
+# Converts all .docl files in the given folder to a Python module. See `docld_all_to_python()`.
+def docl_all_to_python(path):
+	return docld_all_to_python(docl_load_all(path))
+
+# Saves schemas generated by `docl_all_to_schemas()` to the given folder.
+# Returns a list of written file paths.
+def save_schemas(schemas, path):
+	out = []
+	for rel_path in schemas:
+		path_out = os.path.join(path, rel_path)
+		save_json(path_out, schemas[rel_path])
+		out.append(path_out)
+	return out
+
+# Checks if the Lua config class file is protected from writing.
+def docl_is_config_class_protected(path):
+	try:
+		contents = load_file(path)
+		return contents[:6] != "--!!--"
+	except IOError:
+		# TODO: When all Config Classes are implemented, set this to False to allow new config files to be created.
+		return True
+
+# Saves Config Classes generated by `docl_all_to_configs()` to the given folder.
+# If `protect` is set, only existing and unprotected files will be overwritten.
+# Returns a list of `(path, written)` tuples.
+def save_configs(configs, path, protect = True):
+	out = []
+	for file_name in configs:
+		path_out = os.path.join(path, file_name)
+		if protect and docl_is_config_class_protected(path_out):
+			out.append((path_out, False))
+			continue
+		save_file(path_out, configs[file_name])
+		out.append((path_out, True))
+	return out
+
+
+
+#
+#    TESTS
+#
+
+# Converts a DocLang (.docl) file to a config class, and then matches its contents with what's in the specified Config Class file (.lua).
+# By default, only the constructor contents are generated. If `mode` is one of `DOCL_TEST_MODES`, the whole Config Class is generated instead.
+# Returns a dictionary with `expected` (`None` if there is no Lua file), `actual` and `success` fields.
+def docl_test_file_lua(path_test, path_against, mode = None):
+	contents_test = load_file(path_test)
+	try:
+		contents_against = load_file(path_against)
+	except IOError:
+		contents_against = None
+	if mode in DOCL_TEST_MODES:
+		contents_tested = docld_to_lua(docl_to_docld(contents_test), "ExampleObjectConfig", "example_object.json", True, DOCL_TEST_SCHEMA_HASH, mode == "instrumented")
+	else:
+		contents_tested = docld_to_lua(docl_to_docld(contents_test), "ExampleObject", "example_object.json", False)
+	return {
+		"path_test": path_test,
+		"path_against": path_against,
+		"expected": contents_against,
+		"actual": contents_tested,
+		"success": contents_tested == contents_against
+	}
+
+# Converts all `.docl` files in the `docl` subfolder of the given folder to config class files and checks them with corresponding files from the `lua` subfolder.
+# Files in the `DOCL_TEST_MODES` subfolders (e.g. `docl/trusted/test_object.docl`) are converted in that mode.
+# Returns a list of results from `docl_test_file_lua()`.
+def docl_test_all_configs(path):
+	out = []
+	for rel_path in docl_find_files(os.path.join(path, "docl")):
+		path_test = os.path.join(path, "docl", rel_path)
+		path_against = os.path.join(path, "lua", rel_path[:-5] + ".lua")
+		out.append(docl_test_file_lua(path_test, path_against, rel_path.split("/")[0] if "/" in rel_path else None))
+	return out
@@ -0,0 +1,138 @@
+# Variable Provider classifier.
+# Tells for how long the result of each Variable Provider (`config/variable_providers.json`) stays the same, by looking at its type
+# and at the Expressions and Sphere Selectors it embeds. Each provider gets one of the cache tiers, from the most to the least cacheable:
+# - `"constant"` - the result never changes,
+# - `"level"` - the result only changes when another level is started,
+# - `"board"` - the result only changes when a sphere is added, removed or changes its color or chain level,
+# - `"call"` - the result can change at any time, or is random, so it can't be cached (other than with `framePersistence`).
+# The tiers are saved to `config/variable_provider_tiers.json`, which `ExpressionVariables` uses to keep results cached across frames.
+# Along with the tiers, the file stores the paths of the files they have been classified from and their hash, so that the engine
+# can tell whether the providers have been changed since, in which case none of them are cached across frames.
+
+from .game import game_load_resources, game_resolve_extends, game_get_extends_chain, game_hash_files
+from .expression import FUNCTIONS_RANDOM, FUNCTIONS_GAME, expression_get_variables, expression_get_functions
+
+
+# Path to the classified tiers, relative to the game folder.
+PROVIDER_TIERS_PATH = "config/variable_provider_tiers.json"
+# Path to the Variable Providers, relative to the game folder.
+PROVIDERS_PATH = "config/variable_providers.json"
+
+PROVIDER_TIERS = ["constant", "level", "board", "call"]
+
+# Variables set by `Sphere:dumpVariables()` which only change together with the board.
+# Other sphere variables (`sphere.isOffscreen`, `sphere.distance`, ...) depend on where the spheres are, which changes every frame.
+PROVIDER_BOARD_VARIABLES = ["sphere.object", "sphere.color", "sphere.chainLevel"]
+
+
+
+# Returns the less cacheable of the two tiers.
+def provider_tier_max(a, b):
+	return a if PROVIDER_TIERS.index(a) >= PROVIDER_TIERS.index(b) else b
+
+# Classifies an Expression value. Returns `(tier, reasons)`, where `reasons` explain why the tier isn't `"constant"`.
+# `board` tells whether sphere variables are available, i.e. whether the Expression is evaluated for each sphere on the board.
+def provider_classify_expression(value, providers, resources, visiting, board = False):
+	tier = "constant"
+	reasons = []
+	for function in expression_get_functions(value):
+		if function in FUNCTIONS_RANDOM:
+			tier = "call"
+			reasons.append("rolls random numbers with `" + function + "()`")
+		elif function in FUNCTIONS_GAME:
+			tier = provider_tier_max(tier, "level")
+			reasons.append("reads translations with `" + function + "()`")
+	for variable in expression_get_variables(value):
+		if variable == "?":
+			tier = "call"
+			reasons.append("reads a variable whose name is computed at runtime")
+		elif board and variable in PROVIDER_BOARD_VARIABLES:
+			tier = provider_tier_max(tier, "board")
+		elif variable in providers:
+			provider_tier, provider_reasons = provider_classify(variable, providers, resources, visiting)
+			tier = provider_tier_max(tier, provider_tier)
+			if provider_tier != "constant":
+				reasons.append("uses the `" + variable + "` provider, which is per-" + provider_tier)
+		else:
+			tier = "call"
+			reasons.append("reads `" + variable + "`, which can change at any time")
+	return tier, reasons
+
+# Classifies a Sphere Selector, either inline or a path to a Sphere Selector resource. Returns `(tier, reasons)`.
+def provider_classify_selector(selector, providers, resources, visiting):
+	if type(selector) is str:
+		selector = game_resolve_extends(resources, selector)
+	tier = "constant"
+	reasons = []
+	for i, operation in enumerate(selector["operations"]):
+		if operation["type"] == "add":
+			operation_tier, operation_reasons = provider_classify_expression(operation["condition"], providers, resources, visiting, True)
+			operation_tier = provider_tier_max(operation_tier, "board")
+		elif operation["type"] == "addOne":
+			operation_tier, operation_reasons = provider_classify_expression(operation["sphere"], providers, resources, visiting)
+		elif operation["type"] == "select":
+			operation_tier, operation_reasons = "call", ["picks spheres at random"]
+		tier = provider_tier_max(tier, operation_tier)
+		reasons += ["operations[" + str(i) + "]: " + reason for reason in operation_reasons]
+	return tier, reasons
+
+# Classifies a single Variable Provider. Returns `(tier, reasons)`.
+# Providers which (indirectly) use themselves can't be told apart from random ones, so they are classified as `"call"`.
+def provider_classify(name, providers, resources, visiting = None):
+	visiting = visiting or []
+	if name in visiting:
+		return "call", ["uses itself through `" + "` -> `".join(visiting + [name]) + "`"]
+	visiting = visiting + [name]
+	provider = providers[name]
+	tier = "constant"
+	reasons = []
+	def add(field, result):
+		nonlocal tier
+		tier = provider_tier_max(tier, result[0])
+		reasons.extend(field + ": " + reason for reason in result[1])
+
+	if provider["type"] in ["countSpheres", "mostFrequentColor", "redirectSphere", "redirectSphereColor"]:
+		add("sphereSelector", provider_classify_selector(provider["sphereSelector"], providers, resources, visiting))
+	if "sphere" in provider:
+		add("sphere", provider_classify_expression(provider["sphere"], providers, resources, visiting))
+	if "fallback" in provider:
+		add("fallback", provider_classify_expression(provider["fallback"], providers, resources, visiting))
+	if provider["type"] == "mostFrequentColor":
+		add("type", ("call", ["picks a random color if there is a tie"]))
+	elif provider["type"] == "randomSpawnableColor":
+		add("type", ("call", ["picks a random color"]))
+	elif provider["type"] in ["redirectSphere", "redirectSphereColor"]:
+		add("type", ("call", ["picks a random direction if spheres are found on both sides"]))
+	return tier, reasons
+
+# Returns the paths of the files the given Variable Providers are made from: the providers file and the Sphere Selector resources
+# they refer to, along with their `_extends` chains.
+def providers_get_sources(providers, resources):
+	out = game_get_extends_chain(resources, PROVIDERS_PATH)
+	for name in sorted(providers):
+		selector = providers[name].get("sphereSelector")
+		if type(selector) is str and selector in resources:
+			out += [rel_path for rel_path in game_get_extends_chain(resources, selector) if not rel_path in out]
+	return out
+
+# Classifies all Variable Providers of the given game folder.
+# Returns `{"tiers": {name: {"tier", "reasons"}}, "sources": [paths], "hash": hash of the sources, "errors": {name: message}}`.
+def providers_classify_game(path):
+	resources = game_load_resources(path)
+	out = {"tiers": {}, "sources": [], "hash": None, "errors": {}}
+	if not PROVIDERS_PATH in resources:
+		return out
+	try:
+		providers = game_resolve_extends(resources, PROVIDERS_PATH).get("providers", {})
+		out["sources"] = providers_get_sources(providers, resources)
+		out["hash"] = game_hash_files(path, out["sources"])
+	except Exception as e:
+		out["errors"][PROVIDERS_PATH] = str(e)
+		return out
+	for name in sorted(providers):
+		try:
+			tier, reasons = provider_classify(name, providers, resources)
+			out["tiers"][name] = {"tier": tier, "reasons": reasons}
+		except Exception as e:
+			out["errors"][name] = str(e)
+	return out
@@ -0,0 +1,319 @@
+# DocLD to Python Config Class converter.
+# Generates a single, standalone Python module with a class and a loader function for each resource type, for tooling which scans
+# many resources. The loaders mirror the Lua Config Class constructors: each field is taken from the data, then from the base resource
+# (`_extends`), then from its default; arrays and Regex Objects are only taken from the data, and must be there unless they're optional;
+# inline resources are constructed in place and references to other resources are kept as paths. Values which the engine wraps in objects
+# are kept compact: Expressions are kept raw, `Vector2` values become `(x, y)` tuples and `Color` values become `(r, g, b)` tuples.
+# Classes use `__slots__` instead of instance dictionaries. Fields which are not set read as `None`, just like `nil` fields in Lua.
+
+import re
+
+
+
+# Helpers shared by all generated loaders, pasted at the top of the generated module.
+PYTHON_RUNTIME = [
+	"class _Config:",
+	1,
+	"__slots__ = ()",
+	"",
+	"def __getattr__(self, name):",
+	1,
+	"if name in type(self).__slots__:",
+	1,
+	"return None",
+	-1,
+	"raise AttributeError(name)",
+	-1,
+	"",
+	"def __repr__(self):",
+	1,
+	"return type(self).__name__ + \"(\" + \", \".join(name + \"=\" + repr(getattr(self, name)) for name in self.__slots__) + \")\"",
+	-1,
+	"",
+	"def __eq__(self, other):",
+	1,
+	"return type(self) is type(other) and all(getattr(self, name) == getattr(other, name) for name in self.__slots__)",
+	-1,
+	-1,
+	"",
+	"# Returns the first of the given values which is not `None`.",
+	"def _pick(value, base, default = None):",
+	1,
+	"return value if value is not None else (base if base is not None else default)",
+	-1,
+	"",
+	"# Returns the given value, or raises a `ValueError` if it's `None`.",
+	"def _require(value, path, field):",
+	1,
+	"if value is None:",
+	1,
+	"raise ValueError(str(path) + \": field \" + field + \" is missing\")",
+	-1,
+	"return value",
+	-1,
+	"",
+	"# Returns the element of a list or dictionary from the base resource, or `None` if there is none.",
+	"def _index(base, key):",
+	1,
+	"if type(base) is list:",
+	1,
+	"return base[key] if key < len(base) else None",
+	-1,
+	"return base.get(key) if type(base) is dict else None",
+	-1,
+	"",
+	"def _vec2(value):",
+	1,
+	"return (value[\"x\"], value[\"y\"]) if value is not None else None",
+	-1,
+	"",
+	"def _color(value):",
+	1,
+	"return (value[\"r\"], value[\"g\"], value[\"b\"]) if value is not None else None",
+	-1,
+	"",
+	"# Constructs an inline resource with the given loader, or returns the path if the value is a reference.",
+	"def _inline(value, path, loader):",
+	1,
+	"return loader(value, path, True) if type(value) is dict else value",
+	-1,
+	"",
+	"# Returns the schema path of the given data, the same way `ResourceManager:getResourceTypeFromSchema()` does it.",
+	"def _get_schema_path(data):",
+	1,
+	"schema = data.get(\"$schema\") if type(data) is dict else None",
+	"return schema.split(\"/schemas/\")[-1] if type(schema) is str else None",
+	-1
+]
+
+# The part of the generated module which goes after all the classes and loaders.
+PYTHON_RESOURCE_LOADER = [
+	"# Loads a resource from the given dictionary of resource paths to their raw data, along with its base resources.",
+	"# Loaded resources are stored in `cache`, which can be shared between calls.",
+	"def load_resource(resources, rel_path, cache = None):",
+	1,
+	"if cache is None:",
+	1,
+	"cache = {}",
+	-1,
+	"if not rel_path in cache:",
+	1,
+	"data = resources[rel_path]",
+	"loader = CONFIG_LOADERS[_get_schema_path(data)]",
+	"base = load_resource(resources, data[\"_extends\"], cache) if \"_extends\" in data else None",
+	"cache[rel_path] = loader(data, rel_path, False, base)",
+	-1,
+	"return cache[rel_path]",
+	-1
+]
+
+# DocLang types which are stored as they are.
+PYTHON_VALUE_TYPES = ["number", "integer", "boolean", "string"]
+# DocLang types which are converted to tuples, along with the converter function and the fields of the tuple.
+PYTHON_STRUCTURES = {"Vector2": ("_vec2", ["x", "y"]), "Color": ("_color", ["r", "g", "b"])}
+
+
+
+# Returns the name of the loader function for the given Config Class name.
+# ex: "LevelTrainRulesConfig" -> "load_level_train_rules_config"
+def docld_to_python_loader_name(class_name):
+	return "load_" + re.sub(r"(?<=[a-z0-9])([A-Z])", r"_\1", class_name).lower()
+
+# Returns the Python literal of the default value of the given entry, or `"None"` if it has none.
+def docld_to_python_default(entry):
+	if not "default" in entry:
+		return "None"
+	default = entry["default"]
+	if entry["type"] in PYTHON_STRUCTURES and not "expression" in entry and type(default) is dict:
+		return "(" + ", ".join(repr(default.get(field, 0)) for field in PYTHON_STRUCTURES[entry["type"]][1]) + ")"
+	return repr(default)
+
+# Returns the list of field names stored in an object, given its DocLD entry. Enum Objects have the fields of all their choices.
+def docld_to_python_fields(entry):
+	out = []
+	if "keyconst" in entry:
+		out.append(entry["keyconst"])
+	for child in entry.get("children", []):
+		if "const" in child:
+			for subchild in child.get("children", []):
+				if "name" in subchild and not subchild["name"] in out:
+					out.append(subchild["name"])
+		elif "name" in child and not child["name"] in out:
+			out.append(child["name"])
+	return out
+
+# Adds the class of an object to `classes`, a list of `(class name, fields)` tuples.
+def docld_to_python_add_class(classes, class_name, entry):
+	classes.append((class_name, docld_to_python_fields(entry)))
+
+# Converts a single entry's value to lines of Python code which assign it to `target`.
+# `data` and `base` are the Python expressions for the raw value and the value of the base resource, `label` is the field path
+# used in error messages and `depth` is the nesting level, used to name local variables.
+# `state` is `{"classes", "types"}`, where `classes` collects all object classes which need to be generated
+# and `types` lists the resource types which have a Config Class.
+def docld_to_python_value(state, entry, class_name, target, data, base, label, depth):
+	out = []
+	value_type = entry.get("type")
+	# Consts and multi-type fields are not supported by Config Classes, so they are never stored.
+	if value_type == None:
+		return out
+	optional = entry["optional"]
+
+	if value_type == "object":
+		object_class = class_name
+		d, b, o = "d" + str(depth), "b" + str(depth), "o" + str(depth)
+		regex = "regex" in entry
+		if not regex:
+			docld_to_python_add_class(state["classes"], object_class, entry)
+		if not optional or "default" in entry:
+			out.append(o + " = " + ("{}" if regex else object_class + "()"))
+		if optional:
+			out.append(d + " = " + data)
+			out.append("if " + d + " is not None:")
+			out.append(1)
+			if not "default" in entry:
+				out.append(o + " = " + ("{}" if regex else object_class + "()"))
+		elif regex:
+			# Just like arrays, Regex Objects are iterated over straight from the data, which fails if they're missing.
+			out.append(d + " = _require(" + data + ", path, \"" + label + "\")")
+		else:
+			out.append(d + " = " + data + " or {}")
+		out.append(b + " = " + base)
+		if regex:
+			n = "n" + str(depth)
+			out.append("for " + n + " in " + d + ":")
+			out.append(1)
+			out += docld_to_python_value(state, entry["children"][0], class_name, o + "[" + n + "]", d + "[" + n + "]", "_index(" + b + ", " + n + ")", label + "[]", depth + 1)
+			out.append(-1)
+		else:
+			out += docld_to_python_object(state, entry, class_name, o, d, b, label + ".", depth + 1)
+		if optional and not "default" in entry:
+			out.append(target + " = " + o)
+			out.append(-1)
+		else:
+			if optional:
+				out.append(-1)
+			out.append(target + " = " + o)
+	elif value_type == "array":
+		d, b, i = "d" + str(depth), "b" + str(depth), "i" + str(depth)
+		# The Lua constructors only check optional arrays for presence; a missing required array is an error.
+		out.append(d + " = " + (data + " or []" if optional else "_require(" + data + ", path, \"" + label + "\")"))
+		out.append(b + " = " + base)
+		out.append(target + " = [None] * len(" + d + ")")
+		out.append("for " + i + " in range(len(" + d + ")):")
+		out.append(1)
+		out += docld_to_python_value(state, entry["children"][0], class_name, target + "[" + i + "]", d + "[" + i + "]", "_index(" + b + ", " + i + ")", label + "[]", depth + 1)
+		out.append(-1)
+	else:
+		if value_type in PYTHON_STRUCTURES and not "expression" in entry:
+			data = PYTHON_STRUCTURES[value_type][0] + "(" + data + ")"
+		elif not value_type in PYTHON_VALUE_TYPES and value_type in state["types"]:
+			data = "_inline(" + data + ", path, " + docld_to_python_loader_name(value_type + "Config") + ")"
+		value = "_pick(" + data + ", " + base + ", " + docld_to_python_default(entry) + ")"
+		if not optional and not "default" in entry:
+			value = "_require(" + value + ", path, \"" + label + "\")"
+		out.append(target + " = " + value)
+	return out
+
+# Converts the fields of an object to lines of Python code which assign them to `target`. See `docld_to_python_value()`.
+def docld_to_python_object(state, entry, class_name, target, data, base, label, depth):
+	out = []
+	children = [child for child in entry.get("children", []) if "name" in child]
+	if "keyconst" in entry:
+		keyconst = entry["keyconst"]
+		out.append(target + "." + keyconst + " = _require(_pick(" + data + ".get(\"" + keyconst + "\"), getattr(" + base + ", \"" + keyconst + "\", None)), path, \"" + label + keyconst + "\")")
+		choices = [child for child in entry["children"] if "const" in child]
+		for i, choice in enumerate(choices):
+			out.append(("if " if i == 0 else "elif ") + target + "." + keyconst + " == " + repr(choice["const"]) + ":")
+			out.append(1)
+			lines = []
+			for child in choice.get("children", []):
+				lines += docld_to_python_value(state, child, class_name + docld_to_python_class_suffix(child), target + "." + child["name"], data + ".get(\"" + child["name"] + "\")", "getattr(" + base + ", \"" + child["name"] + "\", None)", label + child["name"], depth)
+			out += lines if len(lines) > 0 else ["pass"]
+			out.append(-1)
+		out.append("else:")
+		out.append(1)
+		out.append("raise ValueError(str(path) + \": unknown " + label + keyconst + ": \" + str(" + target + "." + keyconst + "))")
+		out.append(-1)
+	for child in children:
+		out += docld_to_python_value(state, child, class_name + docld_to_python_class_suffix(child), target + "." + child["name"], data + ".get(\"" + child["name"] + "\")", "getattr(" + base + ", \"" + child["name"] + "\", None)", label + child["name"], depth)
+	return out
+
+# Returns the part of a nested class name which comes from the given field, ex. `"sounds"` -> `"Sounds"`.
+def docld_to_python_class_suffix(entry):
+	name = entry["name"]
+	return name[0].upper() + name[1:]
+
+# Converts DocLangData of a single resource type to a list of Python lines: its classes and its loader function.
+# `types` lists the resource types which have a Config Class, used to construct inline resources of other types.
+def docld_to_python_raw(entry, class_name, schema_path, types, schema_hash = None):
+	state = {"classes": [], "types": types}
+	body = docld_to_python_object(state, entry, class_name, "self", "data", "base", "", 1)
+	fields = ["_path", "_alias", "_isAnonymous"] + docld_to_python_fields(entry)
+	out = []
+	out.append("class " + class_name + "(_Config):")
+	out.append(1)
+	out.append("__slots__ = (" + ", ".join("\"" + field + "\"" for field in fields) + ("," if len(fields) == 1 else "") + ")")
+	out.append("metadata = {\"schemaPath\": \"" + schema_path + "\"" + (", \"schemaHash\": \"" + schema_hash + "\"" if schema_hash != None else "") + "}")
+	out.append(-1)
+	out.append("")
+	# The root object is the class itself.
+	for nested_name, nested_fields in state["classes"]:
+		if nested_name == class_name:
+			continue
+		out.append("class " + nested_name + "(_Config):")
+		out.append(1)
+		out.append("__slots__ = (" + ", ".join("\"" + field + "\"" for field in nested_fields) + ("," if len(nested_fields) == 1 else "") + ")")
+		out.append(-1)
+		out.append("")
+	out.append("# Constructs an instance of " + class_name + ". Mirrors `" + class_name + ":new()`.")
+	out.append("def " + docld_to_python_loader_name(class_name) + "(data, path = None, is_anonymous = False, base = None):")
+	out.append(1)
+	out.append("self = " + class_name + "()")
+	out.append("self._path = path")
+	out.append("self._alias = data.get(\"_alias\")")
+	out.append("self._isAnonymous = is_anonymous")
+	out += body
+	out.append("return self")
+	out.append(-1)
+	return out
+
+# Converts DocLangData of all resource types to a single Python module.
+# `entries` is a list of `(entry, class name, schema path, schema hash)` tuples.
+def docld_all_to_python_module(entries):
+	types = [class_name[:-6] for entry, class_name, schema_path, schema_hash in entries]
+	out = []
+	out.append("# Auto-generated by DocLang Generator. Do not modify this file, regenerate it instead.")
+	out.append("")
+	out += PYTHON_RUNTIME
+	for entry, class_name, schema_path, schema_hash in entries:
+		out.append("")
+		out.append("")
+		out.append("")
+		out += docld_to_python_raw(entry, class_name, schema_path, types, schema_hash)
+	out.append("")
+	out.append("")
+	out.append("")
+	out.append("# Loader functions by the schema path of the resources they load.")
+	out.append("CONFIG_LOADERS = {")
+	out.append(1)
+	for i, (entry, class_name, schema_path, schema_hash) in enumerate(entries):
+		out.append("\"" + schema_path + "\": " + docld_to_python_loader_name(class_name) + ("," if i < len(entries) - 1 else ""))
+	out.append(-1)
+	out.append("}")
+	out.append("")
+	out += PYTHON_RESOURCE_LOADER
+	return docld_to_python_finalize(out)
+
+# Turns a raw list of lines and indentation instructions into Python code, indented with tabs.
+def docld_to_python_finalize(raw):
+	output = ""
+	indent = 0
+	for line in raw:
+		if type(line) is int:
+			indent += line
+		elif line == "":
+			output += "\n"
+		else:
+			output += "\t" * indent + line + "\n"
+	return output
@@ -0,0 +1,269 @@
+# The save state backend.
+# Save states (data returned by the `:serialize()` functions, which ends up in the runtime file) are described in DocLang as well.
+# Each `.docl` file in the save state folder describes one save state type named after the file, e.g. `path.docl` -> `PathSave`,
+# which can then be used as a type in the other files.
+# A single Lua module is generated from all of them. It packs save states into nested arrays, dropping all field names and storing the fields
+# in the order they are described in, and unpacks them back. Packed save states are stored with MessagePack instead of JSON.
+# The layouts are stored along with the packed data, so that it can still be unpacked after the save states have changed.
+
+import hashlib
+
+from .utils import case_snake_to_pascal
+from .pipeline import docl_load_all
+from .schema import docld_to_schema
+from .lua import docld_to_lua_finalize
+
+
+
+#
+#    LOADING
+#
+
+# Returns the save state type name for the given `.docl` file.
+# ex: "level.docl" -> "LevelSave", "sphere_ref.docl" -> "SphereRefSave"
+def savestate_get_type_name(rel_path):
+	return case_snake_to_pascal(rel_path[:-5]) + "Save"
+
+# Loads all save state `.docl` files from the given folder.
+# Returns a dictionary of save state type names to their DocLD data.
+def savestate_load_all(path):
+	docld = docl_load_all(path)
+	out = {}
+	for rel_path in docld:
+		out[savestate_get_type_name(rel_path)] = docld[rel_path]
+	return out
+
+# Converts all save states from `savestate_load_all()` to JSON schemas.
+# Schemas are named after the save state types, so that they can reference each other directly, e.g. `"$ref": "PathSave.json"`.
+# Returns a dictionary of schema file names to the schemas themselves.
+def savestate_all_to_schemas(docld):
+	out = {}
+	for type_name in docld:
+		out[type_name + ".json"] = docld_to_schema(docld[type_name], True, "")
+	return out
+
+
+
+#
+#    LUA
+#
+
+# Returns how a single entry is stored in a packed save state:
+# - `"ref"` - another save state type, packed by its own functions,
+# - `"object"` - an object with named fields, packed into an array,
+# - `"array"` or `"map"` - a list or a dictionary whose items are packed one by one,
+# - `"value"` - anything else, stored as is.
+def savestate_get_kind(entry, docld):
+	if savestate_get_ref(entry, docld) != None:
+		return "ref"
+	if entry.get("type") == "array":
+		return "array" if savestate_get_kind(entry["children"][0], docld) != "value" else "value"
+	if entry.get("type") == "object" and not "keyconst" in entry and "children" in entry:
+		if "regex" in entry or not "name" in entry["children"][0]:
+			return "map" if savestate_get_kind(entry["children"][0], docld) != "value" else "value"
+		return "object"
+	return "value"
+
+# Returns the name of the save state type the entry refers to, or `None` if it doesn't refer to any.
+# For multitypes such as `(integer|SphereSave)`, the first save state type is used. Packing functions leave values which aren't tables unchanged,
+# so the other types are stored as is.
+def savestate_get_ref(entry, docld):
+	for choice in entry.get("types", [entry]):
+		if choice.get("type") in docld:
+			return choice["type"]
+	return None
+
+# Converts a single entry to a Lua expression which packs (or, if `unpack` is set, unpacks) the given Lua value.
+# Returns a raw list of lines and indentation instructions, just like `docld_to_lua_raw()`. The first item is always a line.
+def savestate_to_lua_expression(entry, value, docld, unpack = False, depth = 0):
+	function = "unpack" if unpack else "pack"
+	kind = savestate_get_kind(entry, docld)
+	if kind == "value":
+		return [value]
+	elif kind == "ref":
+		return ["SaveStates." + savestate_get_ref(entry, docld) + "." + function + "(" + value + ")"]
+	elif kind == "array" or kind == "map":
+		child = entry["children"][0]
+		mapper = "mapList" if kind == "array" else "mapTable"
+		if savestate_get_kind(child, docld) == "ref":
+			return [mapper + "(" + value + ", SaveStates." + savestate_get_ref(child, docld) + "." + function + ")"]
+		item = "v" + str(depth + 1)
+		out = [mapper + "(" + value + ", function(" + item + ")", 1]
+		out += savestate_prefix(savestate_to_lua_expression(child, item, docld, unpack, depth + 1), "return ")
+		out += [-1, "end)"]
+		return out
+
+	# Objects become arrays with their fields in order, and the other way around.
+	out = ["type(" + value + ") == \"table\" and {", 1]
+	children = entry["children"]
+	for i in range(len(children)):
+		if unpack:
+			line = savestate_prefix(savestate_to_lua_expression(children[i], value + "[" + str(i + 1) + "]", docld, unpack, depth), children[i]["name"] + " = ")
+		else:
+			line = savestate_to_lua_expression(children[i], value + "." + children[i]["name"], docld, unpack, depth)
+		if i < len(children) - 1:
+			line = savestate_suffix(line, ",")
+		out += line
+	out += [-1, "} or " + value]
+	return out
+
+# Converts a single entry to a Lua expression describing how it's packed, so that data packed by an older version of the module can still be unpacked:
+# `0` for values stored as is, the type name for other save state types, `{list = <layout>}` and `{map = <layout>}` for lists and dictionaries,
+# and `{fields = {{<name>, <layout>}, ...}}` for objects. Returns a raw list of lines and indentation instructions.
+def savestate_to_lua_layout(entry, docld):
+	kind = savestate_get_kind(entry, docld)
+	if kind == "value":
+		return ["0"]
+	elif kind == "ref":
+		return ["\"" + savestate_get_ref(entry, docld) + "\""]
+	elif kind == "array" or kind == "map":
+		return savestate_suffix(savestate_prefix(savestate_to_lua_layout(entry["children"][0], docld), "{" + ("list" if kind == "array" else "map") + " = "), "}")
+
+	out = ["{fields = {", 1]
+	children = entry["children"]
+	for i in range(len(children)):
+		line = savestate_suffix(savestate_prefix(savestate_to_lua_layout(children[i], docld), "{\"" + children[i]["name"] + "\", "), "}")
+		if i < len(children) - 1:
+			line = savestate_suffix(line, ",")
+		out += line
+	out += [-1, "}}"]
+	return out
+
+# Prepends the given text to the first line of a raw list.
+def savestate_prefix(raw, text):
+	return [text + raw[0]] + raw[1:]
+
+# Appends the given text to the last line of a raw list.
+def savestate_suffix(raw, text):
+	for i in range(len(raw) - 1, -1, -1):
+		if type(raw[i]) is str:
+			return raw[:i] + [raw[i] + text] + raw[i + 1:]
+	return raw
+
+# Converts all save states from `savestate_load_all()` to a single Lua module with `pack()` and `unpack()` functions for each type.
+# The module also contains a hash of all packed layouts. It changes whenever any field is added, removed or moved,
+# so that the engine never misreads data packed by an older version of this module.
+def savestate_all_to_lua(docld):
+	functions = []
+	for type_name in docld:
+		functions.append("")
+		functions.append("SaveStates." + type_name + " = {}")
+		for unpack in [False, True]:
+			functions.append("")
+			if unpack:
+				functions.append("---Unpacks a `" + type_name + "` save state packed with `SaveStates." + type_name + ".pack()`.")
+				functions.append("---@param v table The packed data.")
+			else:
+				functions.append("---Packs a `" + type_name + "` save state into nested arrays.")
+				functions.append("---@param v table The data to be packed.")
+			functions.append("---@return table")
+			functions.append("function SaveStates." + type_name + "." + ("unpack" if unpack else "pack") + "(v)")
+			functions.append(1)
+			functions += savestate_prefix(savestate_to_lua_expression(docld[type_name], "v", docld, unpack), "return ")
+			functions.append(-1)
+			functions.append("end")
+	layout_hash = hashlib.sha1(docld_to_lua_finalize(functions).encode("utf-8")).hexdigest()[:16]
+
+	layouts = ["", "---Packed layouts of all save state types. They are stored along with packed data, see `SaveStates.unpackWithLayout()`.", "SaveStates.layouts = {", 1]
+	type_names = list(docld)
+	for i in range(len(type_names)):
+		line = savestate_prefix(savestate_to_lua_layout(docld[type_names[i]], docld), type_names[i] + " = ")
+		if i < len(type_names) - 1:
+			line = savestate_suffix(line, ",")
+		layouts += line
+	layouts += [-1, "}"]
+
+	out = [
+		"--!!--",
+		"-- Auto-generated by DocLang Generator",
+		"-- REMOVE THIS COMMENT IF YOU MODIFY THIS FILE",
+		"-- in order to protect it from being overwritten!",
+		"--!!--",
+		"",
+		"---Packs save states into nested arrays, so that they can be stored compactly, and unpacks them back.",
+		"local SaveStates = {}",
+		"",
+		"---A hash of all packed layouts. Data packed with a different hash must be unpacked with `SaveStates.unpackWithLayout()` instead.",
+		"SaveStates.hash = \"" + layout_hash + "\"",
+		"",
+		"---Applies `f` to each item of the list `t` and returns a new list. Values which aren't tables are returned unchanged.",
+		"---@param t table?",
+		"---@param f function",
+		"---@return table?",
+		"local function mapList(t, f)",
+		1,
+		"if type(t) ~= \"table\" then",
+		1,
+		"return t",
+		-1,
+		"end",
+		"local out = {}",
+		"for i, v in ipairs(t) do",
+		1,
+		"out[i] = f(v)",
+		-1,
+		"end",
+		"return out",
+		-1,
+		"end",
+		"",
+		"---Applies `f` to each value of the table `t` and returns a new table with the same keys. Values which aren't tables are returned unchanged.",
+		"---@param t table?",
+		"---@param f function",
+		"---@return table?",
+		"local function mapTable(t, f)",
+		1,
+		"if type(t) ~= \"table\" then",
+		1,
+		"return t",
+		-1,
+		"end",
+		"local out = {}",
+		"for k, v in pairs(t) do",
+		1,
+		"out[k] = f(v)",
+		-1,
+		"end",
+		"return out",
+		-1,
+		"end",
+		"",
+		"---Unpacks data packed with the given layout from `SaveStates.layouts`, which may come from an older version of this module.",
+		"---Fields are named as they were when the data was packed, so the result is the same as what the old `:serialize()` functions returned.",
+		"---@param v any The packed data.",
+		"---@param layout any The layout of the data.",
+		"---@param layouts table<string, any> Layouts of all save state types at the time the data was packed.",
+		"---@return any",
+		"function SaveStates.unpackWithLayout(v, layout, layouts)",
+		1,
+		"if type(v) ~= \"table\" or layout == 0 then",
+		1,
+		"return v",
+		-1,
+		"elseif type(layout) == \"string\" then",
+		1,
+		"return SaveStates.unpackWithLayout(v, layouts[layout], layouts)",
+		-1,
+		"elseif layout.list then",
+		1,
+		"return mapList(v, function(item) return SaveStates.unpackWithLayout(item, layout.list, layouts) end)",
+		-1,
+		"elseif layout.map then",
+		1,
+		"return mapTable(v, function(item) return SaveStates.unpackWithLayout(item, layout.map, layouts) end)",
+		-1,
+		"end",
+		"local out = {}",
+		"for i, field in ipairs(layout.fields) do",
+		1,
+		"out[field[1]] = SaveStates.unpackWithLayout(v[i], field[2], layouts)",
+		-1,
+		"end",
+		"return out",
+		-1,
+		"end"
+	]
+	out += functions
+	out += layouts
+	out += ["", "return SaveStates"]
+	return docld_to_lua_finalize(out)
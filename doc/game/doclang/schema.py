@@ -0,0 +1,154 @@
+# The JSON schema backend.
+
+import json, hashlib
+
+from .utils import markdown_strip
+from .docld import docl_to_docld
+
+
+
+# Converts DocLangData to a JSON schema.
+def docld_to_schema(entry, is_root = True, structures_path = "_structures/"):
+	simple_types = ["number", "integer", "boolean", "string", "object", "array"]
+	constraints = {
+		">=": "minimum",
+		">": "exclusiveMinimum",
+		"<=": "maximum",
+		"<": "exclusiveMaximum"
+	}
+
+	out = {}
+
+	# The root object has a schema as well.
+	if is_root:
+		out["$schema"] = "http://json-schema.org/draft-07/schema"
+	# Carry the type over.
+	if "type" in entry:
+		if entry["type"] in simple_types:
+			if "expression" in entry:
+				out["$ref"] = structures_path + "Expr" + entry["type"].capitalize() + ".json"
+			else:
+				out["type"] = entry["type"]
+		else:
+			out["$ref"] = structures_path + ("Expr" if "expression" in entry else "") + entry["type"] + ".json"
+	elif "const" in entry:
+		out["const"] = entry["const"]
+	elif "types" in entry:
+		# Deal with multitypes.
+		out["anyOf"] = []
+		for choice in entry["types"]:
+			if "type" in choice:
+				if choice["type"] in simple_types:
+					out["anyOf"].append({"type": choice["type"]})
+				else:
+					out["anyOf"].append({"$ref": structures_path + ("Expr" if "expression" in choice else "") + choice["type"] + ".json"})
+			elif "const" in choice:
+				out["anyOf"].append({"const": choice["const"]})
+				
+	elif not "children" in entry:
+		# Non-typed and non-const values with no children mean that any value will suffice. This is depicted as true.
+		return True
+	
+	# Carry the description as well.
+	if "description" in entry:
+		stripped_description = markdown_strip(entry["description"])
+		out["description"] = stripped_description
+		# If we lost some Markdown, make sure to preserve it by putting it in an additional field.
+		if stripped_description != entry["description"]:
+			out["markdownDescription"] = entry["description"]
+
+	# The rest depends on the type.
+	if "type" in entry:
+		if entry["type"] == "object":
+			if "regex" in entry:
+				# So-called "Regex Object".
+				out["propertyNames"] = {"pattern": entry["regex"]}
+				out["patternProperties"] = {}
+				# As with arrays, we care about only one child.
+				out["patternProperties"][entry["regex"]] = docld_to_schema(entry["children"][0], False, structures_path)
+			elif "keyconst" in entry:
+				# So-called "Enum Object".
+				key = entry["keyconst"]
+				out["properties"] = {key: {"enum": []}}
+				out["allOf"] = [{"properties": {key: {"description": entry["keyconst_description"]}}}]
+				out["required"] = [key]
+				if "children" in entry:
+					for child in entry["children"]:
+						if "const" in child: # One of the choices in the Enum Object for the typed variable.
+							child_block = {}
+							# We can't really hook up a call to itself here, because children of this child would get involved and mess things up.
+							child_block["if"] = {"properties": {key: {"const": child["const"], "description": child["description"]}}, "required": [key]}
+							# Now similar stuff to regular objects. Shenanigans incoming!!!
+							# Adding an array as a child at the front ensures that it will come first, display as True and won't show up as required twice.
+							child_children = [{"name": key, "optional": True}]
+							if "children" in child:
+								child_children += child["children"]
+							child_block["then"] = docld_to_schema({"type": "object", "children": child_children}, is_root, structures_path)
+							if "$schema" in child_block["then"]:
+								del child_block["then"]["$schema"]
+							del child_block["then"]["type"]
+							# Add prepared blocks.
+							out["allOf"].append(child_block)
+							out["properties"][key]["enum"].append(child["const"])
+						else: # "Always-there" properties for Enum Objects.
+							# Add this entry to the first block, as it is available all the time.
+							out["properties"][child["name"]] = docld_to_schema(child, False, structures_path)
+							# Mark as non-optional if necessary.
+							if not child["optional"]:
+								out["required"].append(child["name"])
+							# Allow this parameter for all conditional blocks.
+							for child_block in out["allOf"]:
+								if "then" in child_block:
+									child_block["then"]["properties"][child["name"]] = True
+			elif "children" in entry and not "name" in entry["children"][0]:
+				# One nameless child in a regular object means that the object behaves like an array, with all keys possible.
+				out["patternProperties"] = {}
+				out["patternProperties"]["^.*$"] = docld_to_schema(entry["children"][0], False, structures_path)
+			else:
+				# Regular object.
+				out["properties"] = {}
+				out["required"] = []
+				out["additionalProperties"] = False
+				if is_root:
+					out["properties"]["$schema"] = True
+				if "children" in entry:
+					for child in entry["children"]:
+						if not child["optional"]:
+							out["required"].append(child["name"])
+						out["properties"][child["name"]] = docld_to_schema(child, False, structures_path)
+				if len(out["required"]) == 0:
+					del out["required"]
+		elif entry["type"] == "array":
+			# Nothing more, nothing less, exactly ONE nameless child must be here.
+			out["items"] = docld_to_schema(entry["children"][0], False, structures_path)
+		elif entry["type"] == "number" or entry["type"] == "integer":
+			# Check constraints.
+			if "constraints" in entry:
+				for constraint in entry["constraints"]:
+					for prefix in constraints:
+						if constraint.startswith(prefix):
+							number = float(constraint[len(prefix):])
+							if entry["type"] == "integer":
+								number = int(number)
+							out[constraints[prefix]] = number
+							break
+	# Prepare enums.
+	if not "type" in entry or entry["type"] == "string" or entry["type"] == "number" or entry["type"] == "integer":
+		if "children" in entry:
+			out["oneOf"] = []
+			for child in entry["children"]:
+				out["oneOf"].append(docld_to_schema(child, False, structures_path))
+	
+	return out
+
+
+
+# Returns a short hash of the given schema. Resources validated against a schema are stamped with its hash,
+# and Config Classes generated alongside the schema carry the same hash in their metadata.
+def schema_get_hash(schema):
+	return hashlib.sha1(json.dumps(schema, sort_keys = True).encode("utf-8")).hexdigest()[:16]
+
+# Converts DocLang to a JSON schema.
+def docl_to_schema(data, structures_path):
+	data = docl_to_docld(data)
+	return docld_to_schema(data, True, structures_path)
@@ -0,0 +1,112 @@
+# Sphere Selector compiler.
+# The `"add"` operation of a Sphere Selector evaluates its condition for every sphere on the board. Many conditions only check the sphere color,
+# e.g. `"${[sphere.color] == 3 || [sphere.color] == 4}"`; such a condition is the same as a set of colors, which can be found offline
+# by evaluating it for each sphere color the game has.
+# All such conditions are saved to `sphere_selector_masks.json` as `{condition: [colors]}`, so that `SphereSelectorResult` can check the colors
+# directly and skip evaluating the Expression. Consecutive `"add"` operations with disjoint color sets can then be done in a single pass over the board.
+# The color sets depend on which sphere colors the game has, so the file also stores the paths of all Sphere files and the hash of their contents.
+# If a Sphere has been added, removed or changed since, the engine ignores the file and evaluates all conditions.
+
+import re
+
+from .game import game_load_resources, game_get_resources_of_type, game_resolve_extends, game_get_docl_path, game_hash_files
+from .walker import docld_walk
+from .expression import NotStaticError, expression_is_compiled, expression_get_variables, expression_evaluate_static, lua_truthy
+
+
+# Path to the color sets of all color-only conditions, relative to the game folder.
+SELECTOR_MASKS_PATH = "sphere_selector_masks.json"
+
+# Matches the path of a Sphere resource, which holds the color ID, just like `Sphere:getConfig()` builds it.
+SELECTOR_SPHERE_PATTERN = re.compile(r"^spheres/sphere_(-?\d+)\.json$")
+
+
+
+# Returns the sorted list of sphere colors of the given game resources, excluding 0 (the scarab), which Sphere Selectors never add.
+def selector_get_colors(resources):
+	out = []
+	for rel_path in game_get_resources_of_type(resources, "sphere.json"):
+		match = SELECTOR_SPHERE_PATTERN.match(rel_path)
+		if match != None and int(match.group(1)) != 0:
+			out.append(int(match.group(1)))
+	return sorted(out)
+
+# Returns the sorted list of paths of all Sphere files of the given game resources, which the color sets are compiled from.
+# Mirrors `Game:getSphereSelectorMaskSources()`.
+def selector_get_sources(resources):
+	return sorted(rel_path for rel_path in resources if SELECTOR_SPHERE_PATTERN.match(rel_path))
+
+# Returns the list of colors for which the given condition is true, or `None` if the condition depends on anything other than the sphere color.
+def selector_compile_condition(condition, colors):
+	if not expression_is_compiled(condition):
+		return None
+	for variable in expression_get_variables(condition):
+		if variable != "sphere.color":
+			return None
+	out = []
+	try:
+		for color in colors:
+			if lua_truthy(expression_evaluate_static(condition, {"sphere.color": color})):
+				out.append(color)
+	except NotStaticError:
+		return None
+	return out
+
+# Compiles a single Sphere Selector, given its data with `_extends` resolved.
+# Color sets of the color-only conditions are added to `masks`.
+# Returns the compiled operation list, where consecutive `"add"` operations with disjoint color sets are fused into one:
+# `[{"type": "add", "colors": [...], "operations": [indices]}, {"type": "add", "operations": [index]}, ...]`.
+def selector_compile(selector, colors, masks):
+	out = []
+	for i, operation in enumerate(selector["operations"]):
+		if operation["type"] != "add":
+			out.append({"type": operation["type"], "operations": [i]})
+			continue
+		condition = operation["condition"]
+		mask = masks[condition] if type(condition) is str and condition in masks else selector_compile_condition(condition, colors)
+		if mask == None:
+			out.append({"type": "add", "operations": [i]})
+			continue
+		masks[condition] = mask
+		last = out[-1] if len(out) > 0 else None
+		if last != None and "colors" in last and len(set(last["colors"]) & set(mask)) == 0:
+			last["colors"] = sorted(last["colors"] + mask)
+			last["operations"].append(i)
+		else:
+			out.append({"type": "add", "colors": mask, "operations": [i]})
+	return out
+
+# Compiles all Sphere Selectors of the given game folder, using the DocLD trees of all resource types to find the inline ones.
+# Returns `{"masks": {condition: [colors]}, "sources": [Sphere paths], "hash": hash of the Sphere files, "selectors": {path: compiled}, "errors": {path: message}}`.
+def selectors_compile_game(docld, path):
+	resources = game_load_resources(path)
+	colors = selector_get_colors(resources)
+	sources = selector_get_sources(resources)
+	out = {"masks": {}, "sources": sources, "hash": game_hash_files(path, sources), "selectors": {}, "errors": {}}
+	def compile_selector(selector, where):
+		try:
+			out["selectors"][where] = selector_compile(selector, colors, out["masks"])
+		except Exception as e:
+			out["errors"][where] = str(e)
+
+	for rel_path in resources:
+		schema = resources[rel_path]["schema"]
+		if schema == None or not game_get_docl_path(schema) in docld:
+			continue
+		try:
+			data = game_resolve_extends(resources, rel_path)
+		except Exception as e:
+			out["errors"][rel_path] = str(e)
+			continue
+		if schema == "sphere_selector.json":
+			compile_selector(data, rel_path)
+			continue
+		def callback(entry, value, fields):
+			if entry.get("type") != "SphereSelector":
+				return
+			# References to Sphere Selector resources are compiled on their own.
+			if type(value) is dict:
+				compile_selector(value, rel_path + "".join("[" + str(field) + "]" for field in fields))
+			return False
+		docld_walk(docld[game_get_docl_path(schema)], data, callback, docld)
+	return out
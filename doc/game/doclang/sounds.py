@@ -0,0 +1,144 @@
+# Sound Event pool analyzer.
+# Every Sound Event preallocates `instances` Sound Instances (8 by default) for each of its sounds, as done in `SoundEvent:new()`.
+# This analyzer sums them up across a game, finds out where each Sound Event is used, and flags Sound Events whose instances can never all
+# be playing at once, so that their pools can be made smaller.
+
+import os, math, struct
+
+from .utils import load_file
+from .game import game_load_resources, game_get_resources_of_type, game_resolve_extends, game_find_files, game_get_docl_path
+from .walker import docld_walk
+
+
+# The number of frames per second the engine ticks at. Used to tell how many plays of a sound can overlap.
+SOUND_FRAMES_PER_SECOND = 60
+
+
+
+# Returns `{"duration": seconds, "bytes": decoded size in bytes}` of a WAV file, read from its header.
+# Returns `None` if the file is not a PCM WAV file; other formats can't be measured without decoding them.
+def sound_get_wav_info(path):
+	try:
+		with open(path, "rb") as file:
+			contents = file.read()
+	except IOError:
+		return None
+	if contents[:4] != b"RIFF" or contents[8:12] != b"WAVE":
+		return None
+	byte_rate = None
+	i = 12
+	while i + 8 <= len(contents):
+		chunk, size = struct.unpack("<4sI", contents[i:i + 8])
+		if chunk == b"fmt ":
+			byte_rate = struct.unpack("<I", contents[i + 16:i + 20])[0]
+		elif chunk == b"data" and byte_rate:
+			return {"duration": size / byte_rate, "bytes": size}
+		i += 8 + size + size % 2
+	return None
+
+# Returns the list of sound entries of a Sound Event, each with all defaults filled in, the same way `SoundEvent:new()` sees them.
+def sound_event_get_entries(sound_event):
+	if "sound" in sound_event:
+		entries = [sound_event]
+	else:
+		entries = sound_event.get("sounds", [])
+	return [{"sound": entry["sound"], "instances": entry.get("instances", 8), "plays_per_frame": entry.get("playsPerFrame"), "loop": entry.get("loop", False)} for entry in entries]
+
+# Analyzes the sound pools of a single Sound Event, given its data with `_extends` resolved, and the game folder.
+# Returns `{"entries", "instances", "plays_per_frame", "bytes", "reasons"}`, where `instances` is the number of preallocated Sound Instances,
+# `plays_per_frame` is the worst-case number of sounds started on a single frame (`None` if unlimited)
+# and `bytes` is the decoded size of all preallocated instances (`None` if not all sounds are WAV files).
+def sound_event_get_budget(sound_event, path):
+	out = {"entries": [], "instances": 0, "plays_per_frame": 0, "bytes": 0, "reasons": []}
+	for i, entry in enumerate(sound_event_get_entries(sound_event)):
+		info = sound_get_wav_info(os.path.join(path, entry["sound"]))
+		# The most plays of this sound which can overlap, if it can be told.
+		if entry["loop"] or info == None or entry["plays_per_frame"] == None:
+			entry["max_overlap"] = None
+		else:
+			entry["max_overlap"] = entry["plays_per_frame"] * max(1, math.ceil(info["duration"] * SOUND_FRAMES_PER_SECOND))
+		entry["duration"] = info["duration"] if info != None else None
+		out["entries"].append(entry)
+
+		out["instances"] += entry["instances"]
+		if out["plays_per_frame"] != None:
+			out["plays_per_frame"] = out["plays_per_frame"] + entry["plays_per_frame"] if entry["plays_per_frame"] != None else None
+		if out["bytes"] != None:
+			out["bytes"] = out["bytes"] + info["bytes"] * entry["instances"] if info != None else None
+
+		if entry["max_overlap"] != None and entry["instances"] > entry["max_overlap"]:
+			out["reasons"].append("sounds[" + str(i) + "]: " + str(entry["instances"]) + " instances, but at most " + str(entry["max_overlap"]) + " can be playing at once")
+		elif entry["loop"] and entry["instances"] > 1:
+			out["reasons"].append("sounds[" + str(i) + "]: looping sound with " + str(entry["instances"]) + " instances")
+	return out
+
+# Returns a dictionary of Sound Event paths to the list of places which refer to them, as `"path[field][field]..."` strings.
+# Inline (anonymous) Sound Events are returned under keys like `"path[field]"`, with their data in the `inline` dictionary.
+# Lua files (e.g. UI scripts) and JSON files which aren't resources (e.g. UI layouts) are searched for Sound Event paths as well.
+def sound_find_references(docld, resources, path, inline):
+	out = {}
+	def add(key, where):
+		out.setdefault(key, []).append(where)
+
+	for rel_path in resources:
+		docl_path = game_get_docl_path(resources[rel_path]["schema"]) if resources[rel_path]["schema"] != None else None
+		if not docl_path in docld:
+			continue
+		try:
+			data = game_resolve_extends(resources, rel_path)
+		except Exception:
+			continue
+		def callback(entry, value, fields):
+			if entry.get("type") != "SoundEvent":
+				return
+			where = rel_path + "".join("[" + str(field) + "]" for field in fields)
+			if type(value) is str:
+				add(value, where)
+			elif type(value) is dict:
+				inline[where] = value
+				add(where, where)
+			return False
+		docld_walk(docld[docl_path], data, callback, docld)
+
+	sound_events = game_get_resources_of_type(resources, "sound_event.json")
+	other_paths = game_find_files(path, ".lua") + [rel_path for rel_path in resources if resources[rel_path]["schema"] == None]
+	for rel_path in other_paths:
+		contents = load_file(os.path.join(path, rel_path))
+		for sound_event in sound_events:
+			if sound_event in contents:
+				add(sound_event, rel_path)
+	return out
+
+# Analyzes all Sound Events of the given game folder, using the DocLD trees of all resource types to find where they are used.
+# Returns `{"sound_events": {path: budget}, "instances", "plays_per_frame", "bytes", "errors": {path: message}}` with game-wide totals.
+# Each budget additionally has a `references` list; Sound Events which are never referenced are flagged as well.
+def sound_analyze_game(docld, path):
+	resources = game_load_resources(path)
+	inline = {}
+	references = sound_find_references(docld, resources, path, inline)
+	sound_events = {}
+	for rel_path in game_get_resources_of_type(resources, "sound_event.json"):
+		sound_events[rel_path] = None
+	sound_events.update(inline)
+
+	out = {"sound_events": {}, "instances": 0, "plays_per_frame": 0, "bytes": 0, "errors": {}}
+	for key in sound_events:
+		try:
+			data = sound_events[key] if sound_events[key] != None else game_resolve_extends(resources, key)
+			budget = sound_event_get_budget(data, path)
+		except Exception as e:
+			out["errors"][key] = str(e)
+			continue
+		budget["references"] = references.get(key, [])
+		if len(budget["references"]) == 0 and budget["instances"] > 0:
+			budget["reasons"].append("never referenced; " + str(budget["instances"]) + " instances are allocated for nothing")
+		out["sound_events"][key] = budget
+		out["instances"] += budget["instances"]
+		if out["plays_per_frame"] != None:
+			out["plays_per_frame"] = out["plays_per_frame"] + budget["plays_per_frame"] if budget["plays_per_frame"] != None else None
+		if out["bytes"] != None:
+			out["bytes"] = out["bytes"] + budget["bytes"] if budget["bytes"] != None else None
+	for key in references:
+		if not key in sound_events:
+			out["errors"][key] = "referenced by " + ", ".join(references[key]) + ", but no such Sound Event exists"
+	return out
@@ -0,0 +1,106 @@
+# Path speed table baker.
+# `Path:getSpeed()` is called for every sphere group on every frame, and it would otherwise walk the whole speed graph
+# of its path behavior (`pathsBehavior[].speeds` of a Level) each time. This baker samples the speed graph of every path of every level
+# at a fixed step, so that the engine only needs to look up two samples and interpolate between them.
+# Cells of the table which contain a speed node are marked as exact: the engine evaluates the graph there, so that node speeds
+# and `"instant"` transitions come out exactly as before. Elsewhere the graph is smooth, and only `"bezier"` transitions are approximated.
+# The tables are saved to `path_speeds.json` as `{"tables": {key: table}, "levels": {level path: [key for each map path]}}`,
+# where each table is `{"length", "step", "speeds", "samples", "exact"}`. Levels which share a map and a speed graph share their tables.
+
+import math, json, hashlib
+
+from .game import game_load_resources, game_get_resources_of_type, game_resolve_extends
+
+
+# Path to the baked speed tables, relative to the game folder.
+SPEED_TABLES_PATH = "path_speeds.json"
+
+# The distance between two samples, in pixels.
+SPEED_TABLE_STEP = 4
+
+
+
+# Returns the length of a path in pixels, given its data, the same way `Path:prepareNodes()` calculates it.
+def speed_get_path_length(path_data):
+	nodes = path_data["nodes"]
+	out = 0
+	for i in range(len(nodes) - 1):
+		if not nodes[i].get("warp", False):
+			out += math.sqrt((nodes[i + 1]["x"] - nodes[i]["x"]) ** 2 + (nodes[i + 1]["y"] - nodes[i]["y"]) ** 2)
+	return out
+
+# Returns the offset of a speed node in pixels. Mirrors `Path:getSpeedOffset()`.
+def speed_get_offset(speed, length):
+	if "distance" in speed:
+		return speed["distance"] * length
+	elif "offset" in speed:
+		return speed["offset"]
+	elif "offsetFromEnd" in speed:
+		return length - speed["offsetFromEnd"]
+	raise ValueError("neither `distance`, `offset` nor `offsetFromEnd` were specified in a speed node")
+
+# Returns the speed at the given offset of a path, without any difficulty multipliers. Mirrors `Path:evaluateSpeed()`.
+def speed_evaluate(speeds, length, pixels):
+	for i, speed in enumerate(speeds):
+		offset = speed_get_offset(speed, length)
+		if pixels < offset:
+			prev = speeds[i - 1] if i > 0 else None
+			prev_offset = speed_get_offset(prev, length) if prev != None else None
+			if prev != None and offset - prev_offset > 0:
+				t = 1 - (offset - pixels) / (offset - prev_offset)
+				transition = prev.get("transition", {})
+				if transition.get("type") == "bezier":
+					p1, p2 = transition["point1"], transition["point2"]
+					t = p1 * (3 * t * ((1 - t) ** 2)) + p2 * (3 * (t ** 2) * (1 - t)) + t ** 3
+				elif transition.get("type") == "instant":
+					t = 0
+				return prev["speed"] * (1 - t) + speed["speed"] * t
+			return speed["speed"]
+	return speeds[-1]["speed"]
+
+# Bakes the speed table of a single path, given its speed graph and its length.
+# The table has a sample for every `step` pixels, from 0 up to the first sample past the path's end.
+# `exact` lists the cells (cell `k` spans from sample `k` to sample `k + 1`, 0-based) which have a speed node inside or at their end.
+def speed_bake(speeds, length, step = SPEED_TABLE_STEP):
+	if len(speeds) == 0:
+		raise ValueError("the speed graph is empty")
+	count = math.floor(length / step) + 2
+	samples = [speed_evaluate(speeds, length, k * step) for k in range(count)]
+	exact = set()
+	for speed in speeds:
+		offset = speed_get_offset(speed, length)
+		k = math.ceil(offset / step) - 1
+		if k >= 0 and k < count - 1:
+			exact.add(k)
+	return {"length": length, "step": step, "speeds": speeds, "samples": samples, "exact": sorted(exact)}
+
+# Returns the key under which the given speed table is saved, which is the same for all tables baked from the same data.
+def speed_get_table_key(speeds, length):
+	return hashlib.sha1(json.dumps([speeds, length], sort_keys = True).encode("utf-8")).hexdigest()[:16]
+
+# Bakes the speed tables of all paths of all Levels of the given game folder.
+# Returns `{"tables": {key: table}, "levels": {level path: [key]}, "errors": {path: message}}`.
+def speeds_bake_game(path):
+	resources = game_load_resources(path)
+	out = {"tables": {}, "levels": {}, "errors": {}}
+	for rel_path in game_get_resources_of_type(resources, "level.json"):
+		try:
+			level = game_resolve_extends(resources, rel_path)
+			map_path = "maps/" + level["map"] + "/config.json"
+			paths = game_resolve_extends(resources, map_path)["paths"]
+			behaviors = level["pathsBehavior"]
+			keys = []
+			for i, path_data in enumerate(paths):
+				# Path behaviors wrap around, just like in `Map:new()`.
+				speeds = behaviors[i % len(behaviors)]["speeds"]
+				if type(path_data) is str:
+					path_data = game_resolve_extends(resources, path_data)
+				length = speed_get_path_length(path_data)
+				key = speed_get_table_key(speeds, length)
+				if not key in out["tables"]:
+					out["tables"][key] = speed_bake(speeds, length)
+				keys.append(key)
+			out["levels"][rel_path] = keys
+		except Exception as e:
+			out["errors"][rel_path] = str(e)
+	return out
@@ -0,0 +1,129 @@
+# Train preset compiler.
+# `"waves"` Level Train Rules describe their trains with preset strings, which the engine would otherwise parse every time a train spawns.
+# This compiler validates every preset against the key table of its rules and stores all of them, already parsed, in `train_presets.json`,
+# so that `Path` only needs to look them up. Each preset string is compiled into one of:
+# - `{"length": 7, "regular": true}` - a regular preset ("AAABBBB"), which `SphereChain` reads key by key from the preset string itself,
+# - `{"length": 13, "blocks": [[2, 3, ["A", "B", "C"]], [5, 2, ["A", "B", "C"]]]}` - a preset generator ("2*3:ABC,5*2:ABC"),
+#   as `[count, size, pool]` blocks.
+# Presets only contain keys, not colors, so the same preset used by different rules is compiled only once.
+
+import re
+
+from .game import game_load_resources, game_resolve_extends, game_get_docl_path
+from .walker import docld_walk
+
+
+# Path to the compiled train presets, relative to the game folder.
+TRAIN_PRESETS_PATH = "train_presets.json"
+
+# Matches a valid key: a single ASCII character which is neither a number nor punctuation. The engine indexes presets byte by byte.
+TRAIN_KEY_PATTERN = re.compile(r"^[^\W\d_]$", re.ASCII)
+# Matches a single block of a preset generator, ex: "2*3:ABC".
+TRAIN_BLOCK_PATTERN = re.compile(r"^(\d+)\*(\d+):(.+)$")
+
+
+
+# Returns a dictionary of keys to the indices of their entries in the `key` list of the given `"waves"` rules.
+# Throws a `ValueError` if any key entry is malformed.
+def train_get_keys(rules):
+	out = {}
+	for i, entry in enumerate(rules["key"]):
+		where = "key[" + str(i) + "]: "
+		if ("key" in entry) == ("keys" in entry):
+			raise ValueError(where + "exactly one of `key` and `keys` must be specified")
+		keys = [entry["key"]] if "key" in entry else entry["keys"]
+		if len(entry["colors"]) == 0:
+			raise ValueError(where + "`colors` must not be empty")
+		if entry.get("noColorRepeats") and len(entry["colors"]) < len(keys):
+			raise ValueError(where + "`noColorRepeats` is set, but there are fewer colors (" + str(len(entry["colors"])) + ") than keys (" + str(len(keys)) + ")")
+		for key in keys:
+			if not TRAIN_KEY_PATTERN.match(key):
+				raise ValueError(where + "invalid key " + repr(key) + ", keys must be single characters which are neither numbers nor punctuation")
+			if key in out:
+				raise ValueError(where + "key " + repr(key) + " is already defined in key[" + str(out[key]) + "]")
+			out[key] = i
+	return out
+
+# Compiles a single preset string. Presets starting with a digit are preset generators, just like the engine tells them apart.
+# Throws a `ValueError` if the preset is malformed.
+def train_compile_preset(preset):
+	if preset == "":
+		raise ValueError("empty preset")
+	if not preset[0].isdigit():
+		return {"length": len(preset), "regular": True}
+
+	blocks = []
+	for block in preset.split(","):
+		match = TRAIN_BLOCK_PATTERN.match(block)
+		if match == None:
+			raise ValueError("malformed block " + repr(block) + ", expected `<count>*<size>:<keys>`")
+		count, size, pool = int(match.group(1)), int(match.group(2)), list(match.group(3))
+		if count == 0 or size == 0:
+			raise ValueError("block " + repr(block) + " has no spheres")
+		blocks.append([count, size, pool])
+	return {"length": sum(block[0] * block[1] for block in blocks), "blocks": blocks}
+
+# Checks a preset and its compiled form against the keys of its rules, as returned by `train_get_keys()`. Throws a `ValueError` if it can't be spawned.
+# For preset generators, this also checks whether the blocks can be arranged so that no two neighboring blocks have the same key:
+# this is impossible if and only if more than half (rounded up) of all blocks are single-key blocks of the same key.
+def train_check_preset(preset, compiled, keys):
+	used = list(preset) if compiled.get("regular") else [key for block in compiled["blocks"] for key in block[2]]
+	for key in used:
+		if not key in keys:
+			raise ValueError("unknown key " + repr(key))
+	if "blocks" in compiled:
+		total = sum(block[0] for block in compiled["blocks"])
+		single = {}
+		for block in compiled["blocks"]:
+			if len(set(block[2])) == 1:
+				single[block[2][0]] = single.get(block[2][0], 0) + block[0]
+		for key in single:
+			if single[key] > (total + 1) // 2:
+				raise ValueError(str(single[key]) + " of " + str(total) + " blocks can only be " + repr(key) + ", so they can't be kept apart")
+
+# Compiles all presets of a single `"waves"` rules, given its data with `_extends` resolved, into `presets`, a dictionary of preset strings
+# to their compiled forms. Errors are added to `errors` under `"<where>"` and `"<where>[waves][<index>]"` keys.
+def train_compile_rules(rules, where, presets, errors):
+	try:
+		keys = train_get_keys(rules)
+	except Exception as e:
+		errors[where] = str(e)
+		return
+	for i, preset in enumerate(rules["waves"]):
+		try:
+			compiled = presets[preset] if preset in presets else train_compile_preset(preset)
+			train_check_preset(preset, compiled, keys)
+			presets[preset] = compiled
+		except Exception as e:
+			errors[where + "[waves][" + str(i) + "]"] = repr(preset) + ": " + str(e)
+
+# Compiles the presets of all `"waves"` Level Train Rules of the given game folder, using the DocLD trees of all resource types to find them.
+# Returns `{"presets": {preset: compiled}, "rules": number of rules found, "errors": {path: message}}`.
+def trains_compile_game(docld, path):
+	resources = game_load_resources(path)
+	out = {"presets": {}, "rules": 0, "errors": {}}
+	def compile_rules(rules, where):
+		if type(rules) is dict and rules.get("type") == "waves":
+			out["rules"] += 1
+			train_compile_rules(rules, where, out["presets"], out["errors"])
+
+	for rel_path in resources:
+		schema = resources[rel_path]["schema"]
+		if schema == None or not game_get_docl_path(schema) in docld:
+			continue
+		try:
+			data = game_resolve_extends(resources, rel_path)
+		except Exception as e:
+			out["errors"][rel_path] = str(e)
+			continue
+		if schema == "level_train_rules.json":
+			compile_rules(data, rel_path)
+			continue
+		def callback(entry, value, fields):
+			if entry.get("type") != "LevelTrainRules":
+				return
+			# References to standalone rules are compiled on their own.
+			compile_rules(value, rel_path + "".join("[" + str(field) + "]" for field in fields))
+			return False
+		docld_walk(docld[game_get_docl_path(schema)], data, callback, docld)
+	return out
@@ -0,0 +1,124 @@
+# Config field usage report.
+# Config Classes generated with `generate.py -ci` count every read of their fields, and the engine saves the counts to `field_reads.json`
+# in its save directory when it quits: `{schema path: {resource path: {field path: count}}}`. Field paths are separated with dots,
+# and elements of arrays and Regex Objects are marked with `[]`, e.g. `"sounds[].volume"` (see `docld_to_lua_object_paths()`).
+# This module maps these counts back to the DocLang fields, ranking them from the hottest to the coldest and listing the fields
+# which have never been read, and, given the game folder, lists the fields present in each game file which have never been read.
+# Hot fields are candidates for flattening, and unread ones for pruning. Counts only cover what has been played while profiling.
+# Inline resources have their own Config Classes, so their fields are counted under their own schema paths.
+
+import os
+
+from .utils import load_json
+from .game import game_load_resources, game_resolve_extends, game_get_docl_path
+from .walker import docld_get_enum_choice
+
+
+# The file the engine saves the field read counts to. Mirrors `_ConfigUtils.FIELD_READS_FILE`.
+USAGE_READS_FILE = "field_reads.json"
+
+
+
+# Returns the field path of the given field of an object with the given field path.
+def usage_get_label(label, name):
+	return label + "." + name if label != "" else name
+
+# Returns the list of all field paths of the given DocLD entry, in the same format as the field read counts.
+# Fields of all Enum Object choices are included. Inline resources are not descended into, as they are counted separately.
+def usage_get_labels(entry, label = ""):
+	out = []
+	if entry.get("type") == "object" and not "regex" in entry:
+		children = []
+		if "keyconst" in entry:
+			out.append(usage_get_label(label, entry["keyconst"]))
+		for child in entry.get("children", []):
+			if "const" in child:
+				children += child.get("children", [])
+			elif "name" in child:
+				children.append(child)
+		for child in children:
+			child_label = usage_get_label(label, child["name"])
+			out += [child_label] + usage_get_labels(child, child_label)
+	elif entry.get("type") in ["object", "array"]:
+		out += usage_get_labels(entry["children"][0], label + "[]")
+	# Enum Object choices can share fields.
+	return list(dict.fromkeys(out))
+
+# Returns the set of field paths which are present in the given data, given its DocLD entry.
+def usage_get_data_labels(entry, value, label = ""):
+	out = set()
+	if entry.get("type") == "object" and type(value) is dict:
+		children = entry.get("children", [])
+		if "regex" in entry:
+			for key in value:
+				out |= usage_get_data_labels(children[0], value[key], label + "[]")
+			return out
+		if "keyconst" in entry:
+			out.add(usage_get_label(label, entry["keyconst"]))
+			choice = docld_get_enum_choice(entry, value)
+			children = (choice.get("children", []) if choice != None else []) + children
+		for child in children:
+			if "name" in child and child["name"] in value:
+				child_label = usage_get_label(label, child["name"])
+				out.add(child_label)
+				out |= usage_get_data_labels(child, value[child["name"]], child_label)
+	elif entry.get("type") == "array" and type(value) is list:
+		for item in value:
+			out |= usage_get_data_labels(entry["children"][0], item, label + "[]")
+	return out
+
+# Returns the given dictionary of read counts, ranked from the most read field to the least read one.
+def usage_rank(reads):
+	return {label: reads[label] for label in sorted(reads, key = lambda label: (-reads[label], label))}
+
+# Maps the given field read counts (the contents of `field_reads.json`) back to the given DocLD trees.
+# If a game folder is given, the fields present in its files are checked against the counts as well.
+# Returns `{"types": {type: {"resources", "reads", "unused"}}, "files": {path: [field paths]}, "unloaded": [paths], "errors": {path: message}}`, where:
+# - `types` lists, for each resource type loaded at least once, the number of resources loaded, the read count of every field ranked
+#   from the hottest to the coldest, including fields which are not part of the DocLD tree, and the fields which have never been read,
+# - `files` lists, for each loaded game file, the fields present in its data (along with its `_extends` chain) which have never been read in it,
+# - `unloaded` lists the game files of the profiled resource types which have never been loaded.
+def usage_report(docld, reads, path = None):
+	out = {"types": {}, "files": {}, "unloaded": [], "errors": {}}
+	for schema in sorted(reads):
+		docl_path = game_get_docl_path(schema)
+		if not docl_path in docld:
+			out["errors"][schema] = "No DocLang file for this schema"
+			continue
+		totals = {label: 0 for label in usage_get_labels(docld[docl_path])}
+		for rel_path in reads[schema]:
+			for label in reads[schema][rel_path]:
+				totals[label] = totals.get(label, 0) + reads[schema][rel_path][label]
+		out["types"][docl_path[:-5]] = {
+			"resources": len(reads[schema]),
+			"reads": usage_rank(totals),
+			"unused": [label for label in totals if totals[label] == 0]
+		}
+	if path == None:
+		return out
+
+	resources = game_load_resources(path)
+	for rel_path in sorted(resources):
+		schema = resources[rel_path]["schema"]
+		if not schema in reads or not game_get_docl_path(schema) in docld:
+			continue
+		if not rel_path in reads[schema]:
+			out["unloaded"].append(rel_path)
+			continue
+		try:
+			data = game_resolve_extends(resources, rel_path)
+		except Exception as e:
+			out["errors"][rel_path] = str(e)
+			continue
+		counts = reads[schema][rel_path]
+		unread = sorted(label for label in usage_get_data_labels(docld[game_get_docl_path(schema)], data) if counts.get(label, 0) == 0)
+		if len(unread) > 0:
+			out["files"][rel_path] = unread
+	return out
+
+# Loads the field read counts from the given file, or from `field_reads.json` inside of the given folder, and maps them back to the DocLD trees.
+# See `usage_report()`.
+def usage_report_file(docld, reads_path, path = None):
+	if os.path.isdir(reads_path):
+		reads_path = os.path.join(reads_path, USAGE_READS_FILE)
+	return usage_report(docld, load_json(reads_path), path)
@@ -0,0 +1,112 @@
+# Common utilities shared by all DocLang Generator stages.
+
+import os, json
+
+
+
+#
+#    UTILITIES
+#
+
+def load_file(path):
+	file = open(path, "r")
+	contents = file.read()
+	file.close()
+	return contents
+
+def save_file(path, contents):
+	file = open(path, "w")
+	file.write(contents)
+	file.close()
+
+def load_json(path):
+	return json.loads(load_file(path))
+
+# Saves the given data as a JSON file, creating any missing directories along the way.
+def save_json(path, data, indent = 4):
+	directory = os.path.dirname(path)
+	if directory != "" and not os.path.exists(directory):
+		os.makedirs(directory)
+	save_file(path, json.dumps(data, indent = indent))
+
+# Converts case like_this to case LikeThis.
+def case_snake_to_pascal(line):
+	return "".join(word[0].upper() + word[1:].lower() for word in line.split("_"))
+
+# Adds a number of spaces before each line of any multiline text.
+def indent_text(text, spaces):
+	return "\n".join((" " * spaces) + line for line in text.split("\n"))
+
+# Returns `True` if the given regex is numeric (any string satisfying it must be parseable into a number).
+def is_regex_numeric(regex):
+	return regex in ["^[-]?[0-9]*$", "^[0-9]*$", "^-[0-9]*$"]
+
+
+
+#
+#    MARKDOWN
+#
+
+# Finds all pairs of Markdown. Kinda dodgy because it's not extensively used. Available pairs are `code`, *italic*, **bold** and ***bold italic***.
+# Returns a list of text segments with a formatting field.
+# ex: "This is **bold** text!" -> [{"text":"This is ","style":"default"},{"text":"bold","style":"bold"},{"text":" text!","style":"default"}]
+def markdown_find(text):
+	styles = {
+		"`": "code",
+		"*": "italic",
+		"**": "bold",
+		"***": "bold_italic"
+	}
+
+	out = []
+	search_index = 0
+	while search_index < len(text):
+		# Find nearest spell.
+		nearest_index = None
+		nearest_index_end = None
+		nearest_style = None
+		nearest_spell_length = None
+		for mark in styles:
+			spell = mark # " " + mark
+			find_index = search_index
+			# There may not be a space just after the spell. But we gotta crack on until we're sure absolutely nothing matches the spell.
+			while (find_index != -1 and len(text) < find_index + len(spell) - 2 and text[find_index + len(spell)] == " ") or find_index == search_index:
+				find_index = text.find(spell, find_index + 1)
+			# If we haven't found anything, OR we've already found something closer, move on to the next style.
+			if find_index == -1 or (nearest_index != None and nearest_index < find_index):
+				continue
+			# But wait! There's more! We need to make sure there is a closing spell as well.
+			closing_spell = mark # mark + " "
+			closing_find_index = find_index
+			# This time we're looking for a lack of space BEFORE the closing spell.
+			while (closing_find_index != -1 and text[closing_find_index - 1] == " ") or closing_find_index == find_index:
+				closing_find_index = text.find(closing_spell, closing_find_index + 1)
+			# Found one? Great! Store the index.
+			if closing_find_index != -1:
+				nearest_index = find_index
+				nearest_index_end = closing_find_index
+				nearest_style = styles[mark]
+				nearest_spell_length = len(spell)
+		# If no spell has been found, that's the end. Make sure to store the rest!
+		if nearest_index == None:
+			out.append({"text": text[search_index:], "style": "default"})
+			break
+		# Otherwise, we move on!
+		# Store everything before the mark as raw text.
+		out.append({"text": text[search_index:nearest_index], "style": "default"})
+		# Now, store everything enclosed in the mark.
+		out.append({"text": text[nearest_index+nearest_spell_length:nearest_index_end], "style": nearest_style})
+		# Update the search index.
+		search_index = nearest_index_end + nearest_spell_length
+	
+	return out
+
+
+
+# Strips all Markdown that can be detected via markdown_find.
+def markdown_strip(text):
+	out = ""
+	compound = markdown_find(text)
+	for element in compound:
+		out += element["text"]
+	return out
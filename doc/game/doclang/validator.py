@@ -0,0 +1,237 @@
+# A small JSON schema validator, supporting the subset of draft-07 used by the schemas generated from DocLang and the `_structures` folder.
+# Schemas are compiled into nested validator functions once and kept in a schema store, so validating many files costs no extra parsing.
+#
+# A compiled validator is called as `validator(value, fields, errors)`, where `fields` is the list of keys leading to `value`
+# and `errors` is a list to which `(fields, message)` tuples are appended.
+
+import os, re, posixpath
+
+from .utils import load_json
+
+
+
+#
+#    SCHEMA STORE
+#
+
+# Creates an empty schema store. Schemas are keyed by their path relative to the schema folder, e.g. "config/gameplay.json".
+def schema_store_new():
+	return {"schemas": {}, "validators": {}}
+
+# Adds a schema to the store. Any validators compiled before are discarded, since they might refer to the replaced schema.
+def schema_store_add(store, path, schema):
+	store["schemas"][path] = schema
+	store["validators"] = {}
+
+# Adds all schemas from a dictionary of paths to schemas, like the one returned by `docl_all_to_schemas()`.
+def schema_store_add_all(store, schemas):
+	for path in schemas:
+		schema_store_add(store, path, schemas[path])
+
+# Loads all hand-written structure schemas from the `_structures` subfolder of the given schema folder.
+def schema_store_load_structures(store, path):
+	structures_path = os.path.join(path, "_structures")
+	for file in sorted(os.listdir(structures_path)):
+		if file.endswith(".json"):
+			schema_store_add(store, "_structures/" + file, load_json(os.path.join(structures_path, file)))
+
+# Returns a compiled validator for the schema at the given path. Validators are compiled only once.
+def schema_store_get_validator(store, path):
+	if not path in store["validators"]:
+		if not path in store["schemas"]:
+			raise Exception("Unknown schema: " + path)
+		store["validators"][path] = schema_compile(store["schemas"][path], store, path)
+	return store["validators"][path]
+
+# Compiles all schemas in the store up front. Once this is done, the store is safe to be shared between threads.
+def schema_store_compile_all(store):
+	for path in store["schemas"]:
+		schema_store_get_validator(store, path)
+
+# Validates the given value against the schema at the given path.
+# Returns a list of human-readable error messages, empty if the value is valid.
+def schema_store_validate(store, path, value):
+	errors = []
+	schema_store_get_validator(store, path)(value, [], errors)
+	return [get_field_path_str(fields) + ": " + message for fields, message in errors]
+
+
+
+#
+#    COMPILER
+#
+
+# Turns the provided path of fields into a string representation, the same way the Config Class utilities do.
+# ex: ["test", 1, "x"] -> "test[1].x"
+def get_field_path_str(fields):
+	out = ""
+	for field in fields:
+		if type(field) is int:
+			out += "[" + str(field) + "]"
+		else:
+			out += ("." if out != "" else "") + field
+	return out if out != "" else "<root>"
+
+# Returns `True` if the given JSON value matches the given JSON schema type.
+def check_type(value, type_name):
+	if type_name == "object":
+		return type(value) is dict
+	elif type_name == "array":
+		return type(value) is list
+	elif type_name == "string":
+		return type(value) is str
+	elif type_name == "boolean":
+		return type(value) is bool
+	elif type_name == "integer":
+		return (type(value) is int) or (type(value) is float and value.is_integer())
+	elif type_name == "number":
+		return type(value) is int or type(value) is float
+	elif type_name == "null":
+		return value == None
+	return True
+
+# Compiles a single schema (or subschema) into a validator function.
+# `path` is the path of the file the schema comes from, used to resolve relative `$ref`s.
+def schema_compile(schema, store, path):
+	if schema == True:
+		return lambda value, fields, errors: None
+	if schema == False:
+		return lambda value, fields, errors: errors.append((fields, "no value is allowed here"))
+
+	# In draft-07, `$ref` overrides all of its siblings.
+	if "$ref" in schema:
+		ref_path = posixpath.normpath(posixpath.join(posixpath.dirname(path), schema["$ref"]))
+		def validate_ref(value, fields, errors):
+			schema_store_get_validator(store, ref_path)(value, fields, errors)
+		return validate_ref
+
+	checks = []
+
+	if "type" in schema:
+		type_name = schema["type"]
+		def validate_type(value, fields, errors):
+			if not check_type(value, type_name):
+				errors.append((fields, "expected " + type_name))
+				return False
+		checks.append(validate_type)
+	if "const" in schema:
+		const = schema["const"]
+		def validate_const(value, fields, errors):
+			if value != const:
+				errors.append((fields, "expected \"" + str(const) + "\", got " + repr(value)))
+		checks.append(validate_const)
+	if "enum" in schema:
+		enum = schema["enum"]
+		def validate_enum(value, fields, errors):
+			if not value in enum:
+				errors.append((fields, repr(value) + " is not one of: " + ", ".join(str(e) for e in enum)))
+		checks.append(validate_enum)
+	if "pattern" in schema:
+		pattern = re.compile(schema["pattern"])
+		def validate_pattern(value, fields, errors):
+			if type(value) is str and not pattern.search(value):
+				errors.append((fields, repr(value) + " does not match " + schema["pattern"]))
+		checks.append(validate_pattern)
+	for keyword, compare, symbol in [
+		("minimum", lambda a, b: a >= b, ">="),
+		("exclusiveMinimum", lambda a, b: a > b, ">"),
+		("maximum", lambda a, b: a <= b, "<="),
+		("exclusiveMaximum", lambda a, b: a < b, "<")
+	]:
+		if keyword in schema:
+			checks.append(compile_bound(schema[keyword], compare, symbol))
+	if "properties" in schema or "patternProperties" in schema or "required" in schema or "propertyNames" in schema:
+		checks.append(compile_object(schema, store, path))
+	if "items" in schema:
+		checks.append(compile_items(schema["items"], store, path))
+	if "anyOf" in schema or "oneOf" in schema:
+		checks.append(compile_choice(schema, store, path))
+	if "allOf" in schema:
+		checks.append(compile_all_of(schema["allOf"], store, path))
+
+	def validate(value, fields, errors):
+		for check in checks:
+			# A failed type check makes all further checks meaningless.
+			if check(value, fields, errors) == False:
+				return
+	return validate
+
+def compile_bound(bound, compare, symbol):
+	def validate_bound(value, fields, errors):
+		if (type(value) is int or type(value) is float) and not compare(value, bound):
+			errors.append((fields, str(value) + " is not " + symbol + " " + str(bound)))
+	return validate_bound
+
+def compile_object(schema, store, path):
+	properties = {}
+	for key in schema.get("properties", {}):
+		properties[key] = schema_compile(schema["properties"][key], store, path)
+	pattern_properties = []
+	for pattern in schema.get("patternProperties", {}):
+		pattern_properties.append((re.compile(pattern), schema_compile(schema["patternProperties"][pattern], store, path)))
+	required = schema.get("required", [])
+	additional = schema.get("additionalProperties", True)
+	names = re.compile(schema["propertyNames"]["pattern"]) if "propertyNames" in schema else None
+
+	def validate_object(value, fields, errors):
+		if type(value) is not dict:
+			return
+		for key in required:
+			if not key in value:
+				errors.append((fields, "field " + key + " is missing"))
+		for key in value:
+			matched = False
+			if key in properties:
+				properties[key](value[key], fields + [key], errors)
+				matched = True
+			for pattern, validator in pattern_properties:
+				if pattern.search(key):
+					validator(value[key], fields + [key], errors)
+					matched = True
+			if names != None and not names.search(key):
+				errors.append((fields, "key " + repr(key) + " does not match " + names.pattern))
+			if not matched and additional == False:
+				errors.append((fields, "unexpected field " + key))
+	return validate_object
+
+def compile_items(items, store, path):
+	validator = schema_compile(items, store, path)
+	def validate_items(value, fields, errors):
+		if type(value) is not list:
+			return
+		for i in range(len(value)):
+			validator(value[i], fields + [i], errors)
+	return validate_items
+
+def compile_choice(schema, store, path):
+	exactly_one = "oneOf" in schema
+	choices = [schema_compile(choice, store, path) for choice in schema["oneOf" if exactly_one else "anyOf"]]
+	def validate_choice(value, fields, errors):
+		matches = 0
+		for choice in choices:
+			choice_errors = []
+			choice(value, fields, choice_errors)
+			if len(choice_errors) == 0:
+				matches += 1
+		if matches == 0:
+			errors.append((fields, "value " + repr(value) + " does not match any of the allowed choices"))
+		elif exactly_one and matches > 1:
+			errors.append((fields, "value " + repr(value) + " matches more than one of the allowed choices"))
+	return validate_choice
+
+def compile_all_of(blocks, store, path):
+	compiled = []
+	for block in blocks:
+		condition = schema_compile(block["if"], store, path) if "if" in block else None
+		then = schema_compile(block["then"], store, path) if "then" in block else None
+		body = schema_compile({key: block[key] for key in block if key != "if" and key != "then"}, store, path)
+		compiled.append((condition, then, body))
+	def validate_all_of(value, fields, errors):
+		for condition, then, body in compiled:
+			body(value, fields, errors)
+			if condition != None and then != None:
+				condition_errors = []
+				condition(value, fields, condition_errors)
+				if len(condition_errors) == 0:
+					then(value, fields, errors)
+	return validate_all_of
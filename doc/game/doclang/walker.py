@@ -0,0 +1,78 @@
+# Walks raw game data alongside its DocLD description, so that tools can find values by their DocLang type instead of by hardcoded keys.
+
+from .pipeline import docl_get_class_name
+
+
+
+# Returns a dictionary of DocLang type names to the `.docl` files describing them, for all resource types which have a Config Class.
+# ex: {"CollectibleGenerator": "collectible_generator.docl", "Gameplay": "config/gameplay.docl", ...}
+def docld_get_type_map(docld):
+	out = {}
+	for rel_path in docld:
+		out[docl_get_class_name(rel_path)[:-6]] = rel_path
+	return out
+
+# Returns the child of an Enum Object which is selected by the given data, or `None` if the data doesn't select any known choice.
+def docld_get_enum_choice(entry, value):
+	if type(value) is not dict:
+		return None
+	for child in entry.get("children", []):
+		if "const" in child and child["const"] == value.get(entry["keyconst"]):
+			return child
+	return None
+
+# Walks the given data value alongside its DocLD entry.
+# For every value, `callback(entry, value, fields)` is called, where `fields` is the list of keys leading to that value.
+# If the callback returns `False`, the walker does not descend into that value.
+# If `docld` is provided, inline resources (e.g. an anonymous Collectible Generator embedded in a Level) are walked as well,
+# using their own DocLD trees; references to other files (strings) are not followed.
+def docld_walk(entry, value, callback, docld = None, fields = None, type_map = None):
+	fields = fields or []
+	if type_map == None and docld != None:
+		type_map = docld_get_type_map(docld)
+	if callback(entry, value, fields) == False:
+		return
+	if not "type" in entry:
+		return
+
+	if entry["type"] == "object":
+		if type(value) is not dict:
+			return
+		children = entry.get("children", [])
+		if "regex" in entry:
+			# Regex Object: every key is described by the first child.
+			for key in value:
+				docld_walk(children[0], value[key], callback, docld, fields + [key], type_map)
+		elif len(children) > 0 and not "keyconst" in entry and not "name" in children[0]:
+			# A nameless child in a regular object: every key is described by it.
+			for key in value:
+				docld_walk(children[0], value[key], callback, docld, fields + [key], type_map)
+		else:
+			named = []
+			if "keyconst" in entry:
+				# Enum Object: the fields of the selected choice, and the always-there fields.
+				choice = docld_get_enum_choice(entry, value)
+				if choice != None:
+					named += choice.get("children", [])
+			named += [child for child in children if "name" in child]
+			for child in named:
+				if child["name"] in value:
+					docld_walk(child, value[child["name"]], callback, docld, fields + [child["name"]], type_map)
+	elif entry["type"] == "array":
+		if type(value) is not list:
+			return
+		for i in range(len(value)):
+			docld_walk(entry["children"][0], value[i], callback, docld, fields + [i], type_map)
+	elif type_map != None and entry["type"] in type_map and type(value) is dict:
+		# An inline (anonymous) resource.
+		docld_walk(docld[type_map[entry["type"]]], value, callback, docld, fields, type_map)
+
+# Returns the value located at the given list of fields inside of the data.
+def data_get(data, fields):
+	for field in fields:
+		data = data[field]
+	return data
+
+# Replaces the value located at the given list of fields inside of the data. An empty list of fields is not allowed.
+def data_set(data, fields, value):
+	data_get(data, fields[:-1])[fields[-1]] = value
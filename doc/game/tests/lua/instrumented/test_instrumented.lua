@@ -0,0 +1,110 @@
+--!!--
+-- Auto-generated by DocLang Generator
+-- REMOVE THIS COMMENT IF YOU MODIFY THIS FILE
+-- in order to protect it from being overwritten!
+--!!--
+
+local class = require "com.class"
+
+---@class ExampleObjectConfig
+---@overload fun(data, path, isAnonymous):ExampleObjectConfig
+local ExampleObjectConfig = class:derive("ExampleObjectConfig")
+
+ExampleObjectConfig.metadata = {
+    schemaPath = "example_object.json",
+    schemaHash = "0123456789abcdef",
+    objects = {"nested", "nested.inner", "items[]", "weights[]"}
+}
+
+---Constructs an instance of ExampleObjectConfig.
+---@param data table Raw data from a file.
+---@param path string? Path to the file. Used for error messages and saving data.
+---@param isAnonymous boolean? If `true`, this resource is anonymous and its path is invalid for saving data.
+---@param base ExampleObjectConfig? If specified, this resource extends the provided resource. Any missing fields are prepended from the base resource.
+function ExampleObjectConfig:new(data, path, isAnonymous, base)
+    local u = _ConfigUtils
+    self._path = path
+    self._alias = data._alias
+    self._isAnonymous = isAnonymous
+
+    base = base or {}
+
+    u.withFieldReadsPaused(function()
+        self.value = u.parseInteger(data, base, path, {"value"})
+
+        ---@type {inner: {flag: boolean}}
+        self.nested = {}
+
+        ---@type {flag: boolean}
+        self.nested.inner = {}
+        self.nested.inner.flag = u.parseBoolean(data, base, path, {"nested", "inner", "flag"})
+
+        ---@type {id: string}[]
+        self.items = {}
+        for i = 1, #data.items do
+            self.items[i] = {}
+            self.items[i].id = u.parseString(data, base, path, {"items", i, "id"})
+        end
+
+        ---@type table<string, {weight: number}>
+        self.weights = {}
+        for n, _ in pairs(data.weights) do
+            self.weights[n] = {}
+            self.weights[n].weight = u.parseNumber(data, base, path, {"weights", n, "weight"})
+        end
+    end)
+    u.instrumentConfig(self, ExampleObjectConfig)
+end
+
+---Constructs an instance of ExampleObjectConfig from data which has been validated against its schema at build time.
+---No checks are performed. Used by the Resource Manager for resources with a matching `_validated` stamp.
+---@param data table Raw data from a file.
+---@param path string? Path to the file. Used for error messages and saving data.
+---@param isAnonymous boolean? If `true`, this resource is anonymous and its path is invalid for saving data.
+function ExampleObjectConfig:newTrusted(data, path, isAnonymous)
+    local u = _ConfigUtils
+    self._path = path
+    self._alias = data._alias
+    self._isAnonymous = isAnonymous
+
+    self.value = data.value
+
+    ---@type {inner: {flag: boolean}}
+    self.nested = {}
+
+    ---@type {flag: boolean}
+    self.nested.inner = {}
+    self.nested.inner.flag = data.nested.inner.flag
+
+    ---@type {id: string}[]
+    self.items = {}
+    for i = 1, #data.items do
+        self.items[i] = {}
+        self.items[i].id = data.items[i].id
+    end
+
+    ---@type table<string, {weight: number}>
+    self.weights = {}
+    for n, _ in pairs(data.weights) do
+        self.weights[n] = {}
+        self.weights[n].weight = data.weights[n].weight
+    end
+
+    u.instrumentConfig(self, ExampleObjectConfig)
+end
+
+---Injects functions to Resource Manager regarding this resource type.
+---@param ResourceManager ResourceManager Resource Manager class to inject the functions to.
+function ExampleObjectConfig.inject(ResourceManager)
+    ---@class ResourceManager
+    ResourceManager = ResourceManager
+
+    ---Retrieves a ExampleObjectConfig by given path.
+    ---@param reference string The path to the resource.
+    ---@return ExampleObjectConfig
+    function ResourceManager:getExampleObjectConfig(reference)
+        return self:getResourceConfig(reference, "ExampleObject")
+    end
+end
+
+return ExampleObjectConfig
\ No newline at end of file
@@ -0,0 +1,115 @@
+--!!--
+-- Auto-generated by DocLang Generator
+-- REMOVE THIS COMMENT IF YOU MODIFY THIS FILE
+-- in order to protect it from being overwritten!
+--!!--
+
+local class = require "com.class"
+local Vec2 = require("src.Essentials.Vector2")
+
+---@class ExampleObjectConfig
+---@overload fun(data, path, isAnonymous):ExampleObjectConfig
+local ExampleObjectConfig = class:derive("ExampleObjectConfig")
+
+ExampleObjectConfig.metadata = {
+    schemaPath = "example_object.json",
+    schemaHash = "0123456789abcdef"
+}
+
+---Constructs an instance of ExampleObjectConfig.
+---@param data table Raw data from a file.
+---@param path string? Path to the file. Used for error messages and saving data.
+---@param isAnonymous boolean? If `true`, this resource is anonymous and its path is invalid for saving data.
+---@param base ExampleObjectConfig? If specified, this resource extends the provided resource. Any missing fields are prepended from the base resource.
+function ExampleObjectConfig:new(data, path, isAnonymous, base)
+    local u = _ConfigUtils
+    self._path = path
+    self._alias = data._alias
+    self._isAnonymous = isAnonymous
+
+    base = base or {}
+
+    self.name = u.parseString(data, base, path, {"name"})
+    self.count = u.parseInteger(data, base, path, {"count"}, 2)
+    self.size = u.parseVec2(data, base, path, {"size"})
+    self.offset = u.parseVec2(data, base, path, {"offset"}, Vec2(1, 2))
+    self.speed = u.parseExprNumber(data, base, path, {"speed"})
+    self.sprite = u.parseSprite(data, base, path, {"sprite"})
+
+    ---@type {x1: integer}
+    if data.cuts then
+        self.cuts = {}
+        self.cuts.x1 = u.parseInteger(data, base, path, {"cuts", "x1"})
+    end
+
+    ---@type {pos: Vector2}[]
+    self.states = {}
+    for i = 1, #data.states do
+        self.states[i] = {}
+        self.states[i].pos = u.parseVec2(data, base, path, {"states", i, "pos"})
+    end
+
+    ---@type table<number, {color: Color, alpha: number}>
+    self.tints = {}
+    for n, _ in pairs(data.tints) do
+        self.tints[tonumber(n)] = {}
+        self.tints[tonumber(n)].color = u.parseColor(data, base, path, {"tints", n, "color"})
+        self.tints[tonumber(n)].alpha = u.parseNumber(data, base, path, {"tints", n, "alpha"}, 1)
+    end
+end
+
+---Constructs an instance of ExampleObjectConfig from data which has been validated against its schema at build time.
+---No checks are performed. Used by the Resource Manager for resources with a matching `_validated` stamp.
+---@param data table Raw data from a file.
+---@param path string? Path to the file. Used for error messages and saving data.
+---@param isAnonymous boolean? If `true`, this resource is anonymous and its path is invalid for saving data.
+function ExampleObjectConfig:newTrusted(data, path, isAnonymous)
+    local u = _ConfigUtils
+    self._path = path
+    self._alias = data._alias
+    self._isAnonymous = isAnonymous
+
+    self.name = data.name
+    self.count = data.count or 2
+    self.size = u.trustVec2(data.size)
+    self.offset = u.trustVec2(data.offset, Vec2(1, 2))
+    self.speed = u.trustExpr(data.speed)
+    self.sprite = u.trustResource(data.sprite, "getSprite")
+
+    ---@type {x1: integer}
+    if data.cuts then
+        self.cuts = {}
+        self.cuts.x1 = data.cuts.x1
+    end
+
+    ---@type {pos: Vector2}[]
+    self.states = {}
+    for i = 1, #data.states do
+        self.states[i] = {}
+        self.states[i].pos = u.trustVec2(data.states[i].pos)
+    end
+
+    ---@type table<number, {color: Color, alpha: number}>
+    self.tints = {}
+    for n, _ in pairs(data.tints) do
+        self.tints[tonumber(n)] = {}
+        self.tints[tonumber(n)].color = u.trustColor(data.tints[n].color)
+        self.tints[tonumber(n)].alpha = data.tints[n].alpha or 1
+    end
+end
+
+---Injects functions to Resource Manager regarding this resource type.
+---@param ResourceManager ResourceManager Resource Manager class to inject the functions to.
+function ExampleObjectConfig.inject(ResourceManager)
+    ---@class ResourceManager
+    ResourceManager = ResourceManager
+
+    ---Retrieves a ExampleObjectConfig by given path.
+    ---@param reference string The path to the resource.
+    ---@return ExampleObjectConfig
+    function ResourceManager:getExampleObjectConfig(reference)
+        return self:getResourceConfig(reference, "ExampleObject")
+    end
+end
+
+return ExampleObjectConfig
\ No newline at end of file
@@ -290,6 +290,7 @@ function love.quit()
 	if _Settings:getSetting("backToBootWithX") and not _Game.isBootScreen then
 		return true
 	end
+	_ConfigUtils.saveFieldReads()
 	_DiscordRPC:disconnect()
 	_Debug:disconnect()
 	_JProf:close()
@@ -11,7 +11,8 @@ local class = require "com.class"
 local CollectibleConfig = class:derive("CollectibleConfig")
 
 CollectibleConfig.metadata = {
-    schemaPath = "collectible.json"
+    schemaPath = "collectible.json",
+    schemaHash = "ef200232ce9e6275"
 }
 
 ---Constructs an instance of CollectibleConfig.
@@ -56,6 +57,46 @@ function CollectibleConfig:new(data, path, isAnonymous, base)
     end
 end
 
+---Constructs an instance of CollectibleConfig from data which has been validated against its schema at build time.
+---No checks are performed. Used by the Resource Manager for resources with a matching `_validated` stamp.
+---@param data table Raw data from a file.
+---@param path string? Path to the file. Used for error messages and saving data.
+---@param isAnonymous boolean? If `true`, this resource is anonymous and its path is invalid for saving data.
+function CollectibleConfig:newTrusted(data, path, isAnonymous)
+    local u = _ConfigUtils
+    self._path = path
+    self._alias = data._alias
+    self._isAnonymous = isAnonymous
+
+    self.speed = u.trustExpr(data.speed)
+    self.acceleration = u.trustExpr(data.acceleration)
+    self.particle = u.trustConfig(data.particle, path, "ParticleEffect")
+    self.particleLayer = data.particleLayer or "GamePowerups"
+    self.pickupParticle = u.trustConfig(data.pickupParticle, path, "ParticleEffect")
+    self.pickupParticleLayer = data.pickupParticleLayer or "GamePowerups"
+    self.spawnSound = u.trustResource(data.spawnSound, "getSoundEvent")
+    self.pickupSound = u.trustResource(data.pickupSound, "getSoundEvent")
+    self.pickupName = u.trustExpr(data.pickupName)
+    self.pickupFont = u.trustResource(data.pickupFont, "getFont")
+    self.pickupTextLayer = data.pickupTextLayer or "GameScores"
+
+    ---@type CollectibleEffectConfig[]
+    self.effects = {}
+    if data.effects then
+        for i = 1, #data.effects do
+            self.effects[i] = u.trustConfig(data.effects[i], path, "CollectibleEffect")
+        end
+    end
+
+    ---@type CollectibleEffectConfig[]
+    self.dropEffects = {}
+    if data.dropEffects then
+        for i = 1, #data.dropEffects do
+            self.dropEffects[i] = u.trustConfig(data.dropEffects[i], path, "CollectibleEffect")
+        end
+    end
+end
+
 ---Injects functions to Resource Manager regarding this resource type.
 ---@param ResourceManager ResourceManager Resource Manager class to inject the functions to.
 function CollectibleConfig.inject(ResourceManager)
@@ -11,7 +11,8 @@ local class = require "com.class"
 local CollectibleEffectConfig = class:derive("CollectibleEffectConfig")
 
 CollectibleEffectConfig.metadata = {
-    schemaPath = "collectible_effect.json"
+    schemaPath = "collectible_effect.json",
+    schemaHash = "571ec6fd0c99c349"
 }
 
 ---Constructs an instance of CollectibleEffectConfig.
@@ -92,6 +93,82 @@ function CollectibleEffectConfig:new(data, path, isAnonymous, base)
     end
 end
 
+---Constructs an instance of CollectibleEffectConfig from data which has been validated against its schema at build time.
+---No checks are performed. Used by the Resource Manager for resources with a matching `_validated` stamp.
+---@param data table Raw data from a file.
+---@param path string? Path to the file. Used for error messages and saving data.
+---@param isAnonymous boolean? If `true`, this resource is anonymous and its path is invalid for saving data.
+function CollectibleEffectConfig:newTrusted(data, path, isAnonymous)
+    local u = _ConfigUtils
+    self._path = path
+    self._alias = data._alias
+    self._isAnonymous = isAnonymous
+
+    self.type = data.type
+    if self.type == "replaceSphere" then
+        self.color = data.color
+    elseif self.type == "multiSphere" then
+        self.color = data.color
+        self.count = u.trustExpr(data.count)
+        self.time = data.time
+        self.removeWhenTimeOut = data.removeWhenTimeOut
+        self.holdTimeRate = data.holdTimeRate
+    elseif self.type == "removeMultiSphere" then
+        self.removeSpheres = data.removeSpheres
+    elseif self.type == "speedShot" then
+        self.time = data.time
+        self.speed = data.speed
+    elseif self.type == "homingBugs" then
+        self.time = data.time
+    elseif self.type == "speedOverride" then
+        self.speedBase = data.speedBase
+        self.speedMultiplier = data.speedMultiplier
+        self.decceleration = data.decceleration
+        self.time = data.time
+    elseif self.type == "destroySpheres" then
+        self.selector = u.trustConfig(data.selector, path, "SphereSelector")
+        self.scoreEvent = u.trustConfig(data.scoreEvent, path, "ScoreEvent")
+        self.scoreEventPerSphere = u.trustConfig(data.scoreEventPerSphere, path, "ScoreEvent")
+        self.gameEvent = u.trustConfig(data.gameEvent, path, "GameEvent")
+        self.gameEventPerSphere = u.trustConfig(data.gameEventPerSphere, path, "GameEvent")
+    elseif self.type == "spawnPathEntity" then
+        self.pathEntity = u.trustConfig(data.pathEntity, path, "PathEntity")
+    elseif self.type == "activateNet" then
+        self.time = data.time
+    elseif self.type == "changeGameSpeed" then
+        self.speed = data.speed
+        self.time = data.time
+    elseif self.type == "setStreak" then
+        self.streak = data.streak
+    elseif self.type == "executeScoreEvent" then
+        self.scoreEvent = u.trustConfig(data.scoreEvent, path, "ScoreEvent")
+    elseif self.type == "executeGameEvent" then
+        self.gameEvent = u.trustConfig(data.gameEvent, path, "GameEvent")
+    elseif self.type == "setScoreMultiplier" then
+        self.multiplier = data.multiplier
+        self.time = data.time
+    elseif self.type == "collectibleRain" then
+        self.collectibleGenerator = u.trustConfig(data.collectibleGenerator, path, "CollectibleGenerator")
+        self.count = u.trustExpr(data.count)
+        self.delay = u.trustExpr(data.delay)
+    elseif self.type == "projectileStorm" then
+        self.projectile = u.trustConfig(data.projectile, path, "Projectile")
+        self.count = u.trustExpr(data.count)
+        self.delay = u.trustExpr(data.delay)
+        self.cancelWhenNoTargetsRemaining = u.trustBoolean(data.cancelWhenNoTargetsRemaining, false)
+    elseif self.type == "colorSort" then
+        self.sortType = data.sortType
+        self.delay = data.delay or 0
+        self.stopWhenTampered = u.trustBoolean(data.stopWhenTampered, false)
+    elseif self.type == "grantCoin" then
+        -- No fields
+    elseif self.type == "incrementGemStat" then
+        -- No fields
+    else
+        error(string.format("Unknown CollectibleEffectConfig type: %s (expected \"replaceSphere\", \"multiSphere\", \"removeMultiSphere\", \"speedShot\", \"homingBugs\", \"speedOverride\", \"destroySpheres\", \"spawnPathEntity\", \"activateNet\", \"changeGameSpeed\", \"setStreak\", \"executeScoreEvent\", \"executeGameEvent\", \"setScoreMultiplier\", \"collectibleRain\", \"projectileStorm\", \"colorSort\", \"grantCoin\", \"incrementGemStat\")", self.type))
+    end
+end
+
 ---Injects functions to Resource Manager regarding this resource type.
 ---@param ResourceManager ResourceManager Resource Manager class to inject the functions to.
 function CollectibleEffectConfig.inject(ResourceManager)
@@ -11,7 +11,8 @@ local class = require "com.class"
 local CollectibleGeneratorConfig = class:derive("CollectibleGeneratorConfig")
 
 CollectibleGeneratorConfig.metadata = {
-    schemaPath = "collectible_generator.json"
+    schemaPath = "collectible_generator.json",
+    schemaHash = "583bc3224e931030"
 }
 
 ---Constructs an instance of CollectibleGeneratorConfig.
@@ -60,6 +61,50 @@ function CollectibleGeneratorConfig:new(data, path, isAnonymous, base)
     end
 end
 
+---Constructs an instance of CollectibleGeneratorConfig from data which has been validated against its schema at build time.
+---No checks are performed. Used by the Resource Manager for resources with a matching `_validated` stamp.
+---@param data table Raw data from a file.
+---@param path string? Path to the file. Used for error messages and saving data.
+---@param isAnonymous boolean? If `true`, this resource is anonymous and its path is invalid for saving data.
+function CollectibleGeneratorConfig:newTrusted(data, path, isAnonymous)
+    local u = _ConfigUtils
+    self._path = path
+    self._alias = data._alias
+    self._isAnonymous = isAnonymous
+
+    self.type = data.type
+    if self.type == "collectible" then
+        self.collectible = u.trustConfig(data.collectible, path, "Collectible")
+    elseif self.type == "collectibleGenerator" then
+        self.generator = u.trustConfig(data.generator, path, "CollectibleGenerator")
+    elseif self.type == "combine" then
+        self.entries = {}
+        for i = 1, #data.entries do
+            self.entries[i] = u.trustConfig(data.entries[i], path, "CollectibleGenerator")
+        end
+    elseif self.type == "repeat" then
+        self.entry = u.trustConfig(data.entry, path, "CollectibleGenerator")
+        self.count = u.trustExpr(data.count)
+    elseif self.type == "randomPick" then
+        self.pool = {}
+        for i = 1, #data.pool do
+            self.pool[i] = {}
+            self.pool[i].entry = u.trustConfig(data.pool[i].entry, path, "CollectibleGenerator")
+            self.pool[i].weight = data.pool[i].weight
+        end
+    else
+        error(string.format("Unknown CollectibleGeneratorConfig type: %s (expected \"collectible\", \"collectibleGenerator\", \"combine\", \"repeat\", \"randomPick\")", self.type))
+    end
+
+    ---@type Expression[]
+    self.conditions = {}
+    if data.conditions then
+        for i = 1, #data.conditions do
+            self.conditions[i] = u.trustExpr(data.conditions[i])
+        end
+    end
+end
+
 ---Injects functions to Resource Manager regarding this resource type.
 ---@param ResourceManager ResourceManager Resource Manager class to inject the functions to.
 function CollectibleGeneratorConfig.inject(ResourceManager)
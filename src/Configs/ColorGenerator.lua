@@ -11,7 +11,8 @@ local class = require "com.class"
 local ColorGeneratorConfig = class:derive("ColorGeneratorConfig")
 
 ColorGeneratorConfig.metadata = {
-    schemaPath = "color_generator.json"
+    schemaPath = "color_generator.json",
+    schemaHash = "12d5e96a70eef765"
 }
 
 ---Constructs an instance of ColorGeneratorConfig.
@@ -60,6 +61,50 @@ function ColorGeneratorConfig:new(data, path, isAnonymous, base)
     self.fallback = u.parseColorGeneratorConfigOpt(data, base, path, {"fallback"})
 end
 
+---Constructs an instance of ColorGeneratorConfig from data which has been validated against its schema at build time.
+---No checks are performed. Used by the Resource Manager for resources with a matching `_validated` stamp.
+---@param data table Raw data from a file.
+---@param path string? Path to the file. Used for error messages and saving data.
+---@param isAnonymous boolean? If `true`, this resource is anonymous and its path is invalid for saving data.
+function ColorGeneratorConfig:newTrusted(data, path, isAnonymous)
+    local u = _ConfigUtils
+    self._path = path
+    self._alias = data._alias
+    self._isAnonymous = isAnonymous
+
+    self.type = data.type
+    if self.type == "random" then
+        self.hasToExist = data.hasToExist
+        self.discardableColors = {}
+        if data.discardableColors then
+            for i = 1, #data.discardableColors do
+                self.discardableColors[i] = data.discardableColors[i]
+            end
+        end
+    elseif self.type == "nearEnd" then
+        self.selectChance = data.selectChance
+        self.pathsInDangerOnly = data.pathsInDangerOnly
+        self.discardableColors = {}
+        if data.discardableColors then
+            for i = 1, #data.discardableColors do
+                self.discardableColors[i] = data.discardableColors[i]
+            end
+        end
+    elseif self.type == "giveUp" then
+        self.spawnableColorsOnly = data.spawnableColorsOnly
+    else
+        error(string.format("Unknown ColorGeneratorConfig type: %s (expected \"random\", \"nearEnd\", \"giveUp\")", self.type))
+    end
+
+    ---@type integer[]
+    self.colors = {}
+    for i = 1, #data.colors do
+        self.colors[i] = data.colors[i]
+    end
+
+    self.fallback = u.trustConfig(data.fallback, path, "ColorGenerator")
+end
+
 ---Injects functions to Resource Manager regarding this resource type.
 ---@param ResourceManager ResourceManager Resource Manager class to inject the functions to.
 function ColorGeneratorConfig.inject(ResourceManager)
@@ -11,7 +11,8 @@ local class = require "com.class"
 local ColorPaletteConfig = class:derive("ColorPaletteConfig")
 
 ColorPaletteConfig.metadata = {
-    schemaPath = "color_palette.json"
+    schemaPath = "color_palette.json",
+    schemaHash = "e1e6a4de005f7644"
 }
 
 ---Constructs an instance of ColorPaletteConfig.
@@ -30,6 +31,20 @@ function ColorPaletteConfig:new(data, path, isAnonymous, base)
     self.image = u.parseImage(data, base, path, {"image"})
 end
 
+---Constructs an instance of ColorPaletteConfig from data which has been validated against its schema at build time.
+---No checks are performed. Used by the Resource Manager for resources with a matching `_validated` stamp.
+---@param data table Raw data from a file.
+---@param path string? Path to the file. Used for error messages and saving data.
+---@param isAnonymous boolean? If `true`, this resource is anonymous and its path is invalid for saving data.
+function ColorPaletteConfig:newTrusted(data, path, isAnonymous)
+    local u = _ConfigUtils
+    self._path = path
+    self._alias = data._alias
+    self._isAnonymous = isAnonymous
+
+    self.image = u.trustResource(data.image, "getImage")
+end
+
 ---Injects functions to Resource Manager regarding this resource type.
 ---@param ResourceManager ResourceManager Resource Manager class to inject the functions to.
 function ColorPaletteConfig.inject(ResourceManager)
@@ -11,7 +11,8 @@ local class = require "com.class"
 local DifficultyConfig = class:derive("DifficultyConfig")
 
 DifficultyConfig.metadata = {
-    schemaPath = "difficulty.json"
+    schemaPath = "difficulty.json",
+    schemaHash = "3c60bf952eea48e1"
 }
 
 ---Constructs an instance of DifficultyConfig.
@@ -50,6 +51,40 @@ function DifficultyConfig:new(data, path, isAnonymous, base)
     self.lifeConfig.rollbackCoinsAfterFailure = u.parseBoolean(data, base, path, {"lifeConfig", "rollbackCoinsAfterFailure"}, false)
 end
 
+---Constructs an instance of DifficultyConfig from data which has been validated against its schema at build time.
+---No checks are performed. Used by the Resource Manager for resources with a matching `_validated` stamp.
+---@param data table Raw data from a file.
+---@param path string? Path to the file. Used for error messages and saving data.
+---@param isAnonymous boolean? If `true`, this resource is anonymous and its path is invalid for saving data.
+function DifficultyConfig:newTrusted(data, path, isAnonymous)
+    local u = _ConfigUtils
+    self._path = path
+    self._alias = data._alias
+    self._isAnonymous = isAnonymous
+
+    self.speedMultiplier = data.speedMultiplier
+    self.scoreMultiplier = data.scoreMultiplier
+    self.levelSet = u.trustConfig(data.levelSet, path, "LevelSet")
+
+    ---@type table
+    self.lifeConfig = {}
+    self.lifeConfig.type = data.lifeConfig.type
+    if self.lifeConfig.type == "score" then
+        self.lifeConfig.startingLives = data.lifeConfig.startingLives
+        self.lifeConfig.scorePerLife = data.lifeConfig.scorePerLife
+        self.lifeConfig.countUnmultipliedScore = u.trustBoolean(data.lifeConfig.countUnmultipliedScore, false)
+    elseif self.lifeConfig.type == "coins" then
+        self.lifeConfig.startingLives = data.lifeConfig.startingLives
+        self.lifeConfig.coinsPerLife = data.lifeConfig.coinsPerLife
+    elseif self.lifeConfig.type == "none" then
+        -- No fields
+    else
+        error(string.format("Unknown lifeConfig type: %s (expected \"score\", \"coins\", \"none\")", self.lifeConfig.type))
+    end
+    self.lifeConfig.rollbackScoreAfterFailure = u.trustBoolean(data.lifeConfig.rollbackScoreAfterFailure, false)
+    self.lifeConfig.rollbackCoinsAfterFailure = u.trustBoolean(data.lifeConfig.rollbackCoinsAfterFailure, false)
+end
+
 ---Injects functions to Resource Manager regarding this resource type.
 ---@param ResourceManager ResourceManager Resource Manager class to inject the functions to.
 function DifficultyConfig.inject(ResourceManager)
@@ -11,7 +11,8 @@ local class = require "com.class"
 local FontConfig = class:derive("FontConfig")
 
 FontConfig.metadata = {
-    schemaPath = "font.json"
+    schemaPath = "font.json",
+    schemaHash = "3ea7efa5662e8d8e"
 }
 
 ---Constructs an instance of FontConfig.
@@ -54,6 +55,44 @@ function FontConfig:new(data, path, isAnonymous, base)
     self.color = u.parseColorOpt(data, base, path, {"color"})
 end
 
+---Constructs an instance of FontConfig from data which has been validated against its schema at build time.
+---No checks are performed. Used by the Resource Manager for resources with a matching `_validated` stamp.
+---@param data table Raw data from a file.
+---@param path string? Path to the file. Used for error messages and saving data.
+---@param isAnonymous boolean? If `true`, this resource is anonymous and its path is invalid for saving data.
+function FontConfig:newTrusted(data, path, isAnonymous)
+    local u = _ConfigUtils
+    self._path = path
+    self._alias = data._alias
+    self._isAnonymous = isAnonymous
+
+    self.type = data.type
+    if self.type == "image" then
+        self.image = u.trustResource(data.image, "getImage")
+        self.characters = {}
+        for n, _ in pairs(data.characters) do
+            self.characters[n] = {}
+            self.characters[n].x = data.characters[n].x
+            self.characters[n].y = data.characters[n].y or 0
+            self.characters[n].width = data.characters[n].width
+        end
+        self.height = data.height
+        self.lineSpacing = data.lineSpacing or 0
+    elseif self.type == "imageLove" then
+        self.image = u.trustResource(data.image, "getImage")
+        self.characters = data.characters
+        self.spacing = data.spacing or 1
+    elseif self.type == "truetype" then
+        self.file = u.trustResource(data.file, "getFontFile")
+        self.size = data.size
+    elseif self.type == "bmfont" then
+        self.file = data.file
+    else
+        error(string.format("Unknown FontConfig type: %s (expected \"image\", \"imageLove\", \"truetype\", \"bmfont\")", self.type))
+    end
+    self.color = u.trustColor(data.color)
+end
+
 ---Injects functions to Resource Manager regarding this resource type.
 ---@param ResourceManager ResourceManager Resource Manager class to inject the functions to.
 function FontConfig.inject(ResourceManager)
@@ -11,7 +11,8 @@ local class = require "com.class"
 local GameConfig = class:derive("GameConfig")
 
 GameConfig.metadata = {
-    schemaPath = "game.json"
+    schemaPath = "game.json",
+    schemaHash = "e0aea2bc3a441e1f"
 }
 
 ---Constructs an instance of GameConfig.
@@ -55,6 +56,45 @@ function GameConfig:new(data, path, isAnonymous, base)
     end
 end
 
+---Constructs an instance of GameConfig from data which has been validated against its schema at build time.
+---No checks are performed. Used by the Resource Manager for resources with a matching `_validated` stamp.
+---@param data table Raw data from a file.
+---@param path string? Path to the file. Used for error messages and saving data.
+---@param isAnonymous boolean? If `true`, this resource is anonymous and its path is invalid for saving data.
+function GameConfig:newTrusted(data, path, isAnonymous)
+    local u = _ConfigUtils
+    self._path = path
+    self._alias = data._alias
+    self._isAnonymous = isAnonymous
+
+    self.name = data.name
+    self.windowTitle = data.windowTitle
+    self.engineVersion = data.engineVersion
+    self.nativeResolution = u.trustVec2(data.nativeResolution)
+    self.windowResolution = u.trustVec2(data.windowResolution)
+    self.resizableWindow = u.trustBoolean(data.resizableWindow, true)
+    self.layers = u.trustConfig(data.layers, path, "Layers")
+    self.locale = u.trustConfig(data.locale, path, "Locale")
+    self.tickRate = data.tickRate or 60
+    ---@type "filtered"|"pixel"|"pixelPerfect"
+    self.canvasRenderingMode = data.canvasRenderingMode or "filtered"
+
+    ---@type {buttonClickSound: SoundEvent?, buttonHoverSound: SoundEvent?, buttonReleaseSound: SoundEvent?}
+    if data.ui then
+        self.ui = {}
+        self.ui.buttonClickSound = u.trustResource(data.ui.buttonClickSound, "getSoundEvent")
+        self.ui.buttonHoverSound = u.trustResource(data.ui.buttonHoverSound, "getSoundEvent")
+        self.ui.buttonReleaseSound = u.trustResource(data.ui.buttonReleaseSound, "getSoundEvent")
+    end
+
+    ---@type {enabled: boolean, applicationID: string?}
+    if data.richPresence then
+        self.richPresence = {}
+        self.richPresence.enabled = data.richPresence.enabled
+        self.richPresence.applicationID = data.richPresence.applicationID
+    end
+end
+
 ---Injects functions to Resource Manager regarding this resource type.
 ---@param ResourceManager ResourceManager Resource Manager class to inject the functions to.
 function GameConfig.inject(ResourceManager)
@@ -11,7 +11,8 @@ local class = require "com.class"
 local GameEventConfig = class:derive("GameEventConfig")
 
 GameEventConfig.metadata = {
-    schemaPath = "game_event.json"
+    schemaPath = "game_event.json",
+    schemaHash = "87161241b545bb11"
 }
 
 ---Constructs an instance of GameEventConfig.
@@ -72,6 +73,62 @@ function GameEventConfig:new(data, path, isAnonymous, base)
     end
 end
 
+---Constructs an instance of GameEventConfig from data which has been validated against its schema at build time.
+---No checks are performed. Used by the Resource Manager for resources with a matching `_validated` stamp.
+---@param data table Raw data from a file.
+---@param path string? Path to the file. Used for error messages and saving data.
+---@param isAnonymous boolean? If `true`, this resource is anonymous and its path is invalid for saving data.
+function GameEventConfig:newTrusted(data, path, isAnonymous)
+    local u = _ConfigUtils
+    self._path = path
+    self._alias = data._alias
+    self._isAnonymous = isAnonymous
+
+    self.type = data.type
+    if self.type == "single" then
+        self.event = u.trustConfig(data.event, path, "GameEvent")
+    elseif self.type == "sequence" then
+        self.events = {}
+        for i = 1, #data.events do
+            self.events[i] = u.trustConfig(data.events[i], path, "GameEvent")
+        end
+    elseif self.type == "random" then
+        self.events = {}
+        for i = 1, #data.events do
+            self.events[i] = u.trustConfig(data.events[i], path, "GameEvent")
+        end
+    elseif self.type == "setCoins" then
+        self.value = u.trustExpr(data.value)
+    elseif self.type == "setLevelVariable" then
+        self.variable = data.variable
+        self.value = u.trustExpr(data.value)
+    elseif self.type == "setLevelTimer" then
+        self.timer = data.timer
+        self.time = u.trustExpr(data.time, 0)
+    elseif self.type == "addToTimerSeries" then
+        self.timerSeries = data.timerSeries
+        self.time = u.trustExpr(data.time)
+    elseif self.type == "clearTimerSeries" then
+        self.timerSeries = data.timerSeries
+    elseif self.type == "collectibleEffect" then
+        self.collectibleEffect = u.trustConfig(data.collectibleEffect, path, "CollectibleEffect")
+    elseif self.type == "scoreEvent" then
+        self.scoreEvent = u.trustConfig(data.scoreEvent, path, "ScoreEvent")
+    elseif self.type == "playSound" then
+        self.soundEvent = u.trustResource(data.soundEvent, "getSoundEvent")
+    else
+        error(string.format("Unknown GameEventConfig type: %s (expected \"single\", \"sequence\", \"random\", \"setCoins\", \"setLevelVariable\", \"setLevelTimer\", \"addToTimerSeries\", \"clearTimerSeries\", \"collectibleEffect\", \"scoreEvent\", \"playSound\")", self.type))
+    end
+
+    ---@type Expression[]
+    self.conditions = {}
+    if data.conditions then
+        for i = 1, #data.conditions do
+            self.conditions[i] = u.trustExpr(data.conditions[i])
+        end
+    end
+end
+
 ---Injects functions to Resource Manager regarding this resource type.
 ---@param ResourceManager ResourceManager Resource Manager class to inject the functions to.
 function GameEventConfig.inject(ResourceManager)
@@ -11,7 +11,8 @@ local class = require "com.class"
 local GameplayConfig = class:derive("GameplayConfig")
 
 GameplayConfig.metadata = {
-    schemaPath = "config/gameplay.json"
+    schemaPath = "config/gameplay.json",
+    schemaHash = "b096fd33ba32770a"
 }
 
 ---Constructs an instance of GameplayConfig.
@@ -121,6 +122,111 @@ function GameplayConfig:new(data, path, isAnonymous, base)
     end
 end
 
+---Constructs an instance of GameplayConfig from data which has been validated against its schema at build time.
+---No checks are performed. Used by the Resource Manager for resources with a matching `_validated` stamp.
+---@param data table Raw data from a file.
+---@param path string? Path to the file. Used for error messages and saving data.
+---@param isAnonymous boolean? If `true`, this resource is anonymous and its path is invalid for saving data.
+function GameplayConfig:newTrusted(data, path, isAnonymous)
+    local u = _ConfigUtils
+    self._path = path
+    self._alias = data._alias
+    self._isAnonymous = isAnonymous
+
+    self.scoreFormat = u.trustExpr(data.scoreFormat)
+
+    ---@type {acceleration: number, attractionAcceleration: number?, attractionForwardDecceleration: number?, attractionForwardDeccelerationScarab: number?, decceleration: number, backwardsDecceleration: number?, attractionSpeedBase: number, attractionSpeedMult: number, knockbackSpeedBase: number, knockbackSpeedMult: number, knockbackTime: number?, knockbackStopAfterTime: boolean?, foulSpeed: number, foulAcceleration: number?, foulDestroySpheres: table, overspeedCheck: boolean, invincibleScarabs: boolean?, invincibleScarabFrontMatters: boolean?, luxorized: boolean?, joinSound: SoundEvent?, newGroupSound: SoundEvent?, noScarabs: boolean?, noScarabAttraction: boolean?, permitLongMatches: boolean, instantMatches: boolean?, cascadeScope: "chain"|"path"|"level", distanceEvents: {reference: "front"|"back", distance: number, forwards: boolean, backwards: boolean, event: GameEventConfig}[]}
+    self.sphereBehavior = {}
+    self.sphereBehavior.acceleration = data.sphereBehavior.acceleration
+    self.sphereBehavior.attractionAcceleration = data.sphereBehavior.attractionAcceleration
+    self.sphereBehavior.attractionForwardDecceleration = data.sphereBehavior.attractionForwardDecceleration
+    self.sphereBehavior.attractionForwardDeccelerationScarab = data.sphereBehavior.attractionForwardDeccelerationScarab
+    self.sphereBehavior.decceleration = data.sphereBehavior.decceleration
+    self.sphereBehavior.backwardsDecceleration = data.sphereBehavior.backwardsDecceleration
+    self.sphereBehavior.attractionSpeedBase = data.sphereBehavior.attractionSpeedBase
+    self.sphereBehavior.attractionSpeedMult = data.sphereBehavior.attractionSpeedMult
+    self.sphereBehavior.knockbackSpeedBase = data.sphereBehavior.knockbackSpeedBase
+    self.sphereBehavior.knockbackSpeedMult = data.sphereBehavior.knockbackSpeedMult
+    self.sphereBehavior.knockbackTime = data.sphereBehavior.knockbackTime
+    self.sphereBehavior.knockbackStopAfterTime = data.sphereBehavior.knockbackStopAfterTime
+    self.sphereBehavior.foulSpeed = data.sphereBehavior.foulSpeed
+    self.sphereBehavior.foulAcceleration = data.sphereBehavior.foulAcceleration
+
+    ---@type table
+    self.sphereBehavior.foulDestroySpheres = {}
+    self.sphereBehavior.foulDestroySpheres.type = data.sphereBehavior.foulDestroySpheres.type
+    if self.sphereBehavior.foulDestroySpheres.type == "atEnd" then
+        -- No fields
+    elseif self.sphereBehavior.foulDestroySpheres.type == "fromEnd" then
+        self.sphereBehavior.foulDestroySpheres.delay = data.sphereBehavior.foulDestroySpheres.delay
+        self.sphereBehavior.foulDestroySpheres.subsequentDelay = data.sphereBehavior.foulDestroySpheres.subsequentDelay
+    else
+        error(string.format("Unknown foulDestroySpheres type: %s (expected \"atEnd\", \"fromEnd\")", self.sphereBehavior.foulDestroySpheres.type))
+    end
+
+    self.sphereBehavior.overspeedCheck = data.sphereBehavior.overspeedCheck
+    self.sphereBehavior.invincibleScarabs = data.sphereBehavior.invincibleScarabs
+    self.sphereBehavior.invincibleScarabFrontMatters = data.sphereBehavior.invincibleScarabFrontMatters
+    self.sphereBehavior.luxorized = data.sphereBehavior.luxorized
+    self.sphereBehavior.joinSound = u.trustResource(data.sphereBehavior.joinSound, "getSoundEvent")
+    self.sphereBehavior.newGroupSound = u.trustResource(data.sphereBehavior.newGroupSound, "getSoundEvent")
+    self.sphereBehavior.noScarabs = data.sphereBehavior.noScarabs
+    self.sphereBehavior.noScarabAttraction = data.sphereBehavior.noScarabAttraction
+    self.sphereBehavior.permitLongMatches = data.sphereBehavior.permitLongMatches
+    self.sphereBehavior.instantMatches = data.sphereBehavior.instantMatches
+    ---@type "chain"|"path"|"level"
+    self.sphereBehavior.cascadeScope = data.sphereBehavior.cascadeScope or "chain"
+
+    ---@type {reference: "front"|"back", distance: number, forwards: boolean, backwards: boolean, event: GameEventConfig}[]
+    self.sphereBehavior.distanceEvents = {}
+    if data.sphereBehavior.distanceEvents then
+        for i = 1, #data.sphereBehavior.distanceEvents do
+            self.sphereBehavior.distanceEvents[i] = {}
+            ---@type "front"|"back"
+            self.sphereBehavior.distanceEvents[i].reference = data.sphereBehavior.distanceEvents[i].reference
+            self.sphereBehavior.distanceEvents[i].distance = data.sphereBehavior.distanceEvents[i].distance
+            self.sphereBehavior.distanceEvents[i].forwards = u.trustBoolean(data.sphereBehavior.distanceEvents[i].forwards, false)
+            self.sphereBehavior.distanceEvents[i].backwards = u.trustBoolean(data.sphereBehavior.distanceEvents[i].backwards, false)
+            self.sphereBehavior.distanceEvents[i].event = u.trustConfig(data.sphereBehavior.distanceEvents[i].event, path, "GameEvent")
+        end
+    end
+
+    ---@type {particle: ParticleEffectConfig, particleLayer: string, sound: SoundEvent, posY: integer}
+    if data.net then
+        self.net = {}
+        self.net.particle = u.trustConfig(data.net.particle, path, "ParticleEffect")
+        self.net.particleLayer = data.net.particleLayer or "GamePowerups"
+        self.net.sound = u.trustResource(data.net.sound, "getSoundEvent")
+        self.net.posY = data.net.posY
+    end
+
+    ---@type table<string, number>
+    if data.levelVariables then
+        self.levelVariables = {}
+        for n, _ in pairs(data.levelVariables) do
+            self.levelVariables[n] = data.levelVariables[n]
+        end
+    end
+
+    ---@type table<string, {countDown: boolean?, value: number}>
+    if data.levelTimers then
+        self.levelTimers = {}
+        for n, _ in pairs(data.levelTimers) do
+            self.levelTimers[n] = {}
+            self.levelTimers[n].countDown = data.levelTimers[n].countDown
+            self.levelTimers[n].value = data.levelTimers[n].value or 0
+        end
+    end
+
+    ---@type table<string, {}>
+    if data.levelTimerSeries then
+        self.levelTimerSeries = {}
+        for n, _ in pairs(data.levelTimerSeries) do
+            self.levelTimerSeries[n] = {}
+        end
+    end
+end
+
 ---Injects functions to Resource Manager regarding this resource type.
 ---@param ResourceManager ResourceManager Resource Manager class to inject the functions to.
 function GameplayConfig.inject(ResourceManager)
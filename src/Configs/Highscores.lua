@@ -11,7 +11,8 @@ local class = require "com.class"
 local HighscoresConfig = class:derive("HighscoresConfig")
 
 HighscoresConfig.metadata = {
-    schemaPath = "config/highscores.json"
+    schemaPath = "config/highscores.json",
+    schemaHash = "7b25cced511c5d88"
 }
 
 ---Constructs an instance of HighscoresConfig.
@@ -39,6 +40,29 @@ function HighscoresConfig:new(data, path, isAnonymous, base)
     end
 end
 
+---Constructs an instance of HighscoresConfig from data which has been validated against its schema at build time.
+---No checks are performed. Used by the Resource Manager for resources with a matching `_validated` stamp.
+---@param data table Raw data from a file.
+---@param path string? Path to the file. Used for error messages and saving data.
+---@param isAnonymous boolean? If `true`, this resource is anonymous and its path is invalid for saving data.
+function HighscoresConfig:newTrusted(data, path, isAnonymous)
+    local u = _ConfigUtils
+    self._path = path
+    self._alias = data._alias
+    self._isAnonymous = isAnonymous
+
+    self.size = data.size
+
+    ---@type {name: string, score: integer, level: string}[]
+    self.defaultScores = {}
+    for i = 1, #data.defaultScores do
+        self.defaultScores[i] = {}
+        self.defaultScores[i].name = data.defaultScores[i].name
+        self.defaultScores[i].score = data.defaultScores[i].score
+        self.defaultScores[i].level = data.defaultScores[i].level
+    end
+end
+
 ---Injects functions to Resource Manager regarding this resource type.
 ---@param ResourceManager ResourceManager Resource Manager class to inject the functions to.
 function HighscoresConfig.inject(ResourceManager)
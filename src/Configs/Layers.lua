@@ -11,7 +11,8 @@ local class = require "com.class"
 local LayersConfig = class:derive("LayersConfig")
 
 LayersConfig.metadata = {
-    schemaPath = "config/layers.json"
+    schemaPath = "config/layers.json",
+    schemaHash = "1154cb01254b104b"
 }
 
 ---Constructs an instance of LayersConfig.
@@ -34,6 +35,24 @@ function LayersConfig:new(data, path, isAnonymous, base)
     end
 end
 
+---Constructs an instance of LayersConfig from data which has been validated against its schema at build time.
+---No checks are performed. Used by the Resource Manager for resources with a matching `_validated` stamp.
+---@param data table Raw data from a file.
+---@param path string? Path to the file. Used for error messages and saving data.
+---@param isAnonymous boolean? If `true`, this resource is anonymous and its path is invalid for saving data.
+function LayersConfig:newTrusted(data, path, isAnonymous)
+    local u = _ConfigUtils
+    self._path = path
+    self._alias = data._alias
+    self._isAnonymous = isAnonymous
+
+    ---@type string[]
+    self.layers = {}
+    for i = 1, #data.layers do
+        self.layers[i] = data.layers[i]
+    end
+end
+
 ---Injects functions to Resource Manager regarding this resource type.
 ---@param ResourceManager ResourceManager Resource Manager class to inject the functions to.
 function LayersConfig.inject(ResourceManager)
@@ -11,7 +11,8 @@ local class = require "com.class"
 local LevelConfig = class:derive("LevelConfig")
 
 LevelConfig.metadata = {
-    schemaPath = "level.json"
+    schemaPath = "level.json",
+    schemaHash = "99dacf282df9ae46"
 }
 
 ---Constructs an instance of LevelConfig.
@@ -104,6 +105,94 @@ function LevelConfig:new(data, path, isAnonymous, base)
     end
 end
 
+---Constructs an instance of LevelConfig from data which has been validated against its schema at build time.
+---No checks are performed. Used by the Resource Manager for resources with a matching `_validated` stamp.
+---@param data table Raw data from a file.
+---@param path string? Path to the file. Used for error messages and saving data.
+---@param isAnonymous boolean? If `true`, this resource is anonymous and its path is invalid for saving data.
+function LevelConfig:newTrusted(data, path, isAnonymous)
+    local u = _ConfigUtils
+    self._path = path
+    self._alias = data._alias
+    self._isAnonymous = isAnonymous
+
+    self.map = data.map
+    self.sequence = u.trustConfig(data.sequence, path, "LevelSequence")
+    self.music = u.trustResource(data.music, "getMusicPlaylist")
+    self.dangerMusic = u.trustResource(data.dangerMusic, "getMusicPlaylist")
+    self.ambientMusic = u.trustResource(data.ambientMusic, "getMusicTrack")
+    self.dangerSound = u.trustResource(data.dangerSound, "getSoundEvent")
+    self.dangerLoopSound = u.trustResource(data.dangerLoopSound, "getSoundEvent")
+    self.warmupLoopSound = u.trustResource(data.warmupLoopSound, "getSoundEvent")
+    self.failSound = u.trustResource(data.failSound, "getSoundEvent")
+    self.failLoopSound = u.trustResource(data.failLoopSound, "getSoundEvent")
+    self.colorGeneratorNormal = u.trustConfig(data.colorGeneratorNormal, path, "ColorGenerator")
+    self.colorGeneratorDanger = u.trustConfig(data.colorGeneratorDanger, path, "ColorGenerator")
+
+    ---@type {shooter: ShooterConfig, movement: ShooterMovementConfig?}
+    if data.shooter then
+        self.shooter = {}
+        self.shooter.shooter = u.trustConfig(data.shooter.shooter, path, "Shooter")
+        self.shooter.movement = u.trustConfig(data.shooter.movement, path, "ShooterMovement")
+    end
+
+    self.matchEffect = u.trustConfig(data.matchEffect, path, "SphereEffect")
+
+    ---@type {type: "destroyedSpheres"|"timeElapsed"|"score"|"sphereChainsSpawned", target: number}[]
+    self.objectives = {}
+    for i = 1, #data.objectives do
+        self.objectives[i] = {}
+        ---@type "destroyedSpheres"|"timeElapsed"|"score"|"sphereChainsSpawned"
+        self.objectives[i].type = data.objectives[i].type
+        self.objectives[i].target = data.objectives[i].target
+    end
+
+    ---@type table<string, number>
+    if data.variables then
+        self.variables = {}
+        for n, _ in pairs(data.variables) do
+            self.variables[n] = data.variables[n]
+        end
+    end
+
+    ---@type {trainRules: LevelTrainRulesConfig, spawnDistance: number, dangerDistance: number, dangerParticle: ParticleEffectConfig?, dangerParticleLayer: string, speeds: {distance: number?, offset: number?, offsetFromEnd: number?, speed: number, transition: table}[]}[]
+    self.pathsBehavior = {}
+    for i = 1, #data.pathsBehavior do
+        self.pathsBehavior[i] = {}
+        self.pathsBehavior[i].trainRules = u.trustConfig(data.pathsBehavior[i].trainRules, path, "LevelTrainRules")
+        self.pathsBehavior[i].spawnDistance = data.pathsBehavior[i].spawnDistance
+        self.pathsBehavior[i].dangerDistance = data.pathsBehavior[i].dangerDistance
+        self.pathsBehavior[i].dangerParticle = u.trustConfig(data.pathsBehavior[i].dangerParticle, path, "ParticleEffect")
+        self.pathsBehavior[i].dangerParticleLayer = data.pathsBehavior[i].dangerParticleLayer or "GameLevelWarningPsys"
+
+        ---@type {distance: number?, offset: number?, offsetFromEnd: number?, speed: number, transition: table}[]
+        self.pathsBehavior[i].speeds = {}
+        for j = 1, #data.pathsBehavior[i].speeds do
+            self.pathsBehavior[i].speeds[j] = {}
+            self.pathsBehavior[i].speeds[j].distance = data.pathsBehavior[i].speeds[j].distance
+            self.pathsBehavior[i].speeds[j].offset = data.pathsBehavior[i].speeds[j].offset
+            self.pathsBehavior[i].speeds[j].offsetFromEnd = data.pathsBehavior[i].speeds[j].offsetFromEnd
+            self.pathsBehavior[i].speeds[j].speed = data.pathsBehavior[i].speeds[j].speed
+
+            ---@type table
+            if data.pathsBehavior[i].speeds[j].transition then
+                self.pathsBehavior[i].speeds[j].transition = {}
+                self.pathsBehavior[i].speeds[j].transition.type = data.pathsBehavior[i].speeds[j].transition.type
+                if self.pathsBehavior[i].speeds[j].transition.type == "instant" then
+                    -- No fields
+                elseif self.pathsBehavior[i].speeds[j].transition.type == "linear" then
+                    -- No fields
+                elseif self.pathsBehavior[i].speeds[j].transition.type == "bezier" then
+                    self.pathsBehavior[i].speeds[j].transition.point1 = data.pathsBehavior[i].speeds[j].transition.point1
+                    self.pathsBehavior[i].speeds[j].transition.point2 = data.pathsBehavior[i].speeds[j].transition.point2
+                else
+                    error(string.format("Unknown transition type: %s (expected \"instant\", \"linear\", \"bezier\")", self.pathsBehavior[i].speeds[j].transition.type))
+                end
+            end
+        end
+    end
+end
+
 ---Injects functions to Resource Manager regarding this resource type.
 ---@param ResourceManager ResourceManager Resource Manager class to inject the functions to.
 function LevelConfig.inject(ResourceManager)
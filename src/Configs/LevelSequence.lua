@@ -11,7 +11,8 @@ local class = require "com.class"
 local LevelSequenceConfig = class:derive("LevelSequenceConfig")
 
 LevelSequenceConfig.metadata = {
-    schemaPath = "level_sequence.json"
+    schemaPath = "level_sequence.json",
+    schemaHash = "83e18d5b57985f6a"
 }
 
 ---Constructs an instance of LevelSequenceConfig.
@@ -73,6 +74,63 @@ function LevelSequenceConfig:new(data, path, isAnonymous, base)
     end
 end
 
+---Constructs an instance of LevelSequenceConfig from data which has been validated against its schema at build time.
+---No checks are performed. Used by the Resource Manager for resources with a matching `_validated` stamp.
+---@param data table Raw data from a file.
+---@param path string? Path to the file. Used for error messages and saving data.
+---@param isAnonymous boolean? If `true`, this resource is anonymous and its path is invalid for saving data.
+function LevelSequenceConfig:newTrusted(data, path, isAnonymous)
+    local u = _ConfigUtils
+    self._path = path
+    self._alias = data._alias
+    self._isAnonymous = isAnonymous
+
+    ---@type table[]
+    self.sequence = {}
+    for i = 1, #data.sequence do
+        self.sequence[i] = {}
+        self.sequence[i].type = data.sequence[i].type
+        if self.sequence[i].type == "wait" then
+            self.sequence[i].delay = data.sequence[i].delay
+        elseif self.sequence[i].type == "waitForCollectibles" then
+            -- No fields
+        elseif self.sequence[i].type == "uiCallback" then
+            self.sequence[i].callback = data.sequence[i].callback
+            self.sequence[i].waitUntilFinished = data.sequence[i].waitUntilFinished
+            self.sequence[i].retriggerWhenLoaded = u.trustBoolean(data.sequence[i].retriggerWhenLoaded, true)
+        elseif self.sequence[i].type == "pathEntity" then
+            self.sequence[i].pathEntity = u.trustConfig(data.sequence[i].pathEntity, path, "PathEntity")
+            self.sequence[i].separatePaths = data.sequence[i].separatePaths
+            self.sequence[i].launchDelay = data.sequence[i].launchDelay
+            self.sequence[i].waitUntilFinished = data.sequence[i].waitUntilFinished
+            self.sequence[i].skippable = data.sequence[i].skippable
+        elseif self.sequence[i].type == "gameplay" then
+            self.sequence[i].warmupTime = data.sequence[i].warmupTime
+            self.sequence[i].previewFirstShooterColor = data.sequence[i].previewFirstShooterColor
+            self.sequence[i].onFail = data.sequence[i].onFail
+            self.sequence[i].onWin = data.sequence[i].onWin
+            self.sequence[i].onObjectivesReached = data.sequence[i].onObjectivesReached
+        elseif self.sequence[i].type == "fail" then
+            self.sequence[i].waitUntilFinished = data.sequence[i].waitUntilFinished
+            self.sequence[i].skippable = data.sequence[i].skippable
+        elseif self.sequence[i].type == "clearBoard" then
+            -- No fields
+        elseif self.sequence[i].type == "collectibleEffect" then
+            self.sequence[i].effects = {}
+            for j = 1, #data.sequence[i].effects do
+                self.sequence[i].effects[j] = u.trustConfig(data.sequence[i].effects[j], path, "CollectibleEffect")
+            end
+        elseif self.sequence[i].type == "executeGameEvent" then
+            self.sequence[i].gameEvent = u.trustConfig(data.sequence[i].gameEvent, path, "GameEvent")
+        elseif self.sequence[i].type == "end" then
+            self.sequence[i].status = data.sequence[i].status
+        else
+            error(string.format("Unknown LevelSequenceConfig type: %s (expected \"wait\", \"waitForCollectibles\", \"uiCallback\", \"pathEntity\", \"gameplay\", \"fail\", \"clearBoard\", \"collectibleEffect\", \"executeGameEvent\", \"end\")", self.sequence[i].type))
+        end
+        self.sequence[i].muteMusic = data.sequence[i].muteMusic
+    end
+end
+
 ---Injects functions to Resource Manager regarding this resource type.
 ---@param ResourceManager ResourceManager Resource Manager class to inject the functions to.
 function LevelSequenceConfig.inject(ResourceManager)
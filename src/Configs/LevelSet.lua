@@ -11,7 +11,8 @@ local class = require "com.class"
 local LevelSetConfig = class:derive("LevelSetConfig")
 
 LevelSetConfig.metadata = {
-    schemaPath = "level_set.json"
+    schemaPath = "level_set.json",
+    schemaHash = "bf5df0705523c2df"
 }
 
 ---Constructs an instance of LevelSetConfig.
@@ -70,6 +71,60 @@ function LevelSetConfig:new(data, path, isAnonymous, base)
     end
 end
 
+---Constructs an instance of LevelSetConfig from data which has been validated against its schema at build time.
+---No checks are performed. Used by the Resource Manager for resources with a matching `_validated` stamp.
+---@param data table Raw data from a file.
+---@param path string? Path to the file. Used for error messages and saving data.
+---@param isAnonymous boolean? If `true`, this resource is anonymous and its path is invalid for saving data.
+function LevelSetConfig:newTrusted(data, path, isAnonymous)
+    local u = _ConfigUtils
+    self._path = path
+    self._alias = data._alias
+    self._isAnonymous = isAnonymous
+
+    ---@type table[]
+    self.levelOrder = {}
+    for i = 1, #data.levelOrder do
+        self.levelOrder[i] = {}
+        self.levelOrder[i].type = data.levelOrder[i].type
+        if self.levelOrder[i].type == "level" then
+            self.levelOrder[i].level = u.trustConfig(data.levelOrder[i].level, path, "Level")
+            self.levelOrder[i].name = data.levelOrder[i].name
+        elseif self.levelOrder[i].type == "uiScript" then
+            self.levelOrder[i].callback = data.levelOrder[i].callback
+            self.levelOrder[i].name = data.levelOrder[i].name
+        elseif self.levelOrder[i].type == "randomizer" then
+            self.levelOrder[i].pool = {}
+            for j = 1, #data.levelOrder[i].pool do
+                self.levelOrder[i].pool[j] = u.trustConfig(data.levelOrder[i].pool[j], path, "Level")
+            end
+            self.levelOrder[i].names = {}
+            for j = 1, #data.levelOrder[i].names do
+                self.levelOrder[i].names[j] = data.levelOrder[i].names[j]
+            end
+            self.levelOrder[i].count = data.levelOrder[i].count
+            self.levelOrder[i].mode = data.levelOrder[i].mode
+        else
+            error(string.format("Unknown LevelSetConfig type: %s (expected \"level\", \"uiScript\", \"randomizer\")", self.levelOrder[i].type))
+        end
+
+        ---@type {id: integer, unlockedOnStart: boolean?}
+        if data.levelOrder[i].checkpoint then
+            self.levelOrder[i].checkpoint = {}
+            self.levelOrder[i].checkpoint.id = data.levelOrder[i].checkpoint.id
+            self.levelOrder[i].checkpoint.unlockedOnStart = data.levelOrder[i].checkpoint.unlockedOnStart
+        end
+
+        ---@type integer[]
+        self.levelOrder[i].unlockCheckpointsOnBeat = {}
+        if data.levelOrder[i].unlockCheckpointsOnBeat then
+            for j = 1, #data.levelOrder[i].unlockCheckpointsOnBeat do
+                self.levelOrder[i].unlockCheckpointsOnBeat[j] = data.levelOrder[i].unlockCheckpointsOnBeat[j]
+            end
+        end
+    end
+end
+
 ---Injects functions to Resource Manager regarding this resource type.
 ---@param ResourceManager ResourceManager Resource Manager class to inject the functions to.
 function LevelSetConfig.inject(ResourceManager)
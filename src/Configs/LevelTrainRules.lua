@@ -11,7 +11,8 @@ local class = require "com.class"
 local LevelTrainRulesConfig = class:derive("LevelTrainRulesConfig")
 
 LevelTrainRulesConfig.metadata = {
-    schemaPath = "level_train_rules.json"
+    schemaPath = "level_train_rules.json",
+    schemaHash = "2d7b88489364382f"
 }
 
 ---Constructs an instance of LevelTrainRulesConfig.
@@ -97,6 +98,87 @@ function LevelTrainRulesConfig:new(data, path, isAnonymous, base)
     end
 end
 
+---Constructs an instance of LevelTrainRulesConfig from data which has been validated against its schema at build time.
+---No checks are performed. Used by the Resource Manager for resources with a matching `_validated` stamp.
+---@param data table Raw data from a file.
+---@param path string? Path to the file. Used for error messages and saving data.
+---@param isAnonymous boolean? If `true`, this resource is anonymous and its path is invalid for saving data.
+function LevelTrainRulesConfig:newTrusted(data, path, isAnonymous)
+    local u = _ConfigUtils
+    self._path = path
+    self._alias = data._alias
+    self._isAnonymous = isAnonymous
+
+    self.type = data.type
+    if self.type == "random" then
+        self.colors = {}
+        for i = 1, #data.colors do
+            self.colors[i] = data.colors[i]
+        end
+        self.colorStreak = data.colorStreak
+        self.forceDifferentColor = data.forceDifferentColor
+        self.chainChances = {}
+        if data.chainChances then
+            for i = 1, #data.chainChances do
+                self.chainChances[i] = data.chainChances[i]
+            end
+        end
+        self.length = data.length
+    elseif self.type == "pattern" then
+        self.pattern = {}
+        for i = 1, #data.pattern do
+            self.pattern[i] = data.pattern[i]
+        end
+        self.chainChances = {}
+        if data.chainChances then
+            for i = 1, #data.chainChances do
+                self.chainChances[i] = data.chainChances[i]
+            end
+        end
+        self.length = data.length
+    elseif self.type == "waves" then
+        self.key = {}
+        for i = 1, #data.key do
+            self.key[i] = {}
+            self.key[i].key = data.key[i].key
+
+            ---@type string[]
+            self.key[i].keys = {}
+            if data.key[i].keys then
+                for j = 1, #data.key[i].keys do
+                    self.key[i].keys[j] = data.key[i].keys[j]
+                end
+            end
+
+            ---@type integer[]
+            self.key[i].colors = {}
+            for j = 1, #data.key[i].colors do
+                self.key[i].colors[j] = data.key[i].colors[j]
+            end
+
+            self.key[i].homogenous = data.key[i].homogenous
+            self.key[i].noColorRepeats = data.key[i].noColorRepeats
+            self.key[i].colorStreak = data.key[i].colorStreak
+            self.key[i].forceDifferentColor = data.key[i].forceDifferentColor
+
+            ---@type number[]
+            self.key[i].chainChances = {}
+            if data.key[i].chainChances then
+                for j = 1, #data.key[i].chainChances do
+                    self.key[i].chainChances[j] = data.key[i].chainChances[j]
+                end
+            end
+        end
+        self.waves = {}
+        for i = 1, #data.waves do
+            self.waves[i] = data.waves[i]
+        end
+        self.behavior = data.behavior
+    else
+        error(string.format("Unknown LevelTrainRulesConfig type: %s (expected \"random\", \"pattern\", \"waves\")", self.type))
+    end
+end
+
 ---Injects functions to Resource Manager regarding this resource type.
 ---@param ResourceManager ResourceManager Resource Manager class to inject the functions to.
 function LevelTrainRulesConfig.inject(ResourceManager)
@@ -11,7 +11,8 @@ local class = require "com.class"
 local LocaleConfig = class:derive("LocaleConfig")
 
 LocaleConfig.metadata = {
-    schemaPath = "locale.json"
+    schemaPath = "locale.json",
+    schemaHash = "3f1ad2090b84e892"
 }
 
 ---Constructs an instance of LocaleConfig.
@@ -34,6 +35,24 @@ function LocaleConfig:new(data, path, isAnonymous, base)
     end
 end
 
+---Constructs an instance of LocaleConfig from data which has been validated against its schema at build time.
+---No checks are performed. Used by the Resource Manager for resources with a matching `_validated` stamp.
+---@param data table Raw data from a file.
+---@param path string? Path to the file. Used for error messages and saving data.
+---@param isAnonymous boolean? If `true`, this resource is anonymous and its path is invalid for saving data.
+function LocaleConfig:newTrusted(data, path, isAnonymous)
+    local u = _ConfigUtils
+    self._path = path
+    self._alias = data._alias
+    self._isAnonymous = isAnonymous
+
+    ---@type table<string, string>
+    self.keys = {}
+    for n, _ in pairs(data.keys) do
+        self.keys[n] = data.keys[n]
+    end
+end
+
 ---Injects functions to Resource Manager regarding this resource type.
 ---@param ResourceManager ResourceManager Resource Manager class to inject the functions to.
 function LocaleConfig.inject(ResourceManager)
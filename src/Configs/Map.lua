@@ -11,7 +11,8 @@ local class = require "com.class"
 local MapConfig = class:derive("MapConfig")
 
 MapConfig.metadata = {
-    schemaPath = "map.json"
+    schemaPath = "map.json",
+    schemaHash = "f5ba2ea8ac7afc71"
 }
 
 ---Constructs an instance of MapConfig.
@@ -53,6 +54,43 @@ function MapConfig:new(data, path, isAnonymous, base)
     end
 end
 
+---Constructs an instance of MapConfig from data which has been validated against its schema at build time.
+---No checks are performed. Used by the Resource Manager for resources with a matching `_validated` stamp.
+---@param data table Raw data from a file.
+---@param path string? Path to the file. Used for error messages and saving data.
+---@param isAnonymous boolean? If `true`, this resource is anonymous and its path is invalid for saving data.
+function MapConfig:newTrusted(data, path, isAnonymous)
+    local u = _ConfigUtils
+    self._path = path
+    self._alias = data._alias
+    self._isAnonymous = isAnonymous
+
+    self.name = data.name
+
+    ---@type PathConfig[]
+    self.paths = {}
+    for i = 1, #data.paths do
+        self.paths[i] = u.trustConfig(data.paths[i], path, "Path")
+    end
+
+    ---@type table[]
+    self.objects = {}
+    for i = 1, #data.objects do
+        self.objects[i] = {}
+        self.objects[i].type = data.objects[i].type
+        if self.objects[i].type == "sprite" then
+            self.objects[i].sprite = u.trustResource(data.objects[i].sprite, "getSprite")
+        elseif self.objects[i].type == "particle" then
+            self.objects[i].particle = u.trustConfig(data.objects[i].particle, path, "ParticleEffect")
+        else
+            error(string.format("Unknown MapConfig type: %s (expected \"sprite\", \"particle\")", self.objects[i].type))
+        end
+        self.objects[i].layer = data.objects[i].layer
+        self.objects[i].x = data.objects[i].x
+        self.objects[i].y = data.objects[i].y
+    end
+end
+
 ---Injects functions to Resource Manager regarding this resource type.
 ---@param ResourceManager ResourceManager Resource Manager class to inject the functions to.
 function MapConfig.inject(ResourceManager)
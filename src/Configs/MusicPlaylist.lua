@@ -11,7 +11,8 @@ local class = require "com.class"
 local MusicPlaylistConfig = class:derive("MusicPlaylistConfig")
 
 MusicPlaylistConfig.metadata = {
-    schemaPath = "music_playlist.json"
+    schemaPath = "music_playlist.json",
+    schemaHash = "c66e84296767d6b2"
 }
 
 ---Constructs an instance of MusicPlaylistConfig.
@@ -37,6 +38,27 @@ function MusicPlaylistConfig:new(data, path, isAnonymous, base)
     self.order = u.parseString(data, base, path, {"order"}, "random")
 end
 
+---Constructs an instance of MusicPlaylistConfig from data which has been validated against its schema at build time.
+---No checks are performed. Used by the Resource Manager for resources with a matching `_validated` stamp.
+---@param data table Raw data from a file.
+---@param path string? Path to the file. Used for error messages and saving data.
+---@param isAnonymous boolean? If `true`, this resource is anonymous and its path is invalid for saving data.
+function MusicPlaylistConfig:newTrusted(data, path, isAnonymous)
+    local u = _ConfigUtils
+    self._path = path
+    self._alias = data._alias
+    self._isAnonymous = isAnonymous
+
+    ---@type MusicTrack[]
+    self.tracks = {}
+    for i = 1, #data.tracks do
+        self.tracks[i] = u.trustResource(data.tracks[i], "getMusicTrack")
+    end
+
+    ---@type "random"|"sequence"
+    self.order = data.order or "random"
+end
+
 ---Injects functions to Resource Manager regarding this resource type.
 ---@param ResourceManager ResourceManager Resource Manager class to inject the functions to.
 function MusicPlaylistConfig.inject(ResourceManager)
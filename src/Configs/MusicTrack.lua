@@ -11,7 +11,8 @@ local class = require "com.class"
 local MusicTrackConfig = class:derive("MusicTrackConfig")
 
 MusicTrackConfig.metadata = {
-    schemaPath = "music_track.json"
+    schemaPath = "music_track.json",
+    schemaHash = "2910f0de51f04fb2"
 }
 
 ---Constructs an instance of MusicTrackConfig.
@@ -30,6 +31,20 @@ function MusicTrackConfig:new(data, path, isAnonymous, base)
     self.audio = u.parseSound(data, base, path, {"audio"})
 end
 
+---Constructs an instance of MusicTrackConfig from data which has been validated against its schema at build time.
+---No checks are performed. Used by the Resource Manager for resources with a matching `_validated` stamp.
+---@param data table Raw data from a file.
+---@param path string? Path to the file. Used for error messages and saving data.
+---@param isAnonymous boolean? If `true`, this resource is anonymous and its path is invalid for saving data.
+function MusicTrackConfig:newTrusted(data, path, isAnonymous)
+    local u = _ConfigUtils
+    self._path = path
+    self._alias = data._alias
+    self._isAnonymous = isAnonymous
+
+    self.audio = u.trustResource(data.audio, "getSound")
+end
+
 ---Injects functions to Resource Manager regarding this resource type.
 ---@param ResourceManager ResourceManager Resource Manager class to inject the functions to.
 function MusicTrackConfig.inject(ResourceManager)
@@ -11,7 +11,8 @@ local class = require "com.class"
 local ParticleConfig = class:derive("ParticleConfig")
 
 ParticleConfig.metadata = {
-    schemaPath = "particle.json"
+    schemaPath = "particle.json",
+    schemaHash = "d819989edb7be4a5"
 }
 
 ---Constructs an instance of ParticleConfig.
@@ -62,6 +63,52 @@ function ParticleConfig:new(data, path, isAnonymous, base)
     self.angleSpeed = u.parseExprNumberOpt(data, base, path, {"angleSpeed"})
 end
 
+---Constructs an instance of ParticleConfig from data which has been validated against its schema at build time.
+---No checks are performed. Used by the Resource Manager for resources with a matching `_validated` stamp.
+---@param data table Raw data from a file.
+---@param path string? Path to the file. Used for error messages and saving data.
+---@param isAnonymous boolean? If `true`, this resource is anonymous and its path is invalid for saving data.
+function ParticleConfig:newTrusted(data, path, isAnonymous)
+    local u = _ConfigUtils
+    self._path = path
+    self._alias = data._alias
+    self._isAnonymous = isAnonymous
+
+    ---@type table
+    self.movement = {}
+    self.movement.type = data.movement.type
+    if self.movement.type == "loose" then
+        self.movement.speed = u.trustExpr(data.movement.speed)
+        self.movement.acceleration = u.trustVec2(data.movement.acceleration)
+    elseif self.movement.type == "radius" then
+        self.movement.speed = u.trustExpr(data.movement.speed)
+        self.movement.acceleration = u.trustVec2(data.movement.acceleration)
+    elseif self.movement.type == "circle" then
+        self.movement.speed = u.trustExpr(data.movement.speed)
+        self.movement.acceleration = data.movement.acceleration
+    else
+        error(string.format("Unknown movement type: %s (expected \"loose\", \"radius\", \"circle\")", self.movement.type))
+    end
+
+    self.spawnScale = u.trustExpr(data.spawnScale)
+    self.lifespan = u.trustExpr(data.lifespan)
+    self.sprite = u.trustResource(data.sprite, "getSprite")
+    self.animationFrameCount = data.animationFrameCount
+    self.animationSpeed = data.animationSpeed
+    self.animationLoop = data.animationLoop
+    self.animationFrameRandom = data.animationFrameRandom
+    self.fadeTime = u.trustExpr(data.fadeTime)
+    self.fadeInPoint = data.fadeInPoint
+    self.fadeOutPoint = data.fadeOutPoint
+    self.posRelative = u.trustBoolean(data.posRelative, false)
+    self.colorPalette = u.trustResource(data.colorPalette, "getColorPalette")
+    self.colorPaletteSpeed = data.colorPaletteSpeed
+    self.directionDeviationTime = data.directionDeviationTime
+    self.directionDeviationSpeed = u.trustExpr(data.directionDeviationSpeed)
+    self.angle = u.trustExpr(data.angle)
+    self.angleSpeed = u.trustExpr(data.angleSpeed)
+end
+
 ---Injects functions to Resource Manager regarding this resource type.
 ---@param ResourceManager ResourceManager Resource Manager class to inject the functions to.
 function ParticleConfig.inject(ResourceManager)
@@ -11,7 +11,8 @@ local class = require "com.class"
 local ParticleEffectConfig = class:derive("ParticleEffectConfig")
 
 ParticleEffectConfig.metadata = {
-    schemaPath = "particle_effect.json"
+    schemaPath = "particle_effect.json",
+    schemaHash = "7fe866b615d34d74"
 }
 
 ---Constructs an instance of ParticleEffectConfig.
@@ -34,6 +35,24 @@ function ParticleEffectConfig:new(data, path, isAnonymous, base)
     end
 end
 
+---Constructs an instance of ParticleEffectConfig from data which has been validated against its schema at build time.
+---No checks are performed. Used by the Resource Manager for resources with a matching `_validated` stamp.
+---@param data table Raw data from a file.
+---@param path string? Path to the file. Used for error messages and saving data.
+---@param isAnonymous boolean? If `true`, this resource is anonymous and its path is invalid for saving data.
+function ParticleEffectConfig:newTrusted(data, path, isAnonymous)
+    local u = _ConfigUtils
+    self._path = path
+    self._alias = data._alias
+    self._isAnonymous = isAnonymous
+
+    ---@type ParticleEmitterConfig[]
+    self.emitters = {}
+    for i = 1, #data.emitters do
+        self.emitters[i] = u.trustConfig(data.emitters[i], path, "ParticleEmitter")
+    end
+end
+
 ---Injects functions to Resource Manager regarding this resource type.
 ---@param ResourceManager ResourceManager Resource Manager class to inject the functions to.
 function ParticleEffectConfig.inject(ResourceManager)
@@ -11,7 +11,8 @@ local class = require "com.class"
 local ParticleEmitterConfig = class:derive("ParticleEmitterConfig")
 
 ParticleEmitterConfig.metadata = {
-    schemaPath = "particle_emitter.json"
+    schemaPath = "particle_emitter.json",
+    schemaHash = "b67def2c41462092"
 }
 
 ---Constructs an instance of ParticleEmitterConfig.
@@ -37,6 +38,27 @@ function ParticleEmitterConfig:new(data, path, isAnonymous, base)
     self.particleData = u.parseParticleConfig(data, base, path, {"particleData"})
 end
 
+---Constructs an instance of ParticleEmitterConfig from data which has been validated against its schema at build time.
+---No checks are performed. Used by the Resource Manager for resources with a matching `_validated` stamp.
+---@param data table Raw data from a file.
+---@param path string? Path to the file. Used for error messages and saving data.
+---@param isAnonymous boolean? If `true`, this resource is anonymous and its path is invalid for saving data.
+function ParticleEmitterConfig:newTrusted(data, path, isAnonymous)
+    local u = _ConfigUtils
+    self._path = path
+    self._alias = data._alias
+    self._isAnonymous = isAnonymous
+
+    self.pos = u.trustVec2(data.pos)
+    self.speed = u.trustVec2(data.speed)
+    self.acceleration = u.trustVec2(data.acceleration)
+    self.lifespan = data.lifespan
+    self.spawnCount = data.spawnCount
+    self.spawnMax = data.spawnMax
+    self.spawnDelay = data.spawnDelay
+    self.particleData = u.trustConfig(data.particleData, path, "Particle")
+end
+
 ---Injects functions to Resource Manager regarding this resource type.
 ---@param ResourceManager ResourceManager Resource Manager class to inject the functions to.
 function ParticleEmitterConfig.inject(ResourceManager)
@@ -11,7 +11,8 @@ local class = require "com.class"
 local PathConfig = class:derive("PathConfig")
 
 PathConfig.metadata = {
-    schemaPath = "path.json"
+    schemaPath = "path.json",
+    schemaHash = "9f70bd2553c9bcb1"
 }
 
 ---Constructs an instance of PathConfig.
@@ -39,6 +40,29 @@ function PathConfig:new(data, path, isAnonymous, base)
     end
 end
 
+---Constructs an instance of PathConfig from data which has been validated against its schema at build time.
+---No checks are performed. Used by the Resource Manager for resources with a matching `_validated` stamp.
+---@param data table Raw data from a file.
+---@param path string? Path to the file. Used for error messages and saving data.
+---@param isAnonymous boolean? If `true`, this resource is anonymous and its path is invalid for saving data.
+function PathConfig:newTrusted(data, path, isAnonymous)
+    local u = _ConfigUtils
+    self._path = path
+    self._alias = data._alias
+    self._isAnonymous = isAnonymous
+
+    ---@type {x: number, y: number, scale: number, hidden: boolean, warp: boolean?}[]
+    self.nodes = {}
+    for i = 1, #data.nodes do
+        self.nodes[i] = {}
+        self.nodes[i].x = data.nodes[i].x
+        self.nodes[i].y = data.nodes[i].y
+        self.nodes[i].scale = data.nodes[i].scale or 1
+        self.nodes[i].hidden = u.trustBoolean(data.nodes[i].hidden, false)
+        self.nodes[i].warp = data.nodes[i].warp
+    end
+end
+
 ---Injects functions to Resource Manager regarding this resource type.
 ---@param ResourceManager ResourceManager Resource Manager class to inject the functions to.
 function PathConfig.inject(ResourceManager)
@@ -11,7 +11,8 @@ local class = require "com.class"
 local PathEntityConfig = class:derive("PathEntityConfig")
 
 PathEntityConfig.metadata = {
-    schemaPath = "path_entity.json"
+    schemaPath = "path_entity.json",
+    schemaHash = "f076c2bae147e871"
 }
 
 ---Constructs an instance of PathEntityConfig.
@@ -63,6 +64,53 @@ function PathEntityConfig:new(data, path, isAnonymous, base)
     self.maxSphereChainsDestroyed = u.parseIntegerOpt(data, base, path, {"maxSphereChainsDestroyed"})
 end
 
+---Constructs an instance of PathEntityConfig from data which has been validated against its schema at build time.
+---No checks are performed. Used by the Resource Manager for resources with a matching `_validated` stamp.
+---@param data table Raw data from a file.
+---@param path string? Path to the file. Used for error messages and saving data.
+---@param isAnonymous boolean? If `true`, this resource is anonymous and its path is invalid for saving data.
+function PathEntityConfig:newTrusted(data, path, isAnonymous)
+    local u = _ConfigUtils
+    self._path = path
+    self._alias = data._alias
+    self._isAnonymous = isAnonymous
+
+    self.sprite = u.trustResource(data.sprite, "getSprite")
+    self.spriteLayer = data.spriteLayer or "GamePieceNormal"
+    self.spriteHiddenLayer = data.spriteHiddenLayer or "GamePieceHidden"
+    self.shadowSprite = u.trustResource(data.shadowSprite, "getSprite")
+    self.shadowSpriteLayer = data.shadowSpriteLayer or "GamePieceNShadow"
+    self.shadowSpriteHiddenLayer = data.shadowSpriteHiddenLayer or "GamePieceHShadow"
+    ---@type "start"|"end"|"furthestSpheres"
+    self.spawnPlacement = data.spawnPlacement
+    self.spawnOffset = data.spawnOffset or 0
+    self.speed = data.speed
+    self.acceleration = data.acceleration or 0
+    self.maxSpeed = data.maxSpeed
+    self.maxOffset = data.maxOffset
+    self.destroyOffset = data.destroyOffset
+    self.destroyTime = data.destroyTime
+    self.destroyWhenPathEmpty = data.destroyWhenPathEmpty
+    self.destroyAtClearOffset = data.destroyAtClearOffset
+    self.particle = u.trustConfig(data.particle, path, "ParticleEffect")
+    self.particleLayer = data.particleLayer or "GamePieceNormal"
+    self.particleHiddenLayer = data.particleHiddenLayer or "GamePieceHidden"
+    self.particleSeparation = data.particleSeparation
+    self.loopSound = u.trustResource(data.loopSound, "getSoundEvent")
+    self.collectibleGenerator = u.trustConfig(data.collectibleGenerator, path, "CollectibleGenerator")
+    self.collectibleGeneratorSeparation = data.collectibleGeneratorSeparation
+    self.destroyParticle = u.trustConfig(data.destroyParticle, path, "ParticleEffect")
+    self.destroyParticleLayer = data.destroyParticleLayer or "GameCollapses"
+    self.destroySound = u.trustResource(data.destroySound, "getSoundEvent")
+    self.destroyScoreEvent = u.trustConfig(data.destroyScoreEvent, path, "ScoreEvent")
+    self.destroyCollectibleGenerator = u.trustConfig(data.destroyCollectibleGenerator, path, "CollectibleGenerator")
+    self.canDestroySpheres = data.canDestroySpheres
+    self.sphereDestroySound = u.trustResource(data.sphereDestroySound, "getSoundEvent")
+    self.sphereDestroyScoreEvent = u.trustConfig(data.sphereDestroyScoreEvent, path, "ScoreEvent")
+    self.maxSpheresDestroyed = data.maxSpheresDestroyed
+    self.maxSphereChainsDestroyed = data.maxSphereChainsDestroyed
+end
+
 ---Injects functions to Resource Manager regarding this resource type.
 ---@param ResourceManager ResourceManager Resource Manager class to inject the functions to.
 function PathEntityConfig.inject(ResourceManager)
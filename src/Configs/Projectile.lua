@@ -11,7 +11,8 @@ local class = require "com.class"
 local ProjectileConfig = class:derive("ProjectileConfig")
 
 ProjectileConfig.metadata = {
-    schemaPath = "projectile.json"
+    schemaPath = "projectile.json",
+    schemaHash = "d3438c15d580e14d"
 }
 
 ---Constructs an instance of ProjectileConfig.
@@ -45,6 +46,35 @@ function ProjectileConfig:new(data, path, isAnonymous, base)
     self.destroyGameEventPerSphere = u.parseGameEventConfigOpt(data, base, path, {"destroyGameEventPerSphere"})
 end
 
+---Constructs an instance of ProjectileConfig from data which has been validated against its schema at build time.
+---No checks are performed. Used by the Resource Manager for resources with a matching `_validated` stamp.
+---@param data table Raw data from a file.
+---@param path string? Path to the file. Used for error messages and saving data.
+---@param isAnonymous boolean? If `true`, this resource is anonymous and its path is invalid for saving data.
+function ProjectileConfig:newTrusted(data, path, isAnonymous)
+    local u = _ConfigUtils
+    self._path = path
+    self._alias = data._alias
+    self._isAnonymous = isAnonymous
+
+    self.particle = u.trustConfig(data.particle, path, "ParticleEffect")
+    self.particleLayer = data.particleLayer or "GamePowerups"
+    self.speed = data.speed
+    self.spawnDistance = u.trustExpr(data.spawnDistance)
+    self.spawnSound = u.trustResource(data.spawnSound, "getSoundEvent")
+    ---@type "homingBugs"|"lightningStorm"
+    self.sphereAlgorithm = data.sphereAlgorithm
+    self.homing = data.homing
+    self.destroyParticle = u.trustConfig(data.destroyParticle, path, "ParticleEffect")
+    self.destroyParticleLayer = data.destroyParticleLayer or "GamePowerups"
+    self.destroySound = u.trustResource(data.destroySound, "getSoundEvent")
+    self.destroySphereSelector = u.trustConfig(data.destroySphereSelector, path, "SphereSelector")
+    self.destroyScoreEvent = u.trustConfig(data.destroyScoreEvent, path, "ScoreEvent")
+    self.destroyScoreEventPerSphere = u.trustConfig(data.destroyScoreEventPerSphere, path, "ScoreEvent")
+    self.destroyGameEvent = u.trustConfig(data.destroyGameEvent, path, "GameEvent")
+    self.destroyGameEventPerSphere = u.trustConfig(data.destroyGameEventPerSphere, path, "GameEvent")
+end
+
 ---Injects functions to Resource Manager regarding this resource type.
 ---@param ResourceManager ResourceManager Resource Manager class to inject the functions to.
 function ProjectileConfig.inject(ResourceManager)
@@ -11,7 +11,8 @@ local class = require "com.class"
 local ScoreEventConfig = class:derive("ScoreEventConfig")
 
 ScoreEventConfig.metadata = {
-    schemaPath = "score_event.json"
+    schemaPath = "score_event.json",
+    schemaHash = "011a56b03faf2a71"
 }
 
 ---Constructs an instance of ScoreEventConfig.
@@ -49,6 +50,39 @@ function ScoreEventConfig:new(data, path, isAnonymous, base)
     self.layer = u.parseString(data, base, path, {"layer"}, "GameScores")
 end
 
+---Constructs an instance of ScoreEventConfig from data which has been validated against its schema at build time.
+---No checks are performed. Used by the Resource Manager for resources with a matching `_validated` stamp.
+---@param data table Raw data from a file.
+---@param path string? Path to the file. Used for error messages and saving data.
+---@param isAnonymous boolean? If `true`, this resource is anonymous and its path is invalid for saving data.
+function ScoreEventConfig:newTrusted(data, path, isAnonymous)
+    local u = _ConfigUtils
+    self._path = path
+    self._alias = data._alias
+    self._isAnonymous = isAnonymous
+
+    self.score = u.trustExpr(data.score)
+    self.ignoreDifficultyMultiplier = data.ignoreDifficultyMultiplier
+    self.text = u.trustExpr(data.text)
+    self.font = u.trustResource(data.font, "getFont")
+
+    ---@type {options: Font[], default: Font, choice: Expression}
+    if data.fonts then
+        self.fonts = {}
+
+        ---@type Font[]
+        self.fonts.options = {}
+        for i = 1, #data.fonts.options do
+            self.fonts.options[i] = u.trustResource(data.fonts.options[i], "getFont")
+        end
+
+        self.fonts.default = u.trustResource(data.fonts.default, "getFont")
+        self.fonts.choice = u.trustExpr(data.fonts.choice)
+    end
+
+    self.layer = data.layer or "GameScores"
+end
+
 ---Injects functions to Resource Manager regarding this resource type.
 ---@param ResourceManager ResourceManager Resource Manager class to inject the functions to.
 function ScoreEventConfig.inject(ResourceManager)
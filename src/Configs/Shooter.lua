@@ -12,7 +12,8 @@ local Vec2 = require("src.Essentials.Vector2")
 local ShooterConfig = class:derive("ShooterConfig")
 
 ShooterConfig.metadata = {
-    schemaPath = "shooter.json"
+    schemaPath = "shooter.json",
+    schemaHash = "9f58675abacfbfc5"
 }
 
 ---Constructs an instance of ShooterConfig.
@@ -105,6 +106,94 @@ function ShooterConfig:new(data, path, isAnonymous, base)
     self.hitboxSize = u.parseVec2(data, base, path, {"hitboxSize"})
 end
 
+---Constructs an instance of ShooterConfig from data which has been validated against its schema at build time.
+---No checks are performed. Used by the Resource Manager for resources with a matching `_validated` stamp.
+---@param data table Raw data from a file.
+---@param path string? Path to the file. Used for error messages and saving data.
+---@param isAnonymous boolean? If `true`, this resource is anonymous and its path is invalid for saving data.
+function ShooterConfig:newTrusted(data, path, isAnonymous)
+    local u = _ConfigUtils
+    self._path = path
+    self._alias = data._alias
+    self._isAnonymous = isAnonymous
+
+    self.movement = u.trustConfig(data.movement, path, "ShooterMovement")
+
+    ---@type {sprite: Sprite, layer: string, offset: Vector2, anchor: Vector2, animationSpeed: number?, conditions: Expression[]}[]
+    self.sprites = {}
+    for i = 1, #data.sprites do
+        self.sprites[i] = {}
+        self.sprites[i].sprite = u.trustResource(data.sprites[i].sprite, "getSprite")
+        self.sprites[i].layer = data.sprites[i].layer
+        self.sprites[i].offset = u.trustVec2(data.sprites[i].offset, Vec2())
+        self.sprites[i].anchor = u.trustVec2(data.sprites[i].anchor, Vec2(0.5, 0.5))
+        self.sprites[i].animationSpeed = data.sprites[i].animationSpeed
+
+        ---@type Expression[]
+        self.sprites[i].conditions = {}
+        if data.sprites[i].conditions then
+            for j = 1, #data.sprites[i].conditions do
+                self.sprites[i].conditions[j] = u.trustExpr(data.sprites[i].conditions[j])
+            end
+        end
+    end
+
+    ---@type {pos: Vector2, shotPos: Vector2?}[]
+    self.spheres = {}
+    for i = 1, #data.spheres do
+        self.spheres[i] = {}
+        self.spheres[i].pos = u.trustVec2(data.spheres[i].pos)
+        self.spheres[i].shotPos = u.trustVec2(data.spheres[i].shotPos)
+    end
+
+    ---@type {sprite: Sprite?, offset: Vector2?, nextBallSprite: Sprite?, nextBallOffset: Vector2?, radiusSprite: Sprite?, colorFadeTime: number?, nextColorFadeTime: number?}
+    self.reticle = {}
+    if data.reticle then
+        self.reticle.sprite = u.trustResource(data.reticle.sprite, "getSprite")
+        self.reticle.offset = u.trustVec2(data.reticle.offset)
+        self.reticle.nextBallSprite = u.trustResource(data.reticle.nextBallSprite, "getSprite")
+        self.reticle.nextBallOffset = u.trustVec2(data.reticle.nextBallOffset)
+        self.reticle.radiusSprite = u.trustResource(data.reticle.radiusSprite, "getSprite")
+        self.reticle.colorFadeTime = data.reticle.colorFadeTime
+        self.reticle.nextColorFadeTime = data.reticle.nextColorFadeTime
+    end
+
+    ---@type {sphereSwap: SoundEvent, sphereFill: SoundEvent}
+    self.sounds = {}
+    self.sounds.sphereSwap = u.trustResource(data.sounds.sphereSwap, "getSoundEvent")
+    self.sounds.sphereFill = u.trustResource(data.sounds.sphereFill, "getSoundEvent")
+
+    ---@type {sprite: Sprite, layer: string, fadeTime: number, renderingType: "full"|"cut"|"scale", colored: boolean}
+    self.speedShotBeam = {}
+    self.speedShotBeam.sprite = u.trustResource(data.speedShotBeam.sprite, "getSprite")
+    self.speedShotBeam.layer = data.speedShotBeam.layer or "GameSpeedShotPsys"
+    self.speedShotBeam.fadeTime = data.speedShotBeam.fadeTime
+    ---@type "full"|"cut"|"scale"
+    self.speedShotBeam.renderingType = data.speedShotBeam.renderingType
+    self.speedShotBeam.colored = data.speedShotBeam.colored
+
+    self.speedShotParticle = u.trustConfig(data.speedShotParticle, path, "ParticleEffect")
+    self.speedShotParticleLayer = data.speedShotParticleLayer or "GameSpeedShotPsys"
+    self.shotSpeed = data.shotSpeed
+    self.shotCooldown = data.shotCooldown or 0
+    self.shotCooldownFade = data.shotCooldownFade or 0
+    self.multishot = u.trustBoolean(data.multishot, false)
+    self.autofire = u.trustBoolean(data.autofire, false)
+    self.destroySphereOnFail = u.trustBoolean(data.destroySphereOnFail, false)
+
+    ---@type {duration: number, strength: number, speedShotDuration: number?, speedShotStrength: number?}
+    if data.knockback then
+        self.knockback = {}
+        self.knockback.duration = data.knockback.duration
+        self.knockback.strength = data.knockback.strength
+        self.knockback.speedShotDuration = data.knockback.speedShotDuration
+        self.knockback.speedShotStrength = data.knockback.speedShotStrength
+    end
+
+    self.hitboxOffset = u.trustVec2(data.hitboxOffset, Vec2())
+    self.hitboxSize = u.trustVec2(data.hitboxSize)
+end
+
 ---Injects functions to Resource Manager regarding this resource type.
 ---@param ResourceManager ResourceManager Resource Manager class to inject the functions to.
 function ShooterConfig.inject(ResourceManager)
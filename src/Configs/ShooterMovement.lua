@@ -11,7 +11,8 @@ local class = require "com.class"
 local ShooterMovementConfig = class:derive("ShooterMovementConfig")
 
 ShooterMovementConfig.metadata = {
-    schemaPath = "shooter_movement.json"
+    schemaPath = "shooter_movement.json",
+    schemaHash = "bdf0de9f9c2c2b45"
 }
 
 ---Constructs an instance of ShooterMovementConfig.
@@ -41,6 +42,31 @@ function ShooterMovementConfig:new(data, path, isAnonymous, base)
     end
 end
 
+---Constructs an instance of ShooterMovementConfig from data which has been validated against its schema at build time.
+---No checks are performed. Used by the Resource Manager for resources with a matching `_validated` stamp.
+---@param data table Raw data from a file.
+---@param path string? Path to the file. Used for error messages and saving data.
+---@param isAnonymous boolean? If `true`, this resource is anonymous and its path is invalid for saving data.
+function ShooterMovementConfig:newTrusted(data, path, isAnonymous)
+    local u = _ConfigUtils
+    self._path = path
+    self._alias = data._alias
+    self._isAnonymous = isAnonymous
+
+    self.type = data.type
+    if self.type == "linear" then
+        self.xMin = data.xMin
+        self.xMax = data.xMax
+        self.y = data.y
+        self.angle = data.angle
+    elseif self.type == "circular" then
+        self.x = data.x
+        self.y = data.y
+    else
+        error(string.format("Unknown ShooterMovementConfig type: %s (expected \"linear\", \"circular\")", self.type))
+    end
+end
+
 ---Injects functions to Resource Manager regarding this resource type.
 ---@param ResourceManager ResourceManager Resource Manager class to inject the functions to.
 function ShooterMovementConfig.inject(ResourceManager)
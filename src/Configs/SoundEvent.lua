@@ -11,7 +11,8 @@ local class = require "com.class"
 local SoundEventConfig = class:derive("SoundEventConfig")
 
 SoundEventConfig.metadata = {
-    schemaPath = "sound_event.json"
+    schemaPath = "sound_event.json",
+    schemaHash = "81f0db7bfd2ad249"
 }
 
 ---Constructs an instance of SoundEventConfig.
@@ -59,6 +60,49 @@ function SoundEventConfig:new(data, path, isAnonymous, base)
     end
 end
 
+---Constructs an instance of SoundEventConfig from data which has been validated against its schema at build time.
+---No checks are performed. Used by the Resource Manager for resources with a matching `_validated` stamp.
+---@param data table Raw data from a file.
+---@param path string? Path to the file. Used for error messages and saving data.
+---@param isAnonymous boolean? If `true`, this resource is anonymous and its path is invalid for saving data.
+function SoundEventConfig:newTrusted(data, path, isAnonymous)
+    local u = _ConfigUtils
+    self._path = path
+    self._alias = data._alias
+    self._isAnonymous = isAnonymous
+
+    self.sound = u.trustResource(data.sound, "getSound")
+    self.loop = u.trustBoolean(data.loop, false)
+    self.flat = u.trustBoolean(data.flat, false)
+    self.volume = u.trustExpr(data.volume, 1)
+    self.pitch = u.trustExpr(data.pitch, 1)
+    self.playsPerFrame = data.playsPerFrame
+    self.instances = data.instances or 8
+
+    ---@type {sound: Sound, loop: boolean, flat: boolean, volume: Expression, pitch: Expression, playsPerFrame: integer?, instances: integer, conditions: Expression[]}[]
+    self.sounds = {}
+    if data.sounds then
+        for i = 1, #data.sounds do
+            self.sounds[i] = {}
+            self.sounds[i].sound = u.trustResource(data.sounds[i].sound, "getSound")
+            self.sounds[i].loop = u.trustBoolean(data.sounds[i].loop, false)
+            self.sounds[i].flat = u.trustBoolean(data.sounds[i].flat, false)
+            self.sounds[i].volume = u.trustExpr(data.sounds[i].volume, 1)
+            self.sounds[i].pitch = u.trustExpr(data.sounds[i].pitch, 1)
+            self.sounds[i].playsPerFrame = data.sounds[i].playsPerFrame
+            self.sounds[i].instances = data.sounds[i].instances or 8
+
+            ---@type Expression[]
+            self.sounds[i].conditions = {}
+            if data.sounds[i].conditions then
+                for j = 1, #data.sounds[i].conditions do
+                    self.sounds[i].conditions[j] = u.trustExpr(data.sounds[i].conditions[j])
+                end
+            end
+        end
+    end
+end
+
 ---Injects functions to Resource Manager regarding this resource type.
 ---@param ResourceManager ResourceManager Resource Manager class to inject the functions to.
 function SoundEventConfig.inject(ResourceManager)
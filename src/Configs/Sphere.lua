@@ -12,7 +12,8 @@ local Vec2 = require("src.Essentials.Vector2")
 local SphereConfig = class:derive("SphereConfig")
 
 SphereConfig.metadata = {
-    schemaPath = "sphere.json"
+    schemaPath = "sphere.json",
+    schemaHash = "0ee648245d041a37"
 }
 
 ---Constructs an instance of SphereConfig.
@@ -162,6 +163,151 @@ function SphereConfig:new(data, path, isAnonymous, base)
     end
 end
 
+---Constructs an instance of SphereConfig from data which has been validated against its schema at build time.
+---No checks are performed. Used by the Resource Manager for resources with a matching `_validated` stamp.
+---@param data table Raw data from a file.
+---@param path string? Path to the file. Used for error messages and saving data.
+---@param isAnonymous boolean? If `true`, this resource is anonymous and its path is invalid for saving data.
+function SphereConfig:newTrusted(data, path, isAnonymous)
+    local u = _ConfigUtils
+    self._path = path
+    self._alias = data._alias
+    self._isAnonymous = isAnonymous
+
+    ---@type {sprite: Sprite, layer: string, hiddenLayer: string, shooterLayer: string, shotLayer: string, offset: Vector2, anchor: Vector2, rotate: boolean, resize: boolean, animationSpeed: number?, rollingSpeed: number?, rollingMultiplier: number, conditions: Expression[]}[]
+    self.sprites = {}
+    for i = 1, #data.sprites do
+        self.sprites[i] = {}
+        self.sprites[i].sprite = u.trustResource(data.sprites[i].sprite, "getSprite")
+        self.sprites[i].layer = data.sprites[i].layer or "GamePieceNormal"
+        self.sprites[i].hiddenLayer = data.sprites[i].hiddenLayer or "GamePieceHidden"
+        self.sprites[i].shooterLayer = data.sprites[i].shooterLayer or "GameBullet"
+        self.sprites[i].shotLayer = data.sprites[i].shotLayer or "GameBullet"
+        self.sprites[i].offset = u.trustVec2(data.sprites[i].offset, Vec2())
+        self.sprites[i].anchor = u.trustVec2(data.sprites[i].anchor, Vec2(0.5, 0.5))
+        self.sprites[i].rotate = u.trustBoolean(data.sprites[i].rotate, true)
+        self.sprites[i].resize = u.trustBoolean(data.sprites[i].resize, true)
+        self.sprites[i].animationSpeed = data.sprites[i].animationSpeed
+        self.sprites[i].rollingSpeed = data.sprites[i].rollingSpeed
+        self.sprites[i].rollingMultiplier = data.sprites[i].rollingMultiplier or 2
+
+        ---@type Expression[]
+        self.sprites[i].conditions = {}
+        if data.sprites[i].conditions then
+            for j = 1, #data.sprites[i].conditions do
+                self.sprites[i].conditions[j] = u.trustExpr(data.sprites[i].conditions[j])
+            end
+        end
+    end
+
+    self.size = data.size or 32
+    self.idleParticle = u.trustConfig(data.idleParticle, path, "ParticleEffect")
+    self.idleParticleLayer = data.idleParticleLayer or "GamePieceNormalPsys"
+    self.idleParticleHiddenLayer = data.idleParticleHiddenLayer or "GamePieceHiddenPsys"
+    self.idleParticleShooterLayer = data.idleParticleShooterLayer or "GameBulletPsys"
+    self.idleParticleShotLayer = data.idleParticleShotLayer or "GameBulletPsys"
+    self.holdParticle = u.trustConfig(data.holdParticle, path, "ParticleEffect")
+    self.holdParticleLayer = data.holdParticleLayer or "GameBulletPsys"
+    self.destroyParticle = u.trustConfig(data.destroyParticle, path, "ParticleEffect")
+    self.destroyParticleLayer = data.destroyParticleLayer or "GameCollapses"
+    self.destroyCollectible = u.trustConfig(data.destroyCollectible, path, "CollectibleGenerator")
+    self.destroySound = u.trustResource(data.destroySound, "getSoundEvent")
+    self.destroyEvent = u.trustConfig(data.destroyEvent, path, "GameEvent")
+    self.chainDestroyParticle = u.trustConfig(data.chainDestroyParticle, path, "ParticleEffect")
+    self.chainDestroyParticleLayer = data.chainDestroyParticleLayer or "GameCollapses"
+    self.chainDestroySound = u.trustResource(data.chainDestroySound, "getSoundEvent")
+    self.color = u.trustColor(data.color)
+    self.colorPalette = u.trustResource(data.colorPalette, "getColorPalette")
+    self.colorPaletteSpeed = data.colorPaletteSpeed
+    self.swappable = u.trustBoolean(data.swappable, true)
+
+    ---@type table
+    if data.shotBehavior then
+        self.shotBehavior = {}
+        self.shotBehavior.type = data.shotBehavior.type
+        if self.shotBehavior.type == "normal" then
+            self.shotBehavior.amount = data.shotBehavior.amount or 1
+            self.shotBehavior.spreadAngle = data.shotBehavior.spreadAngle or 0
+            self.shotBehavior.gameEvent = u.trustConfig(data.shotBehavior.gameEvent, path, "GameEvent")
+        elseif self.shotBehavior.type == "destroySpheres" then
+            self.shotBehavior.selector = u.trustConfig(data.shotBehavior.selector, path, "SphereSelector")
+            self.shotBehavior.scoreEvent = u.trustConfig(data.shotBehavior.scoreEvent, path, "ScoreEvent")
+            self.shotBehavior.scoreEventPerSphere = u.trustConfig(data.shotBehavior.scoreEventPerSphere, path, "ScoreEvent")
+            self.shotBehavior.gameEvent = u.trustConfig(data.shotBehavior.gameEvent, path, "GameEvent")
+            self.shotBehavior.gameEventPerSphere = u.trustConfig(data.shotBehavior.gameEventPerSphere, path, "GameEvent")
+        else
+            error(string.format("Unknown shotBehavior type: %s (expected \"normal\", \"destroySpheres\")", self.shotBehavior.type))
+        end
+    end
+
+    ---@type CollectibleEffectConfig[]
+    self.shotEffects = {}
+    if data.shotEffects then
+        for i = 1, #data.shotEffects do
+            self.shotEffects[i] = u.trustConfig(data.shotEffects[i], path, "CollectibleEffect")
+        end
+    end
+
+    self.shotSpeed = data.shotSpeed
+    self.shotCooldown = data.shotCooldown
+    self.shotSound = u.trustResource(data.shotSound, "getSoundEvent")
+
+    ---@type table
+    if data.hitBehavior then
+        self.hitBehavior = {}
+        self.hitBehavior.type = data.hitBehavior.type
+        if self.hitBehavior.type == "normal" then
+            self.hitBehavior.effects = {}
+            if data.hitBehavior.effects then
+                for i = 1, #data.hitBehavior.effects do
+                    self.hitBehavior.effects[i] = u.trustConfig(data.hitBehavior.effects[i], path, "SphereEffect")
+                end
+            end
+        elseif self.hitBehavior.type == "destroySpheres" then
+            self.hitBehavior.selector = u.trustConfig(data.hitBehavior.selector, path, "SphereSelector")
+            self.hitBehavior.scoreEvent = u.trustConfig(data.hitBehavior.scoreEvent, path, "ScoreEvent")
+            self.hitBehavior.scoreEventPerSphere = u.trustConfig(data.hitBehavior.scoreEventPerSphere, path, "ScoreEvent")
+            self.hitBehavior.gameEvent = u.trustConfig(data.hitBehavior.gameEvent, path, "GameEvent")
+            self.hitBehavior.gameEventPerSphere = u.trustConfig(data.hitBehavior.gameEventPerSphere, path, "GameEvent")
+            self.hitBehavior.pierce = data.hitBehavior.pierce
+        elseif self.hitBehavior.type == "recolorSpheres" then
+            self.hitBehavior.selector = u.trustConfig(data.hitBehavior.selector, path, "SphereSelector")
+            self.hitBehavior.color = u.trustExpr(data.hitBehavior.color)
+            self.hitBehavior.particle = u.trustConfig(data.hitBehavior.particle, path, "ParticleEffect")
+            self.hitBehavior.particleLayer = data.hitBehavior.particleLayer or "GameCollapses"
+            self.hitBehavior.pierce = data.hitBehavior.pierce
+        elseif self.hitBehavior.type == "splitAndPushBack" then
+            self.hitBehavior.speed = data.hitBehavior.speed
+            self.hitBehavior.pierce = data.hitBehavior.pierce
+        elseif self.hitBehavior.type == "applyEffect" then
+            self.hitBehavior.selector = u.trustConfig(data.hitBehavior.selector, path, "SphereSelector")
+            self.hitBehavior.effect = u.trustConfig(data.hitBehavior.effect, path, "SphereEffect")
+            self.hitBehavior.pierce = data.hitBehavior.pierce
+        else
+            error(string.format("Unknown hitBehavior type: %s (expected \"normal\", \"destroySpheres\", \"recolorSpheres\", \"splitAndPushBack\", \"applyEffect\")", self.hitBehavior.type))
+        end
+    end
+
+    self.hitSound = u.trustResource(data.hitSound, "getSoundEvent")
+    ---@type "normal"|"stone"?
+    self.type = data.type
+    self.autofire = u.trustBoolean(data.autofire, false)
+
+    ---@type integer[]
+    self.matches = {}
+    for i = 1, #data.matches do
+        self.matches[i] = data.matches[i]
+    end
+
+    ---@type integer[]
+    self.doesNotCollideWith = {}
+    if data.doesNotCollideWith then
+        for i = 1, #data.doesNotCollideWith do
+            self.doesNotCollideWith[i] = data.doesNotCollideWith[i]
+        end
+    end
+end
+
 ---Injects functions to Resource Manager regarding this resource type.
 ---@param ResourceManager ResourceManager Resource Manager class to inject the functions to.
 function SphereConfig.inject(ResourceManager)
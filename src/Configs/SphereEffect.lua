@@ -11,7 +11,8 @@ local class = require "com.class"
 local SphereEffectConfig = class:derive("SphereEffectConfig")
 
 SphereEffectConfig.metadata = {
-    schemaPath = "sphere_effect.json"
+    schemaPath = "sphere_effect.json",
+    schemaHash = "d843c737ebb36a70"
 }
 
 ---Constructs an instance of SphereEffectConfig.
@@ -65,6 +66,55 @@ function SphereEffectConfig:new(data, path, isAnonymous, base)
     end
 end
 
+---Constructs an instance of SphereEffectConfig from data which has been validated against its schema at build time.
+---No checks are performed. Used by the Resource Manager for resources with a matching `_validated` stamp.
+---@param data table Raw data from a file.
+---@param path string? Path to the file. Used for error messages and saving data.
+---@param isAnonymous boolean? If `true`, this resource is anonymous and its path is invalid for saving data.
+function SphereEffectConfig:newTrusted(data, path, isAnonymous)
+    local u = _ConfigUtils
+    self._path = path
+    self._alias = data._alias
+    self._isAnonymous = isAnonymous
+
+    self.particle = u.trustConfig(data.particle, path, "ParticleEffect")
+    self.particleLayer = data.particleLayer or "GamePieceNormalPsys"
+    self.time = data.time
+    self.infectionSize = data.infectionSize
+    self.infectionTime = data.infectionTime
+    self.applySound = u.trustResource(data.applySound, "getSoundEvent")
+    self.destroySound = u.trustResource(data.destroySound, "getSoundEvent")
+    self.destroyScoreEvent = u.trustConfig(data.destroyScoreEvent, path, "ScoreEvent")
+    self.destroyParticle = u.trustConfig(data.destroyParticle, path, "ParticleEffect")
+    self.destroyParticleLayer = data.destroyParticleLayer or "GameCollapses"
+    self.destroyCollectible = u.trustConfig(data.destroyCollectible, path, "CollectibleGenerator")
+    self.levelLossProtection = data.levelLossProtection
+    self.immobile = data.immobile
+    self.fragile = data.fragile
+    self.destroyChainedSpheres = data.destroyChainedSpheres
+    self.canBoostStreak = data.canBoostStreak
+    self.canBoostCascade = data.canBoostCascade
+    self.canKeepCascade = data.canKeepCascade
+    self.causeCheck = data.causeCheck
+    self.ghostTime = data.ghostTime
+
+    ---@type GameEventConfig[]
+    self.eventsBefore = {}
+    if data.eventsBefore then
+        for i = 1, #data.eventsBefore do
+            self.eventsBefore[i] = u.trustConfig(data.eventsBefore[i], path, "GameEvent")
+        end
+    end
+
+    ---@type GameEventConfig[]
+    self.eventsAfter = {}
+    if data.eventsAfter then
+        for i = 1, #data.eventsAfter do
+            self.eventsAfter[i] = u.trustConfig(data.eventsAfter[i], path, "GameEvent")
+        end
+    end
+end
+
 ---Injects functions to Resource Manager regarding this resource type.
 ---@param ResourceManager ResourceManager Resource Manager class to inject the functions to.
 function SphereEffectConfig.inject(ResourceManager)
@@ -11,7 +11,8 @@ local class = require "com.class"
 local SphereSelectorConfig = class:derive("SphereSelectorConfig")
 
 SphereSelectorConfig.metadata = {
-    schemaPath = "sphere_selector.json"
+    schemaPath = "sphere_selector.json",
+    schemaHash = "1a0e7b3c6ecd20b9"
 }
 
 ---Constructs an instance of SphereSelectorConfig.
@@ -45,6 +46,35 @@ function SphereSelectorConfig:new(data, path, isAnonymous, base)
     end
 end
 
+---Constructs an instance of SphereSelectorConfig from data which has been validated against its schema at build time.
+---No checks are performed. Used by the Resource Manager for resources with a matching `_validated` stamp.
+---@param data table Raw data from a file.
+---@param path string? Path to the file. Used for error messages and saving data.
+---@param isAnonymous boolean? If `true`, this resource is anonymous and its path is invalid for saving data.
+function SphereSelectorConfig:newTrusted(data, path, isAnonymous)
+    local u = _ConfigUtils
+    self._path = path
+    self._alias = data._alias
+    self._isAnonymous = isAnonymous
+
+    ---@type table[]
+    self.operations = {}
+    for i = 1, #data.operations do
+        self.operations[i] = {}
+        self.operations[i].type = data.operations[i].type
+        if self.operations[i].type == "add" then
+            self.operations[i].condition = u.trustExpr(data.operations[i].condition)
+        elseif self.operations[i].type == "addOne" then
+            self.operations[i].sphere = u.trustExpr(data.operations[i].sphere)
+        elseif self.operations[i].type == "select" then
+            self.operations[i].percentage = data.operations[i].percentage
+            self.operations[i].round = data.operations[i].round or "down"
+        else
+            error(string.format("Unknown SphereSelectorConfig type: %s (expected \"add\", \"addOne\", \"select\")", self.operations[i].type))
+        end
+    end
+end
+
 ---Injects functions to Resource Manager regarding this resource type.
 ---@param ResourceManager ResourceManager Resource Manager class to inject the functions to.
 function SphereSelectorConfig.inject(ResourceManager)
@@ -11,7 +11,8 @@ local class = require "com.class"
 local SpriteConfig = class:derive("SpriteConfig")
 
 SpriteConfig.metadata = {
-    schemaPath = "sprite.json"
+    schemaPath = "sprite.json",
+    schemaHash = "c7241c414c00fbee"
 }
 
 ---Constructs an instance of SpriteConfig.
@@ -50,6 +51,40 @@ function SpriteConfig:new(data, path, isAnonymous, base)
     self.batched = u.parseBooleanOpt(data, base, path, {"batched"})
 end
 
+---Constructs an instance of SpriteConfig from data which has been validated against its schema at build time.
+---No checks are performed. Used by the Resource Manager for resources with a matching `_validated` stamp.
+---@param data table Raw data from a file.
+---@param path string? Path to the file. Used for error messages and saving data.
+---@param isAnonymous boolean? If `true`, this resource is anonymous and its path is invalid for saving data.
+function SpriteConfig:newTrusted(data, path, isAnonymous)
+    local u = _ConfigUtils
+    self._path = path
+    self._alias = data._alias
+    self._isAnonymous = isAnonymous
+
+    self.image = u.trustResource(data.image, "getImage")
+    self.frameSize = u.trustVec2(data.frameSize)
+
+    ---@type {x1: integer, x2: integer, y1: integer, y2: integer}
+    if data.frameCuts then
+        self.frameCuts = {}
+        self.frameCuts.x1 = data.frameCuts.x1
+        self.frameCuts.x2 = data.frameCuts.x2
+        self.frameCuts.y1 = data.frameCuts.y1
+        self.frameCuts.y2 = data.frameCuts.y2
+    end
+
+    ---@type {pos: Vector2, frames: Vector2}[]
+    self.states = {}
+    for i = 1, #data.states do
+        self.states[i] = {}
+        self.states[i].pos = u.trustVec2(data.states[i].pos)
+        self.states[i].frames = u.trustVec2(data.states[i].frames)
+    end
+
+    self.batched = data.batched
+end
+
 ---Injects functions to Resource Manager regarding this resource type.
 ---@param ResourceManager ResourceManager Resource Manager class to inject the functions to.
 function SpriteConfig.inject(ResourceManager)
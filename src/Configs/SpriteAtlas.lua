@@ -11,7 +11,8 @@ local class = require "com.class"
 local SpriteAtlasConfig = class:derive("SpriteAtlasConfig")
 
 SpriteAtlasConfig.metadata = {
-    schemaPath = "sprite_atlas.json"
+    schemaPath = "sprite_atlas.json",
+    schemaHash = "9f2106ab524f9111"
 }
 
 ---Constructs an instance of SpriteAtlasConfig.
@@ -34,6 +35,24 @@ function SpriteAtlasConfig:new(data, path, isAnonymous, base)
     end
 end
 
+---Constructs an instance of SpriteAtlasConfig from data which has been validated against its schema at build time.
+---No checks are performed. Used by the Resource Manager for resources with a matching `_validated` stamp.
+---@param data table Raw data from a file.
+---@param path string? Path to the file. Used for error messages and saving data.
+---@param isAnonymous boolean? If `true`, this resource is anonymous and its path is invalid for saving data.
+function SpriteAtlasConfig:newTrusted(data, path, isAnonymous)
+    local u = _ConfigUtils
+    self._path = path
+    self._alias = data._alias
+    self._isAnonymous = isAnonymous
+
+    ---@type Sprite[]
+    self.sprites = {}
+    for i = 1, #data.sprites do
+        self.sprites[i] = u.trustResource(data.sprites[i], "getSprite")
+    end
+end
+
 ---Injects functions to Resource Manager regarding this resource type.
 ---@param ResourceManager ResourceManager Resource Manager class to inject the functions to.
 function SpriteAtlasConfig.inject(ResourceManager)
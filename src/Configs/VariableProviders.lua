@@ -11,7 +11,8 @@ local class = require "com.class"
 local VariableProvidersConfig = class:derive("VariableProvidersConfig")
 
 VariableProvidersConfig.metadata = {
-    schemaPath = "config/variable_providers.json"
+    schemaPath = "config/variable_providers.json",
+    schemaHash = "6e951916091cb572"
 }
 
 ---Constructs an instance of VariableProvidersConfig.
@@ -62,6 +63,52 @@ function VariableProvidersConfig:new(data, path, isAnonymous, base)
     end
 end
 
+---Constructs an instance of VariableProvidersConfig from data which has been validated against its schema at build time.
+---No checks are performed. Used by the Resource Manager for resources with a matching `_validated` stamp.
+---@param data table Raw data from a file.
+---@param path string? Path to the file. Used for error messages and saving data.
+---@param isAnonymous boolean? If `true`, this resource is anonymous and its path is invalid for saving data.
+function VariableProvidersConfig:newTrusted(data, path, isAnonymous)
+    local u = _ConfigUtils
+    self._path = path
+    self._alias = data._alias
+    self._isAnonymous = isAnonymous
+
+    ---@type table<string, table>
+    if data.providers then
+        self.providers = {}
+        for n, _ in pairs(data.providers) do
+            self.providers[n] = {}
+            self.providers[n].type = data.providers[n].type
+            if self.providers[n].type == "value" then
+                self.providers[n].value = data.providers[n].value
+            elseif self.providers[n].type == "countSpheres" then
+                self.providers[n].sphereSelector = u.trustConfig(data.providers[n].sphereSelector, path, "SphereSelector")
+            elseif self.providers[n].type == "mostFrequentColor" then
+                self.providers[n].sphereSelector = u.trustConfig(data.providers[n].sphereSelector, path, "SphereSelector")
+                self.providers[n].fallback = u.trustExpr(data.providers[n].fallback)
+            elseif self.providers[n].type == "randomSpawnableColor" then
+                self.providers[n].excludedColors = {}
+                if data.providers[n].excludedColors then
+                    for i = 1, #data.providers[n].excludedColors do
+                        self.providers[n].excludedColors[i] = data.providers[n].excludedColors[i]
+                    end
+                end
+            elseif self.providers[n].type == "redirectSphere" then
+                self.providers[n].sphere = u.trustExpr(data.providers[n].sphere)
+                self.providers[n].sphereSelector = u.trustConfig(data.providers[n].sphereSelector, path, "SphereSelector")
+            elseif self.providers[n].type == "redirectSphereColor" then
+                self.providers[n].sphere = u.trustExpr(data.providers[n].sphere)
+                self.providers[n].sphereSelector = u.trustConfig(data.providers[n].sphereSelector, path, "SphereSelector")
+                self.providers[n].fallback = u.trustExpr(data.providers[n].fallback)
+            else
+                error(string.format("Unknown VariableProvidersConfig type: %s (expected \"value\", \"countSpheres\", \"mostFrequentColor\", \"randomSpawnableColor\", \"redirectSphere\", \"redirectSphereColor\")", self.providers[n].type))
+            end
+            self.providers[n].framePersistence = data.providers[n].framePersistence
+        end
+    end
+end
+
 ---Injects functions to Resource Manager regarding this resource type.
 ---@param ResourceManager ResourceManager Resource Manager class to inject the functions to.
 function VariableProvidersConfig.inject(ResourceManager)
@@ -700,6 +700,210 @@ end
 
 
 
+-- TRUSTED DATA
+-- The following functions are used by the trusted constructors of Config Classes (`:newTrusted()`).
+-- The data passed to them has been validated against the schemas at build time, so they perform no checks at all.
+
+---Config Class constructors by resource type, used to construct anonymous resources from trusted data.
+local TRUSTED_CONFIG_CONSTRUCTORS = {
+	Collectible = CollectibleConfig,
+	CollectibleEffect = CollectibleEffectConfig,
+	CollectibleGenerator = CollectibleGeneratorConfig,
+	ColorGenerator = ColorGeneratorConfig,
+	GameEvent = GameEventConfig,
+	Layers = LayersConfig,
+	Level = LevelConfig,
+	LevelSequence = LevelSequenceConfig,
+	LevelSet = LevelSetConfig,
+	LevelTrainRules = LevelTrainRulesConfig,
+	Locale = LocaleConfig,
+	Particle = ParticleConfig,
+	ParticleEffect = ParticleEffectConfig,
+	ParticleEmitter = ParticleEmitterConfig,
+	Path = PathConfig,
+	PathEntity = PathEntityConfig,
+	Projectile = ProjectileConfig,
+	ScoreEvent = ScoreEventConfig,
+	ShooterMovement = ShooterMovementConfig,
+	Sphere = SphereConfig,
+	SphereEffect = SphereEffectConfig,
+	SphereSelector = SphereSelectorConfig,
+	SpriteAtlas = SpriteAtlasConfig,
+	VariableProviders = VariableProvidersConfig
+}
+
+---Constructs a Config Class instance from trusted data, using its trusted constructor if it has one.
+---@param constructor any The Config Class.
+---@param data table Raw resource data.
+---@param path string? Path to the resource file.
+---@param isAnonymous boolean? Whether the resource is anonymous.
+---@return table
+function utils.constructTrusted(constructor, data, path, isAnonymous)
+	if not constructor.newTrusted then
+		-- Hand-written Config Classes don't have a trusted constructor.
+		return constructor(data, path, isAnonymous)
+	end
+	local instance = setmetatable({}, constructor)
+	instance:newTrusted(data, path, isAnonymous)
+	return instance
+end
+
+---Returns the provided value, or `default` if the value is `nil`. Works with `false` values, unlike `value or default`.
+---@param value boolean? The value.
+---@param default boolean The default value.
+---@return boolean
+function utils.trustBoolean(value, default)
+	if value == nil then
+		return default
+	end
+	return value
+end
+
+---@return Vector2?
+function utils.trustVec2(value, default)
+	value = value or default
+	return value and Vec2(value.x, value.y)
+end
+
+---@return Color?
+function utils.trustColor(value)
+	return value and Color(value.r, value.g, value.b)
+end
+
+---@return Expression?
+function utils.trustExpr(value, default)
+	return maybeMakeExpression(value or default)
+end
+
+---Returns a resource by its path using the given Resource Manager getter, or `nil` if no path is provided.
+---@param value string? Path to the resource.
+---@param getter string Name of the Resource Manager getter, for example `"getSprite"`.
+---@return any?
+function utils.trustResource(value, getter)
+	return value and _Res[getter](_Res, value)
+end
+
+---Returns a Config Class instance for the given resource path or inline (anonymous) resource data, or `nil` if neither is provided.
+---@param value string|table? Path to the resource or its raw data.
+---@param path string Resource path which will be passed to the potentially created anonymous resource.
+---@param resType string The type of the provided resource.
+---@return table?
+function utils.trustConfig(value, path, resType)
+	if type(value) == "table" then
+		local constructor = assert(TRUSTED_CONFIG_CONSTRUCTORS[resType], string.format("%s: anonymous %s Configs are not supported", path, resType))
+		return utils.constructTrusted(constructor, value, path, true)
+	end
+	return value and _Res:getResourceConfig(value, resType)
+end
+
+
+
+-- FIELD READ PROFILING
+-- Config Classes generated with `generate.py -ci` call `utils.instrumentConfig()` at the end of their constructors.
+-- Each instance, and each regular object inside of it, is then replaced by a proxy which counts reads of its fields.
+-- Arrays and Regex Objects are left as they are, so that they can still be iterated over, but the objects inside them are counted.
+-- The counts are saved to `utils.FIELD_READS_FILE` when the engine quits, and `generate.py -fu` maps them back to the DocLang fields.
+
+utils.FIELD_READS_FILE = "field_reads.json"
+
+---Read counts by schema path, resource path and field path, e.g. `fieldReads["sound_event.json"]["sounds/click.json"]["sounds[].volume"]`.
+---@type table<string, table<string, table<string, integer>>>
+utils.fieldReads = {}
+
+-- Reads are not counted while this is greater than 0, i.e. while a Config Class is being constructed, as constructors read their base resources.
+local fieldReadsPaused = 0
+
+---Calls the given function without counting field reads. Calls can be nested.
+---Counting is resumed even if the function throws an error, which is then rethrown, so that a failed construction can't stop profiling.
+---@param f function The function to be called.
+function utils.withFieldReadsPaused(f)
+	fieldReadsPaused = fieldReadsPaused + 1
+	local success, err = pcall(f)
+	fieldReadsPaused = fieldReadsPaused - 1
+	if not success then
+		error(err, 0)
+	end
+end
+
+local instrumentValue
+
+---Replaces the fields of a regular object with a proxy which counts reads of them in `counts`.
+---Fields starting with an underscore (`_path`, `_alias`, ...) stay in place and are not counted.
+---@param t table The object.
+---@param label string The field path of the object, `""` for the Config Class instance itself.
+---@param objects table<string, boolean> Field paths of all regular objects of the Config Class.
+---@param counts table<string, integer> Read counts of the resource.
+local function instrumentObject(t, label, objects, counts)
+	local fields = {}
+	for key, value in pairs(t) do
+		if type(key) == "string" and key:sub(1, 1) ~= "_" then
+			fields[key] = value
+		end
+	end
+	for key, value in pairs(fields) do
+		t[key] = nil
+		instrumentValue(value, label == "" and key or label .. "." .. key, objects, counts)
+	end
+	local class = getmetatable(t)
+	setmetatable(t, {
+		__index = function(_, key)
+			local value = fields[key]
+			-- Methods and class fields, such as `metadata`, are not counted.
+			if value == nil and class and class[key] ~= nil then
+				return class[key]
+			end
+			if fieldReadsPaused == 0 then
+				local fieldLabel = label == "" and key or label .. "." .. key
+				counts[fieldLabel] = (counts[fieldLabel] or 0) + 1
+			end
+			return value
+		end,
+		__newindex = fields,
+		__tostring = class and class.__tostring
+	})
+end
+
+---Instruments a field value: regular objects get a proxy, and the elements of arrays and Regex Objects are instrumented one by one.
+---Tables with a metatable (`Vec2`, `Color`, `Expression`, other Config Classes) are left alone.
+---@param value any The value.
+---@param label string The field path of the value.
+---@param objects table<string, boolean> Field paths of all regular objects of the Config Class.
+---@param counts table<string, integer> Read counts of the resource.
+function instrumentValue(value, label, objects, counts)
+	if type(value) ~= "table" or getmetatable(value) then
+		return
+	end
+	if objects[label] then
+		instrumentObject(value, label, objects, counts)
+	else
+		for _, element in pairs(value) do
+			instrumentValue(element, label .. "[]", objects, counts)
+		end
+	end
+end
+
+---Makes the given Config Class instance count reads of its fields. Called at the end of instrumented Config Class constructors.
+---@param config table The Config Class instance.
+---@param class table The Config Class, with `metadata.objects` listing the field paths of all its regular objects.
+function utils.instrumentConfig(config, class)
+	local schemaPath = class.metadata.schemaPath
+	local path = config._path or "?"
+	utils.fieldReads[schemaPath] = utils.fieldReads[schemaPath] or {}
+	utils.fieldReads[schemaPath][path] = utils.fieldReads[schemaPath][path] or {}
+	local objects = {[""] = true}
+	for i, object in ipairs(class.metadata.objects) do
+		objects[object] = true
+	end
+	instrumentObject(config, "", objects, utils.fieldReads[schemaPath][path])
+end
+
+---Saves the field read counts to `utils.FIELD_READS_FILE`, if any Config Class has been instrumented.
+function utils.saveFieldReads()
+	if next(utils.fieldReads) then
+		_Utils.saveJson(utils.FIELD_READS_FILE, utils.fieldReads)
+	end
+end
+
 
 
 return utils
\ No newline at end of file
@@ -1,4 +1,5 @@
 local class = require "com.class"
+local utf8 = require("utf8")
 local Color = require("src.Essentials.Color")
 
 ---@class Font
@@ -13,7 +14,19 @@ function Font:new(config, path)
 
 	self.type = config.type
 
-	if self.type == "image" then
+	-- Glyph metrics baked with `generate.py -fm`. If they exist, characters are looked up by their codepoints in flat arrays,
+	-- and BMFont files are not parsed at all.
+	local metrics = (self.type == "image" or self.type == "bmfont") and _Utils.loadJson(_ParsePath(path:sub(1, -6) .. ".metrics.json"))
+	if metrics and not self:areMetricsFresh(metrics) then
+		_Log:printt("Font", string.format("Baked metrics of `%s` are out of date and will not be used, bake them again with `generate.py -fm`", path))
+		metrics = nil
+	end
+	if metrics then
+		self:loadMetrics(metrics)
+		self.lineSpacing = config.lineSpacing or 0
+		---@type table<integer, boolean?>
+		self.reportedCharacters = {}
+	elseif self.type == "image" then
 		self.image = config.image
 		self.height = config.height or self.image.size.y
 		self.lineSpacing = config.lineSpacing
@@ -42,7 +55,27 @@ end
 ---@param text string The text of which the size is going to be calculated.
 ---@return number, number
 function Font:getTextSize(text)
-	if self.type == "image" then
+	if self.baked then
+		local sizeX, sizeY = 0, self.lineHeight
+		local lineWidth = 0
+		local previous = nil
+		for _, codepoint in utf8.codes(text) do
+			if codepoint == 10 then
+				sizeX = math.max(sizeX, lineWidth)
+				lineWidth = 0
+				sizeY = sizeY + self.lineHeight
+				previous = nil
+			else
+				local advance = self:getAdvance(codepoint)
+				if advance then
+					lineWidth = lineWidth + advance + self:getKerning(previous, codepoint)
+					previous = codepoint
+				end
+			end
+		end
+		sizeX = math.max(sizeX, lineWidth)
+		return sizeX, sizeY
+	elseif self.type == "image" then
 		local sizeX, sizeY = 0, self.height
 		local lineWidth = 0
 		for i = 1, text:len() do
@@ -91,7 +124,13 @@ function Font:draw(text, x, y, alignX, alignY, color, alpha, scaleX, scaleY)
 
 	local sizeX, sizeY = self:getTextSize(text)
 	_Renderer:setColorRGB(color.r * self.color.r, color.g * self.color.g, color.b * self.color.b, alpha)
-	if self.type == "image" then
+	if self.baked then
+		y = y - sizeY * alignY * scaleY
+		for line in (text .. "\n"):gmatch("(.-)\n") do
+			self:drawBakedLine(line, x, y, alignX, scaleX, scaleY)
+			y = y + (self.lineHeight + self.lineSpacing) * scaleY
+		end
+	elseif self.type == "image" then
 		y = y - sizeY * alignY * scaleY
 		local line = ""
 		for i = 1, text:len() do
@@ -135,6 +174,104 @@ function Font:drawLine(text, x, y, align, scaleX, scaleY)
 	end
 end
 
+---Draws a single line of text using baked metrics.
+---@private
+---@param text string A single line of text. Must not contain `\n` characters.
+---@param x number The X coordinate on which the line should be drawn.
+---@param y number The Y coordinate on which the line should be drawn.
+---@param align number The horizontal alignment of the line, `0` to left, `1` to right.
+---@param scaleX number Horizontal scale of the text.
+---@param scaleY number Vertical scale of the text.
+function Font:drawBakedLine(text, x, y, align, scaleX, scaleY)
+	local sizeX, sizeY = self:getTextSize(text)
+	x = x - sizeX * align * scaleX
+	local previous = nil
+	for _, codepoint in utf8.codes(text) do
+		local advance = self:getAdvance(codepoint)
+		if advance then
+			x = x + self:getKerning(previous, codepoint) * scaleX
+			local glyph = self.glyphs[codepoint + 1]
+			_Renderer:drawImage(glyph.page.img, glyph.quad, math.floor(x + glyph.xOffset * scaleX), math.floor(y + glyph.yOffset * scaleY), nil, scaleX, scaleY)
+			x = x + advance * scaleX
+			previous = codepoint
+		end
+	end
+end
+
+---Returns whether the given baked metrics are up to date, i.e. whether the files they have been baked from haven't changed since.
+---@private
+---@param metrics table The contents of a `.metrics.json` file.
+---@return boolean
+function Font:areMetricsFresh(metrics)
+	if not metrics.sources then
+		return false
+	end
+	local paths = {}
+	for i, source in ipairs(metrics.sources) do
+		paths[i] = _ParsePath(source)
+	end
+	return _Utils.hashFiles(paths) == metrics.hash
+end
+
+---Loads glyph metrics baked by the DocLang Generator.
+---`advances` and `quads` are indexed by `codepoint + 1`, and `kerning` is a list of `{first, second, amount}` codepoint pairs.
+---@private
+---@param metrics table The contents of a `.metrics.json` file.
+function Font:loadMetrics(metrics)
+	self.baked = true
+	self.lineHeight = metrics.lineHeight
+	---@type Image[]
+	self.pages = {}
+	for i, page in ipairs(metrics.pages) do
+		self.pages[i] = _Res:getImage(page)
+	end
+	---@type (integer?)[]
+	self.advances = metrics.advances
+	---@alias GlyphData {quad: love.Quad, page: Image, xOffset: integer, yOffset: integer}
+	---@type (GlyphData?)[]
+	self.glyphs = {}
+	for i, quad in pairs(metrics.quads) do
+		local page = self.pages[quad[7] + 1]
+		self.glyphs[i] = {
+			quad = love.graphics.newQuad(quad[1], quad[2], quad[3], quad[4], page.size.x, page.size.y),
+			page = page,
+			xOffset = quad[5],
+			yOffset = quad[6]
+		}
+	end
+	---@type table<integer, table<integer, integer>>
+	self.kerning = {}
+	for i, pair in ipairs(metrics.kerning) do
+		self.kerning[pair[1]] = self.kerning[pair[1]] or {}
+		self.kerning[pair[1]][pair[2]] = pair[3]
+	end
+end
+
+---Returns the advance of the provided character, using baked metrics.
+---If the character is not found in the font, it is reported to the console and `nil` is returned.
+---@private
+---@param codepoint integer The codepoint of the character.
+---@return integer?
+function Font:getAdvance(codepoint)
+	local advance = self.advances[codepoint + 1]
+	if not advance and not self.reportedCharacters[codepoint] then
+		-- report only once
+		_Log:printt("Font", "ERROR: No character " .. utf8.char(codepoint) .. " was found in font " .. self.path)
+		self.reportedCharacters[codepoint] = true
+	end
+	return advance
+end
+
+---Returns the kerning amount between two characters, using baked metrics.
+---@private
+---@param first integer? The codepoint of the previous character, if any.
+---@param second integer The codepoint of the current character.
+---@return integer
+function Font:getKerning(first, second)
+	local amounts = first and self.kerning[first]
+	return amounts and amounts[second] or 0
+end
+
 ---Returns data for the provided character.
 ---If the character is not found in the font, it is reported to the console and `nil` is returned.
 ---Usable only for `image` type fonts.
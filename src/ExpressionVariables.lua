@@ -10,10 +10,19 @@ local SphereSelectorResult = require("src.Game.SphereSelectorResult")
 ---Constructor.
 function ExpressionVariables:new()
     self.VARIABLE_PROVIDER_PATH = "config/variable_providers.json"
+    self.VARIABLE_PROVIDER_TIERS_PATH = "config/variable_provider_tiers.json"
 
 	self.data = {pi = math.pi}
     self.variableProviderCache = {}
     self.variableProviderCacheIndices = {} -- Used for tracking `nil` values.
+
+    -- Cache tiers of Variable Providers, generated by `generate.py -vp`. Loaded together with the Variable Providers themselves.
+    ---@type table<string, "constant"|"level"|"board"|"call">?
+    self.variableProviderTiers = nil
+    self.variableProviderTiersSource = nil
+    -- Results of Variable Providers cached across frames, along with the level and board version they have been evaluated for.
+    ---@type table<string, {value: any, level: Level?, boardVersion: integer?}>
+    self.variableProviderTierCache = {}
 end
 
 ---Sets a variable to be used by Expressions.
@@ -49,8 +58,19 @@ function ExpressionVariables:get(name, default)
         providers = _Res:getVariableProvidersConfig(self.VARIABLE_PROVIDER_PATH).providers
     end
     if providers and providers[name] then
+        local tier = self:getVariableProviderTier(name, providers)
+        local level, boardVersion = self:getVariableProviderCacheState(tier)
+        local cached = self.variableProviderTierCache[name]
+        if cached and cached.level == level and cached.boardVersion == boardVersion then
+            if cached.value ~= nil then
+                return cached.value
+            end
+            return default
+        end
         local value = self:evaluateVariableProvider(providers[name])
-        if providers[name].framePersistence then
+        if tier ~= "call" then
+            self.variableProviderTierCache[name] = {value = value, level = level, boardVersion = boardVersion}
+        elseif providers[name].framePersistence then
             self.variableProviderCache[name] = value
             self.variableProviderCacheIndices[name] = true
         end
@@ -61,6 +81,55 @@ function ExpressionVariables:get(name, default)
     return default
 end
 
+---Returns the cache tier of the given Variable Provider, as classified by `generate.py -vp`.
+---Providers which have not been classified are treated as `"call"`, i.e. they are never cached across frames.
+---@param name string The Variable Provider name.
+---@param providers table The Variable Providers, as loaded from `config/variable_providers.json`.
+---@return "constant"|"level"|"board"|"call"
+function ExpressionVariables:getVariableProviderTier(name, providers)
+    -- Reload the tiers whenever the Variable Providers themselves are different, i.e. when another game has been loaded.
+    if self.variableProviderTiersSource ~= providers then
+        self.variableProviderTiers = self:loadVariableProviderTiers()
+        self.variableProviderTiersSource = providers
+        _Utils.emptyTable(self.variableProviderTierCache)
+    end
+    return self.variableProviderTiers[name] or "call"
+end
+
+---Loads the cache tiers of Variable Providers from `config/variable_provider_tiers.json`.
+---If the file doesn't exist, or the files the tiers have been classified from have changed since, no tiers are returned.
+---@return table<string, "constant"|"level"|"board"|"call">
+function ExpressionVariables:loadVariableProviderTiers()
+    local data = _Utils.loadJson(_ParsePath(self.VARIABLE_PROVIDER_TIERS_PATH))
+    if not data then
+        return {}
+    end
+    local paths = {}
+    for i, source in ipairs(data.sources or {}) do
+        paths[i] = _ParsePath(source)
+    end
+    if not data.sources or _Utils.hashFiles(paths) ~= data.hash then
+        _Log:printt("ExpressionVariables", "Variable Provider tiers are out of date and will not be used, classify them again with `generate.py -vp`")
+        return {}
+    end
+    return data.tiers
+end
+
+---Returns the state which a Variable Provider result of the given cache tier stays valid for: the current level and board version.
+---A result can be reused for as long as this function returns the same values.
+---@param tier "constant"|"level"|"board"|"call" The cache tier.
+---@return Level?, integer?
+function ExpressionVariables:getVariableProviderCacheState(tier)
+    if tier == "constant" or tier == "call" then
+        return nil, nil
+    end
+    local level = _Game.game and _Game.game:getLevel()
+    if tier == "level" or not level then
+        return level, nil
+    end
+    return level, level.colorManager.boardVersion
+end
+
 ---Evaluates a Variable Provider.
 ---@param provider table A Variable Provider.
 ---@return any?
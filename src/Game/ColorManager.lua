@@ -11,6 +11,8 @@ local ColorManager = class:derive("ColorManager")
 function ColorManager:new()
 	self.sphereColorCounts = {}
 	self.dangerColorCounts = {}
+	-- Incremented whenever a sphere is added, removed or changed. Used to tell whether cached Variable Provider results are still valid.
+	self.boardVersion = 0
 end
 
 
@@ -19,6 +21,15 @@ end
 function ColorManager:reset()
 	self.sphereColorCounts = {}
 	self.dangerColorCounts = {}
+	self:markBoardChanged()
+end
+
+
+
+---Marks the board as changed, so that Variable Provider results which depend on the spheres on the board are evaluated again.
+---This is done automatically when the color counters change; call this directly for other changes, like chain levels.
+function ColorManager:markBoardChanged()
+	self.boardVersion = self.boardVersion + 1
 end
 
 
@@ -27,6 +38,7 @@ end
 ---@param color integer The color ID of which counter is to be incremented.
 ---@param danger boolean? Whether we are changing the danger zone counter.
 function ColorManager:increment(color, danger)
+	self:markBoardChanged()
 	if danger then
 		self.dangerColorCounts[color] = (self.dangerColorCounts[color] or 0) + 1
 	else
@@ -40,6 +52,7 @@ end
 ---@param color integer The color ID of which counter is to be decremented.
 ---@param danger boolean? Whether we are changing the danger zone counter.
 function ColorManager:decrement(color, danger)
+	self:markBoardChanged()
 	if danger then
 		self.dangerColorCounts[color] = self.dangerColorCounts[color] - 1
 		if self.dangerColorCounts[color] == 0 then
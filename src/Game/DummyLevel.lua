@@ -10,6 +10,7 @@ local DummyLevel = class:derive("DummyLevel")
 ---@param path string A path to the level file.
 function DummyLevel:new(path)
 	local data = _Res:getLevelConfig(path)
+	self.config = data
 	self.map = Map(self, "maps/" .. data.map, data.pathsBehavior, true)
 end
 
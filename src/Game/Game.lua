@@ -3,6 +3,7 @@ local ProfileManager = require("src.Game.ProfileManager")
 local Highscores = require("src.Game.Highscores")
 local Options = require("src.Game.Options")
 local Level = require("src.Game.Level")
+local SaveStates = require("src.SaveStates")
 
 ---Represents the specific game logic, which is specific to a single game (not universal for the engine).
 ---This specific class contains logic for the SM (sphere matching) part of the engine.
@@ -21,21 +22,33 @@ function Game:new(base)
 	-- Step 2. Load map data.
 	-- TODO: This is now only used for checking the map names without loading the map (UI script -> stage map).
 	-- Find out how to do it better at some point. Hint: Luxor 2 free play map selection dialog.
+	-- If the game has a map catalog (generated by `generate.py -mc`), map configs are only loaded when they are first requested.
+	-- Otherwise, all of them are loaded here.
+	self.mapCatalog = _Utils.loadJson(_ParsePath("maps/catalog.json"))
 	self.maps = {}
-	local mapList = _Utils.getDirListing(_ParsePath("maps"), "dir")
-	for i, mapName in ipairs(mapList) do
-		local mapConfig = _Utils.loadJson(_ParsePath("maps/" .. mapName .. "/config.json"))
-		if mapConfig then
-			_Log:printt("Game", "Loading map data: " .. mapName)
-			self.maps[mapName] = mapConfig
+	if not self.mapCatalog then
+		local mapList = _Utils.getDirListing(_ParsePath("maps"), "dir")
+		for i, mapName in ipairs(mapList) do
+			local mapConfig = _Utils.loadJson(_ParsePath("maps/" .. mapName .. "/config.json"))
+			if mapConfig then
+				_Log:printt("Game", "Loading map data: " .. mapName)
+				self.maps[mapName] = mapConfig
+			end
 		end
 	end
 
+	-- Train presets compiled by `generate.py -tp`. If there are none, each Path parses its own presets.
+	self.trainPresets = _Utils.loadJson(_ParsePath("train_presets.json"))
+	-- Color sets of color-only Sphere Selector conditions compiled by `generate.py -sc`.
+	self.sphereSelectorMasks = self:loadSphereSelectorMasks()
+	-- Path speed tables baked by `generate.py -st`.
+	self.pathSpeeds = _Utils.loadJson(_ParsePath("path_speeds.json"))
+
 	-- Step 3. Register a few savestate-releated objects
 	self.profileManager = ProfileManager()
 	self.highscores = Highscores()
 	self.options = Options()
-	self.base.runtimeManager:registerModule("profiles", self.profileManager)
+	self.base.runtimeManager:registerModule("profiles", self.profileManager, SaveStates.ProfileManagerSave)
 	self.base.runtimeManager:registerModule("highscores", self.highscores)
 	self.base.runtimeManager:registerModule("options", self.options)
 	self.base.runtimeManager:load()
@@ -184,9 +197,63 @@ function Game:getMapData(name)
 	-- TODO/HARD: Currently, loading a map config also causes all of the related map assets to load.
 	-- Find a way to load resources only partially without dependencies or find a way to load resource only when they're needed.
 	--return _Res:getMapConfig("maps/" .. name .. "/config.json")
+	if not self.maps[name] and self.mapCatalog then
+		-- Maps missing from the catalog are still loaded if they exist, as the catalog might not have been regenerated after adding them.
+		self.maps[name] = _Utils.loadJson(_ParsePath("maps/" .. name .. "/config.json"))
+		if self.maps[name] then
+			_Log:printt("Game", "Loading map data: " .. name)
+			if not self.mapCatalog.maps[name] then
+				_Log:printt("Game", string.format("Map '%s' is missing from the map catalog, which is out of date; regenerate it with `generate.py -mc`", name))
+			end
+		end
+	end
 	return assert(self.maps[name], string.format("Map '%s' not found", name))
 end
 
+---Returns the map catalog entry for the given map name, or `nil` if the game has no map catalog or no such map exists.
+---Catalog entries are much cheaper to obtain than full map data, as they don't require loading the map's `config.json` file.
+---@param name string The map directory name.
+---@return {name: string, pathCount: integer, objectCounts: table<string, integer>, hash: string}?
+function Game:getMapCatalogEntry(name)
+	return self.mapCatalog and self.mapCatalog.maps[name]
+end
+
+---Loads the color sets of color-only Sphere Selector conditions from `sphere_selector_masks.json`, generated by `generate.py -sc`.
+---Returns `nil` if the file doesn't exist, or if any Sphere has been added, removed or changed since, as the color sets could miss new colors.
+---@return table<string, integer[]>?
+function Game:loadSphereSelectorMasks()
+	local data = _Utils.loadJson(_ParsePath("sphere_selector_masks.json"))
+	if not data then
+		return nil
+	end
+	local sources = self:getSphereSelectorMaskSources()
+	local fresh = data.sources and #sources == #data.sources
+	local paths = {}
+	for i, source in ipairs(sources) do
+		fresh = fresh and source == data.sources[i]
+		paths[i] = _ParsePath(source)
+	end
+	if not fresh or _Utils.hashFiles(paths) ~= data.hash then
+		_Log:printt("Game", "Sphere Selector color sets are out of date and will not be used, compile them again with `generate.py -sc`")
+		return nil
+	end
+	return data.masks
+end
+
+---Returns the sorted list of paths of all Sphere files, which Sphere Selector color sets are compiled from.
+---Mirrors `selector_get_sources()` in the DocLang Generator.
+---@return string[]
+function Game:getSphereSelectorMaskSources()
+	local sources = {}
+	for i, name in ipairs(_Utils.getDirListing(_ParsePath("spheres"), "file", ".json")) do
+		if name:match("^sphere_%-?%d+%.json$") then
+			table.insert(sources, "spheres/" .. name)
+		end
+	end
+	table.sort(sources)
+	return sources
+end
+
 ---Returns two text lines which will be displayed in the Discord's Rich Presence status for this game.
 ---@return string, string
 function Game:getRichPresenceData()
@@ -24,6 +24,11 @@ function Level:new(config)
 	self.map = Map(self, "maps/" .. config.map, config.pathsBehavior)
 	self.shooter = Shooter(config.shooter)
 	self.colorManager = ColorManager()
+	-- The size of the largest sphere, which bounds how far from a shot sphere the spheres it can hit are.
+	self.maxSphereSize = 0
+	for i, key in ipairs(_Res:getResourceList("Sphere")) do
+		self.maxSphereSize = math.max(self.maxSphereSize, _Res:getSphereConfig(key).size)
+	end
 
 	self.matchEffect = config.matchEffect
 
@@ -1350,31 +1355,20 @@ end
 ---Returns `nil` if no sphere is found.
 ---@param posX number The X coordinate of the position to be checked against.
 ---@param posY number The Y coordinate of the position to be checked against.
+---@param maxDistance number? If specified, spheres further away than this may be skipped, and `nil` may be returned even if there are spheres further away.
 ---@return {path: Path, sphereChain: SphereChain, sphereGroup: SphereGroup, sphere: Sphere, sphereID: integer, pos: Vector2, dist: number, half: boolean}?
-function Level:getNearestSphere(posX, posY)
+function Level:getNearestSphere(posX, posY, maxDistance)
 	local nearestData = {path = nil, sphereChain = nil, sphereGroup = nil, sphereID = nil, sphere = nil, pos = nil, dist = nil, half = nil}
+	-- If the map has a path grid, only the spheres on the parts of paths near the position are considered.
+	-- Spheres which are being appended are not on their paths yet, so they are always considered.
+	local ranges = maxDistance and self.map:getPathRangesNear(posX - maxDistance, posY - maxDistance, posX + maxDistance, posY + maxDistance)
 	for i, path in ipairs(self.map.paths) do
+		local pathRanges = ranges and ranges[i]
 		for j, sphereChain in ipairs(path.sphereChains) do
 			for k, sphereGroup in ipairs(sphereChain.sphereGroups) do
 				for l, sphere in ipairs(sphereGroup.spheres) do
-					local sphereX, sphereY = sphere:getPos()
-					local sphereAngle = sphere:getAngle()
-					local sphereHidden = sphere:getHidden()
-
-					local sphereDist = _V.length(posX - sphereX, posY - sphereY)
-					local sphereDistAngle = _V.angle(posX - sphereX, posY - sphereY)
-					local sphereAngleDiff = (sphereDistAngle - sphereAngle + math.pi / 2) % (math.pi * 2)
-					local sphereHalf = sphereAngleDiff <= math.pi / 2 or sphereAngleDiff > 3 * math.pi / 2
-					-- if closer than the closest for now, save it
-					if not sphere:isGhost() and not sphereHidden and (not nearestData.dist or sphereDist < nearestData.dist) then
-						nearestData.path = path
-						nearestData.sphereChain = sphereChain
-						nearestData.sphereGroup = sphereGroup
-						nearestData.sphereID = l
-						nearestData.sphere = sphere
-						nearestData.pos = Vec2(sphereX, sphereY)
-						nearestData.dist = sphereDist
-						nearestData.half = sphereHalf
+					if not ranges or sphere.appendSize < 1 or (pathRanges and self:isOffsetInRanges(sphere:getOffset(), pathRanges)) then
+						self:checkNearestSphere(nearestData, posX, posY, path, sphereChain, sphereGroup, l, sphere)
 					end
 				end
 			end
@@ -1386,6 +1380,53 @@ function Level:getNearestSphere(posX, posY)
 	return nearestData
 end
 
+---Returns `true` if the given path offset lies within any of the given ranges.
+---@private
+---@param offset number The path offset to be checked, in pixels.
+---@param ranges number[] A flat list of `from, to` pairs of path offsets.
+---@return boolean
+function Level:isOffsetInRanges(offset, ranges)
+	for i = 1, #ranges, 2 do
+		if offset >= ranges[i] and offset <= ranges[i + 1] then
+			return true
+		end
+	end
+	return false
+end
+
+---Replaces the contents of the `nearestData` table with the given sphere if it's closer to the given position than the sphere currently there.
+---Used by `:getNearestSphere()`.
+---@private
+---@param nearestData table The nearest sphere data found so far.
+---@param posX number The X coordinate of the position to be checked against.
+---@param posY number The Y coordinate of the position to be checked against.
+---@param path Path The path the sphere is on.
+---@param sphereChain SphereChain The sphere chain the sphere is in.
+---@param sphereGroup SphereGroup The sphere group the sphere is in.
+---@param l integer The sphere ID in its group.
+---@param sphere Sphere The sphere to be checked.
+function Level:checkNearestSphere(nearestData, posX, posY, path, sphereChain, sphereGroup, l, sphere)
+	local sphereX, sphereY = sphere:getPos()
+	local sphereAngle = sphere:getAngle()
+	local sphereHidden = sphere:getHidden()
+
+	local sphereDist = _V.length(posX - sphereX, posY - sphereY)
+	local sphereDistAngle = _V.angle(posX - sphereX, posY - sphereY)
+	local sphereAngleDiff = (sphereDistAngle - sphereAngle + math.pi / 2) % (math.pi * 2)
+	local sphereHalf = sphereAngleDiff <= math.pi / 2 or sphereAngleDiff > 3 * math.pi / 2
+	-- if closer than the closest for now, save it
+	if not sphere:isGhost() and not sphereHidden and (not nearestData.dist or sphereDist < nearestData.dist) then
+		nearestData.path = path
+		nearestData.sphereChain = sphereChain
+		nearestData.sphereGroup = sphereGroup
+		nearestData.sphereID = l
+		nearestData.sphere = sphere
+		nearestData.pos = Vec2(sphereX, sphereY)
+		nearestData.dist = sphereDist
+		nearestData.half = sphereHalf
+	end
+end
+
 ---Returns the first sphere to collide with a provided line of sight along with some extra data.
 ---The returned table has the following fields:
 ---
@@ -21,17 +21,128 @@ function Map:new(level, path, pathsBehavior, isDummy)
 
 	---@type Path[]
 	self.paths = {}
+	-- Speed tables baked by `generate.py -st`, keyed by the level path. If there are none, each Path bakes its own table.
+	local pathSpeeds = _Game.game.pathSpeeds
+	local speedTableKeys = pathSpeeds and level.config and pathSpeeds.levels[level.config._path]
 	for i, pathData in ipairs(self.config.paths) do
 		-- Loop around the path behavior list if not sufficient enough.
 		-- Useful if all paths should share the same behavior; you don't have to clone it.
 		local pathBehavior = pathsBehavior[(i - 1) % #pathsBehavior + 1]
-		table.insert(self.paths, Path(self, pathData, pathBehavior))
+		local speedTable = speedTableKeys and speedTableKeys[i] and pathSpeeds.tables[speedTableKeys[i]]
+		table.insert(self.paths, Path(self, pathData, pathBehavior, speedTable))
 	end
+	self.pathGrid = self:loadPathGrid(path)
 	---@type ParticlePacket[]
 	self.particles = {}
 	self:activateParticles()
 end
 
+---Loads the path grid of this Map generated by `generate.py -pg`, which lists the path segments passing through each cell of a uniform grid.
+---Returns `nil` if there's no path grid, or if it has been generated for different paths.
+---@param path string Path to the Map's folder.
+---@return table?
+function Map:loadPathGrid(path)
+	local grid = _Utils.loadJson(_ParsePath(path .. "/path_grid.json"))
+	if not grid or #grid.paths ~= #self.paths then
+		return nil
+	end
+	for i, pathInfo in ipairs(grid.paths) do
+		if pathInfo.nodeCount ~= #self.paths[i].nodes or math.abs(pathInfo.length - self.paths[i].length) > 1e-6 then
+			return nil
+		end
+	end
+	-- Cell indices are strings in JSON. Also, spheres past either end of a path stay at that end, so the ranges touching the ends are extended.
+	local cells = {}
+	for index, entries in pairs(grid.cells) do
+		for i, entry in ipairs(entries) do
+			if entry[3] <= 0 then
+				entry[3] = -math.huge
+			end
+			if entry[4] >= self.paths[entry[1]].length then
+				entry[4] = math.huge
+			end
+		end
+		cells[tonumber(index)] = entries
+	end
+	grid.cells = cells
+	return grid
+end
+
+---Calls the provided function for each path grid entry of each cell overlapping the given rectangle.
+---Entries of segments which pass through several of these cells are passed once per cell.
+---@private
+---@param minX number The left edge of the rectangle.
+---@param minY number The top edge of the rectangle.
+---@param maxX number The right edge of the rectangle.
+---@param maxY number The bottom edge of the rectangle.
+---@param fn fun(pathID: integer, segment: integer, from: number, to: number) The function to be called.
+function Map:forEachPathGridEntry(minX, minY, maxX, maxY, fn)
+	local grid = self.pathGrid
+	local x1 = math.max(math.floor(minX / grid.cellSize) - grid.originX, 0)
+	local y1 = math.max(math.floor(minY / grid.cellSize) - grid.originY, 0)
+	local x2 = math.min(math.floor(maxX / grid.cellSize) - grid.originX, grid.columns - 1)
+	local y2 = math.min(math.floor(maxY / grid.cellSize) - grid.originY, grid.rows - 1)
+	for y = y1, y2 do
+		for x = x1, x2 do
+			local cell = grid.cells[y * grid.columns + x]
+			if cell then
+				for i, entry in ipairs(cell) do
+					fn(entry[1], entry[2], entry[3], entry[4])
+				end
+			end
+		end
+	end
+end
+
+---Returns the segments of each path which pass through the given rectangle (or near it), keyed by path ID.
+---Segments are given by the IDs of their first nodes, in ascending order. Paths which don't pass through the rectangle are omitted.
+---Returns `nil` if this Map has no path grid, in which case all segments of all paths need to be checked.
+---@param minX number The left edge of the rectangle.
+---@param minY number The top edge of the rectangle.
+---@param maxX number The right edge of the rectangle.
+---@param maxY number The bottom edge of the rectangle.
+---@return table<integer, integer[]>?
+function Map:getPathSegmentsNear(minX, minY, maxX, maxY)
+	if not self.pathGrid then
+		return nil
+	end
+	local segments = {}
+	local added = {}
+	self:forEachPathGridEntry(minX, minY, maxX, maxY, function(pathID, segment)
+		added[pathID] = added[pathID] or {}
+		if not added[pathID][segment] then
+			added[pathID][segment] = true
+			segments[pathID] = segments[pathID] or {}
+			table.insert(segments[pathID], segment)
+		end
+	end)
+	for pathID, pathSegments in pairs(segments) do
+		table.sort(pathSegments)
+	end
+	return segments
+end
+
+---Returns the path offset ranges of each path which pass through the given rectangle (or near it), keyed by path ID,
+---as flat lists of `from, to` pairs. Paths which don't pass through the rectangle are omitted.
+---Returns `nil` if this Map has no path grid, in which case all offsets of all paths need to be checked.
+---@param minX number The left edge of the rectangle.
+---@param minY number The top edge of the rectangle.
+---@param maxX number The right edge of the rectangle.
+---@param maxY number The bottom edge of the rectangle.
+---@return table<integer, number[]>?
+function Map:getPathRangesNear(minX, minY, maxX, maxY)
+	if not self.pathGrid then
+		return nil
+	end
+	local ranges = {}
+	self:forEachPathGridEntry(minX, minY, maxX, maxY, function(pathID, segment, from, to)
+		ranges[pathID] = ranges[pathID] or {}
+		table.insert(ranges[pathID], from)
+		table.insert(ranges[pathID], to)
+	end)
+	return ranges
+end
+
 ---Updates this Map.
 ---@param dt number Delta time in seconds.
 function Map:update(dt)
@@ -4,14 +4,15 @@ local PathEntity = require("src.Game.PathEntity")
 
 ---Represents a single Path on which the Spheres move. Can have entites such as Bonus Scarabs or Scorpions.
 ---@class Path
----@overload fun(map: Map, pathData: PathConfig, pathBehavior: table):Path
+---@overload fun(map: Map, pathData: PathConfig, pathBehavior: table, speedTable: PathSpeedTable?):Path
 local Path = class:derive("Path")
 
 ---Constructs a new Path instance.
 ---@param map Map The map which this Path belongs to.
 ---@param pathData PathConfig A list of nodes this path has.
 ---@param pathBehavior table Path behavior which is going to be used in this level.
-function Path:new(map, pathData, pathBehavior)
+---@param speedTable PathSpeedTable? The speed table baked for this path by `generate.py -st`, if any.
+function Path:new(map, pathData, pathBehavior, speedTable)
 	self.map = map
 
 	self.nodes = {}
@@ -29,6 +30,14 @@ function Path:new(map, pathData, pathBehavior)
 		--local n = _Game.game:getSession():getUSMNumber() * 10
 		self.trainRules.length = nil
 	end
+	if self.trainRules.type == "waves" then
+		-- Parse all train presets up front, so that no parsing is done when trains spawn.
+		---@type TrainPreset[]
+		self.trainPresets = {}
+		for i, preset in ipairs(self.trainRules.waves) do
+			self.trainPresets[i] = self:compileTrainPreset(preset)
+		end
+	end
 	self.spawnAmount = 0
 	self.spawnDistance = pathBehavior.spawnDistance
 	self.dangerDistance = pathBehavior.dangerDistance
@@ -37,6 +46,7 @@ function Path:new(map, pathData, pathBehavior)
 	self.speeds = pathBehavior.speeds
 
 	self:prepareNodes(pathData.nodes)
+	self.speedTable = self:prepareSpeedTable(speedTable)
 
 	---@type SphereChain[]
 	self.sphereChains = {}
@@ -80,7 +90,7 @@ function Path:prepareNodes(nodes)
 			if angle2 then angle = angle2 else angle = 0 end
 		end
 		angle = (angle + math.pi / 2) % (math.pi * 2)
-		self.nodes[i] = {x = node.x, y = node.y, scale = node.scale, hidden = node.hidden, warp = node.warp, length = length, angle = angle}
+		self.nodes[i] = {x = node.x, y = node.y, scale = node.scale, hidden = node.hidden, warp = node.warp, length = length, offset = self.length, angle = angle}
 
 		-- brightnesses stuff
 		if node.hidden then
@@ -271,23 +281,51 @@ function Path:getCurrentTrainPreset()
 	return self.trainRules.waves[self.currentWave]
 end
 
+---Works only if `trainRules.type == "waves"`. Returns the current wave, already parsed.
+---@return TrainPreset
+function Path:getCurrentCompiledTrainPreset()
+	assert(self.trainRules.type == "waves", "Incorrect getCurrentCompiledTrainPreset call, this should never happen")
+	return self.trainPresets[self.currentWave]
+end
+
+---Returns the parsed form of a train preset string.
+---Presets compiled at build time (`train_presets.json`, generated by `generate.py -tp`) are used if available. Otherwise, the preset is parsed here.
+---@param preset string The train preset, ex. `"AAABBC"` or `"2*3:ABC,5*2:ABC"`.
+---@return TrainPreset
+function Path:compileTrainPreset(preset)
+	---@alias TrainPreset {length: integer, regular: boolean?, blocks: [integer, integer, string[]][]?}
+	local compiledPreset = _Game.game.trainPresets and _Game.game.trainPresets[preset]
+	if compiledPreset then
+		return compiledPreset
+	end
+	compiledPreset = {length = 0}
+	if not tonumber(preset:sub(1, 1)) then
+		-- A regular preset: spheres are generated key by key from the preset string itself.
+		compiledPreset.regular = true
+		compiledPreset.length = preset:len()
+	else
+		-- A preset generator: `count*size:keys` blocks.
+		compiledPreset.blocks = {}
+		for i, strBlock in ipairs(_Utils.strSplit(preset, ",")) do
+			local spl = _Utils.strSplit(strBlock, ":")
+			local pool = {}
+			for j = 1, spl[2]:len() do
+				table.insert(pool, spl[2]:sub(j, j))
+			end
+			spl = _Utils.strSplit(spl[1], "*")
+			local count, size = tonumber(spl[1]), tonumber(spl[2])
+			table.insert(compiledPreset.blocks, {count, size, pool})
+			compiledPreset.length = compiledPreset.length + count * size
+		end
+	end
+	return compiledPreset
+end
+
 ---Returns the length of the current train (on the current wave), or `nil` if the train is going to be continuous.
 ---@return integer?
 function Path:getCurrentTrainLength()
 	if self.trainRules.type == "waves" then
-		local preset = self.trainRules.waves[self.currentWave]
-		if not tonumber(preset:sub(1, 1)) then
-			return preset:len()
-		else
-			local length = 0
-			-- Count the length of each block.
-			for i, strBlock in ipairs(_Utils.strSplit(preset, ",")) do
-				local spl = _Utils.strSplit(strBlock, ":")
-				spl = _Utils.strSplit(spl[1], "*")
-				length = length + tonumber(spl[1]) * tonumber(spl[2])
-			end
-			return length
-		end
+		return self.trainPresets[self.currentWave].length
 	else
 		return self.trainRules.length
 	end
@@ -509,6 +547,22 @@ function Path:getSpeed(pixels)
 		speedMultiplier = speedMultiplier * session:getDifficultyConfig().speedMultiplier
 	end
 
+	-- Look the speed up in the speed table. Cells with a speed node inside and offsets outside of the path are evaluated exactly.
+	local speedTable = self.speedTable
+	local k = math.floor(pixels / speedTable.step)
+	if k < 0 or k + 2 > #speedTable.samples or speedTable.exact[k] then
+		return self:evaluateSpeed(pixels) * speedMultiplier
+	end
+	local a, b = speedTable.samples[k + 1], speedTable.samples[k + 2]
+	return (a + (b - a) * (pixels / speedTable.step - k)) * speedMultiplier
+end
+
+
+
+---Returns the path speed at a given offset, evaluated from the speed graph, without any multipliers.
+---@param pixels number The path offset to be checked, in pixels.
+---@return number
+function Path:evaluateSpeed(pixels)
 	for i, speed in ipairs(self.speeds) do
 		local speedOffset = self:getSpeedOffset(speed)
 		if pixels < speedOffset then
@@ -522,19 +576,73 @@ function Path:getSpeed(pixels)
 					local p1 = prevSpeed.transition.point1
 					local p2 = prevSpeed.transition.point2
 					t = _Utils.bzLerp(t, p1, p2)
-				elseif prevSpeed.transition.type == "instant" then
+				elseif prevSpeed.transition and prevSpeed.transition.type == "instant" then
 					t = 0
 				end
-				return (prevSpeed.speed * (1 - t) + speed.speed * t) * speedMultiplier
+				return prevSpeed.speed * (1 - t) + speed.speed * t
 			end
 
 			-- at the exact position of node or before first node
-			return speed.speed * speedMultiplier
+			return speed.speed
 		end
 	end
 
 	-- after last node
-	return self.speeds[#self.speeds].speed * speedMultiplier
+	return self.speeds[#self.speeds].speed
+end
+
+
+
+---Prepares the speed table of this Path, which `:getSpeed()` looks the speeds up in.
+---The baked table is used if it has been baked from this path's length and speed graph. Otherwise, the table is baked here
+---the same way `generate.py -st` does it: a sample every 4 pixels, with the cells which have a speed node inside or at their end marked as exact.
+---@param bakedTable PathSpeedTable? The speed table baked for this path by `generate.py -st`, if any.
+---@return {step: number, samples: number[], exact: table<integer, boolean>}
+function Path:prepareSpeedTable(bakedTable)
+	---@alias PathSpeedTable {length: number, step: number, speeds: table[], samples: number[], exact: integer[]}
+	local speedTable = {step = 4, samples = nil, exact = {}}
+	if bakedTable and math.abs(bakedTable.length - self.length) < 1e-6 and self:areSpeedsEqual(bakedTable.speeds) then
+		speedTable.step = bakedTable.step
+		speedTable.samples = bakedTable.samples
+		for i, k in ipairs(bakedTable.exact) do
+			speedTable.exact[k] = true
+		end
+		return speedTable
+	end
+	speedTable.samples = {}
+	local count = math.floor(self.length / speedTable.step) + 2
+	for k = 0, count - 1 do
+		speedTable.samples[k + 1] = self:evaluateSpeed(k * speedTable.step)
+	end
+	for i, speed in ipairs(self.speeds) do
+		local k = math.ceil(self:getSpeedOffset(speed) / speedTable.step) - 1
+		if k >= 0 and k < count - 1 then
+			speedTable.exact[k] = true
+		end
+	end
+	return speedTable
+end
+
+
+
+---Returns `true` if the given raw speed graph (as stored in a baked speed table) is the same as this Path's speed graph.
+---@param speeds table[] The raw speed graph.
+---@return boolean
+function Path:areSpeedsEqual(speeds)
+	if #speeds ~= #self.speeds then
+		return false
+	end
+	for i, speed in ipairs(self.speeds) do
+		local other = speeds[i]
+		if speed.distance ~= other.distance or speed.offset ~= other.offset or speed.offsetFromEnd ~= other.offsetFromEnd or speed.speed ~= other.speed then
+			return false
+		end
+		local transition, otherTransition = speed.transition or {}, other.transition or {}
+		if transition.type ~= otherTransition.type or transition.point1 ~= otherTransition.point1 or transition.point2 ~= otherTransition.point2 then
+			return false
+		end
+	end
+	return true
 end
 
 
@@ -714,18 +822,17 @@ end
 ---@param p1y number The Y coordinate of the start point of the line.
 ---@param p2x number The X coordinate of the end point of the line.
 ---@param p2y number The Y coordinate of the end point of the line.
+---@param segments integer[]? If specified, only these segments (given by the IDs of their first nodes, in ascending order) are checked.
 ---@return table
-function Path:getIntersectionPoints(p1x, p1y, p2x, p2y)
+function Path:getIntersectionPoints(p1x, p1y, p2x, p2y, segments)
 	local pminX, pminY = math.min(p1x, p2x), math.min(p1y, p2y)
 	local pmaxX, pmaxY = math.max(p1x, p2x), math.max(p1y, p2y)
-	local distance = 0
 	local intersections = {}
 
-	for i, node in ipairs(self.nodes) do
-		local node2 = self.nodes[i + 1]
-		if not node2 then -- this is the last node; no line there
-			break
-		end
+	-- The last node has no line after it.
+	for i = 1, segments and #segments or #self.nodes - 1 do
+		local node = self.nodes[segments and segments[i] or i]
+		local node2 = self.nodes[(segments and segments[i] or i) + 1]
 		-- Eliminate all impossible cases for optimization.
 		local p3x, p3y = node.x, node.y
 		local p4x, p4y = node2.x, node2.y
@@ -741,10 +848,9 @@ function Path:getIntersectionPoints(p1x, p1y, p2x, p2y)
 			local u = _V.cross(qx - px, qy - py, rx / rcs, ry / rcs)
 			-- t/u < 1 instead of t/u <= 1 is intentional - this way if the line crosses a node perfectly it won't count as two intersections.
 			if rcs ~= 0 and t >= 0 and t < 1 and u >= 0 and u < 1 then
-				table.insert(intersections, distance + node.length * u)
+				table.insert(intersections, node.offset + node.length * u)
 			end
 		end
-		distance = distance + node.length
 	end
 
 	return intersections
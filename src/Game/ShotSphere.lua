@@ -99,8 +99,11 @@ function ShotSphere:moveStep()
 	self.x, self.y = self.x + x, self.y + y
 
 	-- count the gaps
-	for i, path in ipairs(_Game.game:getLevel().map.paths) do
-		local offsets = path:getIntersectionPoints(oldPosX, oldPosY, self.x, self.y)
+	-- If the map has a path grid, only the path segments near this step are checked.
+	local level = _Game.game:getLevel()
+	local segments = level.map:getPathSegmentsNear(math.min(oldPosX, self.x) - 1, math.min(oldPosY, self.y) - 1, math.max(oldPosX, self.x) + 1, math.max(oldPosY, self.y) + 1)
+	for i, path in ipairs(level.map.paths) do
+		local offsets = (not segments or segments[i]) and path:getIntersectionPoints(oldPosX, oldPosY, self.x, self.y, segments and segments[i]) or {}
 		for j, offset in ipairs(offsets) do
 			local size, group = path:getGapSize(offset)
 			if group then
@@ -116,7 +119,8 @@ function ShotSphere:moveStep()
 	end
 
 	-- add if there's a sphere nearby
-	local nearestSphere = _Game.game:getLevel():getNearestSphere(self.x, self.y)
+	-- Spheres further away than the largest sphere could possibly collide with this one don't need to be considered.
+	local nearestSphere = level:getNearestSphere(self.x, self.y, (self.size + level.maxSphereSize) / 2)
 	if nearestSphere and nearestSphere.dist < (self.size + nearestSphere.sphere.config.size) / 2 and (not self.homingTowards or self.homingTowards == nearestSphere.sphere) then
 		-- Execute this only if we are close enough to the nearest sphere and have ANY collision (we are not homing towards something different).
 		if nearestSphere.sphere:isFragile() then
@@ -288,6 +288,9 @@ function Sphere:breakChainLevel()
 	end
 
 	self.chainLevel = self.chainLevel - 1
+	if not self.map.isDummy then
+		self.map.level.colorManager:markBoardChanged()
+	end
 	local x, y = self:getPos()
 	if self.config.chainDestroySound then
 		self.config.chainDestroySound:play(x, y)
@@ -46,21 +46,15 @@ function SphereChain:new(path, data)
 			self.generationPreset = ""
 			-- Generate a preset if the provided value is a preset generator.
 			local preset = self.path:getCurrentTrainPreset()
-			if not tonumber(preset:sub(1, 1)) then
+			local compiledPreset = self.path:getCurrentCompiledTrainPreset()
+			if compiledPreset.regular then
 				self.generationPreset = preset
 			else
 				local blocks = {}
-				-- Parse the preset generator into blocks.
-				local strBlocks = _Utils.strSplit(preset, ",")
-				for i, strBlock in ipairs(strBlocks) do
-					local block = {pool = {}, size = 0} -- ex: {pool = {"X", "Y", "Z"}, size = 3}
-					local spl = _Utils.strSplit(strBlock, ":")
-					for j = 1, spl[2]:len() do
-						table.insert(block.pool, spl[2]:sub(j, j))
-					end
-					spl = _Utils.strSplit(spl[1], "*")
-					block.size = tonumber(spl[2])
-					for j = 1, tonumber(spl[1]) do
+				-- Unpack the already parsed blocks.
+				for i, compiledBlock in ipairs(compiledPreset.blocks) do
+					local block = {pool = compiledBlock[3], size = compiledBlock[2]} -- ex: {pool = {"X", "Y", "Z"}, size = 3}
+					for j = 1, compiledBlock[1] do
 						table.insert(blocks, block)
 					end
 				end
@@ -11,6 +11,10 @@ local class = require "com.class"
 ---@overload fun(config: SphereSelectorConfig, x: number?, y: number?):SphereSelectorResult
 local SphereSelectorResult = class:derive("SphereSelectorResult")
 
+-- Operation plans of Sphere Selector Configs, built once per config. Weak keys, so that unloaded configs can be collected.
+---@type table<SphereSelectorConfig, table[]>
+local plans = setmetatable({}, {__mode = "k"})
+
 ---Constructs a new SphereSelectorResult.
 ---@param config SphereSelectorConfig The Sphere Selector configuration that will be used to generate a result of this selector.
 ---@param x number? X position to check the spheres' positions against. Note that the position-related variables will not be available if this argument is not provided.
@@ -22,8 +26,36 @@ function SphereSelectorResult:new(config, x, y)
 	---@type Sphere[]
 	self.spheres = {}
 	-- TODO: Trigger evaluation for all spheres only when necessary. The `:hasSphere()` function does not need full information.
-	for i, operation in ipairs(config.operations) do
-		if operation.type == "add" then
+	for i, operation in ipairs(SphereSelectorResult.getPlan(config)) do
+		if operation.type == "add" and operation.colors then
+			-- The condition only depends on the sphere color, so no Expression needs to be evaluated.
+			-- Spheres are collected separately for each merged operation, so that they are added in the same order
+			-- as if the operations were performed one by one.
+			local buckets = {}
+			for j = 1, operation.count do
+				buckets[j] = {}
+			end
+			for j, path in ipairs(_Game.game:getLevel().map.paths) do
+				for k = #path.sphereChains, 1, -1 do
+					local sphereChain = path.sphereChains[k]
+					for l = #sphereChain.sphereGroups, 1, -1 do
+						local sphereGroup = sphereChain.sphereGroups[l]
+						for m = #sphereGroup.spheres, 1, -1 do
+							local sphere = sphereGroup.spheres[m]
+							local bucket = operation.colors[sphere.color]
+							if bucket then
+								table.insert(buckets[bucket], sphere)
+							end
+						end
+					end
+				end
+			end
+			for j, bucket in ipairs(buckets) do
+				for k, sphere in ipairs(bucket) do
+					table.insert(self.spheres, sphere)
+				end
+			end
+		elseif operation.type == "add" then
 			for j, path in ipairs(_Game.game:getLevel().map.paths) do
 				for k = #path.sphereChains, 1, -1 do
 					local sphereChain = path.sphereChains[k]
@@ -60,6 +92,43 @@ function SphereSelectorResult:new(config, x, y)
 	end
 end
 
+---Returns the list of operations to be performed for the given Sphere Selector Config.
+---These are the config's operations, except that `"add"` operations whose conditions have been compiled to color sets by `generate.py -sc`
+---(`sphere_selector_masks.json`) have a `colors` set instead, and consecutive ones with disjoint color sets are merged into a single operation.
+---The `colors` set of a merged operation maps each color to the index of the original operation it belongs to, out of `count` operations.
+---@param config SphereSelectorConfig The Sphere Selector configuration.
+---@return table[]
+function SphereSelectorResult.getPlan(config)
+	if plans[config] then
+		return plans[config]
+	end
+	local masks = _Game.game.sphereSelectorMasks
+	local plan = {}
+	for i, operation in ipairs(config.operations) do
+		local mask = masks and operation.type == "add" and masks[operation.condition.str]
+		if mask then
+			local last = plan[#plan]
+			-- Merge with the previous operation if no sphere could be added by both of them.
+			local disjoint = last and last.colors ~= nil
+			for j, color in ipairs(mask) do
+				disjoint = disjoint and not last.colors[color]
+			end
+			local step = disjoint and last or {type = "add", colors = {}, count = 0}
+			step.count = step.count + 1
+			for j, color in ipairs(mask) do
+				step.colors[color] = step.count
+			end
+			if step ~= last then
+				table.insert(plan, step)
+			end
+		else
+			table.insert(plan, operation)
+		end
+	end
+	plans[config] = plan
+	return plan
+end
+
 ---Destroys all of the spheres contained in this Result.
 ---@param scoreEvent ScoreEventConfig? The Score Event that will be executed once on the whole batch.
 ---@param scoreEventPerSphere ScoreEventConfig? The Score Event that will be executed separately for each sphere.
@@ -13,22 +13,29 @@ function Renderer:new()
     self.sx, self.sy, self.sw, self.sh = nil, nil, nil, nil -- The working scissor
     self.workStencil = {fn = nil, action = nil, value = nil, keepValues = nil, testMode = nil, testValue = nil} -- The working stencil
     self.layer = "" -- The working layer
+    self.layerID = 0 -- The ID of the working layer, or 0 if there's no such layer.
     self.priority = 0 -- The working priority
     ---@type table<string, integer>
-    self.layers = {} -- A list of layers, keyed by their names. The higher the number, the later the layer is drawn.
+    self.layers = {} -- A list of layer IDs, keyed by their names. The higher the number, the later the layer is drawn.
+    self.layerCount = 0 -- The number of layers, i.e. the highest layer ID.
 
     ---@alias RendererQueueItem {i: integer, r: number, g: number, b: number, alpha: number,
     ---                          scissorX: number?, scissorY: number?, scissorW: number?, scissorH: number?,
     ---                          stencilFn: function?, stencilAction: love.StencilAction?, stencilValue: integer?, stencilKeepValues: boolean?,
     ---                          stencilTestMode: love.CompareMode?, stencilTestValue: number?,
-    ---                          layer: string, type: string, priority: number, [any]: any}
-    ---A list of commands to be performed, in the order of placing. When `:flush()` is called, this list is sorted by layer and emptied.
+    ---                          layer: string, layerID: integer, type: string, priority: number, [any]: any}
+    ---A list of commands to be performed, in the order of placing. When `:flush()` is called, this list is split by layer and emptied.
     ---@type RendererQueueItem[]
     self.queue = {}
-    self.queueSortFn = function(a, b)
-        local la, lb = self.layers[a.layer] or 0, self.layers[b.layer] or 0
-        return la == lb and (a.priority == b.priority and a.i < b.i or a.priority < b.priority) or la < lb
-    end -- A function to determine the final drawing order, passed to `table.sort`.
+    ---Lists of commands to be performed, keyed by layer ID, in the order of placing. Filled and emptied by `:flush()`; the tables are reused.
+    ---@type table<integer, RendererQueueItem[]>
+    self.buckets = {[0] = {}}
+    ---Layer IDs of the buckets which have items with a non-zero priority, and need sorting before they are drawn.
+    ---@type table<integer, boolean>
+    self.bucketsPrioritized = {}
+    self.bucketSortFn = function(a, b)
+        return a.priority == b.priority and a.i < b.i or a.priority < b.priority
+    end -- A function to determine the drawing order within a single layer, passed to `table.sort`.
     self.lastQueueLength = 0 -- How many queue items have been processed on the last flush.
 end
 
@@ -36,11 +43,15 @@ end
 ---@param layers string[]?
 function Renderer:setLayers(layers)
     self.layers = {}
+    self.buckets = {[0] = {}}
     if layers then
         for i, layer in ipairs(layers) do
             self.layers[layer] = i
+            self.buckets[i] = {}
         end
     end
+    self.layerCount = #self.buckets
+    self.layerID = self.layers[self.layer] or 0
 end
 
 ---Sets a color the following `:draw*()` calls will tint the drawn elements with, using a Color instance.
@@ -108,6 +119,7 @@ end
 function Renderer:setLayer(layer)
     assert(layer, string.format("Renderer error: Could not find a layer called %s", layer))
     self.layer = layer
+    self.layerID = self.layers[layer] or 0
 end
 
 ---Sets or resets priority for the next `:draw*()` calls. Objects with higher priority will be drawn on top of objects with lower priority within the same layer.
@@ -135,6 +147,7 @@ function Renderer:getBaseQueueItem()
         stencilTestMode = self.workStencil.testMode,
         stencilTestValue = self.workStencil.testValue,
         layer = self.layer,
+        layerID = self.layerID,
         priority = self.priority,
         type = ""
     }
@@ -195,24 +208,27 @@ end
 
 ---Draws all queued draw instructions on the screen and clears the queue.
 function Renderer:flush()
-    table.sort(self.queue, self.queueSortFn)
+    -- Split the queue by layer. The items of each layer stay in the order of placing, so only the layers
+    -- which have items with a non-zero priority need sorting.
     for i, item in ipairs(self.queue) do
-        if item.stencilFn then
-            love.graphics.stencil(item.stencilFn, item.stencilAction, item.stencilValue, item.stencilKeepValues)
+        -- Items queued before the layers have changed fall back to the unknown layer.
+        local layerID = self.buckets[item.layerID] and item.layerID or 0
+        local bucket = self.buckets[layerID]
+        bucket[#bucket + 1] = item
+        if item.priority ~= 0 then
+            self.bucketsPrioritized[layerID] = true
         end
-        love.graphics.setStencilTest(item.stencilTestMode, item.stencilTestValue)
-        love.graphics.setColor(item.r, item.g, item.b, item.alpha)
-        love.graphics.setFont(item.font)
-        love.graphics.setScissor(item.scissorX, item.scissorY, item.scissorW, item.scissorH)
-        if item.type == "image" then
-            love.graphics.draw(item.image, item.quad, item.x, item.y, item.rot, item.sx, item.sy, item.ox, item.oy)
-        elseif item.type == "rectangle" then
-            love.graphics.rectangle(item.mode, item.x, item.y, item.w, item.h)
-        elseif item.type == "text" then
-            love.graphics.print(item.text, item.x, item.y, item.rot, item.sx, item.sy)
-        else
-            error(string.format("Illegal render work item type: %s", item.type))
+    end
+    for layerID = 0, self.layerCount do
+        local bucket = self.buckets[layerID]
+        if self.bucketsPrioritized[layerID] then
+            table.sort(bucket, self.bucketSortFn)
+            self.bucketsPrioritized[layerID] = nil
+        end
+        for i, item in ipairs(bucket) do
+            self:drawQueueItem(item)
         end
+        _Utils.emptyTable(bucket)
     end
     self.lastQueueLength = #self.queue
     _Utils.emptyTable(self.queue)
@@ -220,6 +236,28 @@ function Renderer:flush()
     love.graphics.setScissor()
 end
 
+---Draws a single queue item on the screen.
+---@private
+---@param item RendererQueueItem The item to be drawn.
+function Renderer:drawQueueItem(item)
+    if item.stencilFn then
+        love.graphics.stencil(item.stencilFn, item.stencilAction, item.stencilValue, item.stencilKeepValues)
+    end
+    love.graphics.setStencilTest(item.stencilTestMode, item.stencilTestValue)
+    love.graphics.setColor(item.r, item.g, item.b, item.alpha)
+    love.graphics.setFont(item.font)
+    love.graphics.setScissor(item.scissorX, item.scissorY, item.scissorW, item.scissorH)
+    if item.type == "image" then
+        love.graphics.draw(item.image, item.quad, item.x, item.y, item.rot, item.sx, item.sy, item.ox, item.oy)
+    elseif item.type == "rectangle" then
+        love.graphics.rectangle(item.mode, item.x, item.y, item.w, item.h)
+    elseif item.type == "text" then
+        love.graphics.print(item.text, item.x, item.y, item.rot, item.sx, item.sy)
+    else
+        error(string.format("Illegal render work item type: %s", item.type))
+    end
+end
+
 ---Returns how many entries in the queue were processed on the last frame.
 ---@return integer
 function Renderer:getLastQueueLength()
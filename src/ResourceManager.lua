@@ -113,12 +113,15 @@ end
 
 ---Scans the game folder for all resources and queues them for loading.
 ---Resources in folders: `maps`, `config` as well as all files located directly in the root game directory will be omitted.
+---Lua chunks generated from JSON files (`*.json.lua` and `*.json.hash`) and baked Font metrics (`*.metrics.json`) are omitted too,
+---as they are loaded together with their JSON files and Fonts respectively.
 function ResourceManager:scanResources()
 	-- Get all files in the game directory.
 	local files = _Utils.getDirListing(_ParsePath("/"), "file", nil, true)
 	-- Sift through the files, save the files we're interested with in the table.
 	for i, file in ipairs(files) do
-		if not _Utils.strStartsWith(file, "maps/") and not _Utils.strStartsWith(file, "config/") and #_Utils.strSplit(file, "/") > 1 then
+		local isGenerated = _Utils.strEndsWith(file, ".json.lua") or _Utils.strEndsWith(file, ".json.hash") or _Utils.strEndsWith(file, ".metrics.json")
+		if not _Utils.strStartsWith(file, "maps/") and not _Utils.strStartsWith(file, "config/") and #_Utils.strSplit(file, "/") > 1 and not isGenerated then
 			self:queueResource(file)
 		end
 	end
@@ -314,7 +317,14 @@ function ResourceManager:loadResource(key, batches)
 
 	if constructor then
 		-- Construct the resource and check for errors.
-		local success, result = xpcall(function() return constructor(contents, key, false, baseResource) end, debug.traceback)
+		-- Resources which have been validated against the current schema at build time are constructed without any checks.
+		local trusted = not baseResource and contents["_validated"] and contents["_validated"] == constructor.metadata.schemaHash
+		local success, result = xpcall(function()
+			if trusted then
+				return _ConfigUtils.constructTrusted(constructor, contents, key, false)
+			end
+			return constructor(contents, key, false, baseResource)
+		end, debug.traceback)
 		assert(success, string.format("Failed to load file %s: %s", key, tostring(result)))
 		self.resources[key].config = result
 	end
@@ -1,7 +1,9 @@
 local class = require "com.class"
+local MessagePack = require "com.MessagePack"
+local SaveStates = require "src.SaveStates"
 
 ---A class which you can register various objects to (like ProfileManager, Highscores or Options).
----They can be then saved and loaded neatly from one file called `runtime.json`.
+---They can be then saved and loaded neatly from one file called `runtime.dat`.
 ---
 ---Any module registered must be an object containing `serialize` and `deserialize` functions.
 ---@class RuntimeManager
@@ -11,30 +13,36 @@ local RuntimeManager = class:derive("RuntimeManager")
 ---Constructs a Runtime Manager.
 function RuntimeManager:new()
 	_Log:printt("RuntimeManager", "Initializing RuntimeManager...")
-	self.path = _ParsePath("runtime.json")
+	self.path = _ParsePath("runtime.dat")
+	-- Older versions saved everything as JSON. This file is only read if `runtime.dat` doesn't exist.
+	self.jsonPath = _ParsePath("runtime.json")
 
 	---@alias RuntimeManagerModule {serialize: function, deserialize: function, [any]: any}
 	---@type RuntimeManagerModule[]
 	self.modules = {}
+	---@alias RuntimeManagerSaveState {pack: function, unpack: function}
+	---@type table<string, RuntimeManagerSaveState>
+	self.saveStates = {}
 end
 
 ---Registers a module, which is an instance of any class.
 ---The class must have `:serialize()` and `:deserialize()` functions.
 ---@param name string Module name. This will be the name under which the provided module will be stored.
 ---@param module RuntimeManagerModule The object to be registered.
-function RuntimeManager:registerModule(name, module)
+---@param saveState RuntimeManagerSaveState? A save state from `src/SaveStates.lua` describing the module's data. If provided, the data will be packed with it.
+function RuntimeManager:registerModule(name, module, saveState)
 	assert(module.serialize, "Attempted to register a module without a `:serialize()` function!")
 	assert(module.deserialize, "Attempted to register a module without a `:deserialize()` function!")
 	self.modules[name] = module
+	self.saveStates[name] = saveState
 end
 
----Loads serialized data for each found module from `runtime.json`.
+---Loads serialized data for each found module from `runtime.dat`, or from `runtime.json` if the former doesn't exist.
 --- - If there is data for an unregistered module, throws an error.
 --- - If there is no data for a registered module, does not do anything with it.
 --- - If the file doesn't exist altogether, this function will not do anything.
 function RuntimeManager:load()
-	-- if runtime.json exists, then load it
-	local data = _Utils.loadJson(self.path)
+	local data = self:loadPacked() or _Utils.loadJson(self.jsonPath)
 	if data then
 		_CriticalLoad = true
 		for name, moduleData in pairs(data) do
@@ -45,13 +53,58 @@ function RuntimeManager:load()
 	end
 end
 
----Saves data from all registered modules to `runtime.json`.
+---Loads and unpacks data from `runtime.dat`. Returns `nil` if the file doesn't exist.
+---If the file has been saved with different save state layouts, it is unpacked with the layouts stored in it,
+---so that the data gets migrated to the current layouts the next time it is saved.
+---@return table?
+function RuntimeManager:loadPacked()
+	local contents = _Utils.loadFileBinary(self.path)
+	if not contents then
+		return nil
+	end
+	local success, packed = pcall(function() return MessagePack.unpack(contents) end)
+	assert(success, string.format("MessagePack error: %s: %s", self.path, tostring(packed)))
+	local data = {}
+	if packed.hash == SaveStates.hash then
+		for name, moduleData in pairs(packed.modules) do
+			local saveState = self.saveStates[name]
+			data[name] = saveState and saveState.unpack(moduleData) or moduleData
+		end
+	else
+		assert(packed.layouts and packed.types, string.format("File `%s` has been saved with different save state layouts, which have not been stored in it", self.path))
+		_Log:printt("RuntimeManager", string.format("File `%s` has been saved with different save state layouts, migrating", self.path))
+		for name, moduleData in pairs(packed.modules) do
+			local typeName = packed.types[name]
+			data[name] = typeName and SaveStates.unpackWithLayout(moduleData, typeName, packed.layouts) or moduleData
+		end
+	end
+	return data
+end
+
+---Returns the name of the given save state type in `src/SaveStates.lua`, e.g. `"ProfileManagerSave"`.
+---@param saveState RuntimeManagerSaveState The save state.
+---@return string?
+function RuntimeManager:getSaveStateTypeName(saveState)
+	for typeName, layout in pairs(SaveStates.layouts) do
+		if SaveStates[typeName] == saveState then
+			return typeName
+		end
+	end
+end
+
+---Saves data from all registered modules to `runtime.dat`.
+---Data of modules registered with a save state is packed with it first, and then everything is encoded with MessagePack.
+---The save state layouts and the save state type of each module are stored as well, so that the file can be migrated when save states change.
 function RuntimeManager:save()
 	local data = {}
+	local types = {}
 	for name, module in pairs(self.modules) do
-		data[name] = module:serialize()
+		local moduleData = module:serialize()
+		local saveState = self.saveStates[name]
+		data[name] = saveState and saveState.pack(moduleData) or moduleData
+		types[name] = saveState and self:getSaveStateTypeName(saveState)
 	end
-	_Utils.saveJson(self.path, data)
+	_Utils.saveFileBinary(self.path, MessagePack.pack({hash = SaveStates.hash, layouts = SaveStates.layouts, types = types, modules = data}))
 end
 
 return RuntimeManager
@@ -0,0 +1,839 @@
+--!!--
+-- Auto-generated by DocLang Generator
+-- REMOVE THIS COMMENT IF YOU MODIFY THIS FILE
+-- in order to protect it from being overwritten!
+--!!--
+
+---Packs save states into nested arrays, so that they can be stored compactly, and unpacks them back.
+local SaveStates = {}
+
+---A hash of all packed layouts. Data packed with a different hash must be unpacked with `SaveStates.unpackWithLayout()` instead.
+SaveStates.hash = "bb8fac9004ffb83c"
+
+---Applies `f` to each item of the list `t` and returns a new list. Values which aren't tables are returned unchanged.
+---@param t table?
+---@param f function
+---@return table?
+local function mapList(t, f)
+    if type(t) ~= "table" then
+        return t
+    end
+    local out = {}
+    for i, v in ipairs(t) do
+        out[i] = f(v)
+    end
+    return out
+end
+
+---Applies `f` to each value of the table `t` and returns a new table with the same keys. Values which aren't tables are returned unchanged.
+---@param t table?
+---@param f function
+---@return table?
+local function mapTable(t, f)
+    if type(t) ~= "table" then
+        return t
+    end
+    local out = {}
+    for k, v in pairs(t) do
+        out[k] = f(v)
+    end
+    return out
+end
+
+---Unpacks data packed with the given layout from `SaveStates.layouts`, which may come from an older version of this module.
+---Fields are named as they were when the data was packed, so the result is the same as what the old `:serialize()` functions returned.
+---@param v any The packed data.
+---@param layout any The layout of the data.
+---@param layouts table<string, any> Layouts of all save state types at the time the data was packed.
+---@return any
+function SaveStates.unpackWithLayout(v, layout, layouts)
+    if type(v) ~= "table" or layout == 0 then
+        return v
+    elseif type(layout) == "string" then
+        return SaveStates.unpackWithLayout(v, layouts[layout], layouts)
+    elseif layout.list then
+        return mapList(v, function(item) return SaveStates.unpackWithLayout(item, layout.list, layouts) end)
+    elseif layout.map then
+        return mapTable(v, function(item) return SaveStates.unpackWithLayout(item, layout.map, layouts) end)
+    end
+    local out = {}
+    for i, field in ipairs(layout.fields) do
+        out[field[1]] = SaveStates.unpackWithLayout(v[i], field[2], layouts)
+    end
+    return out
+end
+
+SaveStates.LevelSave = {}
+
+---Packs a `LevelSave` save state into nested arrays.
+---@param v table The data to be packed.
+---@return table
+function SaveStates.LevelSave.pack(v)
+    return type(v) == "table" and {
+        v.score,
+        v.coins,
+        v.gems,
+        v.spheresShot,
+        v.successfulShots,
+        v.sphereChainsSpawned,
+        v.time,
+        type(v.shooter) == "table" and {
+            v.shooter.color,
+            v.shooter.nextColor,
+            v.shooter.shotCooldown,
+            v.shooter.shotCooldownFade,
+            v.shooter.shotCooldownSphere,
+            v.shooter.multiColorColor,
+            v.shooter.multiColorCount,
+            v.shooter.multiColorTime,
+            v.shooter.multiColorRemoveWhenTimeOut,
+            v.shooter.multiColorHoldTimeRate,
+            v.shooter.speedShotTime,
+            v.shooter.speedShotSpeed,
+            v.shooter.homingBugsTime
+        } or v.shooter,
+        mapList(v.shotSpheres, function(v1)
+            return type(v1) == "table" and {
+                type(v1.pos) == "table" and {
+                    v1.pos.x,
+                    v1.pos.y
+                } or v1.pos,
+                v1.angle,
+                v1.size,
+                v1.color,
+                v1.speed,
+                v1.steps,
+                SaveStates.SphereRefSave.pack(v1.homingTowards),
+                v1.destroyedFragileSpheres,
+                v1.markedAsSuccessfulShot,
+                SaveStates.SphereRefSave.pack(v1.hitSphere),
+                v1.hitTime,
+                v1.hitTimeMax,
+                mapList(v1.gaps, function(v2)
+                    return type(v2) == "table" and {
+                        v2.groupID,
+                        v2.chainID,
+                        v2.pathID,
+                        v2.size
+                    } or v2
+                end)
+            } or v1
+        end),
+        mapList(v.collectibles, function(v1)
+            return type(v1) == "table" and {
+                v1.id,
+                type(v1.pos) == "table" and {
+                    v1.pos.x,
+                    v1.pos.y
+                } or v1.pos,
+                type(v1.speed) == "table" and {
+                    v1.speed.x,
+                    v1.speed.y
+                } or v1.speed,
+                type(v1.acceleration) == "table" and {
+                    v1.acceleration.x,
+                    v1.acceleration.y
+                } or v1.acceleration
+            } or v1
+        end),
+        mapList(v.projectiles, function(v1)
+            return type(v1) == "table" and {
+                v1.id,
+                type(v1.pos) == "table" and {
+                    v1.pos.x,
+                    v1.pos.y
+                } or v1.pos,
+                type(v1.targetPos) == "table" and {
+                    v1.targetPos.x,
+                    v1.targetPos.y
+                } or v1.targetPos,
+                SaveStates.SphereRefSave.pack(v1.targetSphere)
+            } or v1
+        end),
+        v.streak,
+        v.maxStreak,
+        v.cascade,
+        v.cascadeScore,
+        v.maxCascade,
+        mapList(v.collectibleRains, function(v1)
+            return type(v1) == "table" and {
+                v1.count,
+                v1.time,
+                v1.delay,
+                v1.generator
+            } or v1
+        end),
+        mapList(v.projectileStorms, function(v1)
+            return type(v1) == "table" and {
+                v1.count,
+                v1.time,
+                v1.delay,
+                v1.projectile,
+                v1.cancelWhenNoTargetsRemaining
+            } or v1
+        end),
+        v.netTime,
+        v.destroyedSpheres,
+        mapList(v.paths, SaveStates.PathSave.pack),
+        v.lost,
+        v.failDestructionDelay,
+        v.gameSpeed,
+        v.gameSpeedTime,
+        v.scoreMultiplier,
+        v.scoreMultiplierTime,
+        v.levelSequenceStep,
+        v.levelSequenceVars,
+        v.variables,
+        v.timers,
+        v.timerSeries
+    } or v
+end
+
+---Unpacks a `LevelSave` save state packed with `SaveStates.LevelSave.pack()`.
+---@param v table The packed data.
+---@return table
+function SaveStates.LevelSave.unpack(v)
+    return type(v) == "table" and {
+        score = v[1],
+        coins = v[2],
+        gems = v[3],
+        spheresShot = v[4],
+        successfulShots = v[5],
+        sphereChainsSpawned = v[6],
+        time = v[7],
+        shooter = type(v[8]) == "table" and {
+            color = v[8][1],
+            nextColor = v[8][2],
+            shotCooldown = v[8][3],
+            shotCooldownFade = v[8][4],
+            shotCooldownSphere = v[8][5],
+            multiColorColor = v[8][6],
+            multiColorCount = v[8][7],
+            multiColorTime = v[8][8],
+            multiColorRemoveWhenTimeOut = v[8][9],
+            multiColorHoldTimeRate = v[8][10],
+            speedShotTime = v[8][11],
+            speedShotSpeed = v[8][12],
+            homingBugsTime = v[8][13]
+        } or v[8],
+        shotSpheres = mapList(v[9], function(v1)
+            return type(v1) == "table" and {
+                pos = type(v1[1]) == "table" and {
+                    x = v1[1][1],
+                    y = v1[1][2]
+                } or v1[1],
+                angle = v1[2],
+                size = v1[3],
+                color = v1[4],
+                speed = v1[5],
+                steps = v1[6],
+                homingTowards = SaveStates.SphereRefSave.unpack(v1[7]),
+                destroyedFragileSpheres = v1[8],
+                markedAsSuccessfulShot = v1[9],
+                hitSphere = SaveStates.SphereRefSave.unpack(v1[10]),
+                hitTime = v1[11],
+                hitTimeMax = v1[12],
+                gaps = mapList(v1[13], function(v2)
+                    return type(v2) == "table" and {
+                        groupID = v2[1],
+                        chainID = v2[2],
+                        pathID = v2[3],
+                        size = v2[4]
+                    } or v2
+                end)
+            } or v1
+        end),
+        collectibles = mapList(v[10], function(v1)
+            return type(v1) == "table" and {
+                id = v1[1],
+                pos = type(v1[2]) == "table" and {
+                    x = v1[2][1],
+                    y = v1[2][2]
+                } or v1[2],
+                speed = type(v1[3]) == "table" and {
+                    x = v1[3][1],
+                    y = v1[3][2]
+                } or v1[3],
+                acceleration = type(v1[4]) == "table" and {
+                    x = v1[4][1],
+                    y = v1[4][2]
+                } or v1[4]
+            } or v1
+        end),
+        projectiles = mapList(v[11], function(v1)
+            return type(v1) == "table" and {
+                id = v1[1],
+                pos = type(v1[2]) == "table" and {
+                    x = v1[2][1],
+                    y = v1[2][2]
+                } or v1[2],
+                targetPos = type(v1[3]) == "table" and {
+                    x = v1[3][1],
+                    y = v1[3][2]
+                } or v1[3],
+                targetSphere = SaveStates.SphereRefSave.unpack(v1[4])
+            } or v1
+        end),
+        streak = v[12],
+        maxStreak = v[13],
+        cascade = v[14],
+        cascadeScore = v[15],
+        maxCascade = v[16],
+        collectibleRains = mapList(v[17], function(v1)
+            return type(v1) == "table" and {
+                count = v1[1],
+                time = v1[2],
+                delay = v1[3],
+                generator = v1[4]
+            } or v1
+        end),
+        projectileStorms = mapList(v[18], function(v1)
+            return type(v1) == "table" and {
+                count = v1[1],
+                time = v1[2],
+                delay = v1[3],
+                projectile = v1[4],
+                cancelWhenNoTargetsRemaining = v1[5]
+            } or v1
+        end),
+        netTime = v[19],
+        destroyedSpheres = v[20],
+        paths = mapList(v[21], SaveStates.PathSave.unpack),
+        lost = v[22],
+        failDestructionDelay = v[23],
+        gameSpeed = v[24],
+        gameSpeedTime = v[25],
+        scoreMultiplier = v[26],
+        scoreMultiplierTime = v[27],
+        levelSequenceStep = v[28],
+        levelSequenceVars = v[29],
+        variables = v[30],
+        timers = v[31],
+        timerSeries = v[32]
+    } or v
+end
+
+SaveStates.PathSave = {}
+
+---Packs a `PathSave` save state into nested arrays.
+---@param v table The data to be packed.
+---@return table
+function SaveStates.PathSave.pack(v)
+    return type(v) == "table" and {
+        mapList(v.sphereChains, function(v1)
+            return type(v1) == "table" and {
+                v1.cascade,
+                v1.cascadeScore,
+                v1.speedOverrideBase,
+                v1.speedOverrideMult,
+                v1.speedOverrideDecc,
+                v1.speedOverrideTime,
+                v1.colorSortType,
+                v1.colorSortDelay,
+                v1.colorSortTime,
+                v1.colorSortStopWhenTampered,
+                mapList(v1.sphereGroups, function(v2)
+                    return type(v2) == "table" and {
+                        v2.offset,
+                        v2.speed,
+                        v2.speedTime,
+                        mapList(v2.spheres, SaveStates.SphereSave.pack),
+                        v2.matchCheck,
+                        v2.distanceEventStates
+                    } or v2
+                end),
+                v1.generationAllowed,
+                v1.generationColor,
+                v1.generationIndex,
+                v1.generationPreset,
+                v1.generationKeys
+            } or v1
+        end),
+        v.currentWave,
+        v.reachedFinalWave,
+        v.cascade,
+        v.cascadeScore,
+        v.clearOffset,
+        mapList(v.pathEntities, function(v1)
+            return type(v1) == "table" and {
+                v1.id,
+                v1.offset,
+                v1.backwards,
+                v1.offsetBound,
+                v1.speed,
+                v1.time,
+                v1.traveledDistance,
+                v1.trailDistance,
+                v1.collectibleDistance,
+                v1.destroyedSpheres,
+                v1.destroyedChains
+            } or v1
+        end),
+        mapTable(v.sphereEffectGroups, function(v1)
+            return type(v1) == "table" and {
+                v1.count,
+                SaveStates.SphereRefSave.pack(v1.cause)
+            } or v1
+        end)
+    } or v
+end
+
+---Unpacks a `PathSave` save state packed with `SaveStates.PathSave.pack()`.
+---@param v table The packed data.
+---@return table
+function SaveStates.PathSave.unpack(v)
+    return type(v) == "table" and {
+        sphereChains = mapList(v[1], function(v1)
+            return type(v1) == "table" and {
+                cascade = v1[1],
+                cascadeScore = v1[2],
+                speedOverrideBase = v1[3],
+                speedOverrideMult = v1[4],
+                speedOverrideDecc = v1[5],
+                speedOverrideTime = v1[6],
+                colorSortType = v1[7],
+                colorSortDelay = v1[8],
+                colorSortTime = v1[9],
+                colorSortStopWhenTampered = v1[10],
+                sphereGroups = mapList(v1[11], function(v2)
+                    return type(v2) == "table" and {
+                        offset = v2[1],
+                        speed = v2[2],
+                        speedTime = v2[3],
+                        spheres = mapList(v2[4], SaveStates.SphereSave.unpack),
+                        matchCheck = v2[5],
+                        distanceEventStates = v2[6]
+                    } or v2
+                end),
+                generationAllowed = v1[12],
+                generationColor = v1[13],
+                generationIndex = v1[14],
+                generationPreset = v1[15],
+                generationKeys = v1[16]
+            } or v1
+        end),
+        currentWave = v[2],
+        reachedFinalWave = v[3],
+        cascade = v[4],
+        cascadeScore = v[5],
+        clearOffset = v[6],
+        pathEntities = mapList(v[7], function(v1)
+            return type(v1) == "table" and {
+                id = v1[1],
+                offset = v1[2],
+                backwards = v1[3],
+                offsetBound = v1[4],
+                speed = v1[5],
+                time = v1[6],
+                traveledDistance = v1[7],
+                trailDistance = v1[8],
+                collectibleDistance = v1[9],
+                destroyedSpheres = v1[10],
+                destroyedChains = v1[11]
+            } or v1
+        end),
+        sphereEffectGroups = mapTable(v[8], function(v1)
+            return type(v1) == "table" and {
+                count = v1[1],
+                cause = SaveStates.SphereRefSave.unpack(v1[2])
+            } or v1
+        end)
+    } or v
+end
+
+SaveStates.ProfileSave = {}
+
+---Packs a `ProfileSave` save state into nested arrays.
+---@param v table The data to be packed.
+---@return table
+function SaveStates.ProfileSave.pack(v)
+    return type(v) == "table" and {
+        SaveStates.ProfileSessionSave.pack(v.session),
+        v.levelStats,
+        v.unlockedCheckpoints,
+        v.variables,
+        v.ultimatelySatisfyingMode
+    } or v
+end
+
+---Unpacks a `ProfileSave` save state packed with `SaveStates.ProfileSave.pack()`.
+---@param v table The packed data.
+---@return table
+function SaveStates.ProfileSave.unpack(v)
+    return type(v) == "table" and {
+        session = SaveStates.ProfileSessionSave.unpack(v[1]),
+        levelStats = v[2],
+        unlockedCheckpoints = v[3],
+        variables = v[4],
+        ultimatelySatisfyingMode = v[5]
+    } or v
+end
+
+SaveStates.ProfileManagerSave = {}
+
+---Packs a `ProfileManagerSave` save state into nested arrays.
+---@param v table The data to be packed.
+---@return table
+function SaveStates.ProfileManagerSave.pack(v)
+    return type(v) == "table" and {
+        v.order,
+        mapTable(v.profiles, SaveStates.ProfileSave.pack),
+        v.selected
+    } or v
+end
+
+---Unpacks a `ProfileManagerSave` save state packed with `SaveStates.ProfileManagerSave.pack()`.
+---@param v table The packed data.
+---@return table
+function SaveStates.ProfileManagerSave.unpack(v)
+    return type(v) == "table" and {
+        order = v[1],
+        profiles = mapTable(v[2], SaveStates.ProfileSave.unpack),
+        selected = v[3]
+    } or v
+end
+
+SaveStates.ProfileSessionSave = {}
+
+---Packs a `ProfileSessionSave` save state into nested arrays.
+---@param v table The data to be packed.
+---@return table
+function SaveStates.ProfileSessionSave.pack(v)
+    return type(v) == "table" and {
+        v.difficulty,
+        v.score,
+        v.lives,
+        v.coins,
+        v.lifeScore,
+        v.level,
+        v.sublevel,
+        v.sublevelPool,
+        v.levelID,
+        SaveStates.LevelSave.pack(v.levelSaveData)
+    } or v
+end
+
+---Unpacks a `ProfileSessionSave` save state packed with `SaveStates.ProfileSessionSave.pack()`.
+---@param v table The packed data.
+---@return table
+function SaveStates.ProfileSessionSave.unpack(v)
+    return type(v) == "table" and {
+        difficulty = v[1],
+        score = v[2],
+        lives = v[3],
+        coins = v[4],
+        lifeScore = v[5],
+        level = v[6],
+        sublevel = v[7],
+        sublevelPool = v[8],
+        levelID = v[9],
+        levelSaveData = SaveStates.LevelSave.unpack(v[10])
+    } or v
+end
+
+SaveStates.SphereSave = {}
+
+---Packs a `SphereSave` save state into nested arrays.
+---@param v table The data to be packed.
+---@return table
+function SaveStates.SphereSave.pack(v)
+    return type(v) == "table" and {
+        v.color,
+        type(v.shootOrigin) == "table" and {
+            v.shootOrigin.x,
+            v.shootOrigin.y
+        } or v.shootOrigin,
+        v.shootTime,
+        v.ghostTime,
+        SaveStates.SphereRefSave.pack(v.attachedSphere),
+        v.attachedAngle,
+        v.chainLevel,
+        v.appendSize,
+        v.boostStreak,
+        mapList(v.effects, function(v1)
+            return type(v1) == "table" and {
+                v1.name,
+                v1.time,
+                v1.infectionSize,
+                v1.infectionTime,
+                v1.effectGroupID
+            } or v1
+        end),
+        v.gaps,
+        v.destroyedFragileSpheres,
+        v.growStopped
+    } or v
+end
+
+---Unpacks a `SphereSave` save state packed with `SaveStates.SphereSave.pack()`.
+---@param v table The packed data.
+---@return table
+function SaveStates.SphereSave.unpack(v)
+    return type(v) == "table" and {
+        color = v[1],
+        shootOrigin = type(v[2]) == "table" and {
+            x = v[2][1],
+            y = v[2][2]
+        } or v[2],
+        shootTime = v[3],
+        ghostTime = v[4],
+        attachedSphere = SaveStates.SphereRefSave.unpack(v[5]),
+        attachedAngle = v[6],
+        chainLevel = v[7],
+        appendSize = v[8],
+        boostStreak = v[9],
+        effects = mapList(v[10], function(v1)
+            return type(v1) == "table" and {
+                name = v1[1],
+                time = v1[2],
+                infectionSize = v1[3],
+                infectionTime = v1[4],
+                effectGroupID = v1[5]
+            } or v1
+        end),
+        gaps = v[11],
+        destroyedFragileSpheres = v[12],
+        growStopped = v[13]
+    } or v
+end
+
+SaveStates.SphereRefSave = {}
+
+---Packs a `SphereRefSave` save state into nested arrays.
+---@param v table The data to be packed.
+---@return table
+function SaveStates.SphereRefSave.pack(v)
+    return type(v) == "table" and {
+        v.sphereID,
+        v.groupID,
+        v.chainID,
+        v.pathID
+    } or v
+end
+
+---Unpacks a `SphereRefSave` save state packed with `SaveStates.SphereRefSave.pack()`.
+---@param v table The packed data.
+---@return table
+function SaveStates.SphereRefSave.unpack(v)
+    return type(v) == "table" and {
+        sphereID = v[1],
+        groupID = v[2],
+        chainID = v[3],
+        pathID = v[4]
+    } or v
+end
+
+---Packed layouts of all save state types. They are stored along with packed data, see `SaveStates.unpackWithLayout()`.
+SaveStates.layouts = {
+    LevelSave = {fields = {
+        {"score", 0},
+        {"coins", 0},
+        {"gems", 0},
+        {"spheresShot", 0},
+        {"successfulShots", 0},
+        {"sphereChainsSpawned", 0},
+        {"time", 0},
+        {"shooter", {fields = {
+            {"color", 0},
+            {"nextColor", 0},
+            {"shotCooldown", 0},
+            {"shotCooldownFade", 0},
+            {"shotCooldownSphere", 0},
+            {"multiColorColor", 0},
+            {"multiColorCount", 0},
+            {"multiColorTime", 0},
+            {"multiColorRemoveWhenTimeOut", 0},
+            {"multiColorHoldTimeRate", 0},
+            {"speedShotTime", 0},
+            {"speedShotSpeed", 0},
+            {"homingBugsTime", 0}
+        }}},
+        {"shotSpheres", {list = {fields = {
+            {"pos", {fields = {
+                {"x", 0},
+                {"y", 0}
+            }}},
+            {"angle", 0},
+            {"size", 0},
+            {"color", 0},
+            {"speed", 0},
+            {"steps", 0},
+            {"homingTowards", "SphereRefSave"},
+            {"destroyedFragileSpheres", 0},
+            {"markedAsSuccessfulShot", 0},
+            {"hitSphere", "SphereRefSave"},
+            {"hitTime", 0},
+            {"hitTimeMax", 0},
+            {"gaps", {list = {fields = {
+                {"groupID", 0},
+                {"chainID", 0},
+                {"pathID", 0},
+                {"size", 0}
+            }}}}
+        }}}},
+        {"collectibles", {list = {fields = {
+            {"id", 0},
+            {"pos", {fields = {
+                {"x", 0},
+                {"y", 0}
+            }}},
+            {"speed", {fields = {
+                {"x", 0},
+                {"y", 0}
+            }}},
+            {"acceleration", {fields = {
+                {"x", 0},
+                {"y", 0}
+            }}}
+        }}}},
+        {"projectiles", {list = {fields = {
+            {"id", 0},
+            {"pos", {fields = {
+                {"x", 0},
+                {"y", 0}
+            }}},
+            {"targetPos", {fields = {
+                {"x", 0},
+                {"y", 0}
+            }}},
+            {"targetSphere", "SphereRefSave"}
+        }}}},
+        {"streak", 0},
+        {"maxStreak", 0},
+        {"cascade", 0},
+        {"cascadeScore", 0},
+        {"maxCascade", 0},
+        {"collectibleRains", {list = {fields = {
+            {"count", 0},
+            {"time", 0},
+            {"delay", 0},
+            {"generator", 0}
+        }}}},
+        {"projectileStorms", {list = {fields = {
+            {"count", 0},
+            {"time", 0},
+            {"delay", 0},
+            {"projectile", 0},
+            {"cancelWhenNoTargetsRemaining", 0}
+        }}}},
+        {"netTime", 0},
+        {"destroyedSpheres", 0},
+        {"paths", {list = "PathSave"}},
+        {"lost", 0},
+        {"failDestructionDelay", 0},
+        {"gameSpeed", 0},
+        {"gameSpeedTime", 0},
+        {"scoreMultiplier", 0},
+        {"scoreMultiplierTime", 0},
+        {"levelSequenceStep", 0},
+        {"levelSequenceVars", 0},
+        {"variables", 0},
+        {"timers", 0},
+        {"timerSeries", 0}
+    }},
+    PathSave = {fields = {
+        {"sphereChains", {list = {fields = {
+            {"cascade", 0},
+            {"cascadeScore", 0},
+            {"speedOverrideBase", 0},
+            {"speedOverrideMult", 0},
+            {"speedOverrideDecc", 0},
+            {"speedOverrideTime", 0},
+            {"colorSortType", 0},
+            {"colorSortDelay", 0},
+            {"colorSortTime", 0},
+            {"colorSortStopWhenTampered", 0},
+            {"sphereGroups", {list = {fields = {
+                {"offset", 0},
+                {"speed", 0},
+                {"speedTime", 0},
+                {"spheres", {list = "SphereSave"}},
+                {"matchCheck", 0},
+                {"distanceEventStates", 0}
+            }}}},
+            {"generationAllowed", 0},
+            {"generationColor", 0},
+            {"generationIndex", 0},
+            {"generationPreset", 0},
+            {"generationKeys", 0}
+        }}}},
+        {"currentWave", 0},
+        {"reachedFinalWave", 0},
+        {"cascade", 0},
+        {"cascadeScore", 0},
+        {"clearOffset", 0},
+        {"pathEntities", {list = {fields = {
+            {"id", 0},
+            {"offset", 0},
+            {"backwards", 0},
+            {"offsetBound", 0},
+            {"speed", 0},
+            {"time", 0},
+            {"traveledDistance", 0},
+            {"trailDistance", 0},
+            {"collectibleDistance", 0},
+            {"destroyedSpheres", 0},
+            {"destroyedChains", 0}
+        }}}},
+        {"sphereEffectGroups", {map = {fields = {
+            {"count", 0},
+            {"cause", "SphereRefSave"}
+        }}}}
+    }},
+    ProfileSave = {fields = {
+        {"session", "ProfileSessionSave"},
+        {"levelStats", 0},
+        {"unlockedCheckpoints", 0},
+        {"variables", 0},
+        {"ultimatelySatisfyingMode", 0}
+    }},
+    ProfileManagerSave = {fields = {
+        {"order", 0},
+        {"profiles", {map = "ProfileSave"}},
+        {"selected", 0}
+    }},
+    ProfileSessionSave = {fields = {
+        {"difficulty", 0},
+        {"score", 0},
+        {"lives", 0},
+        {"coins", 0},
+        {"lifeScore", 0},
+        {"level", 0},
+        {"sublevel", 0},
+        {"sublevelPool", 0},
+        {"levelID", 0},
+        {"levelSaveData", "LevelSave"}
+    }},
+    SphereSave = {fields = {
+        {"color", 0},
+        {"shootOrigin", {fields = {
+            {"x", 0},
+            {"y", 0}
+        }}},
+        {"shootTime", 0},
+        {"ghostTime", 0},
+        {"attachedSphere", "SphereRefSave"},
+        {"attachedAngle", 0},
+        {"chainLevel", 0},
+        {"appendSize", 0},
+        {"boostStreak", 0},
+        {"effects", {list = {fields = {
+            {"name", 0},
+            {"time", 0},
+            {"infectionSize", 0},
+            {"infectionTime", 0},
+            {"effectGroupID", 0}
+        }}}},
+        {"gaps", 0},
+        {"destroyedFragileSpheres", 0},
+        {"growStopped", 0}
+    }},
+    SphereRefSave = {fields = {
+        {"sphereID", 0},
+        {"groupID", 0},
+        {"chainID", 0},
+        {"pathID", 0}
+    }}
+}
+
+return SaveStates
\ No newline at end of file
@@ -10,6 +10,12 @@ local UIManager = class:derive("UIManager")
 function UIManager:new()
     ---@type table<string, UIWidget?>
     self.widgets = {splash = nil, root = nil}
+    ---Widgets by their paths, e.g. `root/Menu/Play`. Rebuilt whenever a root node is loaded or unloaded.
+    ---@type table<string, UIWidget>
+    self.widgetIndex = {}
+    ---Lists of widgets named `1`, `2` and so on, by the paths of their parents. Rebuilt along with `self.widgetIndex`.
+    ---@type table<string, UIWidget[]>
+    self.widgetLists = {}
 
     self.script = nil
 
@@ -21,12 +27,48 @@ end
 ---@param data string|table Path to the UI file to be loaded or raw UI data (not recommended).
 function UIManager:loadRootNode(name, data)
     self.widgets[name] = UIWidget(data)
+    self:updateWidgetIndex()
 end
 
 ---Unloads a root node from the UI Manager.
 ---@param name string The root node name, which is used in the paths.
 function UIManager:unloadRootNode(name)
     self.widgets[name] = nil
+    self:updateWidgetIndex()
+end
+
+---Rebuilds the widget path index and the widget lists, so that widgets can be found by their paths without traversing the tree.
+---@private
+function UIManager:updateWidgetIndex()
+    self.widgetIndex = {}
+    self.widgetLists = {}
+    for name, widget in pairs(self.widgets) do
+        self:indexWidget(widget, name)
+    end
+    for path, widget in pairs(self.widgetIndex) do
+        local list = {}
+        local i = 1
+        while self.widgetIndex[path .. "/" .. tostring(i)] do
+            list[i] = self.widgetIndex[path .. "/" .. tostring(i)]
+            i = i + 1
+        end
+        self.widgetLists[path] = list
+    end
+end
+
+---Adds the provided widget and all its children to the widget path index.
+---Only the first of the children with the same name can be found by path, just like with `UIWidget:getChildN()`.
+---@private
+---@param widget UIWidget The widget to be added.
+---@param path string The path to that widget.
+function UIManager:indexWidget(widget, path)
+    if self.widgetIndex[path] then
+        return
+    end
+    self.widgetIndex[path] = widget
+    for i, child in ipairs(widget.children) do
+        self:indexWidget(child, path .. "/" .. child.name)
+    end
 end
 
 ---Loads the UI Script and fires the `init` UI Script callback.
@@ -145,38 +187,23 @@ end
 ---@param names string[] Path to the widget represented as a list of widget names to traverse through, starting from one of the root widget names.
 ---@return UIWidget?
 function UIManager:getWidget(names)
-    local widget = self.widgets[names[1]]
-    for i, name in ipairs(names) do
-        if i > 1 then
-            if not widget then
-                --error("Could not find a widget: \"" .. strJoin(names, "/") .. "\"")
-                return
-            end
-            widget = widget:getChildN(name)
-        end
-    end
-    return widget
+    return self.widgetIndex[table.concat(names, "/")]
 end
 
 ---Returns a widget by its path. If no widget exists at the given location, returns `nil`.
 ---@param names string Path to the widget represented as widget names separated by slashes, starting from one of the root widget names.
 ---@return UIWidget?
 function UIManager:getWidgetN(names)
-    return self:getWidget(_Utils.strSplit(names, "/"))
+    return self.widgetIndex[names]
 end
 
 ---Returns a list of children widgets of the widget by its path. The child names must start at `1` and be a sequence of numbers.
 ---For example, if `root/List` is provided, the function will return a list of nodes at `root/List/1`, `root/List/2` and so on.
+---The returned list is shared between calls and must not be modified.
 ---@param names string Path to the widget represented as widget names separated by slashes, starting from one of the root widget names.
 ---@return UIWidget[]
 function UIManager:getWidgetListN(names)
-    local widgets = {}
-    local i = 1
-    while self:getWidgetN(names .. "/" .. tostring(i)) do
-        widgets[i] = self:getWidgetN(names .. "/" .. tostring(i))
-        i = i + 1
-    end
-    return widgets
+    return self.widgetLists[names] or {}
 end
 
 ---Returns the default Sound Event which will be played when a UI button is pressed.
@@ -293,10 +293,10 @@ function api.unload(name) _Game.uiManager:unloadRootNode(name) end
 ---@param names any
 ---@return UIWidget?
 function api.getWidgetN(names) return _Game.uiManager:getWidgetN(names) end
----comment
+---Returns a copy of the list of children widgets of the given widget, as the UI Manager shares its lists between calls.
 ---@param names any
 ---@return UIWidget[]
-function api.getWidgetListN(names) return _Game.uiManager:getWidgetListN(names) end
+function api.getWidgetListN(names) return _Utils.copyTable(_Game.uiManager:getWidgetListN(names)) end
 ---comment
 function api.resetActive() _Game.uiManager:resetActive() end
 